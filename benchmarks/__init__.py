@@ -0,0 +1,17 @@
+"""Performance benchmarks for arlogi.
+
+Each ``bench_*`` module is runnable on its own, e.g.::
+
+    uv run python -m benchmarks.bench_console
+
+``benchmarks.runner`` runs the per-path microbenchmarks of ``bench_paths``
+against a stdlib ``logging`` baseline and writes JSON results::
+
+    uv run python -m benchmarks.runner --output results.json --compare previous.json
+
+``benchmarks.loadgen`` drives a LoggingConfig from many threads, asyncio
+tasks or processes and reports throughput and latency percentiles.
+
+``benchmarks.bench_memory`` checks per-record allocations (tracemalloc) and
+RSS across logger lifecycles against budgets (``--check``).
+"""
@@ -0,0 +1,105 @@
+"""Compare per-record cost of the console handlers.
+
+Reports two tables:
+
+* full ``handle()`` cost of the Rich and plain console handlers, writing into an
+  in-memory stream so the numbers measure rendering, not terminal I/O;
+* Rich render cost (``render_message`` + ``render``, no console output) with
+  and without ColoredConsoleHandler's caches, i.e. before/after the fast path.
+
+Usage:
+    uv run python -m benchmarks.bench_console [--records N]
+"""
+
+import argparse
+import io
+import logging
+import os
+import time
+
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.text import Text
+
+from arlogi.handlers import ColoredConsoleHandler, PlainConsoleHandler
+
+
+class _UncachedColoredConsoleHandler(ColoredConsoleHandler):
+    """ColoredConsoleHandler with its per-record caches disabled (the old path)."""
+
+    def _relative_path(self, pathname: str) -> str:
+        try:
+            return os.path.relpath(pathname, self.project_root)
+        except (ValueError, OSError):
+            return os.path.basename(pathname)
+
+    def get_level_text(self, record: logging.LogRecord) -> Text:
+        style = self.level_styles.get(record.levelname.lower(), "default")
+        return Text(f"{record.levelname[0]} ", style=style)
+
+    def render_message(self, record: logging.LogRecord, message: str) -> Text:
+        message_text = RichHandler.render_message(self, record, message)
+        message_text.style = self.level_styles.get(record.levelname.lower(), "default")
+        return message_text
+
+
+def _make_record(index: int) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="bench.console",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=index % 500,
+        msg="request %d handled in %.2f ms",
+        args=(index, index / 7),
+        exc_info=None,
+    )
+
+
+def _rich_console() -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, width=120)
+
+
+def _time_handle(handler: logging.Handler, records: int) -> float:
+    """Return the average nanoseconds per handled record."""
+    batch = [_make_record(i) for i in range(records)]
+    start = time.perf_counter_ns()
+    for record in batch:
+        handler.handle(record)
+    return (time.perf_counter_ns() - start) / records
+
+
+def _time_render(handler: ColoredConsoleHandler, records: int) -> float:
+    """Return the average nanoseconds to build the Rich renderable of a record."""
+    batch = [_make_record(i) for i in range(records)]
+    start = time.perf_counter_ns()
+    for record in batch:
+        message = handler.render_message(record, record.getMessage())
+        handler.render(record=record, traceback=None, message_renderable=message)
+    return (time.perf_counter_ns() - start) / records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rich_ns = _time_handle(ColoredConsoleHandler(console=_rich_console()), args.records)
+    plain_ns = _time_handle(PlainConsoleHandler(stream=io.StringIO()), args.records)
+
+    print(f"{'handle()':<32}{'ns/record':>12}")
+    print(f"{'ColoredConsoleHandler':<32}{rich_ns:>12.0f}")
+    print(f"{'PlainConsoleHandler':<32}{plain_ns:>12.0f}")
+    print(f"speedup: {rich_ns / plain_ns:.1f}x")
+    print()
+
+    before_ns = _time_render(_UncachedColoredConsoleHandler(console=_rich_console()), args.records)
+    after_ns = _time_render(ColoredConsoleHandler(console=_rich_console()), args.records)
+
+    print(f"{'Rich render':<32}{'ns/record':>12}")
+    print(f"{'uncached (before)':<32}{before_ns:>12.0f}")
+    print(f"{'cached fast path (after)':<32}{after_ns:>12.0f}")
+    print(f"speedup: {before_ns / after_ns:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
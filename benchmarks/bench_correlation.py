@@ -0,0 +1,101 @@
+"""Record-creation overhead of OpenTelemetry log correlation.
+
+``install_log_correlation`` wraps the LogRecord factory, so its cost is paid
+by every record in the process. This reports the nanoseconds per
+``logger.info()`` call on a logger whose handler never formats the record,
+for a stdlib ``logging.Logger`` and arlogi's TraceLogger:
+
+* correlation off;
+* correlation on, outside any span (only the span lookup);
+* correlation on, inside a span (the hex ids are rendered once per span
+  and reused);
+* correlation on, inside a span, with a formatter reading ``%(trace_id)s``.
+
+Usage:
+    uv run python -m benchmarks.bench_correlation [--records N] [--repeats N]
+"""
+
+import argparse
+import logging
+import time
+from collections.abc import Callable
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from arlogi.factory import TraceLogger
+from arlogi.otel.bootstrap import install_log_correlation
+from benchmarks.bench_paths import NullStream
+
+
+class _DropHandler(logging.Handler):
+    """Accepts records without reading any field."""
+
+    record_fields = frozenset()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def _logger(cls: type[logging.Logger], handler: logging.Handler) -> logging.Logger:
+    logger = cls(f"bench.correlation.{cls.__name__}", logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def _time(call: Callable[[], None], records: int, repeats: int) -> float:
+    """Return the best average nanoseconds per call over ``repeats`` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(records):
+            call()
+        best = min(best, (time.perf_counter_ns() - start) / records)
+    return best
+
+
+def measure(records: int, repeats: int) -> dict[str, dict[str, float]]:
+    """Return ns per record for each scenario and logger class."""
+    tracer = TracerProvider().get_tracer("bench.correlation")
+    formatted = logging.StreamHandler(NullStream())
+    formatted.setFormatter(logging.Formatter("%(trace_id)s %(span_id)s %(message)s"))
+    loggers = {cls.__name__: _logger(cls, _DropHandler()) for cls in (logging.Logger, TraceLogger)}
+    readers = {cls.__name__: _logger(cls, formatted) for cls in (logging.Logger, TraceLogger)}
+
+    def run(chosen: dict[str, logging.Logger], in_span: bool) -> dict[str, float]:
+        results = {}
+        for name, logger in chosen.items():
+            call = lambda logger=logger: logger.info("request %d handled", 42)  # noqa: E731
+            if in_span:
+                with tracer.start_as_current_span("op"):
+                    results[name] = _time(call, records, repeats)
+            else:
+                results[name] = _time(call, records, repeats)
+        return results
+
+    original = logging.getLogRecordFactory()
+    results = {"off": run(loggers, in_span=True)}
+    install_log_correlation()
+    try:
+        results["on, no span"] = run(loggers, in_span=False)
+        results["on, in span"] = run(loggers, in_span=True)
+        results["on, in span, formatted"] = run(readers, in_span=True)
+    finally:
+        logging.setLogRecordFactory(original)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    results = measure(args.records, args.repeats)
+    print(f"{'ns/record':<28}{'Logger':>12}{'TraceLogger':>14}")
+    for scenario, timings in results.items():
+        print(f"{scenario:<28}{timings['Logger']:>12.0f}{timings['TraceLogger']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Allocation and memory regression benchmarks, checked against budgets.
+
+Two modes:
+
+* per-record allocations, measured with tracemalloc for every handler type
+  and kwargs shape: ``peak_bytes`` is the transient memory one record needs
+  (tracemalloc peak above the starting point: the ``_process_params`` dicts,
+  JSONFormatter's ``log_data``, Rich renderables...), ``retained_blocks`` /
+  ``retained_bytes`` are what records leave behind (snapshot diffs after a
+  warm-up, smallest of three windows, i.e. leaks rather than cache churn). Python exposes no
+  cumulative allocation counter, so blocks are counted as retained blocks.
+* a soak scenario that repeatedly creates a JSON logger with
+  ``get_json_logger``, logs, rotates it with ``rotate_json_logger`` and
+  releases it with ``cleanup_json_logger``, checking that RSS stays flat.
+
+``--check`` exits non-zero when a budget is exceeded; the test suite runs it.
+
+Usage:
+    uv run python -m benchmarks.bench_memory [--records N] [--handlers NAME ...] [--soak-cycles N] [--check]
+"""
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from arlogi.factory import TraceLogger, cleanup_json_logger, get_json_logger, rotate_json_logger
+from arlogi.handlers import JSONFileHandler, JSONHandler, PlainConsoleHandler
+from benchmarks.bench_paths import NullStream
+
+# Transient bytes one record may need, per handler type (worst kwargs shape).
+# About twice the measured values, so only real regressions trip them.
+PEAK_BYTES_BUDGETS = {
+    "null": 8_000,
+    "plain_console": 10_000,
+    "rich_console": 64_000,
+    "json_stream": 16_000,
+    "json_file": 16_000,
+}
+# Records logged (traced) before the first snapshot: fills bounded caches
+# (relative paths, level Text, lazy imports, Rich's LRU caches), so what is
+# still retained afterwards is growth, not warm-up.
+WARMUP_RECORDS = 1_000
+# Bytes a record may leave behind once caches are warm (leak detection)
+RETAINED_BYTES_PER_RECORD_BUDGET = 16.0
+# RSS growth allowed between the end of the soak warm-up and the end of the soak
+SOAK_RSS_GROWTH_BUDGET_MB = 8.0
+
+
+def _rich_console_handler(workdir: Path) -> logging.Handler:
+    from rich.console import Console
+
+    from arlogi.handlers import ColoredConsoleHandler
+
+    return ColoredConsoleHandler(console=Console(file=NullStream(), force_terminal=True, width=120))
+
+
+HANDLERS: dict[str, Callable[[Path], logging.Handler]] = {
+    "null": lambda workdir: logging.NullHandler(),
+    "plain_console": lambda workdir: PlainConsoleHandler(stream=NullStream()),
+    "rich_console": _rich_console_handler,
+    "json_stream": lambda workdir: JSONHandler(NullStream()),
+    "json_file": lambda workdir: JSONFileHandler(str(workdir / "memory.jsonl")),
+}
+
+_NESTED = {"request": {"id": "r-1", "headers": {"accept": "json"}}, "items": [1, 2, 3]}
+
+# kwargs shape -> the logging call
+SHAPES: dict[str, Callable[[logging.Logger], None]] = {
+    "message": lambda logger: logger.info("request handled"),
+    "percent_args": lambda logger: logger.info("request %d handled in %.2f ms", 42, 3.14),
+    "kwargs_3": lambda logger: logger.info("request handled", user_id=42, path="/api", status=200),
+    "kwargs_10": lambda logger: logger.info("request handled", **{f"field_{i}": i for i in range(10)}),
+    "kwargs_nested": lambda logger: logger.info("request handled", context=_NESTED),
+    "caller_depth": lambda logger: logger.info("request handled", caller_depth=1),
+}
+
+
+def _retained(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> tuple[int, int]:
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    return sum(stat.count_diff for stat in diff), sum(stat.size_diff for stat in diff)
+
+
+def measure_record_allocations(
+    handler: logging.Handler, call: Callable[[logging.Logger], None], records: int, windows: int = 3
+) -> dict[str, float]:
+    """Return per-record peak bytes and retained blocks/bytes for one handler and call shape.
+
+    Retained memory is measured over ``windows`` consecutive windows of
+    ``records`` records and the smallest growth is kept: a leak grows in every
+    window, while cache churn and interpreter free lists (freed tuples stay
+    traced until reused) come and go.
+
+    Tracing must already be running (see ``run_allocations``) so that cache
+    entries evicted during the measurement were traced when they were added.
+    """
+    logger = TraceLogger("bench.memory", logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for _ in range(WARMUP_RECORDS):
+            call(logger)
+        peak_total = 0
+        retained = []
+        for _ in range(windows):
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for _ in range(records):
+                start, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                call(logger)
+                _, peak = tracemalloc.get_traced_memory()
+                peak_total += peak - start
+            gc.collect()
+            retained.append(_retained(before, tracemalloc.take_snapshot()))
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    blocks, size = min(retained, key=lambda growth: growth[1])
+    return {
+        "peak_bytes": peak_total / (records * windows),
+        "retained_blocks": max(blocks, 0) / records,
+        "retained_bytes": max(size, 0) / records,
+    }
+
+
+def run_allocations(records: int, handlers: list[str] | None = None) -> list[dict[str, Any]]:
+    """Measure every handler type (or the given ones) x kwargs shape combination."""
+    results = []
+    tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory(prefix="arlogi-bench-memory-") as tmp:
+            for handler_name, make_handler in HANDLERS.items():
+                if handlers and handler_name not in handlers:
+                    continue
+                for shape_name, call in SHAPES.items():
+                    result = measure_record_allocations(make_handler(Path(tmp)), call, records)
+                    results.append({"handler": handler_name, "shape": shape_name, **result})
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux /proc; peak RSS elsewhere)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource
+
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+def run_soak(cycles: int, records_per_cycle: int = 50) -> dict[str, float]:
+    """Cycle get_json_logger -> log -> rotate_json_logger -> cleanup_json_logger; report RSS growth.
+
+    The first fifth of the cycles is warm-up; growth is measured from there to the end.
+    """
+    warmup = max(cycles // 5, 1)
+    with tempfile.TemporaryDirectory(prefix="arlogi-soak-") as tmp:
+        log_file = Path(tmp) / "soak.jsonl"
+        baseline = 0
+        for cycle in range(cycles):
+            logger = get_json_logger("soak", str(log_file))
+            for i in range(records_per_cycle):
+                logger.info("soak record %d of cycle %d: %s", i, cycle, "x" * 64)
+            rotate_json_logger("soak")
+            cleanup_json_logger("soak")
+            # Rotated files would be shipped elsewhere; keep the directory small.
+            for rotated in Path(tmp).glob("soak-*.jsonl"):
+                rotated.unlink()
+            if cycle + 1 == warmup:
+                gc.collect()
+                baseline = rss_bytes()
+        gc.collect()
+        final = rss_bytes()
+    return {
+        "cycles": cycles,
+        "rss_start_mb": baseline / 2**20,
+        "rss_end_mb": final / 2**20,
+        "rss_growth_mb": (final - baseline) / 2**20,
+    }
+
+
+def check_budgets(allocations: list[dict[str, Any]], soak: dict[str, float] | None) -> list[str]:
+    """Return a message for every exceeded budget."""
+    failures = []
+    for result in allocations:
+        label = f"{result['handler']}/{result['shape']}"
+        budget = PEAK_BYTES_BUDGETS[result["handler"]]
+        if result["peak_bytes"] > budget:
+            failures.append(f"{label}: peak {result['peak_bytes']:.0f} B/record > {budget} B")
+        if result["retained_bytes"] > RETAINED_BYTES_PER_RECORD_BUDGET:
+            failures.append(
+                f"{label}: retained {result['retained_bytes']:.1f} B/record > {RETAINED_BYTES_PER_RECORD_BUDGET} B"
+            )
+    if soak is not None and soak["rss_growth_mb"] > SOAK_RSS_GROWTH_BUDGET_MB:
+        failures.append(f"soak: RSS grew {soak['rss_growth_mb']:.1f} MB > {SOAK_RSS_GROWTH_BUDGET_MB} MB")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500, help="records per measurement window")
+    parser.add_argument("--handlers", nargs="+", choices=list(HANDLERS), help="handler types to measure")
+    parser.add_argument("--soak-cycles", type=int, default=2_000, help="logger lifecycles in the soak (0: skip)")
+    parser.add_argument("--check", action="store_true", help="exit 1 when a budget is exceeded")
+    args = parser.parse_args(argv)
+
+    allocations = run_allocations(args.records, args.handlers)
+    print(f"{'handler':<16}{'shape':<16}{'peak B':>10}{'budget':>10}{'kept blocks':>13}{'kept B':>10}")
+    for result in allocations:
+        print(
+            f"{result['handler']:<16}{result['shape']:<16}{result['peak_bytes']:>10.0f}"
+            f"{PEAK_BYTES_BUDGETS[result['handler']]:>10}{result['retained_blocks']:>13.2f}"
+            f"{result['retained_bytes']:>10.1f}"
+        )
+
+    soak = None
+    if args.soak_cycles:
+        soak = run_soak(args.soak_cycles)
+        print()
+        print(
+            f"soak: {soak['cycles']} cycles, RSS {soak['rss_start_mb']:.1f} -> {soak['rss_end_mb']:.1f} MB "
+            f"({soak['rss_growth_mb']:+.1f} MB, budget {SOAK_RSS_GROWTH_BUDGET_MB} MB)"
+        )
+
+    failures = check_budgets(allocations, soak)
+    for failure in failures:
+        print(f"budget exceeded: {failure}", file=sys.stderr)
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
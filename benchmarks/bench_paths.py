@@ -0,0 +1,293 @@
+"""Microbenchmarks for every arlogi logging path against a stdlib baseline.
+
+Each case builds an isolated logger (not attached to the root logger) with
+the handler under test; the stdlib side uses ``logging.Logger`` with the
+closest stdlib handler writing to the same kind of sink. JSON baselines use
+a minimal ``json.dumps`` formatter so both sides serialize the same fields.
+
+Usage:
+    uv run python -m benchmarks.bench_paths [runner options]
+
+(equivalent to ``python -m benchmarks.runner``; see that module for options)
+"""
+
+import json
+import logging
+import logging.handlers
+import socket
+import sys
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from rich.console import Console
+
+from arlogi.factory import TraceLogger
+from arlogi.handlers import (
+    ArlogiSyslogHandler,
+    ColoredConsoleHandler,
+    JSONFileHandler,
+    JSONHandler,
+    PlainConsoleHandler,
+)
+from arlogi.syslog import SyslogStreamHandler
+from benchmarks.runner import Case
+
+_CONSOLE_FORMAT = "%(levelname).1s %(message)s  %(pathname)s:%(lineno)d"
+
+
+class NullStream:
+    """A text stream that discards everything (keeps sinks from growing)."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class StdlibJSONFormatter(logging.Formatter):
+    """Minimal stdlib-only JSON formatter emitting the same fields as JSONFormatter."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger_name": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line_number": record.lineno,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+def _logger(cls: type[logging.Logger], name: str, handler: logging.Handler) -> logging.Logger:
+    logger = cls(name, logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def _setup(
+    cls: type[logging.Logger],
+    make_handler: Callable[[Path], logging.Handler],
+    make_call: Callable[[logging.Logger], Callable[[], None]],
+) -> Callable[[Path], tuple[Callable[[], None], Callable[[], None]]]:
+    """Build a case side: logger class + handler factory + the call to time."""
+
+    def setup(workdir: Path) -> tuple[Callable[[], None], Callable[[], None]]:
+        workdir.mkdir(parents=True, exist_ok=True)
+        handler = make_handler(workdir)
+        logger = _logger(cls, f"bench.{cls.__name__}", handler)
+
+        def teardown() -> None:
+            logger.removeHandler(handler)
+            handler.close()
+
+        return make_call(logger), teardown
+
+    return setup
+
+
+def _case(
+    name: str,
+    description: str,
+    arlogi_handler: Callable[[Path], logging.Handler],
+    stdlib_handler: Callable[[Path], logging.Handler],
+    arlogi_call: Callable[[logging.Logger], Callable[[], None]],
+    stdlib_call: Callable[[logging.Logger], Callable[[], None]] | None = None,
+) -> Case:
+    return Case(
+        name,
+        description,
+        arlogi=_setup(TraceLogger, arlogi_handler, arlogi_call),
+        stdlib=_setup(logging.Logger, stdlib_handler, stdlib_call or arlogi_call),
+    )
+
+
+def _null(workdir: Path) -> logging.Handler:
+    return logging.NullHandler()
+
+
+def _stream(formatter: logging.Formatter) -> Callable[[Path], logging.Handler]:
+    def make(workdir: Path) -> logging.Handler:
+        handler = logging.StreamHandler(NullStream())
+        handler.setFormatter(formatter)
+        return handler
+
+    return make
+
+
+def _with_formatter(handler: logging.Handler, formatter: logging.Formatter) -> logging.Handler:
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _info(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.info("request %d handled in %.2f ms", 42, 3.14)
+
+
+def _debug(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.debug("cache miss for %s", "key")
+
+
+def _info_kwargs(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.info("request handled", user_id=42, path="/api/items")
+
+
+def _info_extra(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.info("request handled", extra={"user_id": 42, "path": "/api/items"})
+
+
+def _info_caller_depth(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.info("request handled", caller_depth=1)
+
+
+def _info_stacklevel(logger: logging.Logger) -> Callable[[], None]:
+    return lambda: logger.info("request handled", stacklevel=2)
+
+
+def _exception(logger: logging.Logger) -> Callable[[], None]:
+    def call() -> None:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("request failed")
+
+    return call
+
+
+class _DrainServer:
+    """Local UDP and TCP endpoints that read and discard everything they receive."""
+
+    def __init__(self) -> None:
+        self.udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp.bind(("127.0.0.1", 0))
+        self.tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.tcp.bind(("127.0.0.1", 0))
+        self.tcp.listen()
+        threading.Thread(target=self._drain_udp, daemon=True).start()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _drain_udp(self) -> None:
+        while True:
+            try:
+                self.udp.recv(65536)
+            except OSError:
+                return
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self.tcp.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._drain_tcp, args=(conn,), daemon=True).start()
+
+    @staticmethod
+    def _drain_tcp(conn: socket.socket) -> None:
+        with conn:
+            while conn.recv(65536):
+                pass
+
+
+_drain_server: _DrainServer | None = None
+
+
+def _server() -> _DrainServer:
+    global _drain_server
+    if _drain_server is None:
+        _drain_server = _DrainServer()
+    return _drain_server
+
+
+_PLAIN = logging.Formatter(_CONSOLE_FORMAT)
+_JSON = StdlibJSONFormatter()
+
+CASES = [
+    _case("disabled", "debug() below the logger level", _null, _null, _debug),
+    _case("info", "info() with %-args to a NullHandler", _null, _null, _info),
+    _case(
+        "kwargs_extra",
+        "kwargs moved to extra (stdlib: explicit extra=)",
+        _null,
+        _null,
+        _info_kwargs,
+        _info_extra,
+    ),
+    _case(
+        "caller_depth",
+        "caller attribution (stdlib: stacklevel=2)",
+        _null,
+        _null,
+        _info_caller_depth,
+        _info_stacklevel,
+    ),
+    _case(
+        "console_rich",
+        "ColoredConsoleHandler (stdlib: StreamHandler + Formatter)",
+        lambda _: ColoredConsoleHandler(console=Console(file=NullStream(), force_terminal=True, width=120)),
+        _stream(_PLAIN),
+        _info,
+    ),
+    _case(
+        "console_plain",
+        "PlainConsoleHandler (stdlib: StreamHandler + Formatter)",
+        lambda _: PlainConsoleHandler(stream=NullStream()),
+        _stream(_PLAIN),
+        _info,
+    ),
+    _case(
+        "json_stream",
+        "JSONHandler (stdlib: StreamHandler + json.dumps)",
+        lambda _: JSONHandler(NullStream()),
+        _stream(_JSON),
+        _info,
+    ),
+    _case(
+        "json_file",
+        "JSONFileHandler (stdlib: FileHandler + json.dumps)",
+        lambda d: JSONFileHandler(str(d / "app.jsonl")),
+        lambda d: _with_formatter(logging.FileHandler(d / "app.jsonl"), _JSON),
+        _info,
+    ),
+    _case(
+        "json_file_rotating",
+        "JSONFileHandler hourly schedule (stdlib: TimedRotatingFileHandler)",
+        lambda d: JSONFileHandler(str(d / "app.jsonl"), rotate_schedule="hour"),
+        lambda d: _with_formatter(logging.handlers.TimedRotatingFileHandler(d / "app.jsonl", when="H"), _JSON),
+        _info,
+    ),
+    _case(
+        "syslog_udp",
+        "ArlogiSyslogHandler to a local UDP socket (stdlib: SysLogHandler)",
+        lambda _: ArlogiSyslogHandler(address=_server().udp.getsockname()),
+        lambda _: logging.handlers.SysLogHandler(address=_server().udp.getsockname()),
+        _info,
+    ),
+    _case(
+        "syslog_stream",
+        "SyslogStreamHandler to local TCP (stdlib: SysLogHandler over TCP)",
+        lambda _: SyslogStreamHandler(address=_server().tcp.getsockname()),
+        lambda _: logging.handlers.SysLogHandler(address=_server().tcp.getsockname(), socktype=socket.SOCK_STREAM),
+        _info,
+    ),
+    _case(
+        "exception",
+        "exception() with traceback to JSON (stdlib: json.dumps formatter)",
+        lambda _: JSONHandler(NullStream()),
+        _stream(_JSON),
+        _exception,
+    ),
+]
+
+
+if __name__ == "__main__":
+    from benchmarks.runner import main
+
+    sys.exit(main())
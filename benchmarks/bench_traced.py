@@ -0,0 +1,151 @@
+"""Per-call and per-item overhead of the @traced decorator.
+
+Reports nanoseconds per call of a trivial function, undecorated and wrapped
+by ``@traced``, for sync functions, coroutines (driven without an event
+loop) and generators (one item each), in three states:
+
+* no SDK: only opentelemetry-api, the global tracer is the no-op proxy;
+* enabled: an SDK TracerProvider without processors, with a
+  ``set_trace_modules`` rule set that does not match the module;
+* disabled: the module is switched off by ``set_trace_modules``.
+
+A second table reports nanoseconds per item of a generator yielding
+``--items`` items, plain and traced with ``chunk_size`` 1 (one context
+switch per item) and ``--chunk-size``, with no SDK and enabled.
+
+Usage:
+    uv run python -m benchmarks.bench_traced [--calls N] [--items N] [--chunk-size N] [--repeats N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from arlogi.otel.decorator import set_trace_modules, traced
+
+
+def _plain_sync() -> int:
+    return 1
+
+
+async def _plain_async() -> int:
+    return 1
+
+
+def _plain_gen():
+    yield 1
+
+
+_KINDS = {"sync": _plain_sync, "async": _plain_async, "generator": _plain_gen}
+
+
+def _caller(kind: str, fn: Callable) -> Callable[[], None]:
+    if kind == "sync":
+        return fn
+
+    if kind == "async":
+
+        def drive() -> None:
+            coro = fn()
+            try:
+                coro.send(None)
+            except StopIteration:
+                pass
+
+        return drive
+
+    def consume() -> None:
+        for _ in fn():
+            pass
+
+    return consume
+
+
+def _time(call: Callable[[], None], calls: int, repeats: int) -> float:
+    """Return the best average nanoseconds per call over ``repeats`` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            call()
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+
+def _rows(count: int):
+    yield from range(count)
+
+
+def _time_items(fn: Callable, items: int, repeats: int) -> float:
+    def consume() -> None:
+        for _ in fn(items):
+            pass
+
+    return _time(consume, 1, repeats) / items
+
+
+def measure(
+    calls: int, repeats: int, items: int = 10_000, chunk_size: int = 256
+) -> tuple[dict[str, dict[str, float]], dict[str, dict[str, float]]]:
+    """Measure the decorator's overhead per call and per generator item.
+
+    Installs an SDK TracerProvider as the global provider, so run it in a
+    process of its own (the no-SDK rows are measured first).
+
+    Returns:
+        ns per call by state (plus ``plain``) and function kind, and ns per
+        generator item by state (no SDK, enabled) and variant
+    """
+    wrapped = {kind: traced(fn) for kind, fn in _KINDS.items()}
+    variants = {
+        "plain": _rows,
+        "chunk_size=1": traced(_rows),
+        f"chunk_size={chunk_size}": traced(chunk_size=chunk_size)(_rows),
+    }
+
+    def run(functions: dict[str, Callable]) -> dict[str, float]:
+        return {kind: _time(_caller(kind, fn), calls, repeats) for kind, fn in functions.items()}
+
+    def run_items() -> dict[str, float]:
+        return {variant: _time_items(fn, items, repeats) for variant, fn in variants.items()}
+
+    per_call = {"plain": run(_KINDS), "no SDK": run(wrapped)}
+    per_item = {"no SDK": run_items()}
+    trace.set_tracer_provider(TracerProvider())
+    try:
+        set_trace_modules({"some.other.package": False})
+        per_call["enabled"] = run(wrapped)
+        per_item["enabled"] = run_items()
+        set_trace_modules({__name__: False})
+        per_call["disabled"] = run(wrapped)
+    finally:
+        set_trace_modules(None)
+    return per_call, per_item
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    results, per_item = measure(args.calls, args.repeats, args.items, args.chunk_size)
+    kinds = list(_KINDS)
+    print(f"{'ns/call':<12}" + "".join(f"{kind:>12}" for kind in kinds))
+    for state, timings in results.items():
+        print(f"{state:<12}" + "".join(f"{timings[kind]:>12.0f}" for kind in kinds))
+
+    print()
+    variants = list(per_item["enabled"])
+    print(f"{'ns/item':<12}" + "".join(f"{variant:>16}" for variant in variants))
+    for state, timings in per_item.items():
+        print(f"{state:<12}" + "".join(f"{timings[variant]:>16.0f}" for variant in variants))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""Concurrent load generator with per-call latency percentiles.
+
+Applies a ``LoggingConfig`` the way ``setup_logging`` does (handlers, module
+levels, lean records, redaction, exception dedup, self-metrics), drives a
+logger under it from N threads, asyncio tasks or processes, either flat out
+or at a target total rate, and reports throughput plus p50/p99/p999/max
+latency of the logging calls.
+
+Workloads are synthetic (a mix of levels, %-args and keyword extras) or a
+replay of a JSONL file written by JSONFileHandler (``--replay``), cycled
+until every worker has sent its records.
+
+With ``--rotate-interval`` a background thread forces ``rotate_now()`` on
+every JSONFileHandler at that interval; calls overlapping a rotation (plus
+``--rotation-margin-ms``) are reported separately, so rotation stalls show up
+instead of disappearing in the overall percentiles.
+
+Usage:
+    uv run python -m benchmarks.loadgen --config prod.json --mode threads --workers 8 --records 50000
+    uv run python -m benchmarks.loadgen --mode asyncio --workers 100 --rate 20000 --duration 10
+    uv run python -m benchmarks.loadgen --replay logs/app.jsonl --mode processes --workers 4
+
+``--config`` is a JSON object of LoggingConfig fields (``LoggingConfig.to_dict()``
+output works as-is). Without it, records go to a JSON file in a temporary
+directory.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from arlogi.config import LoggingConfig, is_test_mode
+from arlogi.factory import LoggerFactory
+from arlogi.handlers import _STANDARD_RECORD_ATTRS, JSONFileHandler
+from arlogi.levels import register_trace_level
+
+MODES = ("threads", "asyncio", "processes")
+
+# JSON fields written by JSONFormatter that are not record extras
+_JSON_FIELDS = {"timestamp", "level", "logger_name", "message", "module", "function", "line_number", "exception"}
+# Keys that cannot be passed as extras (makeRecord rejects them)
+_RESERVED = _STANDARD_RECORD_ATTRS | {"asctime", "taskName"}
+
+# One log call: (level, message, extras)
+Message = tuple[int, str, dict[str, Any]]
+
+
+def synthetic_workload(size: int = 64) -> list[Message]:
+    """Build a representative mix of levels, message shapes and extras."""
+    messages: list[Message] = []
+    for i in range(size):
+        if i % 16 == 15:
+            messages.append((logging.WARNING, f"slow request {i} took 1.{i:03d}s", {"path": f"/api/items/{i}"}))
+        elif i % 4 == 3:
+            messages.append((logging.INFO, "request handled", {"user_id": i, "path": "/api/items", "status": 200}))
+        elif i % 4 == 1:
+            messages.append((logging.DEBUG, f"cache lookup for key-{i}", {}))
+        else:
+            messages.append((logging.INFO, f"processed batch {i} with {i * 3} items", {}))
+    return messages
+
+
+def replay_workload(path: str | Path) -> list[Message]:
+    """Load a JSONL file written by JSONFileHandler as a workload.
+
+    Args:
+        path: The JSON log file
+
+    Returns:
+        One (level, message, extras) tuple per parseable line
+
+    Raises:
+        ValueError: If the file contains no parseable records
+    """
+    register_trace_level()  # so TRACE records replay at their level
+    messages: list[Message] = []
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        for line in stream:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            level = logging.getLevelName(str(entry.get("level", "INFO")))
+            extras = {k: v for k, v in entry.items() if k not in _JSON_FIELDS and k not in _RESERVED}
+            messages.append((level if isinstance(level, int) else logging.INFO, str(entry.get("message", "")), extras))
+    if not messages:
+        raise ValueError(f"No JSON log records found in {path}")
+    return messages
+
+
+def build_logger(config: LoggingConfig, name: str = "arlogi.loadgen") -> tuple[logging.Logger, list[logging.Handler]]:
+    """Apply ``config`` as setup_logging does and return a logger plus the root handlers it installed.
+
+    Release the handlers with :func:`release_handlers` when the run is over.
+    """
+    LoggerFactory._apply_configuration(config)
+    if is_test_mode():
+        # _apply_configuration leaves the root handlers alone under test runners
+        LoggerFactory._clear_and_add_handlers(config)
+    return logging.getLogger(name), list(logging.getLogger().handlers)
+
+
+def release_handlers(handlers: list[logging.Handler]) -> None:
+    """Detach the handlers build_logger installed from the root logger and close them."""
+    root = logging.getLogger()
+    for handler in handlers:
+        root.removeHandler(handler)
+        handler.close()
+
+
+def _file_handlers(handlers: list[logging.Handler]) -> list[JSONFileHandler]:
+    """Find JSONFileHandlers, unwrapping deferred and circuit-breaker wrappers."""
+    found = []
+    for handler in handlers:
+        while not isinstance(handler, JSONFileHandler) and hasattr(handler, "handler"):
+            handler = handler.handler
+        if isinstance(handler, JSONFileHandler):
+            found.append(handler)
+    return found
+
+
+class Rotator:
+    """Background thread forcing rotations and recording when they happened."""
+
+    def __init__(self, handlers: list[JSONFileHandler], interval: float):
+        self.handlers = handlers
+        self.interval = interval
+        self.intervals: list[tuple[int, int]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="arlogi-loadgen-rotator", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for handler in self.handlers:
+                start = time.perf_counter_ns()
+                handler.rotate_now()
+                self.intervals.append((start, time.perf_counter_ns()))
+
+    def __enter__(self) -> "Rotator":
+        if self.handlers and self.interval > 0:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+@dataclass
+class Samples:
+    """Start times and durations (ns) of every log call, plus rotation intervals."""
+
+    starts: array = field(default_factory=lambda: array("q"))
+    durations: array = field(default_factory=lambda: array("q"))
+    rotations: list[tuple[int, int]] = field(default_factory=list)
+
+    def extend(self, other: "Samples") -> None:
+        self.starts.extend(other.starts)
+        self.durations.extend(other.durations)
+        self.rotations.extend(other.rotations)
+
+
+def _pacer(rate: float, start: int) -> Callable[[int], float]:
+    """Return a function giving the seconds to wait before call ``i`` (0 when flat out)."""
+    if rate <= 0:
+        return lambda i: 0.0
+    interval_ns = 1e9 / rate
+    return lambda i: (start + i * interval_ns - time.perf_counter_ns()) / 1e9
+
+
+def _run_sync(logger: logging.Logger, workload: list[Message], records: int, rate: float, deadline: float) -> Samples:
+    samples = Samples()
+    starts, durations = samples.starts, samples.durations
+    wait = _pacer(rate, time.perf_counter_ns())
+    size = len(workload)
+    for i in range(records):
+        delay = wait(i)
+        if delay > 0:
+            time.sleep(delay)
+        level, message, extras = workload[i % size]
+        start = time.perf_counter_ns()
+        logger.log(level, message, **extras)
+        end = time.perf_counter_ns()
+        starts.append(start)
+        durations.append(end - start)
+        if end > deadline:
+            break
+    return samples
+
+
+async def _run_task(
+    logger: logging.Logger, workload: list[Message], records: int, rate: float, deadline: float
+) -> Samples:
+    samples = Samples()
+    starts, durations = samples.starts, samples.durations
+    wait = _pacer(rate, time.perf_counter_ns())
+    size = len(workload)
+    for i in range(records):
+        # Always yield to the loop so tasks interleave even when running flat out
+        await asyncio.sleep(max(wait(i), 0.0))
+        level, message, extras = workload[i % size]
+        start = time.perf_counter_ns()
+        logger.log(level, message, **extras)
+        end = time.perf_counter_ns()
+        starts.append(start)
+        durations.append(end - start)
+        if end > deadline:
+            break
+    return samples
+
+
+def _deadline(duration: float | None) -> float:
+    return time.perf_counter_ns() + duration * 1e9 if duration else float("inf")
+
+
+def _process_worker(
+    config: dict[str, Any], workload: list[Message], records: int, rate: float, duration: float | None, rotate: float
+) -> Samples:
+    """Entry point of one worker process: build the handlers and run synchronously."""
+    logger, handlers = build_logger(LoggingConfig.from_kwargs(**config))
+    try:
+        with Rotator(_file_handlers(handlers), rotate) as rotator:
+            samples = _run_sync(logger, workload, records, rate, _deadline(duration))
+        samples.rotations = rotator.intervals
+        return samples
+    finally:
+        release_handlers(handlers)
+
+
+def run_load(
+    config: LoggingConfig,
+    workload: list[Message],
+    mode: str = "threads",
+    workers: int = 4,
+    records: int = 10_000,
+    rate: float = 0.0,
+    duration: float | None = None,
+    rotate_interval: float = 0.0,
+) -> tuple[Samples, float]:
+    """Run the load and return the collected samples plus the wall time in seconds.
+
+    Args:
+        config: Logging configuration whose handlers receive the load
+        workload: Messages cycled by every worker
+        mode: "threads", "asyncio" or "processes"
+        workers: Number of threads, tasks or processes
+        records: Records sent per worker (upper bound when ``duration`` is set)
+        rate: Target total records per second (0: flat out)
+        duration: Optional time limit in seconds
+        rotate_interval: Force JSON file rotation every N seconds (0: never)
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in MODES:
+        raise ValueError(f"Invalid mode: {mode!r} (expected one of {MODES})")
+    per_worker_rate = rate / workers if rate > 0 else 0.0
+    total = Samples()
+    started = time.perf_counter()
+
+    if mode == "processes":
+        # spawn: workers build their own handlers; never fork a process holding handler threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [
+                pool.submit(
+                    _process_worker, config.to_dict(), workload, records, per_worker_rate, duration, rotate_interval
+                )
+                for _ in range(workers)
+            ]
+            for future in futures:
+                total.extend(future.result())
+        return total, time.perf_counter() - started
+
+    logger, handlers = build_logger(config)
+    try:
+        with Rotator(_file_handlers(handlers), rotate_interval) as rotator:
+            results = _run_local(logger, workload, mode, workers, records, per_worker_rate, _deadline(duration))
+        elapsed = time.perf_counter() - started
+        for result in results:
+            total.extend(result)
+        total.rotations = rotator.intervals
+        return total, elapsed
+    finally:
+        release_handlers(handlers)
+
+
+def _run_local(
+    logger: logging.Logger,
+    workload: list[Message],
+    mode: str,
+    workers: int,
+    records: int,
+    rate: float,
+    deadline: float,
+) -> list[Samples]:
+    """Run the workers as threads or asyncio tasks of this process."""
+    if mode == "asyncio":
+
+        async def gather() -> list[Samples]:
+            tasks = [_run_task(logger, workload, records, rate, deadline) for _ in range(workers)]
+            return list(await asyncio.gather(*tasks))
+
+        return asyncio.run(gather())
+
+    results = [Samples() for _ in range(workers)]
+
+    def work(index: int) -> None:
+        results[index] = _run_sync(logger, workload, records, rate, deadline)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def percentiles(durations: list[int] | array) -> dict[str, float]:
+    """Return count, p50, p99, p999 and max of durations, in microseconds."""
+    ordered = sorted(durations)
+    if not ordered:
+        return {"count": 0, "p50_us": 0.0, "p99_us": 0.0, "p999_us": 0.0, "max_us": 0.0}
+    n = len(ordered)
+
+    def pick(q: float) -> float:
+        return ordered[min(int(q * n), n - 1)] / 1000
+
+    return {"count": n, "p50_us": pick(0.5), "p99_us": pick(0.99), "p999_us": pick(0.999), "max_us": ordered[-1] / 1000}
+
+
+def split_by_rotation(samples: Samples, margin_ns: int) -> tuple[list[int], list[int]]:
+    """Split call durations into (near a rotation, elsewhere)."""
+    rotations = sorted(samples.rotations)
+    if not rotations:
+        return [], list(samples.durations)
+    starts = [start - margin_ns for start, _ in rotations]
+    ends = [end + margin_ns for _, end in rotations]
+    near, steady = [], []
+    for call_start, duration in zip(samples.starts, samples.durations, strict=True):
+        index = bisect_right(starts, call_start + duration) - 1
+        if index >= 0 and ends[index] >= call_start:
+            near.append(duration)
+        else:
+            steady.append(duration)
+    return near, steady
+
+
+def summarize(samples: Samples, elapsed: float, margin_ms: float = 5.0) -> dict[str, Any]:
+    """Build the report: throughput and latency percentiles, overall and around rotations."""
+    near, steady = split_by_rotation(samples, int(margin_ms * 1e6))
+    return {
+        "records": len(samples.durations),
+        "elapsed_s": elapsed,
+        "throughput_per_s": len(samples.durations) / elapsed if elapsed else 0.0,
+        "rotations": len(samples.rotations),  # forced via rotate_now(), not the handlers' schedule
+        "latency": percentiles(samples.durations),
+        "latency_near_rotation": percentiles(near),
+        "latency_steady": percentiles(steady),
+    }
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    lines = [
+        f"{summary['records']} records in {summary['elapsed_s']:.2f}s "
+        f"({summary['throughput_per_s']:,.0f}/s), {summary['rotations']} rotations forced via rotate_now()",
+        "",
+        f"{'latency (us)':<16}{'count':>10}{'p50':>10}{'p99':>10}{'p999':>10}{'max':>12}",
+    ]
+    for label, key in (("all", "latency"), ("steady", "latency_steady"), ("near rotation", "latency_near_rotation")):
+        stats = summary[key]
+        lines.append(
+            f"{label:<16}{stats['count']:>10}{stats['p50_us']:>10.1f}{stats['p99_us']:>10.1f}"
+            f"{stats['p999_us']:>10.1f}{stats['max_us']:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, help="JSON file of LoggingConfig fields")
+    parser.add_argument("--mode", choices=MODES, default="threads")
+    parser.add_argument("--workers", type=int, default=4, help="threads, tasks or processes")
+    parser.add_argument("--records", type=int, default=10_000, help="records per worker")
+    parser.add_argument("--rate", type=float, default=0.0, help="target total records/s (0: flat out)")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--replay", type=Path, help="JSONL log file to replay as the workload")
+    parser.add_argument("--rotate-interval", type=float, default=0.0, help="force JSON file rotation every N s")
+    parser.add_argument("--rotation-margin-ms", type=float, default=5.0, help="window around rotations")
+    parser.add_argument("--output", type=Path, help="write the JSON summary to this file")
+    args = parser.parse_args(argv)
+
+    workload = replay_workload(args.replay) if args.replay else synthetic_workload()
+    with tempfile.TemporaryDirectory(prefix="arlogi-loadgen-") as tmp:
+        if args.config:
+            config = LoggingConfig.from_kwargs(**json.loads(args.config.read_text(encoding="utf-8")))
+        else:
+            config = LoggingConfig(json_file_name=str(Path(tmp) / "load.jsonl"), json_file_only=True)
+        samples, elapsed = run_load(
+            config,
+            workload,
+            mode=args.mode,
+            workers=args.workers,
+            records=args.records,
+            rate=args.rate,
+            duration=args.duration,
+            rotate_interval=args.rotate_interval,
+        )
+    summary = summarize(samples, elapsed, args.rotation_margin_ms)
+    summary["parameters"] = {
+        "mode": args.mode,
+        "workers": args.workers,
+        "rate": args.rate,
+        "workload": str(args.replay) if args.replay else "synthetic",
+        "config": config.to_dict(),
+    }
+    print(format_summary(summary))
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2, default=str) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Benchmark runner: time and allocation measurement plus machine-readable results.
+
+Every case is measured twice, once through arlogi and once through an
+equivalent stdlib ``logging`` setup writing to the same kind of sink, so the
+``ratio`` column shows what arlogi costs on top of plain logging.
+
+Per case the runner reports:
+
+* ``ns``: nanoseconds per call (best of ``--repeats`` loops, minus the
+  cost of an empty call);
+* ``peak_bytes``: transient memory allocated while one call runs
+  (tracemalloc peak above the starting point, averaged over calls);
+* ``retained_bytes``: memory still held after the calls (leaks, caches).
+
+Results are written as JSON (``--output``) so runs can be compared release to
+release; ``--compare`` prints the change against an earlier results file.
+
+Usage:
+    uv run python -m benchmarks.runner [--only NAME ...] [--output results.json] [--compare old.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# setup(workdir) -> (call, teardown)
+Setup = Callable[[Path], tuple[Callable[[], None], Callable[[], None]]]
+
+
+@dataclass(frozen=True)
+class Case:
+    """One logging path, measured through arlogi and a stdlib baseline."""
+
+    name: str
+    description: str
+    arlogi: Setup
+    stdlib: Setup
+
+
+def _loop_ns(call: Callable[[], None], iterations: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def _noop() -> None:
+    pass
+
+
+def time_call(call: Callable[[], None], iterations: int, repeats: int) -> float:
+    """Return nanoseconds per call: the best of ``repeats`` loops, minus call overhead."""
+    call()  # warm caches (lazy imports, first-record setup)
+    overhead = min(_loop_ns(_noop, iterations) for _ in range(repeats))
+    best = min(_loop_ns(call, iterations) for _ in range(repeats))
+    return max(best - overhead, 0.0)
+
+
+def measure_allocations(call: Callable[[], None], calls: int) -> dict[str, float]:
+    """Return transient (peak) and retained bytes per call, measured with tracemalloc."""
+    call()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        peak_total = 0
+        for _ in range(calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes": peak_total / calls, "retained_bytes": max(current - baseline, 0) / calls}
+
+
+def measure_side(setup: Setup, workdir: Path, iterations: int, repeats: int, alloc_calls: int) -> dict[str, float]:
+    """Measure one side (arlogi or stdlib) of a case."""
+    call, teardown = setup(workdir)
+    try:
+        result = {"ns": time_call(call, iterations, repeats)}
+        result.update(measure_allocations(call, alloc_calls))
+        return result
+    finally:
+        teardown()
+
+
+def run_cases(
+    cases: list[Case], iterations: int = 20_000, repeats: int = 5, alloc_calls: int = 200
+) -> list[dict[str, Any]]:
+    """Measure every case through arlogi and its stdlib baseline."""
+    results = []
+    for case in cases:
+        with tempfile.TemporaryDirectory(prefix=f"arlogi-bench-{case.name}-") as tmp:
+            arlogi = measure_side(case.arlogi, Path(tmp) / "arlogi", iterations, repeats, alloc_calls)
+            stdlib = measure_side(case.stdlib, Path(tmp) / "stdlib", iterations, repeats, alloc_calls)
+        results.append(
+            {
+                "name": case.name,
+                "description": case.description,
+                "arlogi": arlogi,
+                "stdlib": stdlib,
+                "ratio": arlogi["ns"] / stdlib["ns"] if stdlib["ns"] else None,
+            }
+        )
+    return results
+
+
+def environment() -> dict[str, str]:
+    """Describe the interpreter and package version the results belong to."""
+    try:
+        from importlib.metadata import version
+
+        arlogi_version = version("arlogi")
+    except Exception:
+        arlogi_version = "unknown"
+    return {
+        "arlogi": arlogi_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def format_table(results: list[dict[str, Any]], previous: dict[str, dict[str, Any]] | None = None) -> str:
+    """Render results as a table; with ``previous``, add the change in arlogi ns/call."""
+    header = f"{'case':<24}{'arlogi ns':>12}{'stdlib ns':>12}{'ratio':>8}{'peak B':>10}{'stdlib B':>10}"
+    if previous is not None:
+        header += f"{'vs prev':>10}"
+    lines = [header]
+    for result in results:
+        ratio = f"{result['ratio']:.2f}" if result["ratio"] is not None else "-"
+        line = (
+            f"{result['name']:<24}{result['arlogi']['ns']:>12.0f}{result['stdlib']['ns']:>12.0f}{ratio:>8}"
+            f"{result['arlogi']['peak_bytes']:>10.0f}{result['stdlib']['peak_bytes']:>10.0f}"
+        )
+        if previous is not None:
+            old = previous.get(result["name"])
+            if old and old["arlogi"]["ns"]:
+                line += f"{(result['arlogi']['ns'] / old['arlogi']['ns'] - 1) * 100:>+9.1f}%"
+            else:
+                line += f"{'new':>10}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from benchmarks.bench_paths import CASES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=[case.name for case in CASES], help="cases to run")
+    parser.add_argument("--iterations", type=int, default=20_000, help="calls per timing loop")
+    parser.add_argument("--repeats", type=int, default=5, help="timing loops per case (best is kept)")
+    parser.add_argument("--alloc-calls", type=int, default=200, help="calls traced for allocations")
+    parser.add_argument("--output", type=Path, help="write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="earlier JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.only or case.name in args.only]
+    results = run_cases(cases, args.iterations, args.repeats, args.alloc_calls)
+
+    previous = None
+    if args.compare:
+        previous = {r["name"]: r for r in json.loads(args.compare.read_text(encoding="utf-8"))["results"]}
+    print(format_table(results, previous))
+
+    if args.output:
+        payload = {"environment": environment(), "results": results}
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
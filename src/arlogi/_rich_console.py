@@ -0,0 +1,260 @@
+"""Rich-based colored console handler.
+
+Kept apart from :mod:`arlogi.handlers` so that importing arlogi (and using its
+Rich-free handlers) never imports Rich. Import it as
+``arlogi.handlers.ColoredConsoleHandler``; the name is resolved lazily.
+"""
+
+import copy
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any
+
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.text import Text
+
+from .handlers import _find_project_root
+from .records import PATH_FIELDS, format_record, record_memo, record_message
+from .redaction import EXC_REDACTED
+from .selfmetrics import MeteredHandlerMixin
+
+
+class ColoredConsoleHandler(MeteredHandlerMixin, RichHandler):
+    """A logging handler that uses rich for colored console output.
+
+    Features:
+    - Automatic project root detection for relative file paths (lazy, cached)
+    - Customizable color schemes per log level
+    - Rich traceback support
+    - Compact single-character level indicators (T, D, I, W, E, C)
+    - Per-record fast path: memoized relative paths, prebuilt level Text,
+      markup parsing skipped for messages without markup characters
+    - Message and exception text computed once per record and shared with
+      the other arlogi handlers it reaches; the exception is not formatted
+      as text when a Rich traceback replaces it
+
+    Self-metrics count the formatted text; a Rich traceback is rendered by
+    Rich and only its record's message is counted. An exception whose text
+    had secrets redacted is printed as that text instead of a Rich
+    traceback, which would show the raw values.
+    """
+
+    # Class-level cache for project root to avoid repeated filesystem operations
+    _project_root_cache: str | None = None
+
+    def __init__(
+        self,
+        show_time: bool = False,
+        show_level: bool = True,
+        show_path: bool = True,
+        level_styles: dict[str, str] | None = None,
+        project_root: str | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ):
+        """Initialize the colored console handler.
+
+        Args:
+            show_time: Whether to show timestamps in output
+            show_level: Whether to show log levels
+            show_path: Whether to show file paths
+            level_styles: Custom color styles per level (e.g., {"info": "blue"})
+            project_root: Project root for relative path calculation
+            *args: Additional positional arguments for RichHandler
+            **kwargs: Additional keyword arguments for RichHandler
+        """
+        # Default level styles: INFO is lighter (grey75) than DEBUG/TRACE (grey37)
+        default_styles = {
+            "trace": "grey37",
+            "debug": "grey37",
+            "info": "grey75",
+            "warning": "yellow",
+            "error": "red",
+            "critical": "bold red",
+        }
+        if level_styles:
+            default_styles.update(level_styles)
+
+        # Default to a console that supports colors and directed to stdout
+        if "console" not in kwargs:
+            kwargs["console"] = Console(force_terminal=True, file=sys.stdout)
+
+        # Enable rich tracebacks by default for enhanced error display
+        kwargs.setdefault("rich_tracebacks", True)
+        kwargs.setdefault("markup", True)
+
+        super().__init__(
+            *args,
+            show_time=show_time,
+            show_level=show_level,
+            show_path=show_path,
+            **kwargs,
+        )
+
+        # Set level styles after initialization (for compatibility with older rich versions)
+        self.level_styles = default_styles
+
+        # Project root for relative path calculation; detected on first use
+        self.project_root = project_root
+
+    def _find_project_root(self) -> str:
+        """Find the project root by looking for common indicators.
+
+        Result is cached at class level to avoid repeated filesystem operations.
+
+        Returns:
+            The absolute path to the project root, or current directory if not found
+        """
+        return _find_project_root(ColoredConsoleHandler)
+
+    @property
+    def project_root(self) -> str:
+        """Project root used for relative paths, detected (and cached) on first access."""
+        if self._project_root is None:
+            self._project_root = self._find_project_root()
+        return self._project_root
+
+    @project_root.setter
+    def project_root(self, project_root: str | None) -> None:
+        self._project_root = project_root
+        self._relpath_cache: dict[str, str] = {}
+
+    @property
+    def record_fields(self) -> frozenset[str]:
+        """Optional LogRecord fields this handler reads (see arlogi.records)."""
+        return PATH_FIELDS if self._log_render.show_path else frozenset()
+
+    @property
+    def level_styles(self) -> dict[str, str]:
+        """Color styles per lowercase level name."""
+        return self._level_styles
+
+    @level_styles.setter
+    def level_styles(self, styles: dict[str, str]) -> None:
+        self._level_styles = styles
+        # Prebuilt level Text objects depend on the styles; rebuild lazily.
+        self._level_text_cache: dict[str, Text] = {}
+
+    def _relative_path(self, pathname: str) -> str:
+        """Return the path of a source file relative to the project root (memoized)."""
+        path = self._relpath_cache.get(pathname)
+        if path is None:
+            try:
+                path = os.path.relpath(pathname, self.project_root)
+            except (ValueError, OSError):
+                # Fallback to filename if relative path calculation fails
+                return os.path.basename(pathname)
+            self._relpath_cache[pathname] = path
+        return path
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record, as plain text if its exception text was redacted."""
+        if record.exc_info and record_memo(record).get(EXC_REDACTED):
+            record = copy.copy(record)
+            record.exc_info = None
+        super().emit(record)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the message and exception text other handlers produced."""
+        if self.rich_tracebacks and record.exc_info and record.exc_info != (None, None, None):
+            # RichHandler.emit renders the traceback and discards this text for
+            # the bare message: skip formatting the exception
+            text = record_message(record)
+        elif self.formatter is not None and type(self.formatter) is not logging.Formatter:
+            return super().format(record)
+        else:
+            text = format_record(record, self.formatter)
+        self._count_bytes(text)
+        return text
+
+    def render(
+        self,
+        *,
+        record: logging.LogRecord,
+        traceback: Any,
+        message_renderable: Any,
+    ) -> Any:
+        """Override render method to show relative paths from project root.
+
+        Args:
+            record: The log record to render
+            traceback: Optional traceback information
+            message_renderable: The formatted message
+
+        Returns:
+            A renderable object for Rich to display
+        """
+        # Calculate relative path instead of just filename
+        path = self._relative_path(record.pathname)
+
+        level = self.get_level_text(record)
+        time_format = None if self.formatter is None else self.formatter.datefmt
+        log_time = datetime.fromtimestamp(record.created)
+
+        log_renderable = self._log_render(
+            self.console,
+            [message_renderable] if not traceback else [message_renderable, traceback],
+            log_time=log_time,
+            time_format=time_format,
+            level=level,
+            path=path,
+            line_no=record.lineno,
+            link_path=None,  # Disable links to avoid file:// URLs
+        )
+        return log_renderable
+
+    def get_level_text(self, record: logging.LogRecord) -> Any:
+        """Get level text as a single character with styling.
+
+        The styled Text is built once per level name and reused.
+
+        Args:
+            record: The log record
+
+        Returns:
+            A Rich Text object with the level character
+        """
+        level_name = record.levelname
+        level_text = self._level_text_cache.get(level_name)
+        if level_text is None:
+            # Map TRACE to T, DEBUG to D, etc.
+            char = level_name[0]
+            style = self.level_styles.get(level_name.lower(), "default")
+            # Compact single character indicator
+            level_text = self._level_text_cache[level_name] = Text(f"{char} ", style=style)
+        return level_text
+
+    def render_message(self, record: logging.LogRecord, message: str) -> Any:
+        """Render message text with level-specific styling.
+
+        Messages without ``[`` (markup) or ``:`` (emoji codes) skip the markup
+        parser; Rich would produce the same plain Text for them.
+
+        Args:
+            record: The log record
+            message: The message to render
+
+        Returns:
+            A Rich Text object with the styled message
+        """
+        use_markup = getattr(record, "markup", self.markup)
+        if use_markup and ("[" in message or ":" in message):
+            message_text = Text.from_markup(message)
+        else:
+            message_text = Text(message)
+
+        highlighter = getattr(record, "highlighter", self.highlighter)
+        if highlighter:
+            message_text = highlighter(message_text)
+
+        if self.keywords is None:
+            self.keywords = self.KEYWORDS
+        if self.keywords:
+            message_text.highlight_words(self.keywords, "logging.keyword")
+
+        # Apply style to the entire message text
+        message_text.style = self.level_styles.get(record.levelname.lower(), "default")
+        return message_text
@@ -0,0 +1,248 @@
+"""Per-handler circuit breaker for slow or failing sinks.
+
+CircuitBreakerHandler wraps another handler and watches its emit latency and
+failures. When the sink exceeds its latency or error budget the breaker opens:
+records bypass the sink and are spilled into a bounded in-memory buffer (or
+skipped) instead of blocking the application behind a hung collector or a
+stalled disk. After ``reset_timeout`` one record probes the sink; if it
+succeeds the breaker closes and the spilled records are replayed.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Literal
+
+from .records import handler_fields
+from .selfmetrics import count_suppressed, handler_label
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# Every live breaker, for monitoring via get_breaker_states()
+_breakers: "weakref.WeakSet[CircuitBreakerHandler]" = weakref.WeakSet()
+
+
+class CircuitBreakerHandler(logging.Handler):
+    """Wrap a handler with a latency/error circuit breaker.
+
+    The breaker trips after ``failure_threshold`` consecutive failed emits or
+    ``slow_threshold`` consecutive emits slower than ``latency_budget``. Only
+    the first failure of a streak reaches the wrapped handler's
+    ``handleError``, so a dead sink prints one traceback, not one per record.
+
+    An emit that never returns cannot be timed, but the records queued behind
+    it can: a record that waits longer than ``stall_timeout`` for the sink's
+    lock opens the breaker, so later records bypass the hung sink instead of
+    piling up on its lock. The thread stuck inside the sink stays stuck.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        latency_budget: float = 0.25,
+        slow_threshold: int = 3,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        spill_size: int = 1_000,
+        stall_timeout: float | None = None,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            handler: The sink handler to protect
+            latency_budget: Seconds an emit may take before it counts as slow
+            slow_threshold: Consecutive slow emits that open the breaker
+            failure_threshold: Consecutive failed emits that open the breaker
+            reset_timeout: Seconds the breaker stays open before probing the sink
+            spill_size: Records buffered while open (0 skips them instead)
+            stall_timeout: Seconds a record waits for a sink busy in another
+                thread before the breaker opens (default: latency_budget * slow_threshold)
+        """
+        super().__init__(handler.level)
+        self.handler = handler
+        self.latency_budget = latency_budget
+        self.slow_threshold = slow_threshold
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stall_timeout = latency_budget * slow_threshold if stall_timeout is None else stall_timeout
+
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._streak_reported = False
+        self._local = threading.local()
+        self._spill: deque[logging.LogRecord] = deque(maxlen=max(spill_size, 0))
+        self._state_lock = threading.Lock()
+
+        self.trips = 0
+        self.stalls = 0
+        self.skipped = 0
+        self.spilled = 0
+        self.replayed = 0
+
+        # Route the sink's error reporting through the breaker.
+        self._sink_handle_error = handler.handleError
+        handler.handleError = self._on_sink_error  # type: ignore[method-assign]
+        _breakers.add(self)
+
+    def _now(self) -> float:
+        """Monotonic clock; test seam mirroring JSONFileHandler._now_local."""
+        return time.monotonic()
+
+    @property
+    def state(self) -> BreakerState:
+        """Current breaker state: "closed", "open" or "half_open"."""
+        return self._state
+
+    @property
+    def record_fields(self) -> frozenset[str] | None:
+        """Optional LogRecord fields the wrapped sink reads (see arlogi.records)."""
+        return handler_fields(self.handler)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the breaker state and counters, for monitoring."""
+        return {
+            "handler": type(self.handler).__name__,
+            "state": self._state,
+            "trips": self.trips,
+            "stalls": self.stalls,
+            "consecutive_failures": self._consecutive_failures,
+            "consecutive_slow": self._consecutive_slow,
+            "skipped": self.skipped,
+            "spilled": self.spilled,
+            "buffered": len(self._spill),
+            "replayed": self.replayed,
+        }
+
+    def _on_sink_error(self, record: logging.LogRecord) -> None:
+        """Replacement for the sink's handleError: note the failure, report the first of a streak.
+
+        Reporting happens here, inside the sink's ``except`` block, because the
+        stdlib handleError reads the exception being handled.
+        """
+        self._local.failed = True
+        with self._state_lock:
+            report = self._state == "closed" and not self._streak_reported
+            self._streak_reported = True
+        if report:
+            self._sink_handle_error(record)
+
+    def _bypass(self, record: logging.LogRecord) -> None:
+        """Spill (or skip) a record while the breaker is open."""
+        if self._spill.maxlen:
+            self._spill.append(record)
+            self.spilled += 1
+        else:
+            self.skipped += 1
+            count_suppressed("dropped", handler_label(self.handler))
+
+    def _allow(self) -> bool:
+        """Return True when a record may go to the sink (closed, or the probe when half-open)."""
+        if self._state == "closed":
+            return True
+        with self._state_lock:
+            if self._state == "open" and self._now() - self._opened_at >= self.reset_timeout:
+                self._state = "half_open"
+                return True  # this record is the probe
+            return False
+
+    def _trip(self) -> None:
+        self._state = "open"
+        self._opened_at = self._now()
+        self.trips += 1
+
+    def handle(self, record: logging.LogRecord) -> logging.LogRecord | bool:
+        """Send the record to the sink unless the breaker is open."""
+        rv = self.filter(record)
+        if not rv:
+            return rv
+        if not self._allow():
+            self._bypass(record)
+            return rv
+
+        probing = self._state == "half_open"
+        self._local.failed = False
+        start = self._now()
+        lock = self.handler.lock
+        if lock is not None and not lock.acquire(timeout=self.stall_timeout):
+            self._stalled(record)
+            return rv
+        try:
+            self.handler.handle(record)  # re-enters the sink's RLock
+        finally:
+            if lock is not None:
+                lock.release()
+        elapsed = self._now() - start
+        failed = self._local.failed
+
+        with self._state_lock:
+            self._record_outcome(failed, elapsed, probing)
+        if probing and self._state == "closed":
+            self._replay()
+        return rv
+
+    def _stalled(self, record: logging.LogRecord) -> None:
+        """Open the breaker after a record timed out waiting for a sink held by another thread."""
+        with self._state_lock:
+            self.stalls += 1
+            if self._state != "open":
+                self._trip()
+        self._bypass(record)
+
+    def _record_outcome(self, failed: bool, elapsed: float, probing: bool) -> None:
+        """Update counters after an emit and open/close the breaker (state lock held)."""
+        slow = elapsed > self.latency_budget
+        if not failed:
+            self._streak_reported = False
+        self._consecutive_failures = self._consecutive_failures + 1 if failed else 0
+        self._consecutive_slow = self._consecutive_slow + 1 if slow else 0
+
+        if probing:
+            if failed or slow:
+                self._trip()
+            else:
+                self._state = "closed"
+        elif self._state == "closed" and (
+            self._consecutive_failures >= self.failure_threshold or self._consecutive_slow >= self.slow_threshold
+        ):
+            self._trip()
+
+    def _replay(self) -> None:
+        """Send spilled records to the recovered sink, oldest first."""
+        while self._spill and self._state == "closed":
+            try:
+                record = self._spill.popleft()
+            except IndexError:
+                return
+            self.handler.handle(record)
+            self.replayed += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit directly through the sink (handle() applies the breaker)."""
+        self.handler.emit(record)
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        """Set the formatter on the wrapped sink."""
+        self.handler.setFormatter(fmt)
+
+    def flush(self) -> None:
+        """Flush the sink unless the breaker is open (a hung sink must not block)."""
+        if self._state != "open":
+            self.handler.flush()
+
+    def close(self) -> None:
+        """Close the wrapped sink and unregister the breaker."""
+        try:
+            self.handler.handleError = self._sink_handle_error  # type: ignore[method-assign]
+            self.handler.close()
+        finally:
+            _breakers.discard(self)
+            super().close()
+
+
+def get_breaker_states() -> list[dict[str, Any]]:
+    """Return stats() of every live circuit breaker, for monitoring endpoints."""
+    return [breaker.stats() for breaker in list(_breakers)]
@@ -6,11 +6,16 @@ following the Builder pattern for flexible construction.
 
 import logging
 import os
+import re
 import sys
 from dataclasses import dataclass
 from typing import Any, Literal
 
+from .payload import PayloadLimits
+
 RotateSchedule = Literal["hour", "day", "week", "month"]
+ConsoleRenderer = Literal["auto", "rich", "plain"]
+SyslogTransport = Literal["stdlib", "stream"]
 
 
 @dataclass(frozen=True)
@@ -24,11 +29,27 @@ class LoggingConfig:
         json_file_only: If True, only output to JSON (no console)
         use_syslog: Enable syslog output
         syslog_address: Syslog server address (default: "/dev/log")
+        syslog_transport: "stdlib" (SysLogHandler) or "stream" (batched RFC 5424
+            over TCP/Unix stream sockets with octet-counting framing; requires an
+            explicit syslog_address)
         rotate_schedule: Optional time-window schedule for file rotation
         rotate_retention_count: Optional retention count for rotated files
         show_time: Show timestamps in console output
         show_level: Show log levels in console output
         show_path: Show file paths in console output
+        console_renderer: Console backend: "rich", "plain", or "auto" (Rich only
+            when stdout is a TTY)
+        defer_handlers: Build each handler only when the first record reaches it
+        circuit_breaker: Wrap each handler in a CircuitBreakerHandler so a slow or
+            failing sink is bypassed instead of blocking every logging call
+        self_metrics: Collect pipeline self-metrics (see arlogi.selfmetrics)
+        profile_log_volume: Attribute log volume to call sites (see arlogi.profiler)
+        lean_records: Capture only the LogRecord fields the handlers need (see arlogi.records)
+        exception_dedup_window: Seconds during which repeated tracebacks are logged once (None: off; see arlogi.dedup)
+        payload_limits: Size budgets for JSON records, PayloadLimits field -> value (None: no limits; see arlogi.payload)
+        redact: Mask secrets in messages and extras before any sink (see arlogi.redaction)
+        redact_keys: Secret field names added to the redaction defaults (implies redact)
+        redact_patterns: Regular expressions added to the redaction defaults (implies redact)
     """
 
     level: int | str = logging.INFO
@@ -37,11 +58,23 @@ class LoggingConfig:
     json_file_only: bool = False
     use_syslog: bool = False
     syslog_address: str | tuple[str, int] = "/dev/log"
+    syslog_transport: SyslogTransport = "stdlib"
     rotate_schedule: RotateSchedule | None = None
     rotate_retention_count: int | None = None
     show_time: bool = False
     show_level: bool = True
     show_path: bool = True
+    console_renderer: ConsoleRenderer = "auto"
+    defer_handlers: bool = False
+    circuit_breaker: bool = False
+    self_metrics: bool = False
+    profile_log_volume: bool = False
+    lean_records: bool = True
+    exception_dedup_window: float | None = None
+    payload_limits: dict[str, int] | None = None
+    redact: bool = False
+    redact_keys: list[str] | None = None
+    redact_patterns: list[str] | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -50,10 +83,7 @@ class LoggingConfig:
 
         # Validate module levels if provided
         if self.module_levels:
-            for name, m_level in self.module_levels.items():
-                if not isinstance(name, str) or not name:
-                    raise ValueError(f"Invalid module name: {name!r}")
-                self._validate_level(m_level)
+            self._validate_module_levels(self.module_levels)
 
         # Validate rotation schedule
         if self.rotate_schedule is not None:
@@ -64,10 +94,56 @@ class LoggingConfig:
                     f"Valid values: {', '.join(sorted(valid_schedules))}"
                 )
 
+        # Validate syslog transport
+        if self.syslog_transport not in ("stdlib", "stream"):
+            raise ValueError(f"Invalid syslog_transport: {self.syslog_transport!r}. Valid values: stdlib, stream")
+        if self.syslog_transport == "stream" and self.syslog_address == "/dev/log":
+            # /dev/log is a datagram socket: a stream connect would fail forever and drop every record
+            raise ValueError(
+                'syslog_transport="stream" needs an explicit syslog_address: a (host, port) tuple '
+                "or the path of a Unix stream socket (/dev/log is a datagram socket)"
+            )
+
+        # Validate console renderer
+        if self.console_renderer not in ("auto", "rich", "plain"):
+            raise ValueError(f"Invalid console_renderer: {self.console_renderer!r}. Valid values: auto, plain, rich")
+
         # Validate rotation retention count
         if self.rotate_retention_count is not None and self.rotate_retention_count < 1:
             raise ValueError("rotate_retention_count must be >= 1 when provided")
 
+        self._validate_record_processing()
+
+    def _validate_record_processing(self) -> None:
+        """Validate the options of the per-record stages (dedup, payload limits, redaction).
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        if self.exception_dedup_window is not None and self.exception_dedup_window <= 0:
+            raise ValueError("exception_dedup_window must be positive when provided")
+
+        if self.payload_limits is not None:
+            PayloadLimits.from_dict(self.payload_limits)
+
+        for pattern in self.redact_patterns or ():
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid redact pattern {pattern!r}: {e}") from e
+
+    @classmethod
+    def _validate_module_levels(cls, module_levels: dict[str, str | int]) -> None:
+        """Validate module names and their log levels.
+
+        Raises:
+            ValueError: If a module name or level is invalid
+        """
+        for name, m_level in module_levels.items():
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"Invalid module name: {name!r}")
+            cls._validate_level(m_level)
+
     @staticmethod
     def _validate_level(level: int | str) -> None:
         """Validate a log level value.
@@ -102,6 +178,26 @@ class LoggingConfig:
             return getattr(logging, self.level.upper())
         return self.level
 
+    @property
+    def resolved_payload_limits(self) -> PayloadLimits | None:
+        """Get the JSON payload limits as a PayloadLimits.
+
+        Returns:
+            The limits (defaults for missing keys), or None when unlimited
+        """
+        if self.payload_limits is None:
+            return None
+        return PayloadLimits.from_dict(self.payload_limits)
+
+    @property
+    def redaction_enabled(self) -> bool:
+        """Determine if records are redacted.
+
+        Returns:
+            True if redact is set or redaction keys or patterns are given
+        """
+        return bool(self.redact or self.redact_keys or self.redact_patterns)
+
     @property
     def show_console(self) -> bool:
         """Determine if console output should be shown.
@@ -154,11 +250,23 @@ class LoggingConfig:
             "json_file_only": self.json_file_only,
             "use_syslog": self.use_syslog,
             "syslog_address": self.syslog_address,
+            "syslog_transport": self.syslog_transport,
             "rotate_schedule": self.rotate_schedule,
             "rotate_retention_count": self.rotate_retention_count,
             "show_time": self.show_time,
             "show_level": self.show_level,
             "show_path": self.show_path,
+            "console_renderer": self.console_renderer,
+            "defer_handlers": self.defer_handlers,
+            "circuit_breaker": self.circuit_breaker,
+            "self_metrics": self.self_metrics,
+            "profile_log_volume": self.profile_log_volume,
+            "lean_records": self.lean_records,
+            "exception_dedup_window": self.exception_dedup_window,
+            "payload_limits": self.payload_limits,
+            "redact": self.redact,
+            "redact_keys": self.redact_keys,
+            "redact_patterns": self.redact_patterns,
         }
 
     @classmethod
@@ -189,11 +297,23 @@ class LoggingConfig:
             "json_file_only",
             "use_syslog",
             "syslog_address",
+            "syslog_transport",
             "rotate_schedule",
             "rotate_retention_count",
             "show_time",
             "show_level",
             "show_path",
+            "console_renderer",
+            "defer_handlers",
+            "circuit_breaker",
+            "self_metrics",
+            "profile_log_volume",
+            "lean_records",
+            "exception_dedup_window",
+            "payload_limits",
+            "redact",
+            "redact_keys",
+            "redact_patterns",
         }
 
         # Check for unknown keys to catch typos early
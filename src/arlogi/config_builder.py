@@ -28,11 +28,23 @@ class LoggingConfigBuilder:
         self._json_file_only = False
         self._use_syslog = False
         self._syslog_address: str | tuple[str, int] = "/dev/log"
+        self._syslog_transport = "stdlib"
         self._rotate_schedule: str | None = None
         self._rotate_retention_count: int | None = None
         self._show_time = False
         self._show_level = True
         self._show_path = True
+        self._console_renderer = "auto"
+        self._defer_handlers = False
+        self._circuit_breaker = False
+        self._self_metrics = False
+        self._profile_log_volume = False
+        self._lean_records = True
+        self._exception_dedup_window = None
+        self._payload_limits = None
+        self._redact = False
+        self._redact_keys = None
+        self._redact_patterns = None
 
     def with_level(self, level: str | int) -> "LoggingConfigBuilder":
         """Set the global log level.
@@ -101,11 +113,15 @@ class LoggingConfigBuilder:
         self._json_file_only = True
         return self
 
-    def with_syslog(self, address: str | tuple[str, int] = "/dev/log") -> "LoggingConfigBuilder":
+    def with_syslog(
+        self, address: str | tuple[str, int] = "/dev/log", transport: str = "stdlib"
+    ) -> "LoggingConfigBuilder":
         """Enable syslog output.
 
         Args:
             address: Syslog server address (default: "/dev/log" for Unix socket)
+            transport: "stdlib" (SysLogHandler) or "stream" (batched RFC 5424
+                over a persistent TCP/Unix stream connection)
 
         Returns:
             Self for method chaining
@@ -116,13 +132,21 @@ class LoggingConfigBuilder:
             >>>
             >>> # Remote syslog server
             >>> builder.with_syslog(("192.168.1.1", 514))
+            >>>
+            >>> # Remote collector over TCP with RFC 6587 framing
+            >>> builder.with_syslog(("192.168.1.1", 601), transport="stream")
         """
         self._use_syslog = True
         self._syslog_address = address
+        self._syslog_transport = transport
         return self
 
     def with_console_format(
-        self, show_time: bool = False, show_level: bool = True, show_path: bool = True
+        self,
+        show_time: bool = False,
+        show_level: bool = True,
+        show_path: bool = True,
+        renderer: str = "auto",
     ) -> "LoggingConfigBuilder":
         """Configure console output format.
 
@@ -130,6 +154,8 @@ class LoggingConfigBuilder:
             show_time: Show timestamps in console output
             show_level: Show log levels (default: True)
             show_path: Show file paths (default: True)
+            renderer: Console backend: "rich", "plain", or "auto" (default: Rich
+                only when stdout is a TTY)
 
         Returns:
             Self for method chaining
@@ -140,6 +166,7 @@ class LoggingConfigBuilder:
         self._show_time = show_time
         self._show_level = show_level
         self._show_path = show_path
+        self._console_renderer = renderer
         return self
 
     def with_rotation(self, schedule: str, retention_count: int | None = None) -> "LoggingConfigBuilder":
@@ -159,6 +186,145 @@ class LoggingConfigBuilder:
         self._rotate_retention_count = retention_count
         return self
 
+    def with_deferred_handlers(self, enabled: bool = True) -> "LoggingConfigBuilder":
+        """Build handlers lazily, on the first record that reaches each of them.
+
+        Useful for short-lived CLI tools that may never log at all.
+
+        Args:
+            enabled: Whether handler construction is deferred (default: True)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_deferred_handlers()
+        """
+        self._defer_handlers = enabled
+        return self
+
+    def with_circuit_breaker(self, enabled: bool = True) -> "LoggingConfigBuilder":
+        """Protect every handler with a latency/error circuit breaker.
+
+        A sink that hangs or keeps failing is bypassed (its records spill to
+        a bounded buffer) until a periodic probe finds it healthy again.
+
+        Args:
+            enabled: Whether handlers are wrapped in circuit breakers (default: True)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_syslog(("collector", 601), transport="stream").with_circuit_breaker()
+        """
+        self._circuit_breaker = enabled
+        return self
+
+    def with_self_metrics(self, enabled: bool = True) -> "LoggingConfigBuilder":
+        """Collect self-metrics describing the cost of the logging pipeline.
+
+        Args:
+            enabled: Whether self-metrics are collected (default: True)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_self_metrics()
+        """
+        self._self_metrics = enabled
+        return self
+
+    def with_log_profiler(self, enabled: bool = True) -> "LoggingConfigBuilder":
+        """Attribute log volume to call sites and loggers.
+
+        Args:
+            enabled: Whether the call-site volume profiler runs (default: True)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_log_profiler()
+        """
+        self._profile_log_volume = enabled
+        return self
+
+    def with_lean_records(self, enabled: bool = True) -> "LoggingConfigBuilder":
+        """Capture only the LogRecord fields the configured handlers need.
+
+        Enabled by default; disable it when filters or third-party code read
+        caller information (pathname, lineno) that no handler formats.
+
+        Args:
+            enabled: Whether records are captured lean (default: True)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_lean_records(False)
+        """
+        self._lean_records = enabled
+        return self
+
+    def with_exception_dedup(self, window: float = 60.0) -> "LoggingConfigBuilder":
+        """Log each distinct traceback once per window.
+
+        Later records with the same exception fingerprint keep only the
+        ``exc_fingerprint`` and ``exc_occurrences`` fields.
+
+        Args:
+            window: Seconds during which repeated tracebacks are dropped (default: 60)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_exception_dedup(window=300)
+        """
+        self._exception_dedup_window = window
+        return self
+
+    def with_payload_limits(self, **limits: int) -> "LoggingConfigBuilder":
+        """Bound the size of JSON records.
+
+        Keys are PayloadLimits fields (max_message_length, max_value_length,
+        max_depth, max_items, max_record_bytes); missing ones use defaults.
+
+        Args:
+            **limits: Budgets overriding the PayloadLimits defaults
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_payload_limits(max_value_length=1024, max_record_bytes=16384)
+        """
+        self._payload_limits = limits
+        return self
+
+    def with_redaction(
+        self, keys: list[str] | None = None, patterns: list[str] | None = None
+    ) -> "LoggingConfigBuilder":
+        """Mask secrets in messages and extra fields before any sink sees them.
+
+        Args:
+            keys: Secret field names added to the defaults (password, token...)
+            patterns: Regular expressions added to the built-in patterns
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> builder.with_redaction(keys=["session_id"], patterns=[r"sk_live_\\w+"])
+        """
+        self._redact = True
+        self._redact_keys = list(keys) if keys else None
+        self._redact_patterns = list(patterns) if patterns else None
+        return self
+
     def build(self) -> LoggingConfig:
         """Build the LoggingConfig instance.
 
@@ -178,9 +344,21 @@ class LoggingConfigBuilder:
             json_file_only=self._json_file_only,
             use_syslog=self._use_syslog,
             syslog_address=self._syslog_address,
+            syslog_transport=self._syslog_transport,
             rotate_schedule=self._rotate_schedule,
             rotate_retention_count=self._rotate_retention_count,
             show_time=self._show_time,
             show_level=self._show_level,
             show_path=self._show_path,
+            console_renderer=self._console_renderer,
+            defer_handlers=self._defer_handlers,
+            circuit_breaker=self._circuit_breaker,
+            self_metrics=self._self_metrics,
+            profile_log_volume=self._profile_log_volume,
+            lean_records=self._lean_records,
+            exception_dedup_window=self._exception_dedup_window,
+            payload_limits=self._payload_limits,
+            redact=self._redact,
+            redact_keys=self._redact_keys,
+            redact_patterns=self._redact_patterns,
         )
@@ -0,0 +1,224 @@
+"""Exception fingerprinting and traceback deduplication.
+
+When a dependency goes down, every request logs the same multi-kilobyte
+traceback. With deduplication enabled, TraceLogger fingerprints the exception
+of each record carrying one (its type, the frames it went through and its
+chained causes) and, per fingerprint, lets only the first record of every
+``window`` seconds keep its traceback. All of them get two extra fields:
+
+* ``exc_fingerprint``: 16 hex digits, stable across processes and restarts
+  of the same code (messages, addresses and absolute paths are not hashed)
+* ``exc_occurrences``: occurrences of the fingerprint in the current window,
+  1 for the record that carries the full traceback
+
+JSON and RFC 5424 sinks export them like any extra field, so a pipeline can
+join later records back to the traceback. ``get_exception_counts()`` reports
+per-fingerprint totals, and self-metrics count each dropped traceback as a
+"throttled" record of source "dedup".
+
+Deduplication is opt-in. TraceLogger checks a single module global per record
+while it is disabled.
+
+Example:
+    >>> from arlogi.dedup import enable_exception_dedup, get_exception_counts
+    >>> enable_exception_dedup(window=60.0)
+    >>> get_exception_counts()["3f1c0e9a4b7d2a65"]
+    {'type': 'requests.exceptions.ConnectionError', 'count': 912, 'window_count': 37, ...}
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .selfmetrics import count_suppressed
+
+# Chained exceptions (__cause__ / __context__) included in a fingerprint
+_MAX_CHAIN = 5
+
+
+def _type_name(exc_type: type) -> str:
+    return f"{exc_type.__module__}.{exc_type.__qualname__}"
+
+
+def exception_fingerprint(exc: BaseException) -> str:
+    """Return a stable fingerprint of an exception's type, frames and causes.
+
+    Frames contribute their file name (without directories), function and
+    line, so the same failure raised from the same code gets the same
+    fingerprint on every host, while the message does not matter.
+
+    Args:
+        exc: The exception to fingerprint
+
+    Returns:
+        16 lowercase hex digits
+    """
+    import hashlib  # imported on first use: it loads OpenSSL, slowing `import arlogi`
+
+    digest = hashlib.blake2b(digest_size=8)
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen and len(seen) < _MAX_CHAIN:
+        seen.add(id(current))
+        digest.update(_type_name(type(current)).encode())
+        tb = current.__traceback__
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            digest.update(f"|{os.path.basename(code.co_filename)}:{code.co_name}:{tb.tb_lineno}".encode())
+            tb = tb.tb_next
+        digest.update(b"<")
+        current = current.__cause__ or (None if current.__suppress_context__ else current.__context__)
+    return digest.hexdigest()
+
+
+class _Fingerprint:
+    __slots__ = ("type", "count", "window_count", "window_start", "first_seen", "last_seen")
+
+    def __init__(self, type_name: str, now: float):
+        self.type = type_name
+        self.count = 0
+        self.window_count = 0
+        self.window_start = now
+        self.first_seen = now
+        self.last_seen = now
+
+
+class ExceptionDeduplicator:
+    """Keep the traceback of the first record per fingerprint and window.
+
+    At most ``capacity`` fingerprints are tracked; the least recently seen
+    one is forgotten when a new one arrives, so its next occurrence logs a
+    full traceback again.
+    """
+
+    def __init__(self, window: float = 60.0, capacity: int = 1000):
+        """Initialize the deduplicator.
+
+        Args:
+            window: Seconds during which repeated tracebacks are dropped
+            capacity: Maximum number of tracked fingerprints
+
+        Raises:
+            ValueError: If window or capacity is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window!r}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity!r}")
+        self.window = window
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._fingerprints: OrderedDict[str, _Fingerprint] = OrderedDict()
+
+    def _now(self) -> float:
+        """Wall clock; test seam mirroring LogVolumeProfiler._now."""
+        return time.time()
+
+    def observe(self, exc: BaseException, now: float | None = None) -> tuple[str, int]:
+        """Count one occurrence of an exception.
+
+        Args:
+            exc: The logged exception
+            now: Occurrence time (default: the deduplicator clock)
+
+        Returns:
+            The fingerprint and its occurrences in the current window
+            (1: the traceback should be logged)
+        """
+        fingerprint = exception_fingerprint(exc)
+        if now is None:
+            now = self._now()
+        with self._lock:
+            entry = self._fingerprints.get(fingerprint)
+            if entry is None:
+                entry = self._fingerprints[fingerprint] = _Fingerprint(_type_name(type(exc)), now)
+                if len(self._fingerprints) > self.capacity:
+                    self._fingerprints.popitem(last=False)
+            else:
+                self._fingerprints.move_to_end(fingerprint)
+                if now - entry.window_start >= self.window:
+                    entry.window_start = now
+                    entry.window_count = 0
+            entry.count += 1
+            entry.window_count += 1
+            entry.last_seen = now
+            return fingerprint, entry.window_count
+
+    def process(self, record: logging.LogRecord) -> None:
+        """Fingerprint a record's exception, dropping a repeated traceback."""
+        exc_info = record.exc_info
+        if not exc_info or exc_info[1] is None:
+            return
+        fingerprint, occurrences = self.observe(exc_info[1])
+        record.exc_fingerprint = fingerprint
+        record.exc_occurrences = occurrences
+        if occurrences > 1:
+            record.exc_info = None
+            record.exc_text = None
+            count_suppressed("throttled", "dedup")
+
+    def counts(self) -> dict[str, dict[str, Any]]:
+        """Return the tracked fingerprints, most recently seen last.
+
+        Returns:
+            fingerprint -> ``type`` (qualified exception class name), total
+            ``count``, ``window_count`` (occurrences in its current window)
+            and ``first_seen`` / ``last_seen`` (epoch seconds)
+        """
+        with self._lock:
+            return {
+                fingerprint: {
+                    "type": entry.type,
+                    "count": entry.count,
+                    "window_count": entry.window_count,
+                    "first_seen": entry.first_seen,
+                    "last_seen": entry.last_seen,
+                }
+                for fingerprint, entry in self._fingerprints.items()
+            }
+
+    def reset(self) -> None:
+        """Forget every fingerprint."""
+        with self._lock:
+            self._fingerprints.clear()
+
+
+# The active deduplicator; None while deduplication is disabled (the fast path).
+_active: ExceptionDeduplicator | None = None
+
+
+def enable_exception_dedup(window: float = 60.0, capacity: int = 1000) -> ExceptionDeduplicator:
+    """Start deduplicating tracebacks (replacing any active deduplicator).
+
+    Args:
+        window: Seconds during which repeated tracebacks are dropped
+        capacity: Maximum number of tracked fingerprints
+
+    Returns:
+        The active ExceptionDeduplicator
+    """
+    global _active
+    _active = ExceptionDeduplicator(window=window, capacity=capacity)
+    return _active
+
+
+def disable_exception_dedup() -> None:
+    """Stop deduplicating tracebacks and discard the counts."""
+    global _active
+    _active = None
+
+
+def get_exception_deduplicator() -> ExceptionDeduplicator | None:
+    """Return the active deduplicator, or None while deduplication is disabled."""
+    return _active
+
+
+def get_exception_counts() -> dict[str, dict[str, Any]]:
+    """Return the active deduplicator's per-fingerprint counts (empty while disabled)."""
+    deduplicator = _active
+    if deduplicator is None:
+        return {}
+    return deduplicator.counts()
@@ -6,11 +6,12 @@ and caller attribution features.
 """
 
 import logging
+import sys
 from typing import Any
 
+from . import dedup, profiler, records, redaction, selfmetrics
 from .config import LoggingConfig, get_default_level, is_test_mode
 from .handler_factory import HandlerFactory
-from .handlers import ArlogiSyslogHandler, JSONFileHandler, JSONHandler
 from .levels import TRACE_LEVEL_NUM, register_trace_level
 from .types import LoggerProtocol
 
@@ -34,8 +35,6 @@ class TraceLogger(logging.Logger):
             Tuple of (module_name, function_name)
         """
         try:
-            import sys
-
             # Stack frame offsets:
             # 0: _get_caller_info
             # 1: _process_params
@@ -113,7 +112,63 @@ class TraceLogger(logging.Logger):
         kwargs.setdefault("stacklevel", 2)
         return msg, kwargs
 
-    # Standard logging methods with caller attribution support
+    def _log(
+        self,
+        level: int,
+        msg: Any,
+        args: Any,
+        exc_info: Any = None,
+        extra: dict[str, Any] | None = None,
+        stack_info: bool = False,
+        stacklevel: int = 1,
+    ) -> None:
+        """Create a record holding what the handlers need and handle it.
+
+        Records are LeanLogRecords unless a handler's needs are unknown (see
+        arlogi.records); the caller lookup is skipped when nothing reads it.
+        ``stacklevel`` counts the public logging method as level 1.
+        """
+        fields = records.needed_fields(self, level)
+        if fields is None:
+            super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel + 1)
+            return
+        if profiler._active is not None:
+            fields = fields | profiler.RECORD_FIELDS
+
+        sinfo = None
+        if stack_info or not fields.isdisjoint(records.CALLER_FIELDS):
+            try:
+                fn, lno, func, sinfo = self.findCaller(stack_info, stacklevel + 1)
+            except ValueError:
+                fn, lno, func = "(unknown file)", 0, "(unknown function)"
+        else:
+            fn, lno, func = "(unknown file)", 0, "(unknown function)"
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = records.make_record(self.name, level, fn, lno, msg, args, exc_info, func, extra, sinfo, fields)
+        self.handle(record)
+
+    def callHandlers(self, record: logging.LogRecord) -> None:
+        """Pass a record to the handlers, counting, deduplicating and profiling it when enabled.
+
+        Redaction runs in the handlers' RedactionFilter (see arlogi.redaction).
+        """
+        metrics = selfmetrics._active
+        if metrics is not None:
+            metrics.count_record(record)
+        deduplicator = dedup._active
+        if deduplicator is not None and record.exc_info:
+            deduplicator.process(record)
+        volume_profiler = profiler._active
+        if volume_profiler is not None:
+            volume_profiler.observe(record)
+        super().callHandlers(record)
+
+    # Standard logging methods with caller attribution support. The level is
+    # checked first so that disabled calls skip parameter processing.
     def trace(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log a message with TRACE level (below DEBUG).
 
@@ -122,44 +177,56 @@ class TraceLogger(logging.Logger):
             *args: Format arguments for the message
             **kwargs: Optional caller_depth for caller attribution
         """
-        msg, kwargs = self._process_params(msg, kwargs)
         if self.isEnabledFor(TRACE_LEVEL_NUM):
+            msg, kwargs = self._process_params(msg, kwargs)
             self._log(TRACE_LEVEL_NUM, msg, args, **kwargs)
 
     def debug(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().debug(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.DEBUG):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(logging.DEBUG, msg, args, **kwargs)
 
     def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log an info message."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().info(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(logging.INFO, msg, args, **kwargs)
 
     def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().warning(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(logging.WARNING, msg, args, **kwargs)
 
     def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().error(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(logging.ERROR, msg, args, **kwargs)
 
     def critical(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log a critical message."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().critical(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.CRITICAL):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(logging.CRITICAL, msg, args, **kwargs)
 
     def exception(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log an exception with traceback."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().exception(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            msg, kwargs = self._process_params(msg, kwargs)
+            kwargs.setdefault("exc_info", True)
+            self._log(logging.ERROR, msg, args, **kwargs)
 
     def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log a message at the specified level."""
-        msg, kwargs = self._process_params(msg, kwargs)
-        super().log(level, msg, *args, **kwargs)
+        if not isinstance(level, int):
+            if logging.raiseExceptions:
+                raise TypeError("level must be an integer")
+            return
+        if self.isEnabledFor(level):
+            msg, kwargs = self._process_params(msg, kwargs)
+            self._log(level, msg, args, **kwargs)
 
 
 class LoggerFactory:
@@ -181,11 +248,23 @@ class LoggerFactory:
         json_file_only: bool = False,
         use_syslog: bool = False,
         syslog_address: str | tuple[str, int] = "/dev/log",
+        syslog_transport: str = "stdlib",
         rotate_schedule: str | None = None,
         rotate_retention_count: int | None = None,
         show_time: bool = False,
         show_level: bool = True,
         show_path: bool = True,
+        console_renderer: str = "auto",
+        defer_handlers: bool = False,
+        circuit_breaker: bool = False,
+        self_metrics: bool = False,
+        profile_log_volume: bool = False,
+        lean_records: bool = True,
+        exception_dedup_window: float | None = None,
+        payload_limits: dict[str, int] | None = None,
+        redact: bool = False,
+        redact_keys: list[str] | None = None,
+        redact_patterns: list[str] | None = None,
     ) -> None:
         """Centralized logging setup for arlogi.
 
@@ -199,11 +278,23 @@ class LoggerFactory:
             json_file_only: If True, only output JSON (no console)
             use_syslog: Enable syslog output
             syslog_address: Syslog server address
+            syslog_transport: "stdlib" or "stream" (batched RFC 5424 over TCP/Unix stream)
             rotate_schedule: Optional rotation schedule for JSON file logging
             rotate_retention_count: Optional number of rotated files to retain
             show_time: Show timestamps in console output
             show_level: Show log levels in console output
             show_path: Show file paths in console output
+            console_renderer: Console backend ("auto", "rich" or "plain")
+            defer_handlers: Build each handler only when its first record arrives
+            circuit_breaker: Bypass slow or failing sinks via per-handler circuit breakers
+            self_metrics: Collect pipeline self-metrics (records, bytes, emit latency, errors)
+            profile_log_volume: Attribute records and bytes to call sites (see arlogi.profiler)
+            lean_records: Capture only the LogRecord fields the handlers need (see arlogi.records)
+            exception_dedup_window: Log each distinct traceback once per this many seconds (see arlogi.dedup)
+            payload_limits: Size budgets for JSON records, e.g. {"max_value_length": 1024} (see arlogi.payload)
+            redact: Mask secrets in messages and extras before any sink (see arlogi.redaction)
+            redact_keys: Secret field names added to the redaction defaults (implies redact)
+            redact_patterns: Regular expressions added to the redaction defaults (implies redact)
         """
         config = LoggingConfig.from_kwargs(
             level=level,
@@ -212,11 +303,23 @@ class LoggerFactory:
             json_file_only=json_file_only,
             use_syslog=use_syslog,
             syslog_address=syslog_address,
+            syslog_transport=syslog_transport,
             rotate_schedule=rotate_schedule,
             rotate_retention_count=rotate_retention_count,
             show_time=show_time,
             show_level=show_level,
             show_path=show_path,
+            console_renderer=console_renderer,
+            defer_handlers=defer_handlers,
+            circuit_breaker=circuit_breaker,
+            self_metrics=self_metrics,
+            profile_log_volume=profile_log_volume,
+            lean_records=lean_records,
+            exception_dedup_window=exception_dedup_window,
+            payload_limits=payload_limits,
+            redact=redact,
+            redact_keys=redact_keys,
+            redact_patterns=redact_patterns,
         )
         cls._apply_configuration(config)
 
@@ -229,6 +332,30 @@ class LoggerFactory:
         """
         cls._initialize_trace_level()
         cls._configure_root_logger(config)
+        if config.self_metrics:
+            selfmetrics.enable_self_metrics()
+        else:
+            selfmetrics.disable_self_metrics()
+        if config.profile_log_volume:
+            if profiler.get_profiler() is None:
+                profiler.enable_profiler()
+        else:
+            profiler.disable_profiler()
+        if config.lean_records:
+            records.enable_lean_records()
+        else:
+            records.disable_lean_records()
+        if config.redaction_enabled:
+            redaction.enable_redaction(keys=config.redact_keys, patterns=config.redact_patterns)
+        else:
+            redaction.disable_redaction()
+        window = config.exception_dedup_window
+        if window is not None:
+            deduplicator = dedup.get_exception_deduplicator()
+            if deduplicator is None or deduplicator.window != window:
+                dedup.enable_exception_dedup(window=window)
+        else:
+            dedup.disable_exception_dedup()
 
         if not is_test_mode():
             cls._clear_and_add_handlers(config)
@@ -256,6 +383,8 @@ class LoggerFactory:
     def _clear_and_add_handlers(cls, config: LoggingConfig) -> None:
         """Clear existing handlers and add configured ones.
 
+        Handlers flagged ``keep_on_reconfigure`` (the OTel log bridge) stay.
+
         Args:
             config: The logging configuration
         """
@@ -263,7 +392,8 @@ class LoggerFactory:
 
         # Remove existing handlers
         for handler in root.handlers[:]:
-            root.removeHandler(handler)
+            if not getattr(handler, "keep_on_reconfigure", False):
+                root.removeHandler(handler)
 
         # Add configured handlers via factory
         handlers = HandlerFactory.create_handlers(config)
@@ -299,6 +429,8 @@ class LoggerFactory:
         """Get a logger instance conforming to LoggerProtocol.
 
         Auto-initializes with default settings if called before setup().
+        The implicit setup defers handler construction until the first
+        record, so tools that never log do not pay for it.
 
         Args:
             name: Logger name (typically __name__ of the module)
@@ -308,7 +440,7 @@ class LoggerFactory:
             A logger instance supporting caller attribution
         """
         if not cls._initialized:
-            cls.setup(level=get_default_level())
+            cls.setup(level=get_default_level(), defer_handlers=True)
 
         logger = logging.getLogger(name)
         if level is not None:
@@ -327,6 +459,8 @@ class LoggerFactory:
         Returns:
             A JSON-only logger instance
         """
+        from .handlers import JSONFileHandler, JSONHandler
+
         logger = logging.getLogger(f"arlogi.json.{name}")
         logger.propagate = False
 
@@ -335,21 +469,23 @@ class LoggerFactory:
             handler.close()
             logger.removeHandler(handler)
 
-        if json_file_name:
-            logger.addHandler(JSONFileHandler(json_file_name))
-        else:
-            logger.addHandler(JSONHandler())
+        handler = JSONFileHandler(json_file_name) if json_file_name else JSONHandler()
+        handler.addFilter(redaction.RedactionFilter())
+        logger.addHandler(handler)
 
         logger.setLevel(logging.DEBUG)
         return logger  # type: ignore
 
     @classmethod
-    def get_syslog_logger(cls, name: str = "syslog", address: str | tuple[str, int] = "/dev/log") -> LoggerProtocol:
+    def get_syslog_logger(
+        cls, name: str = "syslog", address: str | tuple[str, int] = "/dev/log", transport: str = "stdlib"
+    ) -> LoggerProtocol:
         """Get a logger that only outputs to Syslog, bypassing root handlers.
 
         Args:
             name: Logger name suffix
             address: Syslog server address
+            transport: "stdlib" or "stream" (batched RFC 5424 over TCP/Unix stream)
 
         Returns:
             A syslog-only logger instance
@@ -362,7 +498,10 @@ class LoggerFactory:
             handler.close()
             logger.removeHandler(handler)
 
-        logger.addHandler(ArlogiSyslogHandler(address=address))
+        config = LoggingConfig(use_syslog=True, syslog_address=address, syslog_transport=transport)
+        handler = HandlerFactory.create_syslog(config)
+        handler.addFilter(redaction.RedactionFilter())
+        logger.addHandler(handler)
         logger.setLevel(logging.DEBUG)
         return logger  # type: ignore
 
@@ -430,11 +569,23 @@ def setup_logging(
     json_file_only: bool = False,
     use_syslog: bool = False,
     syslog_address: str | tuple[str, int] = "/dev/log",
+    syslog_transport: str = "stdlib",
     rotate_schedule: str | None = None,
     rotate_retention_count: int | None = None,
     show_time: bool = False,
     show_level: bool = True,
     show_path: bool = True,
+    console_renderer: str = "auto",
+    defer_handlers: bool = False,
+    circuit_breaker: bool = False,
+    self_metrics: bool = False,
+    profile_log_volume: bool = False,
+    lean_records: bool = True,
+    exception_dedup_window: float | None = None,
+    payload_limits: dict[str, int] | None = None,
+    redact: bool = False,
+    redact_keys: list[str] | None = None,
+    redact_patterns: list[str] | None = None,
 ) -> None:
     """Set up arlogi logging with the specified configuration.
 
@@ -447,11 +598,23 @@ def setup_logging(
         json_file_only: If True, only output JSON (no console)
         use_syslog: Enable syslog output
         syslog_address: Syslog server address
+        syslog_transport: "stdlib" or "stream" (batched RFC 5424 over TCP/Unix stream)
         rotate_schedule: Optional rotation schedule for JSON file logging
         rotate_retention_count: Optional number of rotated files to retain
         show_time: Show timestamps in console output
         show_level: Show log levels in console output
         show_path: Show file paths in console output
+        console_renderer: Console backend ("auto", "rich" or "plain")
+        defer_handlers: Build each handler only when its first record arrives
+        circuit_breaker: Bypass slow or failing sinks via per-handler circuit breakers
+        self_metrics: Collect pipeline self-metrics (records, bytes, emit latency, errors)
+        profile_log_volume: Attribute records and bytes to call sites (see arlogi.profiler)
+        lean_records: Capture only the LogRecord fields the handlers need (see arlogi.records)
+        exception_dedup_window: Log each distinct traceback once per this many seconds (see arlogi.dedup)
+        payload_limits: Size budgets for JSON records, e.g. {"max_value_length": 1024} (see arlogi.payload)
+        redact: Mask secrets in messages and extras before any sink (see arlogi.redaction)
+        redact_keys: Secret field names added to the redaction defaults (implies redact)
+        redact_patterns: Regular expressions added to the redaction defaults (implies redact)
     """
     LoggerFactory.setup(
         level=level,
@@ -460,11 +623,23 @@ def setup_logging(
         json_file_only=json_file_only,
         use_syslog=use_syslog,
         syslog_address=syslog_address,
+        syslog_transport=syslog_transport,
         rotate_schedule=rotate_schedule,
         rotate_retention_count=rotate_retention_count,
         show_time=show_time,
         show_level=show_level,
         show_path=show_path,
+        console_renderer=console_renderer,
+        defer_handlers=defer_handlers,
+        circuit_breaker=circuit_breaker,
+        self_metrics=self_metrics,
+        profile_log_volume=profile_log_volume,
+        lean_records=lean_records,
+        exception_dedup_window=exception_dedup_window,
+        payload_limits=payload_limits,
+        redact=redact,
+        redact_keys=redact_keys,
+        redact_patterns=redact_patterns,
     )
 
 
@@ -503,6 +678,8 @@ def rotate_json_logger(name: str = "json") -> int:
     Returns:
         Number of handlers successfully rotated
     """
+    from .handlers import JSONFileHandler
+
     logger_name = f"arlogi.json.{name}"
     logger = logging.getLogger(logger_name)
     rotated = 0
@@ -514,17 +691,20 @@ def rotate_json_logger(name: str = "json") -> int:
     return rotated
 
 
-def get_syslog_logger(name: str = "syslog", address: str | tuple[str, int] = "/dev/log") -> LoggerProtocol:
+def get_syslog_logger(
+    name: str = "syslog", address: str | tuple[str, int] = "/dev/log", transport: str = "stdlib"
+) -> LoggerProtocol:
     """Get a dedicated syslog-only logger.
 
     Args:
         name: Logger name suffix
         address: Syslog server address
+        transport: "stdlib" or "stream" (batched RFC 5424 over TCP/Unix stream)
 
     Returns:
         A syslog-only logger instance
     """
-    return LoggerFactory.get_syslog_logger(name, address)
+    return LoggerFactory.get_syslog_logger(name, address, transport)
 
 
 def cleanup_json_logger(name: str = "json") -> None:
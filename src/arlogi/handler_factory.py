@@ -2,18 +2,94 @@
 
 This module provides a centralized factory for creating log handlers,
 following the Factory pattern for consistent handler creation and
-easier testing.
+easier testing, plus DeferredHandler for building handlers on first use.
 """
 
+import functools
 import logging
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from .config import LoggingConfig
-from .handlers import (
-    ArlogiSyslogHandler,
-    ColoredConsoleHandler,
-    JSONFileHandler,
-    JSONHandler,
-)
+from .records import handler_fields
+from .redaction import RedactionFilter
+
+if TYPE_CHECKING:
+    from .handlers import JSONFileHandler, JSONHandler
+
+# Handler classes are imported inside the create_* methods: importing arlogi
+# must not pay for Rich, logging.handlers or the JSON machinery up front.
+
+
+class DeferredHandler(logging.Handler):
+    """A placeholder that builds the real handler on the first record reaching it.
+
+    Lets short-lived tools configure logging without paying for handlers
+    (Rich consoles, files, sockets) that never receive a record. Once built,
+    every record is delegated to the real handler.
+    """
+
+    def __init__(self, factory: Callable[[], logging.Handler], level: int = logging.NOTSET):
+        """Initialize the deferred handler.
+
+        Args:
+            factory: Zero-argument callable that builds the real handler
+            level: Handler level applied before the real handler is built
+        """
+        super().__init__(level)
+        self._factory = factory
+        self._handler: logging.Handler | None = None
+
+    @property
+    def handler(self) -> logging.Handler:
+        """The real handler, built on first access (thread-safe)."""
+        handler = self._handler
+        if handler is None:
+            with self.lock:  # type: ignore[union-attr]
+                if self._handler is None:
+                    self._handler = self._factory()
+                handler = self._handler
+        return handler
+
+    @property
+    def is_built(self) -> bool:
+        """True once the real handler has been constructed."""
+        return self._handler is not None
+
+    @property
+    def record_fields(self) -> frozenset[str] | None:
+        """Optional LogRecord fields the real handler reads; unknown (None) until built."""
+        handler = self._handler
+        return None if handler is None else handler_fields(handler)
+
+    def handle(self, record: logging.LogRecord) -> logging.LogRecord | bool:
+        """Apply this handler's filters, then delegate to the real handler."""
+        rv = self.filter(record)
+        if rv:
+            return self.handler.handle(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record through the real handler."""
+        self.handler.emit(record)
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        """Set the formatter on the real handler (building it if needed)."""
+        self.handler.setFormatter(fmt)
+
+    def flush(self) -> None:
+        """Flush the real handler if it has been built."""
+        if self._handler is not None:
+            self._handler.flush()
+
+    def close(self) -> None:
+        """Close the real handler if it has been built."""
+        try:
+            if self._handler is not None:
+                self._handler.close()
+        finally:
+            super().close()
 
 
 class HandlerFactory:
@@ -24,18 +100,37 @@ class HandlerFactory:
     """
 
     @staticmethod
-    def create_console(config: LoggingConfig) -> ColoredConsoleHandler:
-        """Create a colored console handler.
+    def create_console(config: LoggingConfig) -> logging.Handler:
+        """Create a console handler.
+
+        With ``console_renderer="auto"`` a Rich ColoredConsoleHandler is used when
+        stdout is a TTY, and the lightweight PlainConsoleHandler otherwise (pipes,
+        CI logs, container log collectors).
 
         Args:
             config: Logging configuration
 
         Returns:
-            A configured ColoredConsoleHandler instance
+            A configured ColoredConsoleHandler or PlainConsoleHandler instance
 
         Example:
             >>> handler = HandlerFactory.create_console(LoggingConfig(show_time=True, show_level=True))
         """
+        renderer = config.console_renderer
+        if renderer == "auto":
+            isatty = getattr(sys.stdout, "isatty", None)
+            renderer = "rich" if isatty is not None and isatty() else "plain"
+
+        if renderer == "plain":
+            from .handlers import PlainConsoleHandler
+
+            return PlainConsoleHandler(
+                show_time=config.show_time,
+                show_level=config.show_level,
+                show_path=config.show_path,
+            )
+        from ._rich_console import ColoredConsoleHandler
+
         return ColoredConsoleHandler(
             show_time=config.show_time,
             show_level=config.show_level,
@@ -43,19 +138,24 @@ class HandlerFactory:
         )
 
     @staticmethod
-    def create_json_stream() -> JSONHandler:
+    def create_json_stream(config: LoggingConfig | None = None) -> "JSONHandler":
         """Create a JSON stream handler (outputs to stderr).
 
+        Args:
+            config: Optional logging configuration (payload limits)
+
         Returns:
             A JSONHandler instance configured for stream output
 
         Example:
             >>> handler = HandlerFactory.create_json_stream()
         """
-        return JSONHandler()
+        from .handlers import JSONHandler
+
+        return JSONHandler(limits=None if config is None else config.resolved_payload_limits)
 
     @staticmethod
-    def create_json_file(config: LoggingConfig) -> JSONFileHandler:
+    def create_json_file(config: LoggingConfig) -> "JSONFileHandler":
         """Create a JSON file handler.
 
         Args:
@@ -74,10 +174,13 @@ class HandlerFactory:
         if not config.json_file_name:
             raise ValueError("json_file_name must be set in config")
 
+        from .handlers import JSONFileHandler
+
         return JSONFileHandler(
             config.json_file_name,
             rotate_schedule=config.rotate_schedule,
             rotate_retention_count=config.rotate_retention_count,
+            limits=config.resolved_payload_limits,
         )
 
     @staticmethod
@@ -104,30 +207,79 @@ class HandlerFactory:
         """
         if config.json_file_name:
             return HandlerFactory.create_json_file(config)
-        return HandlerFactory.create_json_stream()
+        return HandlerFactory.create_json_stream(config)
 
     @staticmethod
-    def create_syslog(config: LoggingConfig) -> ArlogiSyslogHandler:
+    def create_syslog(config: LoggingConfig) -> logging.Handler:
         """Create a syslog handler.
 
         Args:
             config: Logging configuration with syslog settings
 
         Returns:
-            An ArlogiSyslogHandler instance
+            An ArlogiSyslogHandler, or a SyslogStreamHandler when
+            ``syslog_transport="stream"``
 
         Example:
             >>> config = LoggingConfig(use_syslog=True, syslog_address="/dev/log")
             >>> handler = HandlerFactory.create_syslog(config)
         """
+        if config.syslog_transport == "stream":
+            from .syslog import SyslogStreamHandler
+
+            return SyslogStreamHandler(address=config.syslog_address)
+
+        from .handlers import ArlogiSyslogHandler
+
         return ArlogiSyslogHandler(address=config.syslog_address)
 
+    @staticmethod
+    def create_deferred(builder: Callable[[], logging.Handler]) -> DeferredHandler:
+        """Wrap a handler builder so the handler is constructed on its first record.
+
+        Args:
+            builder: Zero-argument callable returning the real handler
+
+        Returns:
+            A DeferredHandler delegating to the built handler
+
+        Example:
+            >>> handler = HandlerFactory.create_deferred(lambda: HandlerFactory.create_console(config))
+        """
+        return DeferredHandler(builder)
+
+    @staticmethod
+    def create_circuit_breaker(handler: logging.Handler) -> logging.Handler:
+        """Wrap a handler in a CircuitBreakerHandler with default budgets.
+
+        Args:
+            handler: The sink handler to protect
+
+        Returns:
+            A CircuitBreakerHandler delegating to ``handler``
+
+        Example:
+            >>> handler = HandlerFactory.create_circuit_breaker(HandlerFactory.create_syslog(config))
+        """
+        from .breaker import CircuitBreakerHandler
+
+        return CircuitBreakerHandler(handler)
+
+    @classmethod
+    def _build_with_breaker(cls, builder: Callable[[], logging.Handler]) -> logging.Handler:
+        """Build a handler and wrap it in a circuit breaker."""
+        return cls.create_circuit_breaker(builder())
+
     @classmethod
     def create_handlers(cls, config: LoggingConfig) -> list[logging.Handler]:
         """Create all handlers based on configuration.
 
         This is the main factory method that orchestrates the creation
-        of all configured handlers.
+        of all configured handlers. With ``config.defer_handlers`` each
+        handler is wrapped in a DeferredHandler and only built when the
+        first record reaches it; with ``config.circuit_breaker`` each one is
+        protected by a CircuitBreakerHandler. Every handler gets a
+        RedactionFilter (see arlogi.redaction).
 
         Args:
             config: Complete logging configuration
@@ -141,21 +293,30 @@ class HandlerFactory:
             >>> for handler in handlers:
             ...     logger.addHandler(handler)
         """
-        handlers: list[logging.Handler] = []
+        builders: list[Callable[[], logging.Handler]] = []
 
         # JSON file handler
         if config.json_file_name:
-            handlers.append(cls.create_json_file(config))
+            builders.append(functools.partial(cls.create_json_file, config))
 
         # Console handler (show unless json_file_only)
         if config.show_console:
-            handlers.append(cls.create_console(config))
+            builders.append(functools.partial(cls.create_console, config))
         elif config.json_file_only and not config.json_file_name:
             # JSON on console when json_file_only=True but no file specified
-            handlers.append(cls.create_json_stream())
+            builders.append(functools.partial(cls.create_json_stream, config))
 
         # Syslog handler
         if config.use_syslog:
-            handlers.append(cls.create_syslog(config))
+            builders.append(functools.partial(cls.create_syslog, config))
+
+        if config.circuit_breaker:
+            builders = [functools.partial(cls._build_with_breaker, builder) for builder in builders]
 
+        if config.defer_handlers:
+            handlers = [cls.create_deferred(builder) for builder in builders]
+        else:
+            handlers = [builder() for builder in builders]
+        for handler in handlers:
+            handler.addFilter(RedactionFilter())
         return handlers
@@ -2,31 +2,99 @@
 
 This module provides custom logging handlers including:
 - ColoredConsoleHandler: Rich-based colored console output
+- PlainConsoleHandler: Rich-free console output for pipes and containers
 - JSONHandler/JSONFileHandler: Structured JSON logging
 - ArlogiSyslogHandler: Syslog integration with fallback support
 """
 
+import importlib
 import json
 import logging
 import logging.handlers
 import os
 import sys
+import time
 from datetime import datetime
 from glob import glob
 from typing import Any
 
-from rich.console import Console
-from rich.logging import RichHandler
+from .payload import TRUNCATED_FIELD, PayloadLimits, bound_fields, clip
+from .records import PATH_FIELDS, format_record, record_exc_text, record_message, record_payload
+from .selfmetrics import MeteredHandlerMixin, observe_rotation
 
+# Rich is imported only when a ColoredConsoleHandler is first requested, so
+# `import arlogi` and the Rich-free handlers stay cheap for short-lived tools.
+_LAZY_CLASSES = {
+    "ColoredConsoleHandler": "arlogi._rich_console",
+}
 
-class ColoredConsoleHandler(RichHandler):
-    """A logging handler that uses rich for colored console output.
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+# Common project root indicators, checked in order in every directory
+_PROJECT_ROOT_INDICATORS = (
+    ".git",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "requirements.txt",
+    "Pipfile",
+    "poetry.lock",
+    ".hg",
+    ".svn",
+)
+
+
+def _find_project_root(owner: type) -> str:
+    """Find the project root by looking for common indicators.
+
+    Searches upward from the current directory for files like
+    .git, pyproject.toml, setup.py, etc.
+
+    The result is cached in the ``_project_root_cache`` attribute of the
+    calling console handler class to avoid repeated filesystem operations.
+
+    Args:
+        owner: Handler class whose ``_project_root_cache`` stores the result
+
+    Returns:
+        The absolute path to the project root, or current directory if not found
+    """
+    # Return cached value if available
+    if owner._project_root_cache is not None:
+        return owner._project_root_cache
+
+    current = os.getcwd()
+
+    # Walk up the directory tree looking for indicators
+    while current != os.path.dirname(current):  # Stop at filesystem root
+        for indicator in _PROJECT_ROOT_INDICATORS:
+            if os.path.exists(os.path.join(current, indicator)):
+                owner._project_root_cache = os.path.abspath(current)
+                return owner._project_root_cache
+        current = os.path.dirname(current)
+
+    # If no indicators found, fall back to current working directory
+    owner._project_root_cache = os.getcwd()
+    return owner._project_root_cache
+
+
+class PlainConsoleHandler(MeteredHandlerMixin, logging.StreamHandler):
+    """A Rich-free console handler for pipes, CI logs and container collectors.
+
+    Emits the same compact layout as ColoredConsoleHandler without colors or
+    table layout: ``<level char> <message>  <relative path>:<line>``.
 
     Features:
-    - Automatic project root detection for relative file paths (cached)
-    - Customizable color schemes per log level
-    - Rich traceback support
-    - Compact single-character level indicators (T, D, I, W, E, C)
+    - Line template precompiled once from the show_* flags
+    - Relative paths memoized per source file
+    - Rich markup only parsed when a message actually contains ``[``
+    - Writes directly to the (buffered) stdout text stream
     """
 
     # Class-level cache for project root to avoid repeated filesystem operations
@@ -37,180 +105,146 @@ class ColoredConsoleHandler(RichHandler):
         show_time: bool = False,
         show_level: bool = True,
         show_path: bool = True,
-        level_styles: dict[str, str] | None = None,
         project_root: str | None = None,
-        *args: Any,
-        **kwargs: Any,
+        stream: Any = None,
     ):
-        """Initialize the colored console handler.
+        """Initialize the plain console handler.
 
         Args:
             show_time: Whether to show timestamps in output
             show_level: Whether to show log levels
             show_path: Whether to show file paths
-            level_styles: Custom color styles per level (e.g., {"info": "blue"})
             project_root: Project root for relative path calculation
-            *args: Additional positional arguments for RichHandler
-            **kwargs: Additional keyword arguments for RichHandler
-        """
-        # Default level styles: INFO is lighter (grey75) than DEBUG/TRACE (grey37)
-        default_styles = {
-            "trace": "grey37",
-            "debug": "grey37",
-            "info": "grey75",
-            "warning": "yellow",
-            "error": "red",
-            "critical": "bold red",
-        }
-        if level_styles:
-            default_styles.update(level_styles)
-
-        # Default to a console that supports colors and directed to stdout
-        if "console" not in kwargs:
-            kwargs["console"] = Console(force_terminal=True, file=sys.stdout)
-
-        # Enable rich tracebacks by default for enhanced error display
-        kwargs.setdefault("rich_tracebacks", True)
-        kwargs.setdefault("markup", True)
-
-        super().__init__(
-            *args,
-            show_time=show_time,
-            show_level=show_level,
-            show_path=show_path,
-            **kwargs,
-        )
-
-        # Set level styles after initialization (for compatibility with older rich versions)
-        self.level_styles = default_styles
-
-        # Store project root for relative path calculation (use cache if available)
-        self.project_root = project_root or self._find_project_root()
-
-    def _find_project_root(self) -> str:
-        """Find the project root by looking for common indicators.
-
-        Searches upward from the current directory for files like
-        .git, pyproject.toml, setup.py, etc.
-
-        Result is cached at class level to avoid repeated filesystem operations.
-
-        Returns:
-            The absolute path to the project root, or current directory if not found
+            stream: The stream to write to (defaults to sys.stdout)
         """
-        # Return cached value if available
-        if ColoredConsoleHandler._project_root_cache is not None:
-            return ColoredConsoleHandler._project_root_cache
-
-        current = os.getcwd()
-
-        # Common project root indicators
-        indicators = [
-            ".git",
-            "pyproject.toml",
-            "setup.py",
-            "setup.cfg",
-            "requirements.txt",
-            "Pipfile",
-            "poetry.lock",
-            ".hg",
-            ".svn",
-        ]
-
-        # Walk up the directory tree looking for indicators
-        while current != os.path.dirname(current):  # Stop at filesystem root
-            for indicator in indicators:
-                if os.path.exists(os.path.join(current, indicator)):
-                    ColoredConsoleHandler._project_root_cache = os.path.abspath(current)
-                    return ColoredConsoleHandler._project_root_cache
-            current = os.path.dirname(current)
-
-        # If no indicators found, fall back to current working directory
-        ColoredConsoleHandler._project_root_cache = os.getcwd()
-        return ColoredConsoleHandler._project_root_cache
+        super().__init__(stream if stream is not None else sys.stdout)
+        self.show_time = show_time
+        self.show_level = show_level
+        self.show_path = show_path
+        # Project root for relative path calculation; detected on first use
+        self.project_root = project_root
+
+        # Precompile the line template once; emit() only fills in the fields.
+        parts = []
+        if show_time:
+            parts.append("{time} ")
+        if show_level:
+            parts.append("{level} ")
+        parts.append("{message}")
+        if show_path:
+            parts.append("  {path}:{lineno}")
+        self._template = "".join(parts) + "\n"
+
+    @property
+    def project_root(self) -> str:
+        """Project root used for relative paths, detected (and cached) on first access."""
+        if self._project_root is None:
+            self._project_root = _find_project_root(PlainConsoleHandler)
+        return self._project_root
+
+    @project_root.setter
+    def project_root(self, project_root: str | None) -> None:
+        self._project_root = project_root
+        self._relpath_cache: dict[str, str] = {}
+
+    @property
+    def record_fields(self) -> frozenset[str]:
+        """Optional LogRecord fields this handler reads (see arlogi.records)."""
+        return PATH_FIELDS if self.show_path else frozenset()
+
+    def _relative_path(self, pathname: str) -> str:
+        """Return the path of a source file relative to the project root (memoized)."""
+        path = self._relpath_cache.get(pathname)
+        if path is None:
+            try:
+                path = os.path.relpath(pathname, self.project_root)
+            except (ValueError, OSError):
+                path = os.path.basename(pathname)
+            self._relpath_cache[pathname] = path
+        return path
 
-    def render(
-        self,
-        *,
-        record: logging.LogRecord,
-        traceback: Any,
-        message_renderable: Any,
-    ) -> Any:
-        """Override render method to show relative paths from project root.
+    def render(self, record: logging.LogRecord) -> str:
+        """Render a record as a single plain-text console entry.
 
         Args:
             record: The log record to render
-            traceback: Optional traceback information
-            message_renderable: The formatted message
 
         Returns:
-            A renderable object for Rich to display
+            The rendered text, including the trailing newline
         """
-        from pathlib import Path
+        message = record_message(record)
+        if "[" in message:
+            # Honour Rich markup (and caller attribution's escaped brackets)
+            # without colors; Rich is only imported when markup may be present.
+            from rich.text import Text
 
-        # Calculate relative path instead of just filename
-        try:
-            relpath = os.path.relpath(record.pathname, self.project_root)
-            path = relpath
-        except (ValueError, OSError):
-            # Fallback to filename if relative path calculation fails
-            path = Path(record.pathname).name
-
-        level = self.get_level_text(record)
-        time_format = None if self.formatter is None else self.formatter.datefmt
-        from datetime import datetime
-
-        log_time = datetime.fromtimestamp(record.created)
-
-        log_renderable = self._log_render(
-            self.console,
-            [message_renderable] if not traceback else [message_renderable, traceback],
-            log_time=log_time,
-            time_format=time_format,
-            level=level,
-            path=path,
-            line_no=record.lineno,
-            link_path=None,  # Disable links to avoid file:// URLs
+            try:
+                message = Text.from_markup(message).plain
+            except Exception:
+                pass  # Not valid markup: print the message verbatim
+        if record.exc_info:
+            message = f"{message}\n{record_exc_text(record, self.formatter)}"
+        if "\n" in message:
+            # Indent continuation lines under the message column like Rich does
+            message = message.replace("\n", "\n  " if self.show_level else "\n")
+
+        return self._template.format(
+            time=self._format_time(record) if self.show_time else "",
+            level=record.levelname[0],
+            message=message,
+            path=self._relative_path(record.pathname) if self.show_path else "",
+            lineno=record.lineno,
         )
-        return log_renderable
-
-    def get_level_text(self, record: logging.LogRecord) -> Any:
-        """Get level text as a single character with styling.
-
-        Args:
-            record: The log record
-
-        Returns:
-            A Rich Text object with the level character
-        """
-        from rich.text import Text
-
-        level_name = record.levelname
-        # Map TRACE to T, DEBUG to D, etc.
-        char = level_name[0]
 
-        style = self.level_styles.get(level_name.lower(), "default")
-        # Compact single character indicator
-        return Text(f"{char} ", style=style)
-
-    def render_message(self, record: logging.LogRecord, message: str) -> Any:
-        """Render message text with level-specific styling.
-
-        Args:
-            record: The log record
-            message: The message to render
+    def _format_time(self, record: logging.LogRecord) -> str:
+        """Format the record creation time using the formatter's datefmt, if any."""
+        time_format = None if self.formatter is None else self.formatter.datefmt
+        return datetime.fromtimestamp(record.created).strftime(time_format or "[%x %X]")
 
-        Returns:
-            A Rich Text object with the styled message
-        """
-        message_text = super().render_message(record, message)
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a rendered record to the stream."""
+        try:
+            text = self.render(record)
+            self._count_bytes(text)
+            self.stream.write(text)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
-        # Apply style to the entire message text
-        level_name = record.levelname.lower()
-        style = self.level_styles.get(level_name, "default")
 
-        message_text.style = style
-        return message_text
+# LogRecord attributes that are not user-supplied extra fields
+_STANDARD_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+    }
+)
+
+
+# JSONFormatter fields kept as they are when payload limits apply
+_JSON_CORE_FIELDS = frozenset({"timestamp", "level", "logger_name", "module", "function", "line_number"})
 
 
 class JSONFormatter(logging.Formatter):
@@ -220,8 +254,32 @@ class JSONFormatter(logging.Formatter):
     fields added via the `extra` parameter.
 
     Includes robust error handling for JSON serialization failures.
+    With ``limits`` set, oversized messages and extras are clipped before
+    serialization (see arlogi.payload).
     """
 
+    # Optional LogRecord fields format() reads (see arlogi.records)
+    record_fields = frozenset({"module", "funcName", "lineno"})
+
+    def __init__(self, *args: Any, limits: PayloadLimits | None = None, **kwargs: Any):
+        """Initialize the JSON formatter.
+
+        Args:
+            *args: Positional arguments for logging.Formatter
+            limits: Payload size budgets (default: None, no limits)
+            **kwargs: Keyword arguments for logging.Formatter
+        """
+        super().__init__(*args, **kwargs)
+        self.limits = limits
+
+    def field_plan(self) -> Any:
+        """Return a key for the fields format() emits and how it encodes them.
+
+        Formatters with equal plans produce identical payloads for a record,
+        so a record sent to several JSON sinks is serialized once.
+        """
+        return (type(self), self.limits)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -235,11 +293,14 @@ class JSONFormatter(logging.Formatter):
             If JSON serialization fails, falls back to a basic format
             with error information to prevent logging crashes.
         """
+        return record_payload(record, self.field_plan(), self._format_json)
+
+    def _format_json(self, record: logging.LogRecord) -> str:
         log_data = {
             "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger_name": record.name,
-            "message": record.getMessage(),
+            "message": record_message(record),
             "module": record.module,
             "function": record.funcName,
             "line_number": record.lineno,
@@ -247,40 +308,23 @@ class JSONFormatter(logging.Formatter):
 
         # Add exception info if present
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            log_data["exception"] = record_exc_text(record, self)
 
         # Add extra fields from the record (excluding standard logging attributes)
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "message",
-        }
-
         for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith("_"):
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
                 log_data[key] = value
 
+        limits = self.limits
+        if limits is not None:
+            log_data = bound_fields(log_data, limits, _JSON_CORE_FIELDS)
+
         # Try to serialize with error handling
         try:
-            return json.dumps(log_data, default=str)
+            text = json.dumps(log_data, default=str)
+            if limits is not None and len(text) > limits.max_record_bytes:
+                text = self._core_fields_json(log_data, limits)
+            return text
         except (TypeError, ValueError) as e:
             # Fallback to basic format on serialization failure
             return json.dumps(
@@ -296,8 +340,21 @@ class JSONFormatter(logging.Formatter):
                 }
             )
 
+    @staticmethod
+    def _core_fields_json(log_data: dict[str, Any], limits: PayloadLimits) -> str:
+        """Encode only the core fields and as much of the message as fits the record budget."""
+        core = {key: value for key, value in log_data.items() if key in _JSON_CORE_FIELDS}
+        message = str(log_data.get("message", ""))
+        length = min(len(message), limits.max_message_length)
+        while True:
+            # json.dumps escapes to ASCII, so characters are bytes
+            text = json.dumps({**core, "message": clip(message, length), TRUNCATED_FIELD: ["record"]}, default=str)
+            if len(text) <= limits.max_record_bytes or length == 0:
+                return text
+            length //= 2
 
-class JSONHandler(logging.StreamHandler):
+
+class JSONHandler(MeteredHandlerMixin, logging.StreamHandler):
     """A logging handler that outputs log records as JSON to a stream.
 
     Defaults to stderr for compatibility with log aggregation tools.
@@ -305,11 +362,15 @@ class JSONHandler(logging.StreamHandler):
     Properly manages custom streams to prevent resource leaks.
     """
 
-    def __init__(self, stream: Any = None):
+    # Reads no optional LogRecord fields itself; JSONFormatter declares its own
+    record_fields = frozenset()
+
+    def __init__(self, stream: Any = None, limits: PayloadLimits | None = None):
         """Initialize the JSON stream handler.
 
         Args:
             stream: The stream to write to (defaults to sys.stderr if None)
+            limits: Payload size budgets for the JSONFormatter (default: no limits)
 
         Note:
             Custom streams are tracked and closed when the handler is closed.
@@ -318,7 +379,7 @@ class JSONHandler(logging.StreamHandler):
         # Track whether we own the stream for cleanup purposes
         self._owns_stream = stream is not None
         super().__init__(stream)
-        self.setFormatter(JSONFormatter())
+        self.setFormatter(JSONFormatter(limits=limits))
 
     def close(self):
         """Close the handler and the stream if we own it.
@@ -339,12 +400,37 @@ class JSONHandler(logging.StreamHandler):
             super().close()
 
 
-class JSONFileHandler(logging.FileHandler):
+def period_key(schedule: str | None, now_local: datetime) -> str:
+    """Return the wall-clock period `now_local` falls in for a rotation schedule.
+
+    Args:
+        schedule: One of "hour", "day", "week" or "month"
+        now_local: Local time to bucket
+
+    Raises:
+        ValueError: If the schedule is not supported
+    """
+    if schedule == "hour":
+        return now_local.strftime("%Y-%m-%d-%H")
+    if schedule == "day":
+        return now_local.strftime("%Y-%m-%d")
+    if schedule == "week":
+        # %U is Sunday-based week number with Sunday as week boundary.
+        return now_local.strftime("%Y-W%U")
+    if schedule == "month":
+        return now_local.strftime("%Y-%m")
+    raise ValueError(f"Unsupported rotate_schedule: {schedule!r}")
+
+
+class JSONFileHandler(MeteredHandlerMixin, logging.FileHandler):
     """A logging handler that outputs log records as JSON to a file.
 
     Automatically creates parent directories if they don't exist.
     """
 
+    # Reads no optional LogRecord fields itself; JSONFormatter declares its own
+    record_fields = frozenset()
+
     def __init__(
         self,
         filename: str,
@@ -353,6 +439,7 @@ class JSONFileHandler(logging.FileHandler):
         delay: bool = False,
         rotate_schedule: str | None = None,
         rotate_retention_count: int | None = None,
+        limits: PayloadLimits | None = None,
     ):
         """Initialize the JSON file handler.
 
@@ -363,6 +450,7 @@ class JSONFileHandler(logging.FileHandler):
             delay: Whether to delay file opening until first emit
             rotate_schedule: Optional rotation schedule (hour/day/week/month)
             rotate_retention_count: Optional retention count for rotated files
+            limits: Payload size budgets for the JSONFormatter (default: no limits)
 
         Note:
             Thread-safe: Uses exist_ok=True to safely handle concurrent
@@ -382,7 +470,7 @@ class JSONFileHandler(logging.FileHandler):
             rotate_retention_count if rotate_retention_count is not None else (7 if rotate_schedule else None)
         )
         self._active_period_key = self._compute_period_key(self._now_local()) if self.rotate_schedule else None
-        self.setFormatter(JSONFormatter())
+        self.setFormatter(JSONFormatter(limits=limits))
 
     def _now_local(self) -> datetime:
         """Get current local datetime.
@@ -393,16 +481,7 @@ class JSONFileHandler(logging.FileHandler):
 
     def _compute_period_key(self, now_local: datetime) -> str:
         """Compute the period key for the configured schedule."""
-        if self.rotate_schedule == "hour":
-            return now_local.strftime("%Y-%m-%d-%H")
-        if self.rotate_schedule == "day":
-            return now_local.strftime("%Y-%m-%d")
-        if self.rotate_schedule == "week":
-            # %U is Sunday-based week number with Sunday as week boundary.
-            return now_local.strftime("%Y-W%U")
-        if self.rotate_schedule == "month":
-            return now_local.strftime("%Y-%m")
-        raise ValueError(f"Unsupported rotate_schedule: {self.rotate_schedule!r}")
+        return period_key(self.rotate_schedule, now_local)
 
     def _build_rotated_path(self, period_key: str) -> str:
         """Build target path for a rotated file."""
@@ -481,6 +560,7 @@ class JSONFileHandler(logging.FileHandler):
             return False
 
         target = self._build_collision_safe_path(self._build_rotated_path(period_key))
+        start = time.perf_counter()
 
         try:
             self.flush()
@@ -492,6 +572,7 @@ class JSONFileHandler(logging.FileHandler):
             self.stream = self._open()
             self._active_period_key = period_key
             self._prune_rotated_files()
+            observe_rotation(time.perf_counter() - start)
             return True
         except PermissionError:
             # Windows: OS briefly holds the file after close (antivirus, open reader).
@@ -537,7 +618,7 @@ class JSONFileHandler(logging.FileHandler):
             self.handleError(record)
 
 
-class ArlogiSyslogHandler(logging.handlers.SysLogHandler):
+class ArlogiSyslogHandler(MeteredHandlerMixin, logging.handlers.SysLogHandler):
     """A robust syslog handler with standard formatting and automatic fallback.
 
     Features:
@@ -546,6 +627,9 @@ class ArlogiSyslogHandler(logging.handlers.SysLogHandler):
     - Graceful degradation - won't crash the application if syslog is unavailable
     """
 
+    # Reads no optional LogRecord fields itself; its format string asks for the process id
+    record_fields = frozenset()
+
     def __init__(
         self,
         address: str | tuple[str, int] = "/dev/log",
@@ -574,3 +658,11 @@ class ArlogiSyslogHandler(logging.handlers.SysLogHandler):
                     pass
             else:
                 raise e
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the message and exception text other handlers produced."""
+        if type(self.formatter) is not logging.Formatter:
+            return super().format(record)
+        text = format_record(record, self.formatter)
+        self._count_bytes(text)
+        return text
@@ -6,12 +6,20 @@ from typing import Any
 from arlogi.otel.decorator import set_trace_modules, traced
 
 __all__ = [
+    "FanOutMetricReader",
+    "FanOutSpanProcessor",
+    "OtelLogHandler",
+    "RotatingJsonlLogExporter",
     "RotatingJsonlMetricExporter",
     "RotatingJsonlSpanExporter",
+    "get_span_processor",
     "install_log_correlation",
+    "read_segment",
     "set_trace_modules",
+    "setup_logs",
     "setup_metrics",
     "setup_tracing",
+    "shutdown_logs",
     "shutdown_metrics",
     "shutdown_tracing",
     "traced",
@@ -21,13 +29,21 @@ __all__ = [
 # opentelemetry-sdk. Importing them lazily keeps `import arlogi.otel.decorator`
 # (or `arlogi.otel`) SDK-free for consumers who only installed the api.
 _LAZY_MODULES = {
+    "get_span_processor": "arlogi.otel.bootstrap",
     "install_log_correlation": "arlogi.otel.bootstrap",
+    "setup_logs": "arlogi.otel.bootstrap",
     "setup_metrics": "arlogi.otel.bootstrap",
     "setup_tracing": "arlogi.otel.bootstrap",
+    "shutdown_logs": "arlogi.otel.bootstrap",
     "shutdown_metrics": "arlogi.otel.bootstrap",
     "shutdown_tracing": "arlogi.otel.bootstrap",
+    "FanOutMetricReader": "arlogi.otel.readers",
+    "FanOutSpanProcessor": "arlogi.otel.processors",
+    "OtelLogHandler": "arlogi.otel.logs",
+    "RotatingJsonlLogExporter": "arlogi.otel.exporters",
     "RotatingJsonlMetricExporter": "arlogi.otel.exporters",
     "RotatingJsonlSpanExporter": "arlogi.otel.exporters",
+    "read_segment": "arlogi.otel.segments",
 }
 
 
@@ -1,14 +1,63 @@
 """OTLP/JSON encoding helpers.
 
-Protobuf's JSON mapping emits bytes fields (trace/span ids) as base64; the
-OTLP file-exporter spec requires hex. b64_ids_to_hex() fixes them in place.
+The exporters encode SDK spans, metrics and log records straight into the
+OTLP/JSON structure: plain dicts and lists, built in one pass with ids as hex
+(as the OTLP file-exporter spec requires), then serialized by ``json.dumps``.
+The output is identical to the protobuf path (``encode_spans`` /
+``encode_metrics`` / ``encode_logs``, then ``MessageToDict``, then
+``b64_ids_to_hex``) without building protobuf messages, converting them to
+dicts and walking those dicts again to rewrite the ids.
+
+The encoders follow the proto3 JSON mapping that MessageToDict applies:
+fields in field-number order, camelCase names, fields holding their default
+value omitted (unless they have presence: oneofs, optional and message
+fields), 64-bit integers as strings, enums by name and non-finite doubles as
+"NaN" / "Infinity" / "-Infinity".
+
+b64_ids_to_hex() converts the protobuf path's base64 ids; it is kept for
+comparisons against that path.
 """
 
 import base64
+import logging
+import math
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any
 
+from opentelemetry.sdk.metrics.export import ExponentialHistogram, Gauge, Histogram, Sum
+
+logger = logging.getLogger(__name__)
+
 _ID_KEYS = frozenset({"traceId", "spanId", "parentSpanId"})
 
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Enum names, by value, of the proto enums the encoders emit
+_SPAN_KINDS = (
+    "SPAN_KIND_UNSPECIFIED",
+    "SPAN_KIND_INTERNAL",
+    "SPAN_KIND_SERVER",
+    "SPAN_KIND_CLIENT",
+    "SPAN_KIND_PRODUCER",
+    "SPAN_KIND_CONSUMER",
+)
+_STATUS_CODES = ("STATUS_CODE_UNSET", "STATUS_CODE_OK", "STATUS_CODE_ERROR")
+_TEMPORALITIES = (
+    "AGGREGATION_TEMPORALITY_UNSPECIFIED",
+    "AGGREGATION_TEMPORALITY_DELTA",
+    "AGGREGATION_TEMPORALITY_CUMULATIVE",
+)
+_SEVERITY_NUMBERS = ("SEVERITY_NUMBER_UNSPECIFIED",) + tuple(
+    f"SEVERITY_NUMBER_{base}{suffix}"
+    for base in ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL")
+    for suffix in ("", "2", "3", "4")
+)
+
+# Span flags: the parent's is_remote is known, and whether it is remote
+_FLAGS_HAS_IS_REMOTE = 0x100
+_FLAGS_IS_REMOTE = 0x200
+
 
 def b64_ids_to_hex(node: Any) -> None:
     """Recursively convert base64-encoded id fields to lowercase hex, in place."""
@@ -21,3 +70,425 @@ def b64_ids_to_hex(node: Any) -> None:
     elif isinstance(node, list):
         for item in node:
             b64_ids_to_hex(item)
+
+
+def _enum(names: tuple[str, ...], value: int) -> str | int:
+    # Unknown values are emitted as numbers, like MessageToDict
+    return names[value] if 0 <= value < len(names) else value
+
+
+def _double(value: float) -> float | str:
+    # Double fields hold floats even when set from ints (min=0 encodes as 0.0)
+    if math.isfinite(value):
+        return float(value)
+    if math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+def _int64(value: int) -> str:
+    if not _INT64_MIN <= value <= _INT64_MAX:
+        raise ValueError(f"Value out of range: {value}")
+    return str(value)
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    """Encode an attribute value as an AnyValue (see _encode_value upstream)."""
+    # Exact type checks first: nearly every attribute is one of these
+    kind = type(value)
+    if kind is str:
+        return {"stringValue": value}
+    if kind is bool:
+        return {"boolValue": value}
+    if kind is int:
+        return {"intValue": _int64(value)}
+    if kind is float:
+        return {"doubleValue": _double(value)}
+    return _any_other_value(value)
+
+
+def _any_other_value(value: Any) -> dict[str, Any]:
+    if value is None:
+        return {}
+    if isinstance(value, bool):
+        return {"boolValue": bool(value)}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    if isinstance(value, int):
+        return {"intValue": _int64(value)}
+    if isinstance(value, float):
+        return {"doubleValue": _double(value)}
+    if isinstance(value, bytes):
+        return {"bytesValue": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, Sequence):
+        values = [_any_value(item) for item in value]
+        return {"arrayValue": {"values": values} if values else {}}
+    if isinstance(value, Mapping):
+        pairs = [_key_value(str(key), item) for key, item in value.items()]
+        return {"kvlistValue": {"values": pairs} if pairs else {}}
+    raise ValueError(f"Invalid type {type(value)} of value {value}")
+
+
+def _key_value(key: str, value: Any) -> dict[str, Any]:
+    encoded = _any_value(value)
+    return {"key": key, "value": encoded} if key else {"value": encoded}
+
+
+def _attributes(attributes: Mapping[str, Any] | None) -> list[dict[str, Any]]:
+    """Encode attributes as KeyValues, skipping (and logging) values that cannot be encoded."""
+    if not attributes:
+        return []
+    encoded = []
+    for key, value in attributes.items():
+        try:
+            encoded.append(_key_value(key, value))
+        except Exception as error:
+            logger.exception("Failed to encode key %s: %s", key, error)
+    return encoded
+
+
+def _put_attributes(target: dict[str, Any], name: str, attributes: Mapping[str, Any] | None) -> None:
+    encoded = _attributes(attributes)
+    if encoded:
+        target[name] = encoded
+
+
+def _resource(resource: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    _put_attributes(encoded, "attributes", resource.attributes)
+    return encoded
+
+
+def _scope(scope: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    if scope is None:
+        return encoded
+    if scope.name:
+        encoded["name"] = scope.name
+    if scope.version:
+        encoded["version"] = scope.version
+    _put_attributes(encoded, "attributes", scope.attributes)
+    return encoded
+
+
+def _group(
+    items: Iterable[Any],
+    encode: Callable[[Any], dict[str, Any]],
+    scopes_key: str,
+    items_key: str,
+) -> list[dict[str, Any]]:
+    """Group encoded items by resource, then instrumentation scope (as the upstream encoders do)."""
+    grouped: defaultdict[Any, defaultdict[Any, list[dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
+    for item in items:
+        grouped[item.resource][item.instrumentation_scope or None].append(encode(item))
+
+    resources = []
+    for resource, scopes in grouped.items():
+        scope_list = []
+        for scope, encoded_items in scopes.items():
+            entry: dict[str, Any] = {"scope": _scope(scope), items_key: encoded_items}
+            if scope is not None and scope.schema_url:
+                entry["schemaUrl"] = scope.schema_url
+            scope_list.append(entry)
+        resources.append(_resource_entry(resource, scopes_key, scope_list))
+    return resources
+
+
+def _resource_entry(resource: Any, scopes_key: str, scope_list: list[dict[str, Any]]) -> dict[str, Any]:
+    entry: dict[str, Any] = {"resource": _resource(resource)}
+    if scope_list:
+        entry[scopes_key] = scope_list
+    if resource.schema_url:
+        entry["schemaUrl"] = resource.schema_url
+    return entry
+
+
+def _span_flags(parent: Any) -> int:
+    if parent is not None and parent.is_remote:
+        return _FLAGS_HAS_IS_REMOTE | _FLAGS_IS_REMOTE
+    return _FLAGS_HAS_IS_REMOTE
+
+
+def _span(span: Any) -> dict[str, Any]:
+    context = span.get_span_context()
+    encoded: dict[str, Any] = {
+        "traceId": format(context.trace_id, "032x"),
+        "spanId": format(context.span_id, "016x"),
+    }
+    trace_state = context.trace_state
+    if trace_state:
+        encoded["traceState"] = ",".join(f"{key}={value}" for key, value in trace_state.items())
+    parent = span.parent
+    if parent:
+        encoded["parentSpanId"] = format(parent.span_id, "016x")
+    if span.name:
+        encoded["name"] = span.name
+    encoded["kind"] = _enum(_SPAN_KINDS, span.kind.value + 1)
+    if span.start_time:
+        encoded["startTimeUnixNano"] = str(span.start_time)
+    if span.end_time:
+        encoded["endTimeUnixNano"] = str(span.end_time)
+    _put_span_children(encoded, span)
+    encoded["status"] = _status(span.status)
+    encoded["flags"] = _span_flags(parent)
+    return encoded
+
+
+def _put_span_children(encoded: dict[str, Any], span: Any) -> None:
+    """Add a span's attributes, events and links, with their dropped counts."""
+    _put_attributes(encoded, "attributes", span.attributes)
+    if span.dropped_attributes:
+        encoded["droppedAttributesCount"] = span.dropped_attributes
+    if span.events:
+        encoded["events"] = [_event(event) for event in span.events]
+    if span.dropped_events:
+        encoded["droppedEventsCount"] = span.dropped_events
+    if span.links:
+        encoded["links"] = [_link(link) for link in span.links]
+    if span.dropped_links:
+        encoded["droppedLinksCount"] = span.dropped_links
+
+
+def _event(event: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    if event.timestamp:
+        encoded["timeUnixNano"] = str(event.timestamp)
+    if event.name:
+        encoded["name"] = event.name
+    _put_attributes(encoded, "attributes", event.attributes)
+    if event.dropped_attributes:
+        encoded["droppedAttributesCount"] = event.dropped_attributes
+    return encoded
+
+
+def _link(link: Any) -> dict[str, Any]:
+    context = link.context
+    encoded: dict[str, Any] = {
+        "traceId": format(context.trace_id, "032x"),
+        "spanId": format(context.span_id, "016x"),
+    }
+    _put_attributes(encoded, "attributes", link.attributes)
+    if link.dropped_attributes:
+        encoded["droppedAttributesCount"] = link.dropped_attributes
+    encoded["flags"] = _span_flags(context)
+    return encoded
+
+
+def _status(status: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    if status is None:
+        return encoded
+    if status.description:
+        encoded["message"] = status.description
+    if status.status_code.value:
+        encoded["code"] = _enum(_STATUS_CODES, status.status_code.value)
+    return encoded
+
+
+def encode_spans_json(spans: Sequence[Any]) -> dict[str, Any]:
+    """Encode ReadableSpans as an OTLP/JSON ExportTraceServiceRequest with hex ids."""
+    return {"resourceSpans": _group(spans, _span, "scopeSpans", "spans")} if spans else {}
+
+
+def _log(readable: Any) -> dict[str, Any]:
+    record = readable.log_record
+    encoded: dict[str, Any] = {}
+    if record.timestamp:
+        encoded["timeUnixNano"] = str(record.timestamp)
+    severity = getattr(record.severity_number, "value", None)
+    if severity:
+        encoded["severityNumber"] = _enum(_SEVERITY_NUMBERS, severity)
+    if record.severity_text:
+        encoded["severityText"] = record.severity_text
+    encoded["body"] = _any_value(record.body)
+    _put_attributes(encoded, "attributes", record.attributes)
+    if readable.dropped_attributes:
+        encoded["droppedAttributesCount"] = readable.dropped_attributes
+    flags = int(record.trace_flags or 0)
+    if flags:
+        encoded["flags"] = flags
+    if record.trace_id:
+        encoded["traceId"] = format(record.trace_id, "032x")
+    if record.span_id:
+        encoded["spanId"] = format(record.span_id, "016x")
+    if record.observed_timestamp:
+        encoded["observedTimeUnixNano"] = str(record.observed_timestamp)
+    if record.event_name:
+        encoded["eventName"] = record.event_name
+    return encoded
+
+
+def encode_logs_json(batch: Sequence[Any]) -> dict[str, Any]:
+    """Encode ReadableLogRecords as an OTLP/JSON ExportLogsServiceRequest with hex ids."""
+    return {"resourceLogs": _group(batch, _log, "scopeLogs", "logRecords")} if batch else {}
+
+
+def _exemplars(exemplars: Sequence[Any]) -> list[dict[str, Any]]:
+    encoded_list = []
+    for exemplar in exemplars:
+        encoded: dict[str, Any] = {}
+        if exemplar.time_unix_nano:
+            encoded["timeUnixNano"] = str(exemplar.time_unix_nano)
+        value = exemplar.value
+        if isinstance(value, float):
+            encoded["asDouble"] = _double(value)
+        elif not isinstance(value, int):
+            raise ValueError("Exemplar value must be an int or float")
+        if exemplar.span_id is not None and exemplar.trace_id is not None:
+            encoded["spanId"] = format(exemplar.span_id, "016x")
+            encoded["traceId"] = format(exemplar.trace_id, "032x")
+        if not isinstance(value, float):
+            encoded["asInt"] = _int64(value)
+        _put_attributes(encoded, "filteredAttributes", exemplar.filtered_attributes)
+        encoded_list.append(encoded)
+    return encoded_list
+
+
+def _put_exemplars(encoded: dict[str, Any], point: Any) -> None:
+    exemplars = _exemplars(point.exemplars)
+    if exemplars:
+        encoded["exemplars"] = exemplars
+
+
+def _put_min_max(encoded: dict[str, Any], point: Any) -> None:
+    if point.min is not None:
+        encoded["min"] = _double(point.min)
+    if point.max is not None:
+        encoded["max"] = _double(point.max)
+
+
+def _times(encoded: dict[str, Any], point: Any, start: bool = True) -> None:
+    if start and point.start_time_unix_nano:
+        encoded["startTimeUnixNano"] = str(point.start_time_unix_nano)
+    if point.time_unix_nano:
+        encoded["timeUnixNano"] = str(point.time_unix_nano)
+
+
+def _number_point(point: Any, start: bool) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    _times(encoded, point, start)
+    value = point.value
+    if not isinstance(value, int):
+        encoded["asDouble"] = _double(value)
+    _put_exemplars(encoded, point)
+    if isinstance(value, int):
+        encoded["asInt"] = _int64(value)
+    _put_attributes(encoded, "attributes", point.attributes)
+    return encoded
+
+
+def _histogram_point(point: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    _times(encoded, point)
+    if point.count:
+        encoded["count"] = str(point.count)
+    if point.sum is not None:
+        encoded["sum"] = _double(point.sum)
+    if point.bucket_counts:
+        encoded["bucketCounts"] = [str(count) for count in point.bucket_counts]
+    if point.explicit_bounds:
+        encoded["explicitBounds"] = [_double(bound) for bound in point.explicit_bounds]
+    _put_exemplars(encoded, point)
+    _put_attributes(encoded, "attributes", point.attributes)
+    _put_min_max(encoded, point)
+    return encoded
+
+
+def _buckets(buckets: Any) -> dict[str, Any] | None:
+    if not buckets.bucket_counts:
+        return None
+    encoded: dict[str, Any] = {}
+    if buckets.offset:
+        encoded["offset"] = buckets.offset
+    encoded["bucketCounts"] = [str(count) for count in buckets.bucket_counts]
+    return encoded
+
+
+def _exponential_point(point: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    _put_attributes(encoded, "attributes", point.attributes)
+    _times(encoded, point)
+    if point.count:
+        encoded["count"] = str(point.count)
+    if point.sum is not None:
+        encoded["sum"] = _double(point.sum)
+    if point.scale:
+        encoded["scale"] = point.scale
+    if point.zero_count:
+        encoded["zeroCount"] = str(point.zero_count)
+    for name, buckets in (("positive", point.positive), ("negative", point.negative)):
+        encoded_buckets = _buckets(buckets)
+        if encoded_buckets is not None:
+            encoded[name] = encoded_buckets
+    if point.flags:
+        encoded["flags"] = point.flags
+    _put_exemplars(encoded, point)
+    _put_min_max(encoded, point)
+    return encoded
+
+
+def _aggregated(points: list[dict[str, Any]], temporality: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {"dataPoints": points}
+    if temporality:
+        encoded["aggregationTemporality"] = _enum(_TEMPORALITIES, int(temporality))
+    return encoded
+
+
+def _metric_data(data: Any) -> tuple[str, dict[str, Any]] | None:
+    """Return the Metric field name and value for a metric's data, or None if it has no points."""
+    points = data.data_points
+    if not points:
+        return None
+    if isinstance(data, Gauge):
+        return "gauge", {"dataPoints": [_number_point(point, start=False) for point in points]}
+    if isinstance(data, Histogram):
+        return "histogram", _aggregated([_histogram_point(point) for point in points], data.aggregation_temporality)
+    if isinstance(data, Sum):
+        encoded = _aggregated([_number_point(point, start=True) for point in points], data.aggregation_temporality)
+        if data.is_monotonic:
+            encoded["isMonotonic"] = True
+        return "sum", encoded
+    if isinstance(data, ExponentialHistogram):
+        return "exponentialHistogram", _aggregated(
+            [_exponential_point(point) for point in points], data.aggregation_temporality
+        )
+    logger.warning("unsupported data type %s", data.__class__.__name__)
+    return None
+
+
+def _metric(metric: Any) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    if metric.name:
+        encoded["name"] = metric.name
+    if metric.description:
+        encoded["description"] = metric.description
+    if metric.unit:
+        encoded["unit"] = metric.unit
+    data = _metric_data(metric.data)
+    if data is not None:
+        encoded[data[0]] = data[1]
+    return encoded
+
+
+def encode_metrics_json(metrics_data: Any) -> dict[str, Any]:
+    """Encode MetricsData as an OTLP/JSON ExportMetricsServiceRequest with hex ids."""
+    # Scopes are unique per resource, and resources per MetricsData (as upstream assumes)
+    resources: dict[Any, dict[Any, dict[str, Any]]] = {}
+    for resource_metrics in metrics_data.resource_metrics:
+        scopes = resources[resource_metrics.resource] = {}
+        for scope_metrics in resource_metrics.scope_metrics:
+            scope = scope_metrics.scope
+            entry: dict[str, Any] = {"scope": _scope(scope)}
+            metrics = [_metric(metric) for metric in scope_metrics.metrics]
+            if metrics:
+                entry["metrics"] = metrics
+            if scope.schema_url:
+                entry["schemaUrl"] = scope.schema_url
+            scopes[scope] = entry
+    if not resources:
+        return {}
+    return {
+        "resourceMetrics": [
+            _resource_entry(resource, "scopeMetrics", list(scopes.values())) for resource, scopes in resources.items()
+        ]
+    }
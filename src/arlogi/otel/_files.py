@@ -1,81 +1,357 @@
-"""Rotating JSONL file writer shared by the span and metric exporters."""
+"""Rotating file writers shared by the span, metric and log exporters."""
 
+import gzip
+import io
 import logging
+import os
+import re
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import IO
 
+from arlogi.handlers import period_key
+
+try:
+    import fcntl
+except ImportError:  # Windows: open files cannot be deleted there anyway
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_WORKER_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+@contextmanager
+def _directory_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `path` across processes (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _in_use(path: Path) -> bool:
+    """True when a live writer holds the file (see _RotatingJsonlWriter._mark_in_use)."""
+    if fcntl is None:
+        return False
+    try:
+        with open(path, "rb") as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            return False
+    except OSError:
+        return False
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0  # deleted meanwhile; sorts as oldest
+
 
 class _RotatingJsonlWriter:
     """Appends lines to `<directory>/<prefix>-YYYYMMDD-HHMMSS.jsonl`.
 
-    A new file is started when the current one is older than `rotate_hours`;
-    afterwards only the newest `retention_count` matching files are kept.
+    A new file is started when the current one is older than `rotate_hours`,
+    or when the wall clock crosses a `rotate_schedule` boundary ("hour",
+    "day", "week" or "month"); afterwards only the newest `retention_count`
+    matching files (compressed or not) are kept.
+
+    By default every write is flushed. With `flush_interval` (seconds) or
+    `flush_bytes` set, writes are buffered and flushed once either limit is
+    reached on a write, by `flush()`, and on rotation and close. With
+    `flush_interval`, a timer also flushes data still buffered that long
+    after it was written, so an idle writer reaches disk in time. With
+    `compress` the active file is a gzip stream (`.jsonl.gz`); each flush
+    ends a deflate block, so buffering keeps the compression ratio up.
+
+    Several processes can share one directory: each names its files
+    `<prefix>-YYYYMMDD-HHMMSS-<owner>.jsonl`, where the owner is `worker_id`
+    or, by default, the pid (re-read after a fork). Files are created and
+    pruned under an advisory lock on `.<prefix>.lock`; the active file is
+    held with a shared lock so other writers never delete it. Retention is
+    counted per owner, and owners with no live writer (exited processes,
+    files from before owners were recorded) share a single budget.
+
     I/O errors mark the writer broken (one warning, then silent no-op) —
     telemetry must never break the host application.
     """
 
-    def __init__(self, directory: str | Path, prefix: str, rotate_hours: int, retention_count: int) -> None:
+    suffix = ".jsonl"
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str,
+        rotate_hours: int,
+        retention_count: int,
+        *,
+        rotate_schedule: str | None = None,
+        flush_interval: float = 0.0,
+        flush_bytes: int = 0,
+        compress: bool = False,
+        worker_id: str | None = None,
+    ) -> None:
+        if rotate_schedule is not None:
+            period_key(rotate_schedule, datetime.now())  # validates the schedule
+        if worker_id is not None and not _WORKER_ID.fullmatch(worker_id):
+            raise ValueError(f"Invalid worker_id {worker_id!r}: use letters, digits, '_' and '-'")
         self._directory = Path(directory)
         self._prefix = prefix
         self._rotate_seconds = rotate_hours * 3600
         self._retention_count = retention_count
-        self._stream: IO[str] | None = None
+        self._rotate_schedule = rotate_schedule
+        self._flush_interval = flush_interval
+        self._flush_bytes = flush_bytes
+        self._buffered = flush_interval > 0 or flush_bytes > 0
+        self._compress = compress
+        self._file_suffix = self.suffix + (".gz" if compress else "")
+        self._worker_id = worker_id
+        self._pid = os.getpid()
+        self._name_pattern = re.compile(
+            rf"{re.escape(prefix)}-\d{{8}}-\d{{6}}(?:-(?P<owner>[A-Za-z0-9_-]+))?(?:\.\d+)?"
+            rf"{re.escape(self.suffix)}(?:\.gz)?"
+        )
+        self._stream: IO | None = None
         self._opened_at = 0.0
+        self._period: str | None = None
+        self._flushed_at = 0.0
+        self._pending = 0
         self._broken = False
+        # Flushes data left buffered by the last write (flush_interval only)
+        self._timer: threading.Timer | None = None
+        # Exports run on the processor's worker; flush/close may come from any thread
+        self._lock = threading.Lock()
 
     def _now(self) -> float:
         """Test seam, mirroring JSONFileHandler._now_local."""
         return time.time()
 
     def write_line(self, line: str) -> bool:
-        if self._broken:
-            return False
-        try:
-            if self._stream is None or self._stream.closed or self._now() - self._opened_at >= self._rotate_seconds:
-                self._open_new_file()
-            assert self._stream is not None
-            self._stream.write(line + "\n")
-            self._stream.flush()
+        return self._write(line + "\n")
+
+    def _write(self, data: str | bytes) -> bool:
+        with self._lock:
+            if self._broken:
+                return False
+            try:
+                now = self._now()
+                if self._needs_new_file(now):
+                    self._open_new_file()
+                assert self._stream is not None
+                self._stream.write(data)
+                self._pending += len(data)
+                if self._flush_due(now):
+                    self._flush_stream(now)
+                elif self._flush_interval:
+                    self._schedule_flush()
+                return True
+            except OSError as exc:
+                self._disable(exc)
+                return False
+
+    @property
+    def _owner(self) -> str:
+        return self._worker_id or str(self._pid)
+
+    def _needs_new_file(self, now: float) -> bool:
+        if self._worker_id is None and os.getpid() != self._pid:
+            self._abandon_stream()
+            self._pid = os.getpid()
             return True
-        except OSError as exc:
-            self._broken = True
-            logger.warning("Telemetry file writer disabled after I/O error: %s", exc)
-            return False
+        if self._stream is None or self._stream.closed or now - self._opened_at >= self._rotate_seconds:
+            return True
+        return self._rotate_schedule is not None and self._period != self._period_at(now)
+
+    def _period_at(self, now: float) -> str | None:
+        if self._rotate_schedule is None:
+            return None
+        return period_key(self._rotate_schedule, datetime.fromtimestamp(now))
+
+    def _flush_due(self, now: float) -> bool:
+        if not self._buffered:
+            return True
+        if self._flush_bytes and self._pending >= self._flush_bytes:
+            return True
+        return bool(self._flush_interval) and now - self._flushed_at >= self._flush_interval
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer unless one is pending (timers do not survive a fork)."""
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = threading.Timer(self._flush_interval, self._flush_pending)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_pending(self) -> None:
+        """Timer callback: flush data still buffered."""
+        with self._lock:
+            if self._broken or self._stream is None or self._stream.closed or not self._pending:
+                return
+            try:
+                self._flush_stream(self._now())
+            except OSError as exc:
+                self._disable(exc)
+
+    def _flush_stream(self, now: float) -> None:
+        assert self._stream is not None
+        self._stream.flush()
+        self._pending = 0
+        self._flushed_at = now
+
+    def _disable(self, exc: OSError) -> None:
+        self._broken = True
+        logger.warning("Telemetry file writer disabled after I/O error: %s", exc)
+
+    def flush(self) -> bool:
+        """Write out buffered data. Returns False once the writer is broken."""
+        with self._lock:
+            if self._broken:
+                return False
+            if self._stream is None or self._stream.closed:
+                return True
+            try:
+                self._flush_stream(self._now())
+                return True
+            except OSError as exc:
+                self._disable(exc)
+                return False
+
+    def _abandon_stream(self) -> None:
+        """Drop a stream inherited across fork without flushing the parent's buffer into it."""
+        if self._stream is None or self._stream.closed:
+            return
+        try:
+            os.close(self._stream.fileno())
+        except OSError:
+            pass
+        try:
+            self._stream.close()
+        except (OSError, ValueError):
+            pass  # the buffered data belongs to the parent process
+        self._stream = None
 
     def _open_new_file(self) -> None:
         if self._stream is not None and not self._stream.closed:
             self._stream.close()
         self._directory.mkdir(parents=True, exist_ok=True)
-        stamp = datetime.fromtimestamp(self._now()).strftime("%Y%m%d-%H%M%S")
-        target = self._directory / f"{self._prefix}-{stamp}.jsonl"
-        suffix = 1
-        while target.exists():
-            target = self._directory / f"{self._prefix}-{stamp}.{suffix}.jsonl"
-            suffix += 1
-        self._stream = target.open("a", encoding="utf-8")
-        self._opened_at = self._now()
-        self._prune()
+        now = self._now()
+        with _directory_lock(self._directory / f".{self._prefix}.lock"):
+            self._stream = self._open(self._create_target(now))
+            self._mark_in_use()
+            self._opened_at = self._flushed_at = now
+            self._period = self._period_at(now)
+            self._pending = 0
+            self._prune()
+
+    def _create_target(self, now: float) -> Path:
+        stamp = datetime.fromtimestamp(now).strftime("%Y%m%d-%H%M%S")
+        base = f"{self._prefix}-{stamp}-{self._owner}"
+        target = self._directory / f"{base}{self._file_suffix}"
+        counter = 1
+        while True:
+            try:
+                target.touch(exist_ok=False)  # atomic, even against writers not using the lock
+                return target
+            except FileExistsError:
+                target = self._directory / f"{base}.{counter}{self._file_suffix}"
+                counter += 1
+
+    def _mark_in_use(self) -> None:
+        """Hold a shared lock on the active file while it is open; pruners skip locked files."""
+        if fcntl is None or self._stream is None:
+            return
+        try:
+            fcntl.flock(self._stream.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except OSError:
+            pass  # filesystems without flock: the directory lock still orders writers
+
+    def _buffer_size(self) -> int:
+        # Large enough that flush_bytes, not the io buffer, decides when to write
+        return max(self._flush_bytes, io.DEFAULT_BUFFER_SIZE) if self._buffered else -1
+
+    def _open(self, target: Path) -> IO:
+        if self._compress:
+            return gzip.open(target, "at", encoding="utf-8")
+        return target.open("a", encoding="utf-8", buffering=self._buffer_size())
 
     def _prune(self) -> None:
-        files = sorted(
-            self._directory.glob(f"{self._prefix}-*.jsonl"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        owners: dict[str, list[Path]] = {}
+        for path in self._directory.glob(f"{self._prefix}-*{self.suffix}*"):
+            match = self._name_pattern.fullmatch(path.name)
+            if match is not None:
+                owners.setdefault(match["owner"] or "", []).append(path)
+        retired: list[Path] = []
+        for owner, files in owners.items():
+            files.sort(key=_mtime, reverse=True)
+            if owner != self._owner and not _in_use(files[0]):
+                retired.extend(files)
+            else:
+                self._delete_oldest(files)
+        retired.sort(key=_mtime, reverse=True)
+        self._delete_oldest(retired)
+
+    def _delete_oldest(self, files: list[Path]) -> None:
+        """Delete all but the newest `retention_count` of `files` (sorted newest first)."""
         for old in files[self._retention_count :]:
+            if _in_use(old):
+                continue
             try:
                 old.unlink()
             except OSError:
                 continue  # pruning failures must never break telemetry
 
     def close(self) -> None:
-        if self._stream is not None and not self._stream.closed:
-            try:
-                self._stream.close()
-            except OSError:
-                pass
-        self._stream = None
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._stream is not None and not self._stream.closed:
+                try:
+                    self._stream.close()
+                except OSError:
+                    pass
+            self._stream = None
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative int as a protobuf base-128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+class _RotatingSegmentWriter(_RotatingJsonlWriter):
+    """Appends length-delimited messages to `<prefix>-YYYYMMDD-HHMMSS.binpb`.
+
+    Each message is written as a varint byte length followed by the message
+    bytes, the framing protobuf's own writeDelimitedTo uses. Rotation,
+    retention, buffering, compression and error handling are the JSONL
+    writer's.
+    """
+
+    suffix = ".binpb"
+
+    def write_message(self, message: bytes) -> bool:
+        return self._write(encode_varint(len(message)) + message)
+
+    def _open(self, target: Path) -> IO:
+        if self._compress:
+            return gzip.open(target, "ab")
+        return target.open("ab", buffering=self._buffer_size())
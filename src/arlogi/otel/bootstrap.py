@@ -4,21 +4,33 @@ import logging
 import socket
 import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from opentelemetry import metrics, trace
+from opentelemetry import _logs, metrics, trace
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-from arlogi.otel.exporters import RotatingJsonlMetricExporter, RotatingJsonlSpanExporter
+from arlogi.otel.exporters import RotatingJsonlLogExporter, RotatingJsonlMetricExporter, RotatingJsonlSpanExporter
+from arlogi.otel.logs import OtelLogHandler
+from arlogi.otel.processors import FanOutSpanProcessor
+from arlogi.otel.readers import FanOutMetricReader
+from arlogi.otel.selfmetrics import register_self_metrics
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics.export import MetricExporter
+    from opentelemetry.sdk.trace.export import SpanExporter
 
 logger = logging.getLogger(__name__)
 
 _lock = threading.Lock()
 _tracer_provider: TracerProvider | None = None
+_span_processor: FanOutSpanProcessor | None = None
 _meter_provider: MeterProvider | None = None
+_logger_provider: LoggerProvider | None = None
+_log_handler: OtelLogHandler | None = None
 
 
 def _clear_global_tracer_provider() -> None:
@@ -48,6 +60,17 @@ def _clear_global_meter_provider() -> None:
         logger.warning("could not release the global MeterProvider; re-initialisation may be ignored")
 
 
+def _clear_global_logger_provider() -> None:
+    """Release OpenTelemetry's process-global LoggerProvider slot (see above)."""
+    try:
+        from opentelemetry.util._once import Once
+
+        _logs._internal._LOGGER_PROVIDER_SET_ONCE = Once()
+        _logs._internal._LOGGER_PROVIDER = None
+    except Exception:  # pragma: no cover - upstream internals moved
+        logger.warning("could not release the global LoggerProvider; re-initialisation may be ignored")
+
+
 def _build_resource(service_name: str, service_version: str | None) -> Resource:
     attributes: dict[str, str] = {"service.name": service_name, "host.name": socket.gethostname()}
     if service_version:
@@ -63,45 +86,94 @@ def setup_tracing(
     file_prefix: str = "traces",
     rotate_hours: int = 24,
     retention_count: int = 20,
+    file_format: str = "jsonl",
+    rotate_schedule: str | None = None,
+    flush_interval: float = 0.0,
+    flush_bytes: int = 0,
+    compress: bool = False,
+    worker_id: str | None = None,
     otlp_endpoint: str | None = None,
     otlp_timeout: int = 5,
+    max_queue_size: int = 2048,
+    max_export_batch_size: int = 512,
+    schedule_delay_millis: float = 5000,
+    drop_policy: str = "drop_oldest",
 ) -> TracerProvider:
     """Create and register the global TracerProvider. Idempotent.
 
+    Spans are queued once by a :class:`~arlogi.otel.processors.FanOutSpanProcessor`,
+    which hands each batch to the file exporter and, when ``otlp_endpoint`` is
+    set, to the OTLP exporter. Its counters (including dropped spans) are
+    available from :func:`get_span_processor`.
+
     Call :func:`shutdown_tracing` before calling this again if the host
     application needs to tear the pipeline down and re-initialise it.
 
     Args:
+        file_format: ``"jsonl"`` (OTLP/JSON lines) or ``"protobuf"`` (length-delimited
+            binary OTLP ``.binpb`` segments, read back with :mod:`arlogi.otel.segments`)
+        rotate_schedule: Also start a new file on each "hour", "day", "week" or
+            "month" wall-clock boundary
+        flush_interval: Buffer writes and flush them at most this many seconds apart
+        flush_bytes: Buffer writes and flush them once this many are pending
+        compress: Write gzip-compressed files (``.jsonl.gz`` / ``.binpb.gz``)
+        worker_id: Owner tag in the file names, defaulting to the pid; lets several
+            processes share ``file_dir``, each pruning only its own files
         otlp_timeout: Per-export timeout in seconds for the OTLP exporter. Keeps an
             unreachable collector from stalling shutdown with retry backoff.
+        max_queue_size: Ended spans held for export before ``drop_policy`` applies
+        max_export_batch_size: Most spans written or sent per export call
+        schedule_delay_millis: Longest wait before a partial batch is exported
+        drop_policy: ``"drop_oldest"`` or ``"drop_newest"`` when the queue is full
     """
-    global _tracer_provider
+    global _tracer_provider, _span_processor
     with _lock:
         if _tracer_provider is not None:
             logger.warning("setup_tracing() called more than once; keeping existing provider")
             return _tracer_provider
 
-        provider = TracerProvider(resource=_build_resource(service_name, service_version))
-        provider.add_span_processor(
-            BatchSpanProcessor(
-                RotatingJsonlSpanExporter(
-                    file_dir, prefix=file_prefix, rotate_hours=rotate_hours, retention_count=retention_count
-                )
+        exporters: list[SpanExporter] = [
+            RotatingJsonlSpanExporter(
+                file_dir,
+                prefix=file_prefix,
+                rotate_hours=rotate_hours,
+                retention_count=retention_count,
+                file_format=file_format,
+                rotate_schedule=rotate_schedule,
+                flush_interval=flush_interval,
+                flush_bytes=flush_bytes,
+                compress=compress,
+                worker_id=worker_id,
             )
-        )
+        ]
         if otlp_endpoint:
             from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
-            provider.add_span_processor(
-                BatchSpanProcessor(
-                    OTLPSpanExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/traces", timeout=otlp_timeout)
-                )
-            )
+            exporters.append(OTLPSpanExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/traces", timeout=otlp_timeout))
+        processor = FanOutSpanProcessor(
+            exporters,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+            schedule_delay_millis=schedule_delay_millis,
+            drop_policy=drop_policy,
+        )
+        provider = TracerProvider(resource=_build_resource(service_name, service_version))
+        provider.add_span_processor(processor)
         trace.set_tracer_provider(provider)
         _tracer_provider = provider
+        _span_processor = processor
         return provider
 
 
+def get_span_processor() -> FanOutSpanProcessor | None:
+    """Return the span processor of the :func:`setup_tracing` pipeline, if any.
+
+    Its :meth:`~arlogi.otel.processors.FanOutSpanProcessor.stats` report queued,
+    exported and dropped spans and failed exports.
+    """
+    return _span_processor
+
+
 def shutdown_tracing() -> None:
     """Shut down and unregister the global TracerProvider.
 
@@ -109,20 +181,48 @@ def shutdown_tracing() -> None:
     (and repeatedly) from host-application cleanup paths. After this returns,
     :func:`setup_tracing` builds a fresh, working provider.
     """
-    global _tracer_provider
+    global _tracer_provider, _span_processor
     with _lock:
         if _tracer_provider is None:
             return
         _tracer_provider.shutdown()
         _tracer_provider = None
+        _span_processor = None
         _clear_global_tracer_provider()
 
 
+# span_id -> (trace id, trace id hex, span id hex), shared by the span's
+# records. Hits are a single dict read; misses insert (evicting the oldest
+# span once full) under _span_ids_lock.
+_span_ids: dict[int, tuple[int, str, str]] = {}
+_span_ids_lock = threading.Lock()
+_SPAN_IDS_MAX = 1024
+
+
+def _stamp_correlation(record: logging.LogRecord) -> None:
+    """Set trace_id/span_id on ``record`` while a span is active."""
+    context = trace.get_current_span().get_span_context()
+    if not context.is_valid:
+        return
+    span_id, trace_id = context.span_id, context.trace_id
+    ids = _span_ids.get(span_id)
+    if ids is None or ids[0] != trace_id:
+        ids = (trace_id, format(trace_id, "032x"), format(span_id, "016x"))
+        with _span_ids_lock:
+            if len(_span_ids) >= _SPAN_IDS_MAX:
+                del _span_ids[next(iter(_span_ids))]
+            _span_ids[span_id] = ids
+    record.trace_id, record.span_id = ids[1], ids[2]
+
+
 def install_log_correlation() -> None:
     """Stamp trace_id/span_id (hex) onto LogRecords while a span is active.
 
     Implemented via the process-global LogRecord factory (not a Filter) so it
-    survives handler reconfiguration by the host application.
+    survives handler reconfiguration by the host application. The ids are
+    plain strings, rendered as hex once per span and shared by all records
+    of the span. The factory exposes ``stamp_record``
+    and ``wraps_factory``, so TraceLogger keeps building lean records.
     """
     with _lock:
         current = logging.getLogRecordFactory()
@@ -131,13 +231,12 @@ def install_log_correlation() -> None:
 
         def factory(*args: object, **kwargs: object) -> logging.LogRecord:
             record = current(*args, **kwargs)  # type: ignore[arg-type]
-            context = trace.get_current_span().get_span_context()
-            if context.is_valid:
-                record.trace_id = format(context.trace_id, "032x")
-                record.span_id = format(context.span_id, "016x")
+            _stamp_correlation(record)
             return record
 
         factory._arlogi_otel_correlation = True  # type: ignore[attr-defined]
+        factory.stamp_record = _stamp_correlation  # type: ignore[attr-defined]
+        factory.wraps_factory = current  # type: ignore[attr-defined]
         logging.setLogRecordFactory(factory)
 
 
@@ -149,18 +248,42 @@ def setup_metrics(
     file_prefix: str = "metrics",
     rotate_hours: int = 24,
     retention_count: int = 20,
+    file_format: str = "jsonl",
+    rotate_schedule: str | None = None,
+    flush_interval: float = 0.0,
+    flush_bytes: int = 0,
+    compress: bool = False,
+    worker_id: str | None = None,
     otlp_endpoint: str | None = None,
     otlp_timeout: int = 5,
     export_interval_millis: int = 60_000,
+    temporality: str = "cumulative",
+    skip_unchanged: bool = False,
 ) -> MeterProvider:
     """Create and register the global MeterProvider. Idempotent.
 
     Call :func:`shutdown_metrics` before calling this again if the host
     application needs to tear the pipeline down and re-initialise it.
 
+    arlogi's own pipeline self-metrics (see :mod:`arlogi.selfmetrics`) are
+    published through the provider while their collection is enabled.
+
     Args:
+        file_format: ``"jsonl"`` (OTLP/JSON lines) or ``"protobuf"`` (length-delimited
+            binary OTLP ``.binpb`` segments, read back with :mod:`arlogi.otel.segments`)
+        rotate_schedule: Also start a new file on each "hour", "day", "week" or
+            "month" wall-clock boundary
+        flush_interval: Buffer writes and flush them at most this many seconds apart
+        flush_bytes: Buffer writes and flush them once this many are pending
+        compress: Write gzip-compressed files (``.jsonl.gz`` / ``.binpb.gz``)
+        worker_id: Owner tag in the file names, defaulting to the pid; lets several
+            processes share ``file_dir``, each pruning only its own files
         otlp_timeout: Per-export timeout in seconds for the OTLP exporter. Keeps an
             unreachable collector from stalling shutdown with retry backoff.
+        export_interval_millis: Interval between collections, each exported to every sink
+        temporality: ``"cumulative"``, or ``"delta"`` for counters and histograms
+        skip_unchanged: Leave series that did not change since the last export
+            out of it, shrinking the metrics files
     """
     global _meter_provider
     with _lock:
@@ -168,24 +291,34 @@ def setup_metrics(
             logger.warning("setup_metrics() called more than once; keeping existing provider")
             return _meter_provider
 
-        readers = [
-            PeriodicExportingMetricReader(
-                RotatingJsonlMetricExporter(
-                    file_dir, prefix=file_prefix, rotate_hours=rotate_hours, retention_count=retention_count
-                ),
-                export_interval_millis=export_interval_millis,
+        exporters: list[MetricExporter] = [
+            RotatingJsonlMetricExporter(
+                file_dir,
+                prefix=file_prefix,
+                rotate_hours=rotate_hours,
+                retention_count=retention_count,
+                file_format=file_format,
+                rotate_schedule=rotate_schedule,
+                flush_interval=flush_interval,
+                flush_bytes=flush_bytes,
+                compress=compress,
+                worker_id=worker_id,
             )
         ]
         if otlp_endpoint:
             from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 
-            readers.append(
-                PeriodicExportingMetricReader(
-                    OTLPMetricExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/metrics", timeout=otlp_timeout),
-                    export_interval_millis=export_interval_millis,
-                )
+            exporters.append(
+                OTLPMetricExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/metrics", timeout=otlp_timeout)
             )
-        provider = MeterProvider(resource=_build_resource(service_name, service_version), metric_readers=readers)
+        reader = FanOutMetricReader(
+            exporters,
+            export_interval_millis=export_interval_millis,
+            temporality=temporality,
+            skip_unchanged=skip_unchanged,
+        )
+        provider = MeterProvider(resource=_build_resource(service_name, service_version), metric_readers=[reader])
+        register_self_metrics(provider)
         metrics.set_meter_provider(provider)
         _meter_provider = provider
         return provider
@@ -205,3 +338,102 @@ def shutdown_metrics() -> None:
         _meter_provider.shutdown()
         _meter_provider = None
         _clear_global_meter_provider()
+
+
+def setup_logs(
+    service_name: str,
+    service_version: str | None = None,
+    *,
+    file_dir: str | Path,
+    file_prefix: str = "logs",
+    rotate_hours: int = 24,
+    retention_count: int = 20,
+    file_format: str = "jsonl",
+    rotate_schedule: str | None = None,
+    flush_interval: float = 0.0,
+    flush_bytes: int = 0,
+    compress: bool = False,
+    worker_id: str | None = None,
+    otlp_endpoint: str | None = None,
+    otlp_timeout: int = 5,
+    level: int = logging.NOTSET,
+) -> LoggerProvider:
+    """Create and register the global LoggerProvider and bridge logging to it. Idempotent.
+
+    An :class:`~arlogi.otel.logs.OtelLogHandler` is attached to the root
+    logger, so arlogi and stdlib records that propagate there are exported as
+    OTel logs. The calling thread only captures the record; batching, OTLP
+    encoding and writing run in BatchLogRecordProcessor's worker thread.
+
+    Call :func:`shutdown_logs` before calling this again if the host
+    application needs to tear the pipeline down and re-initialise it.
+
+    Args:
+        file_format: ``"jsonl"`` (OTLP/JSON lines) or ``"protobuf"`` (length-delimited
+            binary OTLP ``.binpb`` segments, read back with :mod:`arlogi.otel.segments`)
+        rotate_schedule: Also start a new file on each "hour", "day", "week" or
+            "month" wall-clock boundary
+        flush_interval: Buffer writes and flush them at most this many seconds apart
+        flush_bytes: Buffer writes and flush them once this many are pending
+        compress: Write gzip-compressed files (``.jsonl.gz`` / ``.binpb.gz``)
+        worker_id: Owner tag in the file names, defaulting to the pid; lets several
+            processes share ``file_dir``, each pruning only its own files
+        otlp_timeout: Per-export timeout in seconds for the OTLP exporter. Keeps an
+            unreachable collector from stalling shutdown with retry backoff.
+        level: Minimum level of the records exported
+    """
+    global _logger_provider, _log_handler
+    with _lock:
+        if _logger_provider is not None:
+            logger.warning("setup_logs() called more than once; keeping existing provider")
+            return _logger_provider
+
+        provider = LoggerProvider(resource=_build_resource(service_name, service_version))
+        provider.add_log_record_processor(
+            BatchLogRecordProcessor(
+                RotatingJsonlLogExporter(
+                    file_dir,
+                    prefix=file_prefix,
+                    rotate_hours=rotate_hours,
+                    retention_count=retention_count,
+                    file_format=file_format,
+                    rotate_schedule=rotate_schedule,
+                    flush_interval=flush_interval,
+                    flush_bytes=flush_bytes,
+                    compress=compress,
+                    worker_id=worker_id,
+                )
+            )
+        )
+        if otlp_endpoint:
+            from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+
+            provider.add_log_record_processor(
+                BatchLogRecordProcessor(
+                    OTLPLogExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/logs", timeout=otlp_timeout)
+                )
+            )
+        _logs.set_logger_provider(provider)
+        _log_handler = OtelLogHandler(provider, level)
+        logging.getLogger().addHandler(_log_handler)
+        _logger_provider = provider
+        return provider
+
+
+def shutdown_logs() -> None:
+    """Detach the log bridge, then flush, shut down and unregister the LoggerProvider.
+
+    A no-op when logs were never set up, so it is safe to call unconditionally
+    (and repeatedly) from host-application cleanup paths. After this returns,
+    :func:`setup_logs` builds a fresh, working provider.
+    """
+    global _logger_provider, _log_handler
+    with _lock:
+        if _logger_provider is None:
+            return
+        if _log_handler is not None:
+            logging.getLogger().removeHandler(_log_handler)
+            _log_handler = None
+        _logger_provider.shutdown()
+        _logger_provider = None
+        _clear_global_logger_provider()
@@ -3,12 +3,14 @@
 import asyncio
 import functools
 import inspect
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any, overload
 
 from opentelemetry import trace
 
 _trace_modules: dict[str, bool] = {}
+# Bumped by set_trace_modules so every _Gate re-resolves its cached decision
+_generation = 0
 
 
 def set_trace_modules(rules: dict[str, bool] | None) -> None:
@@ -18,8 +20,9 @@ def set_trace_modules(rules: dict[str, bool] | None) -> None:
     subtree. Longest-prefix match wins. Modules matching no rule default to
     enabled. None or {} clears all rules (trace everything).
     """
-    global _trace_modules
+    global _trace_modules, _generation
     _trace_modules = dict(rules) if rules else {}
+    _generation += 1
 
 
 def _module_enabled(module: str) -> bool:
@@ -35,11 +38,258 @@ def _module_enabled(module: str) -> bool:
     return True
 
 
+class _Gate:
+    """One decorated function's gating decision, cached until the rules change.
+
+    Wrappers test ``gate.generation == _generation`` inline and only call
+    :meth:`refresh` after set_trace_modules(), so a disabled module costs a
+    comparison per call instead of a prefix walk.
+    """
+
+    __slots__ = ("enabled", "generation", "module")
+
+    def __init__(self, module: str) -> None:
+        self.module = module
+        self.generation = -1
+        self.enabled = True
+
+    def refresh(self) -> bool:
+        # Read the generation first: rules replaced meanwhile bump it again
+        generation = _generation
+        self.enabled = _module_enabled(self.module)
+        self.generation = generation
+        return self.enabled
+
+
+def _pull_chunk(gen: Iterator[Any], size: int) -> tuple[list[Any], Exception | None]:
+    """Pull up to ``size`` items from ``gen``.
+
+    Returns:
+        The items pulled and the exception that stopped the generator, if
+        any (raised by the caller after yielding the items before it)
+    """
+    chunk: list[Any] = []
+    try:
+        for item in gen:
+            chunk.append(item)
+            if len(chunk) == size:
+                break
+    except Exception as exc:
+        return chunk, exc
+    return chunk, None
+
+
+async def _apull_chunk(agen: AsyncIterator[Any], size: int) -> tuple[list[Any], Exception | None]:
+    """Async counterpart of :func:`_pull_chunk`."""
+    chunk: list[Any] = []
+    try:
+        async for item in agen:
+            chunk.append(item)
+            if len(chunk) == size:
+                break
+    except Exception as exc:
+        return chunk, exc
+    return chunk, None
+
+
+def _trace_async_generator(
+    fn: Callable[..., Any], tracer: trace.Tracer, span_name: str, attrs: dict[str, Any] | None, gate: _Gate
+) -> Callable[..., Any]:
+    """Async counterpart of :func:`_trace_generator`."""
+
+    @functools.wraps(fn)
+    async def agen_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not (gate.enabled if gate.generation == _generation else gate.refresh()):
+            async for item in fn(*args, **kwargs):
+                yield item
+            return
+        span = tracer.start_span(span_name, attributes=attrs)
+        gen = fn(*args, **kwargs)
+        try:
+            while True:
+                with trace.use_span(
+                    span,
+                    end_on_exit=False,
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    try:
+                        item = await gen.__anext__()
+                    except StopAsyncIteration:
+                        break
+                yield item
+        except (GeneratorExit, asyncio.CancelledError):
+            # Consumer abandonment / task cancellation: end the span
+            # below without marking it as a generator failure.
+            raise
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(trace.StatusCode.ERROR, str(exc))
+            raise
+        finally:
+            span.end()
+
+    return agen_wrapper
+
+
+def _trace_generator(
+    fn: Callable[..., Any], tracer: trace.Tracer, span_name: str, attrs: dict[str, Any] | None, gate: _Gate
+) -> Callable[..., Any]:
+    """Build traced()'s wrapper for a generator function: one span per call, current while each item is pulled."""
+
+    @functools.wraps(fn)
+    def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not (gate.enabled if gate.generation == _generation else gate.refresh()):
+            yield from fn(*args, **kwargs)
+            return
+        span = tracer.start_span(span_name, attributes=attrs)
+        gen = fn(*args, **kwargs)
+        try:
+            while True:
+                with trace.use_span(
+                    span,
+                    end_on_exit=False,
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    try:
+                        item = next(gen)
+                    except StopIteration:
+                        break
+                yield item
+        except GeneratorExit:
+            raise  # consumer close(): end span without ERROR status
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(trace.StatusCode.ERROR, str(exc))
+            raise
+        finally:
+            span.end()
+
+    return gen_wrapper
+
+
+def _trace_async_generator_chunks(
+    fn: Callable[..., Any],
+    tracer: trace.Tracer,
+    span_name: str,
+    attrs: dict[str, Any] | None,
+    gate: _Gate,
+    chunk_size: int,
+) -> Callable[..., Any]:
+    """Async counterpart of :func:`_trace_generator_chunks`."""
+
+    @functools.wraps(fn)
+    async def agen_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not (gate.enabled if gate.generation == _generation else gate.refresh()):
+            async for item in fn(*args, **kwargs):
+                yield item
+            return
+        span = tracer.start_span(span_name, attributes=attrs)
+        gen = fn(*args, **kwargs)
+        try:
+            while True:
+                with trace.use_span(
+                    span,
+                    end_on_exit=False,
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    chunk, failure = await _apull_chunk(gen, chunk_size)
+                for item in chunk:
+                    yield item
+                if failure is not None:
+                    raise failure
+                if len(chunk) < chunk_size:
+                    break
+        except (GeneratorExit, asyncio.CancelledError):
+            # Consumer abandonment / task cancellation: end the span
+            # below without marking it as a generator failure.
+            raise
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(trace.StatusCode.ERROR, str(exc))
+            raise
+        finally:
+            span.end()
+
+    return agen_wrapper
+
+
+def _trace_generator_chunks(
+    fn: Callable[..., Any],
+    tracer: trace.Tracer,
+    span_name: str,
+    attrs: dict[str, Any] | None,
+    gate: _Gate,
+    chunk_size: int,
+) -> Callable[..., Any]:
+    """Build traced()'s wrapper for a generator function with chunk_size > 1.
+
+    One span per call, current while each chunk is pulled.
+    """
+
+    @functools.wraps(fn)
+    def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not (gate.enabled if gate.generation == _generation else gate.refresh()):
+            yield from fn(*args, **kwargs)
+            return
+        span = tracer.start_span(span_name, attributes=attrs)
+        gen = fn(*args, **kwargs)
+        try:
+            while True:
+                with trace.use_span(
+                    span,
+                    end_on_exit=False,
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    chunk, failure = _pull_chunk(gen, chunk_size)
+                yield from chunk
+                if failure is not None:
+                    raise failure
+                if len(chunk) < chunk_size:
+                    break
+        except GeneratorExit:
+            raise  # consumer close(): end span without ERROR status
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(trace.StatusCode.ERROR, str(exc))
+            raise
+        finally:
+            span.end()
+
+    return gen_wrapper
+
+
+def _wrap_generator(
+    fn: Callable[..., Any],
+    tracer: trace.Tracer,
+    span_name: str,
+    attrs: dict[str, Any] | None,
+    gate: _Gate,
+    chunk_size: int,
+) -> Callable[..., Any] | None:
+    """Return traced()'s wrapper for a (async) generator function, or None for other functions.
+
+    chunk_size 1 gets the per-item wrappers, which skip the chunk bookkeeping.
+    """
+    if inspect.isasyncgenfunction(fn):
+        if chunk_size == 1:
+            return _trace_async_generator(fn, tracer, span_name, attrs, gate)
+        return _trace_async_generator_chunks(fn, tracer, span_name, attrs, gate, chunk_size)
+    if inspect.isgeneratorfunction(fn):
+        if chunk_size == 1:
+            return _trace_generator(fn, tracer, span_name, attrs, gate)
+        return _trace_generator_chunks(fn, tracer, span_name, attrs, gate, chunk_size)
+    return None
+
+
 @overload
 def traced[**P, R](func: Callable[P, R]) -> Callable[P, R]: ...
 @overload
 def traced[**P, R](
-    *, name: str | None = None, attrs: dict[str, Any] | None = None
+    *, name: str | None = None, attrs: dict[str, Any] | None = None, chunk_size: int = 1
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
@@ -48,6 +298,7 @@ def traced[**P, R](
     *,
     name: str | None = None,
     attrs: dict[str, Any] | None = None,
+    chunk_size: int = 1,
 ) -> Any:
     """Wrap a function in an OpenTelemetry span.
 
@@ -56,87 +307,34 @@ def traced[**P, R](
     controlled by set_trace_modules(). Exceptions are recorded on the span
     and re-raised. Without a configured SDK the proxy tracer makes this a
     near-zero-cost no-op.
+
+    Generators are resumed with their span as the current span, so spans
+    and log records created in the body are its children. That costs a
+    context attach/detach per item; chunk_size > 1 instead pulls up to
+    chunk_size items per activation and yields them afterwards, for
+    generators that stream many items. The body then runs that many items
+    ahead of the consumer, and an exception is raised only after the items
+    produced before it. chunk_size is ignored for other functions.
+
+    Raises:
+        ValueError: If chunk_size is less than 1
     """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
 
     def decorate(fn: Callable[P, R]) -> Callable[P, R]:
         span_name = name or f"{fn.__module__}.{fn.__qualname__}"
         tracer = trace.get_tracer(fn.__module__)
-        module = fn.__module__
-
-        if inspect.isasyncgenfunction(fn):
-
-            @functools.wraps(fn)
-            async def agen_wrapper(*args: Any, **kwargs: Any) -> Any:
-                if not _module_enabled(module):
-                    async for item in fn(*args, **kwargs):
-                        yield item
-                    return
-                span = tracer.start_span(span_name, attributes=attrs)
-                gen = fn(*args, **kwargs)
-                try:
-                    while True:
-                        with trace.use_span(
-                            span,
-                            end_on_exit=False,
-                            record_exception=False,
-                            set_status_on_exception=False,
-                        ):
-                            try:
-                                item = await gen.__anext__()
-                            except StopAsyncIteration:
-                                break
-                        yield item
-                except (GeneratorExit, asyncio.CancelledError):
-                    # Consumer abandonment / task cancellation: end the span
-                    # below without marking it as a generator failure.
-                    raise
-                except Exception as exc:
-                    span.record_exception(exc)
-                    span.set_status(trace.StatusCode.ERROR, str(exc))
-                    raise
-                finally:
-                    span.end()
-
-            return agen_wrapper
-
-        if inspect.isgeneratorfunction(fn):
-
-            @functools.wraps(fn)
-            def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
-                if not _module_enabled(module):
-                    yield from fn(*args, **kwargs)
-                    return
-                span = tracer.start_span(span_name, attributes=attrs)
-                gen = fn(*args, **kwargs)
-                try:
-                    while True:
-                        with trace.use_span(
-                            span,
-                            end_on_exit=False,
-                            record_exception=False,
-                            set_status_on_exception=False,
-                        ):
-                            try:
-                                item = next(gen)
-                            except StopIteration:
-                                break
-                        yield item
-                except GeneratorExit:
-                    raise  # consumer close(): end span without ERROR status
-                except Exception as exc:
-                    span.record_exception(exc)
-                    span.set_status(trace.StatusCode.ERROR, str(exc))
-                    raise
-                finally:
-                    span.end()
+        gate = _Gate(fn.__module__)
 
+        gen_wrapper = _wrap_generator(fn, tracer, span_name, attrs, gate, chunk_size)
+        if gen_wrapper is not None:
             return gen_wrapper
-
         if inspect.iscoroutinefunction(fn):
 
             @functools.wraps(fn)
             async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                if not _module_enabled(module):
+                if not (gate.enabled if gate.generation == _generation else gate.refresh()):
                     return await fn(*args, **kwargs)  # type: ignore[no-any-return]
                 with tracer.start_as_current_span(span_name, attributes=attrs):
                     return await fn(*args, **kwargs)  # type: ignore[no-any-return]
@@ -145,7 +343,7 @@ def traced[**P, R](
 
         @functools.wraps(fn)
         def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            if not _module_enabled(module):
+            if not (gate.enabled if gate.generation == _generation else gate.refresh()):
                 return fn(*args, **kwargs)
             with tracer.start_as_current_span(span_name, attributes=attrs):
                 return fn(*args, **kwargs)
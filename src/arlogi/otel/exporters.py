@@ -1,22 +1,56 @@
-"""File-based OTLP exporters."""
+"""File-based OTLP exporters.
+
+With the default ``file_format="jsonl"`` batches are encoded to OTLP/JSON
+directly from the SDK objects (see arlogi.otel._encode), without building
+protobuf messages. ``file_format="protobuf"`` instead writes each batch as a
+length-delimited binary OTLP Export*ServiceRequest to a ``.binpb`` segment;
+arlogi.otel.segments reads those back as OTLP/JSON.
+
+Every exporter also takes ``rotate_schedule`` (rotate on hour/day/week/month
+boundaries as well as by age), ``flush_interval``/``flush_bytes`` (buffer
+writes instead of flushing each batch; ``force_flush`` writes the buffer
+out), ``compress`` (gzip the active file as it is written) and
+``worker_id`` (the owner tag in file names, the pid by default, so several
+processes can share a directory).
+"""
 
 import json
 from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
-from google.protobuf.json_format import MessageToDict
-from opentelemetry.exporter.otlp.proto.common.metrics_encoder import encode_metrics
-from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import LogRecordExporter, LogRecordExportResult
 from opentelemetry.sdk.metrics.export import MetricExporter, MetricExportResult, MetricsData
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
-from arlogi.otel._encode import b64_ids_to_hex
-from arlogi.otel._files import _RotatingJsonlWriter
+from arlogi.otel._encode import encode_logs_json, encode_metrics_json, encode_spans_json
+from arlogi.otel._files import _RotatingJsonlWriter, _RotatingSegmentWriter
+
+FILE_FORMATS = ("jsonl", "protobuf")
+
+
+def _writer(
+    file_format: str,
+    directory: str | Path,
+    prefix: str,
+    rotate_hours: int,
+    retention_count: int,
+    **options: Any,
+) -> _RotatingJsonlWriter:
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Invalid file_format {file_format!r}. Must be one of: {', '.join(FILE_FORMATS)}")
+    writer_class = _RotatingSegmentWriter if file_format == "protobuf" else _RotatingJsonlWriter
+    return writer_class(directory, prefix, rotate_hours, retention_count, **options)
 
 
 class RotatingJsonlSpanExporter(SpanExporter):
-    """Writes each export batch as one OTLP/JSON ResourceSpans object per line."""
+    """Writes each export batch as one OTLP/JSON ResourceSpans object per line.
+
+    With ``file_format="protobuf"`` each batch is instead appended to a
+    ``.binpb`` segment as a length-delimited binary OTLP request.
+    """
 
     def __init__(
         self,
@@ -24,27 +58,52 @@ class RotatingJsonlSpanExporter(SpanExporter):
         prefix: str = "traces",
         rotate_hours: int = 24,
         retention_count: int = 20,
+        file_format: str = "jsonl",
+        *,
+        rotate_schedule: str | None = None,
+        flush_interval: float = 0.0,
+        flush_bytes: int = 0,
+        compress: bool = False,
+        worker_id: str | None = None,
     ) -> None:
-        self._writer = _RotatingJsonlWriter(directory, prefix, rotate_hours, retention_count)
+        self._writer = _writer(
+            file_format,
+            directory,
+            prefix,
+            rotate_hours,
+            retention_count,
+            rotate_schedule=rotate_schedule,
+            flush_interval=flush_interval,
+            flush_bytes=flush_bytes,
+            compress=compress,
+            worker_id=worker_id,
+        )
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         try:
-            payload = MessageToDict(encode_spans(spans))
+            if isinstance(self._writer, _RotatingSegmentWriter):
+                from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+
+                ok = self._writer.write_message(encode_spans(spans).SerializeToString())
+            else:
+                ok = self._writer.write_line(json.dumps(encode_spans_json(spans), separators=(",", ":")))
         except Exception:
             return SpanExportResult.FAILURE
-        b64_ids_to_hex(payload)
-        ok = self._writer.write_line(json.dumps(payload, separators=(",", ":")))
         return SpanExportResult.SUCCESS if ok else SpanExportResult.FAILURE
 
     def force_flush(self, timeout_millis: int = 30_000) -> bool:
-        return True  # write_line flushes on every batch
+        return self._writer.flush()
 
     def shutdown(self) -> None:
         self._writer.close()
 
 
 class RotatingJsonlMetricExporter(MetricExporter):
-    """Writes each export as one OTLP/JSON ResourceMetrics object per line."""
+    """Writes each export as one OTLP/JSON ResourceMetrics object per line.
+
+    With ``file_format="protobuf"`` each batch is instead appended to a
+    ``.binpb`` segment as a length-delimited binary OTLP request.
+    """
 
     def __init__(
         self,
@@ -52,24 +111,98 @@ class RotatingJsonlMetricExporter(MetricExporter):
         prefix: str = "metrics",
         rotate_hours: int = 24,
         retention_count: int = 20,
+        file_format: str = "jsonl",
+        *,
+        rotate_schedule: str | None = None,
+        flush_interval: float = 0.0,
+        flush_bytes: int = 0,
+        compress: bool = False,
+        worker_id: str | None = None,
     ) -> None:
         # Installed opentelemetry-sdk's MetricExporter.__init__ accepts
         # preferred_temporality/preferred_aggregation, both defaulting to None, so no
         # explicit args are required here.
         super().__init__()
-        self._writer = _RotatingJsonlWriter(directory, prefix, rotate_hours, retention_count)
+        self._writer = _writer(
+            file_format,
+            directory,
+            prefix,
+            rotate_hours,
+            retention_count,
+            rotate_schedule=rotate_schedule,
+            flush_interval=flush_interval,
+            flush_bytes=flush_bytes,
+            compress=compress,
+            worker_id=worker_id,
+        )
 
     def export(self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs: object) -> MetricExportResult:
         try:
-            payload = MessageToDict(encode_metrics(metrics_data))
+            if isinstance(self._writer, _RotatingSegmentWriter):
+                from opentelemetry.exporter.otlp.proto.common.metrics_encoder import encode_metrics
+
+                ok = self._writer.write_message(encode_metrics(metrics_data).SerializeToString())
+            else:
+                ok = self._writer.write_line(json.dumps(encode_metrics_json(metrics_data), separators=(",", ":")))
         except Exception:
             return MetricExportResult.FAILURE
-        b64_ids_to_hex(payload)
-        ok = self._writer.write_line(json.dumps(payload, separators=(",", ":")))
         return MetricExportResult.SUCCESS if ok else MetricExportResult.FAILURE
 
     def force_flush(self, timeout_millis: float = 10_000) -> bool:
-        return True
+        return self._writer.flush()
 
     def shutdown(self, timeout_millis: float = 30_000, **kwargs: object) -> None:
         self._writer.close()
+
+
+class RotatingJsonlLogExporter(LogRecordExporter):
+    """Writes each export batch as one OTLP/JSON ResourceLogs object per line.
+
+    With ``file_format="protobuf"`` each batch is instead appended to a
+    ``.binpb`` segment as a length-delimited binary OTLP request.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "logs",
+        rotate_hours: int = 24,
+        retention_count: int = 20,
+        file_format: str = "jsonl",
+        *,
+        rotate_schedule: str | None = None,
+        flush_interval: float = 0.0,
+        flush_bytes: int = 0,
+        compress: bool = False,
+        worker_id: str | None = None,
+    ) -> None:
+        self._writer = _writer(
+            file_format,
+            directory,
+            prefix,
+            rotate_hours,
+            retention_count,
+            rotate_schedule=rotate_schedule,
+            flush_interval=flush_interval,
+            flush_bytes=flush_bytes,
+            compress=compress,
+            worker_id=worker_id,
+        )
+
+    def export(self, batch: Sequence[ReadableLogRecord]) -> LogRecordExportResult:
+        try:
+            if isinstance(self._writer, _RotatingSegmentWriter):
+                from opentelemetry.exporter.otlp.proto.common._log_encoder import encode_logs
+
+                ok = self._writer.write_message(encode_logs(batch).SerializeToString())
+            else:
+                ok = self._writer.write_line(json.dumps(encode_logs_json(batch), separators=(",", ":")))
+        except Exception:
+            return LogRecordExportResult.FAILURE
+        return LogRecordExportResult.SUCCESS if ok else LogRecordExportResult.FAILURE
+
+    def force_flush(self, timeout_millis: int = 30_000) -> bool:
+        return self._writer.flush()
+
+    def shutdown(self) -> None:
+        self._writer.close()
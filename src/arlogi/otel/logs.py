@@ -0,0 +1,120 @@
+"""Bridge from stdlib/arlogi log records to an OpenTelemetry LoggerProvider.
+
+OtelLogHandler does only what has to happen on the calling thread: it
+captures the interpolated message (memoized per record, so shared with the
+other sinks), the extras as attributes, the severity and the current
+context, and hands the result to the provider. Encoding to OTLP and writing
+happen in the provider's BatchLogRecordProcessor worker.
+"""
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from opentelemetry._logs import SeverityNumber
+from opentelemetry.context import get_current
+from opentelemetry.sdk._logs import LoggerProvider
+
+from arlogi import redaction
+from arlogi.records import _RECORD_ATTRS, record_exc_text, record_message
+
+# Python level -> (OTel severity number, severity text)
+_SEVERITIES = {
+    logging.DEBUG: (SeverityNumber.DEBUG, "DEBUG"),
+    logging.INFO: (SeverityNumber.INFO, "INFO"),
+    logging.WARNING: (SeverityNumber.WARN, "WARN"),
+    logging.ERROR: (SeverityNumber.ERROR, "ERROR"),
+    logging.CRITICAL: (SeverityNumber.FATAL, "FATAL"),
+}
+
+# Attributes OTel accepts as they are; anything else is sent as str()
+_ATTRIBUTE_TYPES = (str, bool, int, float, bytes, Mapping, Sequence)
+
+# Extras not sent as attributes: the record's context already carries them
+_CONTEXT_FIELDS = frozenset({"trace_id", "span_id"})
+
+# Loggers whose records would feed the export pipeline back into itself
+_SKIPPED_PREFIX = "opentelemetry"
+
+
+def _severity(record: logging.LogRecord) -> tuple[SeverityNumber, str]:
+    severity = _SEVERITIES.get(record.levelno)
+    if severity is None:
+        # Custom levels (TRACE is 5) map onto the nearest standard one below
+        number = SeverityNumber.TRACE
+        for level, (candidate, _) in sorted(_SEVERITIES.items()):
+            if record.levelno >= level:
+                number = candidate
+        severity = (number, record.levelname)
+    return severity
+
+
+class OtelLogHandler(logging.Handler):
+    """Emits records to an OpenTelemetry LoggerProvider.
+
+    Attach it to the root logger (``setup_logs`` does) or to any logger whose
+    records should be exported as OTel logs. On the root logger it survives
+    ``setup_logging()`` reconfiguration. It carries a RedactionFilter,
+    so records are masked while redaction is enabled (see arlogi.redaction).
+    """
+
+    # code.* attributes come from the caller fields
+    record_fields = frozenset({"pathname", "funcName", "lineno"})
+    # Kept on the root logger when setup_logging() replaces its handlers
+    keep_on_reconfigure = True
+
+    def __init__(self, logger_provider: LoggerProvider, level: int = logging.NOTSET):
+        """Initialize the handler.
+
+        Args:
+            logger_provider: Provider the records are emitted to
+            level: Minimum level exported
+        """
+        super().__init__(level)
+        self.logger_provider = logger_provider
+        self.addFilter(redaction.RedactionFilter())
+        # Logger name -> OTel logger (the provider's own cache takes a lock)
+        self._loggers: dict[str, Any] = {}
+
+    def _otel_logger(self, name: str) -> Any:
+        otel_logger = self._loggers.get(name)
+        if otel_logger is None:
+            otel_logger = self._loggers[name] = self.logger_provider.get_logger(name)
+        return otel_logger
+
+    def _attributes(self, record: logging.LogRecord) -> dict[str, Any]:
+        attributes = {
+            key: value if value is None or isinstance(value, _ATTRIBUTE_TYPES) else str(value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRS and key not in _CONTEXT_FIELDS and not key.startswith("_")
+        }
+        attributes["code.file.path"] = record.pathname
+        attributes["code.function.name"] = record.funcName
+        attributes["code.line.number"] = record.lineno
+        if record.exc_info and record.exc_info[0] is not None:
+            exc_type, exc, _ = record.exc_info
+            attributes["exception.type"] = exc_type.__name__
+            redactor = redaction._active
+            attributes["exception.message"] = str(exc) if redactor is None else redactor.redact_text(str(exc))
+            attributes["exception.stacktrace"] = record_exc_text(record, self.formatter)
+        return attributes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Hand the record to the provider's processors."""
+        if record.name.startswith(_SKIPPED_PREFIX):
+            return
+        try:
+            severity_number, severity_text = _severity(record)
+            self._otel_logger(record.name).emit(
+                timestamp=int(record.created * 1e9),
+                context=get_current(),
+                severity_number=severity_number,
+                severity_text=severity_text,
+                body=record_message(record),
+                attributes=self._attributes(record),
+            )
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Nothing to flush here: the provider's processors batch and export."""
@@ -0,0 +1,213 @@
+"""Batching span processor that feeds one queue to several exporters.
+
+``BatchSpanProcessor`` pairs one queue and one worker thread with one
+exporter, so sending spans to a file and to a collector queues every span
+twice and runs two workers. FanOutSpanProcessor batches once and hands the
+same batch to each exporter in turn, counting what it drops.
+"""
+
+import collections
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from opentelemetry import metrics
+from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY, Context, attach, detach, set_value
+from opentelemetry.metrics import CallbackOptions, Observation
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest")
+
+
+class FanOutSpanProcessor(SpanProcessor):
+    """Queues ended spans once and exports each batch to every exporter.
+
+    When the queue holds ``max_queue_size`` spans, ``drop_policy`` decides
+    what is lost: ``"drop_oldest"`` (BatchSpanProcessor's behaviour) evicts
+    the oldest queued span, ``"drop_newest"`` rejects the span being ended.
+    Drops are counted, never logged per span; see :meth:`stats` and the
+    ``arlogi.otel.spans.dropped`` counter.
+    """
+
+    def __init__(
+        self,
+        exporters: Sequence[SpanExporter],
+        *,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay_millis: float = 5000,
+        drop_policy: str = "drop_oldest",
+        meter_provider: metrics.MeterProvider | None = None,
+    ) -> None:
+        """Initialize the processor and start its worker thread.
+
+        Args:
+            exporters: Exporters every batch is handed to, in order
+            max_queue_size: Spans held before the drop policy applies
+            max_export_batch_size: Most spans passed to one export call
+            schedule_delay_millis: Longest wait before a partial batch is exported
+            drop_policy: ``"drop_oldest"`` or ``"drop_newest"``
+            meter_provider: Provider of the dropped-span counter (default: the global one)
+
+        Raises:
+            ValueError: If a size or the drop policy is invalid
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Invalid drop_policy {drop_policy!r}. Must be one of: {', '.join(DROP_POLICIES)}")
+        if max_queue_size <= 0 or max_export_batch_size <= 0 or schedule_delay_millis <= 0:
+            raise ValueError("max_queue_size, max_export_batch_size and schedule_delay_millis must be positive")
+        if max_export_batch_size > max_queue_size:
+            raise ValueError("max_export_batch_size must not exceed max_queue_size")
+        self._exporters = list(exporters)
+        self._max_queue_size = max_queue_size
+        self._max_export_batch_size = max_export_batch_size
+        self._schedule_delay = schedule_delay_millis / 1000
+        self._drop_oldest = drop_policy == "drop_oldest"
+        self._dropped: collections.Counter[str] = collections.Counter()
+        self._failures: collections.Counter[str] = collections.Counter()
+        self._exported = 0
+        self._shutdown = False
+        self._start_worker()
+        if hasattr(os, "register_at_fork"):
+            restart = weakref.WeakMethod(self._start_worker)
+
+            def after_in_child() -> None:
+                if method := restart():
+                    method()
+
+            os.register_at_fork(after_in_child=after_in_child)
+        self._register_counter(meter_provider or metrics.get_meter_provider())
+
+    def _start_worker(self) -> None:
+        # Also runs in a forked child: the parent's queue and thread are not ours
+        self._queue: collections.deque[ReadableSpan] = collections.deque()
+        self._stats_lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = threading.Thread(name="ArlogiFanOutSpanProcessor", target=self._run, daemon=True)
+        self._worker.start()
+
+    def _register_counter(self, meter_provider: metrics.MeterProvider) -> None:
+        # The callback must not keep a shut-down processor (and its exporters) alive
+        processor = weakref.ref(self)
+
+        def observe(options: CallbackOptions) -> Iterable[Observation]:
+            live = processor()
+            if live is None:
+                return []
+            return [Observation(count, {"reason": reason}) for reason, count in live.stats()["dropped"].items()]
+
+        meter_provider.get_meter("arlogi").create_observable_counter(
+            "arlogi.otel.spans.dropped",
+            [observe],
+            unit="{span}",
+            description="Ended spans dropped before export",
+        )
+
+    @property
+    def dropped_spans(self) -> int:
+        """Spans dropped so far, for any reason."""
+        return sum(self._dropped.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the processor's counters.
+
+        Returns:
+            ``queued`` (spans waiting), ``exported`` (spans handed to the
+            exporters), ``dropped`` (by reason: ``queue_full``, ``shutdown``)
+            and ``export_failures`` (failed export calls, by exporter class)
+        """
+        with self._stats_lock:
+            return {
+                "queued": len(self._queue),
+                "exported": self._exported,
+                "dropped": dict(self._dropped),
+                "export_failures": dict(self._failures),
+            }
+
+    def _drop(self, reason: str) -> None:
+        with self._stats_lock:
+            self._dropped[reason] += 1
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not span.context.trace_flags.sampled:
+            return
+        if self._shutdown:
+            self._drop("shutdown")
+            return
+        if len(self._queue) >= self._max_queue_size:
+            self._drop("queue_full")
+            if not self._drop_oldest:
+                return
+            try:
+                self._queue.popleft()
+            except IndexError:
+                pass  # drained by the worker meanwhile
+        self._queue.append(span)
+        if len(self._queue) >= self._max_export_batch_size and not self._wake.is_set():
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._shutdown:
+            self._wake.wait(self._schedule_delay)
+            self._wake.clear()
+            if self._shutdown:
+                break
+            self._export(drain=False)
+
+    def _export(self, drain: bool) -> None:
+        """Export full batches, then the remainder when `drain` or no full batch was ready."""
+        with self._export_lock:
+            exported_any = False
+            while self._queue:
+                if len(self._queue) < self._max_export_batch_size and exported_any and not drain:
+                    return
+                count = min(self._max_export_batch_size, len(self._queue))
+                self._export_batch([self._queue.popleft() for _ in range(count)])
+                exported_any = True
+
+    def _export_batch(self, batch: list[ReadableSpan]) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            for exporter in self._exporters:
+                try:
+                    ok = exporter.export(batch) is SpanExportResult.SUCCESS
+                except Exception:
+                    logger.exception("Exception while exporting spans to %s", type(exporter).__name__)
+                    ok = False
+                if not ok:
+                    with self._stats_lock:
+                        self._failures[type(exporter).__name__] += 1
+        finally:
+            detach(token)
+        with self._stats_lock:
+            self._exported += len(batch)
+
+    def force_flush(self, timeout_millis: int = 30_000) -> bool:
+        """Export every queued span now, on the calling thread."""
+        if self._shutdown:
+            return False
+        self._export(drain=True)
+        # SpanExporter.force_flush returns None unless overridden: only False is a failure
+        results = [exporter.force_flush(timeout_millis) for exporter in self._exporters]
+        return False not in results
+
+    def shutdown(self) -> None:
+        """Export what is queued, stop the worker and shut the exporters down."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._wake.set()
+        self._worker.join()
+        self._export(drain=True)
+        for exporter in self._exporters:
+            exporter.shutdown()
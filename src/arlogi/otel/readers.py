@@ -0,0 +1,165 @@
+"""Metric reader that collects once and exports the result to several exporters.
+
+One ``PeriodicExportingMetricReader`` per exporter means one collection
+cycle per exporter: every instrument is aggregated twice and the sinks see
+slightly different snapshots. FanOutMetricReader collects once per interval
+and hands the same MetricsData to each exporter, optionally with delta
+temporality and without the series that did not change.
+"""
+
+import dataclasses
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from opentelemetry.sdk.metrics import (
+    Counter,
+    Histogram,
+    ObservableCounter,
+    ObservableGauge,
+    ObservableUpDownCounter,
+    UpDownCounter,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    Metric,
+    MetricExporter,
+    MetricExportResult,
+    MetricsData,
+    PeriodicExportingMetricReader,
+    ScopeMetrics,
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPORALITIES = ("cumulative", "delta")
+
+# The OTLP exporters' "delta" preference: monotonic instruments report deltas,
+# up-down counters and gauges stay cumulative
+_DELTA = {
+    Counter: AggregationTemporality.DELTA,
+    Histogram: AggregationTemporality.DELTA,
+    ObservableCounter: AggregationTemporality.DELTA,
+    UpDownCounter: AggregationTemporality.CUMULATIVE,
+    ObservableUpDownCounter: AggregationTemporality.CUMULATIVE,
+    ObservableGauge: AggregationTemporality.CUMULATIVE,
+}
+
+_SeriesKey = tuple[str, str, tuple[tuple[str, Any], ...]]
+
+
+def _state(point: Any) -> tuple[Any, ...]:
+    """What makes a point differ from the previous export of its series."""
+    if hasattr(point, "value"):
+        return (point.value,)
+    return (point.count, point.sum)
+
+
+class _FanOutMetricExporter(MetricExporter):
+    """Exports one MetricsData to every exporter, after dropping unchanged series."""
+
+    def __init__(self, exporters: Sequence[MetricExporter], temporality: str, skip_unchanged: bool) -> None:
+        if temporality not in TEMPORALITIES:
+            raise ValueError(f"Invalid temporality {temporality!r}. Must be one of: {', '.join(TEMPORALITIES)}")
+        super().__init__(preferred_temporality=_DELTA if temporality == "delta" else None)
+        self._exporters = list(exporters)
+        self._skip_unchanged = skip_unchanged
+        # Series -> state at its last export; rebuilt every collection so ended series are forgotten
+        self._last: dict[_SeriesKey, tuple[Any, ...]] = {}
+
+    def export(self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs: Any) -> MetricExportResult:
+        if self._skip_unchanged:
+            metrics_data = self._changed(metrics_data)
+        if not metrics_data.resource_metrics:
+            return MetricExportResult.SUCCESS
+        result = MetricExportResult.SUCCESS
+        for exporter in self._exporters:
+            try:
+                if exporter.export(metrics_data, timeout_millis=timeout_millis) is not MetricExportResult.SUCCESS:
+                    result = MetricExportResult.FAILURE
+            except Exception:
+                logger.exception("Exception while exporting metrics to %s", type(exporter).__name__)
+                result = MetricExportResult.FAILURE
+        return result
+
+    def _changed(self, metrics_data: MetricsData) -> MetricsData:
+        seen: dict[_SeriesKey, tuple[Any, ...]] = {}
+        resource_metrics = []
+        for resource in metrics_data.resource_metrics:
+            scopes = []
+            for scope in resource.scope_metrics:
+                kept = [m for m in (self._changed_metric(scope, m, seen) for m in scope.metrics) if m is not None]
+                if kept:
+                    scopes.append(dataclasses.replace(scope, metrics=kept))
+            if scopes:
+                resource_metrics.append(dataclasses.replace(resource, scope_metrics=scopes))
+        self._last = seen
+        return MetricsData(resource_metrics=resource_metrics)
+
+    def _changed_metric(
+        self, scope: ScopeMetrics, metric: Metric, seen: dict[_SeriesKey, tuple[Any, ...]]
+    ) -> Metric | None:
+        delta = getattr(metric.data, "aggregation_temporality", None) is AggregationTemporality.DELTA
+        points = []
+        for point in metric.data.data_points:
+            state = _state(point)
+            key = (scope.scope.name, metric.name, tuple(sorted(point.attributes.items())))
+            seen[key] = state
+            # A delta series is unchanged when nothing was recorded; a cumulative one when it repeats
+            unchanged = not any(state) if delta else self._last.get(key) == state
+            if not unchanged:
+                points.append(point)
+        if not points:
+            return None
+        return dataclasses.replace(metric, data=dataclasses.replace(metric.data, data_points=points))
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        results = [exporter.force_flush(timeout_millis=timeout_millis) for exporter in self._exporters]
+        return False not in results
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs: Any) -> None:
+        # PeriodicExportingMetricReader passes the remaining milliseconds as `timeout`
+        timeout_millis = kwargs.get("timeout", timeout_millis)
+        for exporter in self._exporters:
+            try:
+                exporter.shutdown(timeout_millis=timeout_millis)
+            except Exception:
+                logger.exception("Exception while shutting down %s", type(exporter).__name__)
+
+
+class FanOutMetricReader(PeriodicExportingMetricReader):
+    """Collects metrics once per interval and exports them to several exporters.
+
+    The reader's temporality applies to every exporter (their own
+    preferences are ignored): ``"cumulative"``, or ``"delta"`` for counters
+    and histograms. With ``skip_unchanged`` a series is left out of an
+    export when it did not change since the previous one: a cumulative
+    point repeating its value, or a delta point recording nothing.
+    """
+
+    def __init__(
+        self,
+        exporters: Sequence[MetricExporter],
+        export_interval_millis: float | None = None,
+        export_timeout_millis: float | None = None,
+        *,
+        temporality: str = "cumulative",
+        skip_unchanged: bool = False,
+    ) -> None:
+        """Initialize the reader and start its collection thread.
+
+        Args:
+            exporters: Exporters every collection is handed to, in order
+            export_interval_millis: Collection interval (default: OTEL_METRIC_EXPORT_INTERVAL or 60s)
+            export_timeout_millis: Collection timeout (default: OTEL_METRIC_EXPORT_TIMEOUT or 30s)
+            temporality: ``"cumulative"`` or ``"delta"``
+            skip_unchanged: Leave series that did not change out of each export
+
+        Raises:
+            ValueError: If the temporality is invalid
+        """
+        super().__init__(
+            _FanOutMetricExporter(exporters, temporality, skip_unchanged),
+            export_interval_millis=export_interval_millis,
+            export_timeout_millis=export_timeout_millis,
+        )
@@ -0,0 +1,139 @@
+"""Reader for the length-delimited OTLP protobuf segments the file exporters write.
+
+Exporters created with ``file_format="protobuf"`` append every batch to a
+``.binpb`` segment as a varint byte length followed by a serialized
+Export{Trace,Metrics,Logs}ServiceRequest. The files are several times
+smaller than OTLP/JSON lines and can be replayed to a collector as they are;
+this module turns them back into OTLP/JSON only when someone reads them::
+
+    from arlogi.otel.segments import read_segment
+
+    for payload in read_segment("logs/traces-20250101-000000.binpb"):
+        print(payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"])
+
+The dicts have the same shape as the lines of the JSONL exporters, with hex
+trace and span ids.
+"""
+
+import gzip
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+from arlogi.otel._encode import b64_ids_to_hex
+
+logger = logging.getLogger(__name__)
+
+_REQUESTS = {
+    "traces": ExportTraceServiceRequest,
+    "metrics": ExportMetricsServiceRequest,
+    "logs": ExportLogsServiceRequest,
+}
+
+
+class SegmentError(ValueError):
+    """Raised when a segment is not a sequence of length-delimited OTLP messages."""
+
+
+def _read_varint(stream: IO[bytes]) -> int | None:
+    """Read one varint, or return None at a clean end of file."""
+    value = shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise SegmentError("Segment ends inside a length prefix")
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+        if shift > 63:
+            raise SegmentError("Length prefix longer than 10 bytes")
+
+
+def iter_messages(path: str | Path) -> Iterator[bytes]:
+    """Yield the raw serialized messages of a segment, in write order.
+
+    A trailing message cut short (the process died mid-write, or the file is
+    still being written) ends the iteration with a warning. Gzip-compressed
+    segments (``.binpb.gz``) are decompressed as they are read.
+
+    Args:
+        path: Path to a ``.binpb`` or ``.binpb.gz`` segment
+
+    Raises:
+        SegmentError: If a length prefix is malformed
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rb") as stream:
+        try:
+            while (size := _read_varint(stream)) is not None:
+                message = stream.read(size)
+                if len(message) < size:
+                    logger.warning("Ignoring truncated message at the end of %s", path)
+                    return
+                yield message
+        except EOFError:
+            # Still being written, or cut off before the gzip trailer
+            logger.warning("Ignoring truncated data at the end of %s", path)
+
+
+def _signal(path: Path) -> str:
+    """Guess the signal from the default exporter prefixes."""
+    for signal in _REQUESTS:
+        if path.name.startswith(signal):
+            return signal
+    raise ValueError(f"Cannot tell the signal of {path.name}; pass signal= explicitly")
+
+
+def read_segment(path: str | Path, signal: str | None = None) -> Iterator[dict]:
+    """Yield each batch of a segment as an OTLP/JSON dict.
+
+    Args:
+        path: Path to a ``.binpb`` segment
+        signal: ``"traces"``, ``"metrics"`` or ``"logs"``; guessed from the
+            file name prefix (the exporters' defaults) when omitted
+
+    Raises:
+        ValueError: If the signal is unknown or cannot be guessed
+        SegmentError: If the file is not a valid segment of that signal
+    """
+    path = Path(path)
+    signal = signal or _signal(path)
+    request_class = _REQUESTS.get(signal)
+    if request_class is None:
+        raise ValueError(f"Invalid signal {signal!r}. Must be one of: {', '.join(_REQUESTS)}")
+    for message in iter_messages(path):
+        try:
+            request = request_class.FromString(message)
+        except Exception as exc:
+            raise SegmentError(f"{path} does not hold {signal} requests: {exc}") from exc
+        payload = MessageToDict(request)
+        b64_ids_to_hex(payload)
+        yield payload
+
+
+def to_jsonl(path: str | Path, output: IO[str], signal: str | None = None) -> int:
+    """Write a segment as OTLP/JSON lines, the JSONL exporters' format.
+
+    Args:
+        path: Path to a ``.binpb`` segment
+        output: Text stream the lines are written to
+        signal: As for :func:`read_segment`
+
+    Returns:
+        The number of lines written
+    """
+    count = 0
+    for payload in read_segment(path, signal):
+        output.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,107 @@
+"""Publish arlogi's pipeline self-metrics through an OpenTelemetry MeterProvider."""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from opentelemetry.metrics import CallbackOptions, MeterProvider, Observation
+
+from arlogi.selfmetrics import get_self_metrics
+
+_Callback = Callable[[CallbackOptions], Iterable[Observation]]
+
+
+def _observe(extract: Callable[[dict[str, Any]], Iterable[Observation]]) -> _Callback:
+    """Build an observable-instrument callback over one self-metrics snapshot."""
+
+    def callback(options: CallbackOptions) -> Iterable[Observation]:
+        snapshot = get_self_metrics()
+        if not snapshot["enabled"]:
+            return []
+        return list(extract(snapshot))
+
+    return callback
+
+
+def _records(snapshot: dict[str, Any]) -> Iterable[Observation]:
+    for logger_name, levels in snapshot["records"].items():
+        for level, count in levels.items():
+            yield Observation(count, {"logger": logger_name, "level": level})
+
+
+def _per_handler(key: str, field: str | None = None) -> Callable[[dict[str, Any]], Iterable[Observation]]:
+    def extract(snapshot: dict[str, Any]) -> Iterable[Observation]:
+        for handler, value in snapshot[key].items():
+            yield Observation(value if field is None else value[field], {"handler": handler})
+
+    return extract
+
+
+def _rotation(field: str) -> Callable[[dict[str, Any]], Iterable[Observation]]:
+    def extract(snapshot: dict[str, Any]) -> Iterable[Observation]:
+        if snapshot["rotation_duration"]["count"]:
+            yield Observation(snapshot["rotation_duration"][field])
+
+    return extract
+
+
+def _suppressed(snapshot: dict[str, Any]) -> Iterable[Observation]:
+    for reason, sources in snapshot["suppressed"].items():
+        for source, count in sources.items():
+            yield Observation(count, {"reason": reason, "source": source})
+
+
+def register_self_metrics(provider: MeterProvider) -> None:
+    """Register observable instruments reporting arlogi's self-metrics.
+
+    Instruments observe nothing while self-metrics are disabled, so
+    registering them is free for applications that never enable collection.
+
+    Args:
+        provider: MeterProvider the instruments are created on
+    """
+    meter = provider.get_meter("arlogi")
+    meter.create_observable_counter(
+        "arlogi.records", [_observe(_records)], unit="{record}", description="Records passed to handlers"
+    )
+    meter.create_observable_counter(
+        "arlogi.handler.bytes", [_observe(_per_handler("handler_bytes"))], unit="By", description="Formatted bytes"
+    )
+    meter.create_observable_counter(
+        "arlogi.handler.emits",
+        [_observe(_per_handler("emit_latency", "count"))],
+        unit="{record}",
+        description="Records handled per handler",
+    )
+    meter.create_observable_counter(
+        "arlogi.handler.emit.duration",
+        [_observe(_per_handler("emit_latency", "sum"))],
+        unit="s",
+        description="Total time spent in handler emit",
+    )
+    meter.create_observable_gauge(
+        "arlogi.handler.emit.duration.max",
+        [_observe(_per_handler("emit_latency", "max"))],
+        unit="s",
+        description="Slowest handler emit",
+    )
+    meter.create_observable_counter(
+        "arlogi.handler.errors",
+        [_observe(_per_handler("handle_errors"))],
+        unit="{error}",
+        description="handleError invocations",
+    )
+    meter.create_observable_counter(
+        "arlogi.rotations", [_observe(_rotation("count"))], unit="{rotation}", description="Log file rotations"
+    )
+    meter.create_observable_counter(
+        "arlogi.rotation.duration",
+        [_observe(_rotation("sum"))],
+        unit="s",
+        description="Total time spent rotating log files",
+    )
+    meter.create_observable_counter(
+        "arlogi.records.suppressed",
+        [_observe(_suppressed)],
+        unit="{record}",
+        description="Records dropped or throttled before reaching a sink",
+    )
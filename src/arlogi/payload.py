@@ -0,0 +1,204 @@
+"""Payload size budgets for structured log records.
+
+A log call carrying a huge string or dict in its extras would make
+JSONFormatter serialize megabytes. With limits set, the formatter first copies
+the record's fields into a bounded structure, clipping as it walks them, and
+only then serializes that copy, so the cost of a record stays bounded no
+matter what callers pass:
+
+* ``max_message_length``: characters of the message and of the exception text
+* ``max_value_length``: characters one extra value may hold, counting the
+  strings and keys nested in it
+* ``max_depth`` / ``max_items``: nesting depth and items per container
+  (mappings, sequences and sets of any type; bytes are clipped before they
+  are rendered)
+* ``max_record_bytes``: bytes of the whole encoded record; extras that no
+  longer fit are dropped, and a record still too large keeps only its core
+  fields
+
+Records that were cut get a ``_truncated`` field listing the clipped fields.
+
+Example:
+    >>> from arlogi.payload import PayloadLimits
+    >>> from arlogi.handlers import JSONHandler
+    >>> handler = JSONHandler(limits=PayloadLimits(max_value_length=1024))
+"""
+
+from collections.abc import Mapping, Sequence, Set
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+# Field listing what was clipped in a truncated record
+TRUNCATED_FIELD = "_truncated"
+
+# Size charged for a number, boolean or null (an upper bound of most)
+_SCALAR_SIZE = 8
+# Record budget kept free for the note clip() appends
+_CLIP_RESERVE = 32
+
+
+@dataclass(frozen=True)
+class PayloadLimits:
+    """Size budgets applied to a record while it is encoded.
+
+    Attributes:
+        max_message_length: Characters kept of the message and exception text
+        max_value_length: Characters one extra value may hold (strings and keys, nested)
+        max_depth: Container nesting kept inside an extra value
+        max_items: Items kept per dict or list
+        max_record_bytes: Bytes of the encoded record
+    """
+
+    max_message_length: int = 32_768
+    max_value_length: int = 8_192
+    max_depth: int = 8
+    max_items: int = 100
+    max_record_bytes: int = 65_536
+
+    def __post_init__(self) -> None:
+        """Validate that every limit is a positive integer."""
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"{field.name} must be a positive integer, got {value!r}")
+
+    @classmethod
+    def from_dict(cls, limits: dict[str, int]) -> "PayloadLimits":
+        """Create limits from a dict, using defaults for missing keys.
+
+        Raises:
+            ValueError: If a key is unknown or a value is not a positive integer
+        """
+        unknown = set(limits) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown payload limits: {', '.join(sorted(unknown))}")
+        return cls(**limits)
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the limits as a dict."""
+        return asdict(self)
+
+
+def clip(text: str, max_length: int) -> str:
+    """Cut ``text`` to ``max_length`` characters, noting how many were dropped."""
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...[{len(text) - max_length} chars truncated]"
+
+
+class _Bounder:
+    """Copies one value into a bounded structure, charging a character budget."""
+
+    __slots__ = ("limits", "remaining", "truncated")
+
+    def __init__(self, limits: PayloadLimits, budget: int):
+        self.limits = limits
+        self.remaining = budget
+        self.truncated = False
+
+    def text(self, text: str) -> str:
+        if len(text) > self.remaining:
+            self.truncated = True
+            text = clip(text, max(self.remaining, 0))
+        self.remaining -= len(text) + 2
+        return text
+
+    def value(self, value: Any, depth: int) -> Any:
+        if isinstance(value, str):
+            return self.text(value)
+        if value is None or isinstance(value, (bool, int, float)):
+            self.remaining -= _SCALAR_SIZE
+            return value
+        if isinstance(value, Mapping):
+            return self._dict(value, depth) if depth < self.limits.max_depth else self._cut("{...}")
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self._bytes(value)
+        if isinstance(value, (Sequence, Set)):
+            return self._list(value, depth) if depth < self.limits.max_depth else self._cut("[...]")
+        # Anything else is encoded as str(), as json.dumps(default=str) would;
+        # only a custom __str__ can make that expensive
+        return self.text(str(value))
+
+    def _bytes(self, value: bytes | bytearray | memoryview) -> str:
+        # Clip before rendering: str() spends up to 4 characters per byte
+        keep = max(self.remaining, 0)
+        if len(value) <= keep:
+            return self.text(str(value))
+        self.truncated = True
+        return self.text(f"{value[:keep]}...[{len(value) - keep} bytes truncated]")
+
+    def _dict(self, value: Mapping[Any, Any], depth: int) -> dict[Any, Any]:
+        bounded: dict[Any, Any] = {}
+        self.remaining -= 2
+        for key, item in value.items():
+            if len(bounded) >= self.limits.max_items or self.remaining <= 0:
+                self.truncated = True
+                break
+            if isinstance(key, str):
+                key = self.text(key)
+            elif key is not None and not isinstance(key, (int, float)):
+                key = self.text(str(key))
+            bounded[key] = self.value(item, depth + 1)
+        return bounded
+
+    def _list(self, value: Sequence[Any] | Set[Any], depth: int) -> list[Any]:
+        bounded = []
+        self.remaining -= 2
+        for item in value:
+            if len(bounded) >= self.limits.max_items or self.remaining <= 0:
+                self.truncated = True
+                break
+            bounded.append(self.value(item, depth + 1))
+        return bounded
+
+    def _cut(self, placeholder: str) -> str:
+        self.truncated = True
+        self.remaining -= len(placeholder)
+        return placeholder
+
+
+def bound_fields(log_data: dict[str, Any], limits: PayloadLimits, core_fields: frozenset[str]) -> dict[str, Any]:
+    """Return a copy of a record's fields that fits the limits.
+
+    ``message`` and ``exception`` are clipped to ``max_message_length``,
+    other non-core fields are extras bounded by ``max_value_length``, and the
+    whole record is charged against ``max_record_bytes`` in order.
+
+    Args:
+        log_data: Field name -> value, in output order
+        limits: The budgets to apply
+        core_fields: Fields kept as they are (timestamp, level, logger...)
+
+    Returns:
+        The bounded fields, with ``_truncated`` listing clipped fields if any
+    """
+    bounded: dict[str, Any] = {}
+    truncated = []
+    # Keep room for the marker field, and for listing every field not yet
+    # bounded in it; a field's listing room is released when it is reached.
+    remaining = limits.max_record_bytes - len(TRUNCATED_FIELD) - 8
+    unlisted = sum(len(key) + 4 for key in log_data if key not in core_fields)
+    for key, value in log_data.items():
+        if key in core_fields:
+            bounded[key] = value
+            remaining -= len(key) + (len(value) if isinstance(value, str) else _SCALAR_SIZE) + 8
+            continue
+        unlisted -= len(key) + 4
+        is_text = key in ("message", "exception")
+        budget = limits.max_message_length if is_text else limits.max_value_length
+        room = remaining - unlisted - len(key) - 6 - _CLIP_RESERVE
+        if room < budget:
+            if room < _CLIP_RESERVE and not is_text:
+                truncated.append(key)
+                remaining -= len(key) + 4
+                continue
+            budget = max(room, 0)
+        bounder = _Bounder(limits, budget)
+        bounded[key] = bounder.value(value, 0)
+        remaining -= len(key) + 6 + budget - bounder.remaining
+        if bounder.truncated:
+            truncated.append(key)
+            remaining -= len(key) + 4
+    if truncated:
+        bounded[TRUNCATED_FIELD] = truncated
+    return bounded
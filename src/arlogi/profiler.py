@@ -0,0 +1,388 @@
+"""Call-site log volume profiler.
+
+Attributes records and message bytes (the interpolated message, not the
+formatted output or tracebacks) to the line of code that logged them
+(module, function, line) and to the logger name, so a sudden explosion of
+log volume can be traced back to the responsible call sites.
+
+Aggregation is bounded: each dimension is tracked by a space-saving top-K
+sketch, which keeps at most ``capacity`` keys no matter how many distinct
+call sites log. Counts of keys that entered the sketch late are
+over-estimated by at most their reported ``error``.
+
+Profiling is opt-in. TraceLogger checks a single module global per record
+while it is disabled.
+
+Example:
+    >>> from arlogi.profiler import enable_profiler, get_profile_report
+    >>> enable_profiler(capacity=200, window=60.0)
+    >>> report = get_profile_report(top=10)
+    >>> report["sites"][0]
+    {'module': 'worker', 'function': 'poll', 'line': 42, 'records': 9120, 'bytes': 731904, 'error': 0}
+
+The module is also a CLI that profiles JSON log files written by
+JSONFileHandler::
+
+    python -m arlogi.profiler logs/app.jsonl --top 20 --by bytes
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from datetime import datetime
+from typing import Any
+
+from .records import record_message
+
+CallSite = tuple[str, str, int]
+
+# LogRecord fields observe() reads; TraceLogger captures them while profiling
+RECORD_FIELDS = frozenset({"module", "funcName", "lineno"})
+
+
+class SpaceSaving:
+    """Space-saving top-K sketch (Metwally et al.) over weighted keys.
+
+    At most ``capacity`` keys are monitored. A new key arriving while the
+    sketch is full replaces the key with the smallest count and inherits that
+    count as its error bound, so heavy hitters are never missed.
+    """
+
+    __slots__ = ("capacity", "counts", "errors")
+
+    def __init__(self, capacity: int):
+        """Initialize the sketch.
+
+        Args:
+            capacity: Maximum number of monitored keys
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.counts: dict[Hashable, int] = {}
+        self.errors: dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, weight: int = 1) -> None:
+        """Add ``weight`` to ``key``."""
+        counts = self.counts
+        if key in counts:
+            counts[key] += weight
+            return
+        if len(counts) < self.capacity:
+            counts[key] = weight
+            self.errors[key] = 0
+            return
+        # Evict the minimum; O(capacity), but only for keys not yet monitored.
+        victim = min(counts, key=counts.__getitem__)
+        floor = counts.pop(victim)
+        del self.errors[victim]
+        counts[key] = floor + weight
+        self.errors[key] = floor
+
+    def top(self, k: int) -> list[tuple[Hashable, int, int]]:
+        """Return the ``k`` heaviest keys as (key, count, error), heaviest first."""
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(key, count, self.errors[key]) for key, count in ranked]
+
+
+def _message_bytes(record: logging.LogRecord) -> int:
+    """UTF-8 size of a record's interpolated message.
+
+    This is message volume, not emitted bytes: what a sink writes depends on
+    its format, and tracebacks are only rendered later, by the handlers.
+    """
+    try:
+        message = record_message(record)  # memoized for the handlers
+    except Exception:
+        message = str(record.msg)
+    return len(message) if message.isascii() else len(message.encode("utf-8", "replace"))
+
+
+class _Window:
+    """Aggregates of one profiling window."""
+
+    __slots__ = ("bytes", "logger_bytes", "logger_records", "records", "site_bytes", "site_records", "start")
+
+    def __init__(self, capacity: int, start: float):
+        self.start = start
+        self.records = 0
+        self.bytes = 0
+        self.site_records = SpaceSaving(capacity)
+        self.site_bytes = SpaceSaving(capacity)
+        self.logger_records = SpaceSaving(capacity)
+        self.logger_bytes = SpaceSaving(capacity)
+
+    def add(self, site: CallSite, logger_name: str, size: int) -> None:
+        self.records += 1
+        self.bytes += size
+        self.site_records.add(site)
+        self.site_bytes.add(site, size)
+        self.logger_records.add(logger_name)
+        self.logger_bytes.add(logger_name, size)
+
+    def report(self, top: int, by: str, end: float) -> dict[str, Any]:
+        by_records = by == "records"
+        sites = []
+        ranked, other = (self.site_records, self.site_bytes) if by_records else (self.site_bytes, self.site_records)
+        for site, count, error in ranked.top(top):
+            secondary = other.counts.get(site)
+            records, size = (count, secondary) if by_records else (secondary, count)
+            module, function, line = site  # type: ignore[misc]
+            sites.append(
+                {
+                    "module": module,
+                    "function": function,
+                    "line": line,
+                    "records": records,
+                    "bytes": size,
+                    "error": error,
+                }
+            )
+        loggers = []
+        ranked, other = (
+            (self.logger_records, self.logger_bytes) if by_records else (self.logger_bytes, self.logger_records)
+        )
+        for name, count, error in ranked.top(top):
+            secondary = other.counts.get(name)
+            records, size = (count, secondary) if by_records else (secondary, count)
+            loggers.append({"logger": name, "records": records, "bytes": size, "error": error})
+        return {
+            "window_start": self.start,
+            "elapsed": max(end - self.start, 0.0),
+            "records": self.records,
+            "bytes": self.bytes,
+            "sites": sites,
+            "loggers": loggers,
+        }
+
+
+class LogVolumeProfiler:
+    """Bounded top-K attribution of records and bytes to call sites and loggers.
+
+    With ``window`` set, aggregation restarts every ``window`` seconds and the
+    previous window stays available for reports, so the profile reflects
+    recent traffic rather than the whole process lifetime.
+    """
+
+    def __init__(self, capacity: int = 100, window: float | None = None):
+        """Initialize the profiler.
+
+        Args:
+            capacity: Keys monitored per sketch (call sites and logger names)
+            window: Window length in seconds (None: a single window until reset())
+        """
+        self.capacity = capacity
+        self.window = window
+        self._lock = threading.Lock()
+        self._current = _Window(capacity, self._now())
+        self._previous: _Window | None = None
+        self._previous_end = 0.0
+
+    def _now(self) -> float:
+        """Wall clock; test seam mirroring JSONFileHandler._now_local."""
+        return time.time()
+
+    def add(self, site: CallSite, logger_name: str, size: int, now: float | None = None) -> None:
+        """Attribute one record of ``size`` bytes to a call site and logger.
+
+        Args:
+            site: (module, function, line) of the logging call
+            logger_name: Name of the logger that created the record
+            size: Bytes attributed to the record
+            now: Record time (default: the profiler clock), used for windowing
+        """
+        with self._lock:
+            if self.window is not None:
+                if now is None:
+                    now = self._now()
+                if now - self._current.start >= self.window:
+                    self._previous = self._current
+                    self._previous_end = now
+                    self._current = _Window(self.capacity, now)
+            self._current.add(site, logger_name, size)
+
+    def observe(self, record: logging.LogRecord) -> None:
+        """Attribute one record to its call site and logger."""
+        self.add((record.module, record.funcName, record.lineno), record.name, _message_bytes(record))
+
+    def reset(self, now: float | None = None) -> None:
+        """Discard all aggregates and start a new window (at ``now``, default: the profiler clock)."""
+        with self._lock:
+            self._previous = None
+            self._current = _Window(self.capacity, self._now() if now is None else now)
+
+    def report(
+        self, top: int = 10, by: str = "records", previous: bool = False, now: float | None = None
+    ) -> dict[str, Any]:
+        """Return the heaviest call sites and loggers of a window.
+
+        Args:
+            top: Number of call sites and loggers to report
+            by: Rank by "records" or "bytes"
+            previous: Report the last completed window instead of the current one
+            now: End of the current window (default: the profiler clock)
+
+        Returns:
+            A dict with the window ``window_start``/``elapsed``, its total
+            ``records`` and ``bytes``, and ranked ``sites`` and ``loggers``.
+            The secondary measure of an entry is None when the other sketch
+            evicted it. Returns an empty dict for ``previous=True`` before a
+            window has completed.
+
+        Raises:
+            ValueError: If ``by`` is not "records" or "bytes"
+        """
+        if by not in ("records", "bytes"):
+            raise ValueError(f"Invalid report order: {by!r} (expected 'records' or 'bytes')")
+        with self._lock:
+            if previous:
+                if self._previous is None:
+                    return {}
+                return self._previous.report(top, by, self._previous_end)
+            return self._current.report(top, by, self._now() if now is None else now)
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a profiler report as a plain-text table.
+
+    Args:
+        report: A report returned by LogVolumeProfiler.report()
+
+    Returns:
+        The table, one call site or logger per line
+    """
+    if not report:
+        return "no completed window\n"
+    lines = [f"{report['records']} records, {report['bytes']} bytes over {report['elapsed']:.1f}s", ""]
+    lines.append(f"{'records':>10} {'bytes':>12} {'±error':>8}  call site")
+    for site in report["sites"]:
+        lines.append(
+            f"{site['records'] if site['records'] is not None else '?':>10} "
+            f"{site['bytes'] if site['bytes'] is not None else '?':>12} {site['error']:>8}  "
+            f"{site['module']}.{site['function']}:{site['line']}"
+        )
+    lines.append("")
+    lines.append(f"{'records':>10} {'bytes':>12} {'±error':>8}  logger")
+    for entry in report["loggers"]:
+        lines.append(
+            f"{entry['records'] if entry['records'] is not None else '?':>10} "
+            f"{entry['bytes'] if entry['bytes'] is not None else '?':>12} {entry['error']:>8}  {entry['logger']}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# The active profiler; None while profiling is disabled (the fast path).
+_active: LogVolumeProfiler | None = None
+
+
+def enable_profiler(capacity: int = 100, window: float | None = None) -> LogVolumeProfiler:
+    """Start profiling log volume per call site (replacing any active profiler).
+
+    Args:
+        capacity: Keys monitored per sketch
+        window: Window length in seconds (None: a single window until reset())
+
+    Returns:
+        The active LogVolumeProfiler
+    """
+    global _active
+    _active = LogVolumeProfiler(capacity=capacity, window=window)
+    return _active
+
+
+def disable_profiler() -> None:
+    """Stop profiling and discard the collected aggregates."""
+    global _active
+    _active = None
+
+
+def get_profiler() -> LogVolumeProfiler | None:
+    """Return the active profiler, or None while profiling is disabled."""
+    return _active
+
+
+def get_profile_report(top: int = 10, by: str = "records", previous: bool = False) -> dict[str, Any]:
+    """Return the active profiler's report (empty dict while disabled).
+
+    Args:
+        top: Number of call sites and loggers to report
+        by: Rank by "records" or "bytes"
+        previous: Report the last completed window instead of the current one
+    """
+    profiler = _active
+    if profiler is None:
+        return {}
+    return profiler.report(top=top, by=by, previous=previous)
+
+
+def profile_json_lines(
+    lines: Iterable[str], top: int = 20, by: str = "records", capacity: int = 1000
+) -> dict[str, Any]:
+    """Profile JSON log lines as written by JSONFormatter.
+
+    Bytes are the size of each line, i.e. what the log actually cost on disk.
+    The window spans the first to the last record timestamp.
+
+    Args:
+        lines: JSON log lines (lines that are not a JSON object with a numeric
+            line_number are skipped)
+        top: Number of call sites and loggers to report
+        by: Rank by "records" or "bytes"
+        capacity: Keys monitored per sketch
+
+    Returns:
+        A report in the format of LogVolumeProfiler.report()
+    """
+    import json
+
+    profiler = LogVolumeProfiler(capacity=capacity)
+    first: float | None = None
+    last = 0.0
+    for line in lines:
+        try:
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                continue
+            created = datetime.fromisoformat(entry["timestamp"]).timestamp() if "timestamp" in entry else None
+            site = (str(entry.get("module")), str(entry.get("function")), int(entry.get("line_number") or 0))
+        except (ValueError, TypeError, AttributeError):
+            continue
+        if created is not None:
+            if first is None:
+                first = created
+                profiler.reset(now=created)
+            last = max(last, created)
+        profiler.add(site, str(entry.get("logger_name")), len(line.rstrip("\n").encode("utf-8", "replace")))
+    return profiler.report(top=top, by=by, now=last if first is not None else None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Report the heaviest call sites of JSON log files."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m arlogi.profiler", description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="JSON log files (default: stdin)")
+    parser.add_argument("--top", type=int, default=20, help="number of call sites and loggers to show")
+    parser.add_argument("--by", choices=("records", "bytes"), default="records", help="ranking measure")
+    parser.add_argument("--capacity", type=int, default=1000, help="keys monitored per sketch")
+    args = parser.parse_args(argv)
+
+    def lines() -> Iterable[str]:
+        if not args.files:
+            yield from sys.stdin
+        for path in args.files:
+            with open(path, encoding="utf-8", errors="replace") as stream:
+                yield from stream
+
+    report = profile_json_lines(lines(), top=args.top, by=args.by, capacity=args.capacity)
+    sys.stdout.write(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""Lean LogRecord capture driven by what the configured handlers need.
+
+``LogRecord.__init__`` fills every attribute on every record: the caller (a
+frame walk in ``findCaller`` plus path splitting), thread, process and
+asyncio task names. arlogi's handlers read a handful of them, so TraceLogger
+asks the handlers a record will reach which optional fields they need:
+
+* arlogi handlers and formatters declare ``record_fields`` (console
+  ``show_path`` needs the caller path and line, JSONFormatter the module,
+  function and line, the syslog formatters the process id);
+* the format string of a plain ``logging.Formatter`` is parsed
+  (``%(process)d``, ``{threadName}``, ``${module}``);
+* stdlib handlers that only read records through their formatter
+  (StreamHandler, FileHandler, SysLogHandler...) need what it needs;
+* any other handler or formatter may read anything, so records reaching it
+  are captured in full, exactly like stdlib records;
+* so may filters, on the logger or on a handler the record reaches, unless
+  they declare ``record_fields`` too.
+
+The caller lookup is skipped when no handler needs it. Other optional fields
+are computed at creation when needed and otherwise on first attribute access.
+Attributes stay in ``__dict__`` because ``logging.Formatter`` formats with
+``fmt % record.__dict__``; only the raw timestamp lives in a slot.
+
+A record sent to several sinks (console, JSON file, syslog...) is also
+formatted once: ``record_message``, ``record_exc_text`` and
+``record_payload`` memoize the interpolated message, the exception text and
+whole payloads in the record, so every arlogi handler reuses them. Memos are
+checked against the record's ``msg`` and ``args`` (and, for payloads, its
+attribute count), so filters that rewrite a record between handlers get a
+fresh format rather than a stale one.
+
+Example:
+    >>> from arlogi.records import disable_lean_records
+    >>> disable_lean_records()  # back to stdlib LogRecords everywhere
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# Fields filled by the caller lookup
+CALLER_FIELDS = frozenset({"pathname", "filename", "module", "lineno", "funcName"})
+# What console handlers print next to the message when show_path is on
+PATH_FIELDS = frozenset({"pathname", "lineno"})
+
+_NO_FIELDS: frozenset[str] = frozenset()
+
+
+# pathname -> (filename, module); source files are few, records many
+_path_parts: dict[str, tuple[str, str]] = {}
+_PATH_PARTS_MAX = 4096
+
+
+def _split_path(pathname: str) -> tuple[str, str]:
+    parts = _path_parts.get(pathname)
+    if parts is None:
+        try:
+            filename = os.path.basename(pathname)
+            module = os.path.splitext(filename)[0]
+        except (TypeError, ValueError, AttributeError):
+            return pathname, "Unknown module"
+        if len(_path_parts) >= _PATH_PARTS_MAX:
+            _path_parts.clear()
+        parts = _path_parts[pathname] = (filename, module)
+    return parts
+
+
+def _filename(record: logging.LogRecord) -> str:
+    return _split_path(record.pathname)[0]
+
+
+def _module(record: logging.LogRecord) -> str:
+    return _split_path(record.pathname)[1]
+
+
+def _msecs(record: "LeanLogRecord") -> float:
+    # Same arithmetic as LogRecord.__init__ (the ns -> s conversion can round up)
+    ct = record._ct
+    msecs = (ct % 1_000_000_000) // 1_000_000 + 0.0
+    if msecs == 999.0 and int(record.created) != ct // 1_000_000_000:
+        msecs = 0.0
+    return msecs
+
+
+def _relative_created(record: "LeanLogRecord") -> float:
+    return (record._ct - logging._startTime) / 1e6
+
+
+def _thread(record: logging.LogRecord) -> int | None:
+    return threading.get_ident() if logging.logThreads else None
+
+
+def _thread_name(record: logging.LogRecord) -> str | None:
+    return threading.current_thread().name if logging.logThreads else None
+
+
+def _process(record: logging.LogRecord) -> int | None:
+    return os.getpid() if logging.logProcesses else None
+
+
+def _process_name(record: logging.LogRecord) -> str | None:
+    if not logging.logMultiprocessing:
+        return None
+    mp = sys.modules.get("multiprocessing")
+    if mp is not None:
+        try:
+            return mp.current_process().name
+        except Exception:
+            pass
+    return "MainProcess"
+
+
+def _task_name(record: logging.LogRecord) -> str | None:
+    if not logging.logAsyncioTasks:
+        return None
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None:
+        try:
+            return asyncio.current_task().get_name()
+        except Exception:
+            pass
+    return None
+
+
+# Optional field -> how LogRecord.__init__ computes it
+_COMPUTED_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "filename": _filename,
+    "module": _module,
+    "msecs": _msecs,
+    "relativeCreated": _relative_created,
+    "thread": _thread,
+    "threadName": _thread_name,
+    "process": _process,
+    "processName": _process_name,
+    "taskName": _task_name,
+}
+OPTIONAL_FIELDS = CALLER_FIELDS | _COMPUTED_FIELDS.keys()
+
+# Every attribute a stdlib LogRecord has; extra= may not overwrite them
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class LeanLogRecord(logging.LogRecord):
+    """A LogRecord that captures only the optional fields its handlers need.
+
+    Optional fields not listed in ``fields`` are computed on first access.
+    Thread, process and task fields then describe the reader, so handlers
+    that read records on another thread must list them in ``record_fields``.
+    """
+
+    __slots__ = ("_ct",)
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        pathname: str,
+        lineno: int,
+        msg: Any,
+        args: Any,
+        exc_info: Any,
+        func: str | None = None,
+        sinfo: str | None = None,
+        fields: frozenset[str] = _NO_FIELDS,
+    ):
+        """Initialize the record like LogRecord, computing only ``fields`` eagerly.
+
+        Args:
+            name: Logger name
+            level: Numeric level
+            pathname: Caller path (or "(unknown file)" when not looked up)
+            lineno: Caller line number
+            msg: Message or format string
+            args: Message arguments
+            exc_info: Exception info tuple or None
+            func: Caller function name
+            sinfo: Formatted stack information
+            fields: Optional fields the handlers need (see OPTIONAL_FIELDS)
+        """
+        ct = time.time_ns()
+        self._ct = ct
+        self.name = name
+        self.msg = msg
+        # A single non-empty mapping is used for %(key)s formatting (as in LogRecord)
+        if args and len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]
+        self.args = args
+        self.levelname = logging.getLevelName(level)
+        self.levelno = level
+        self.pathname = pathname
+        self.lineno = lineno
+        self.funcName = func
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.stack_info = sinfo
+        self.created = ct / 1e9
+        for field in fields:
+            compute = _COMPUTED_FIELDS.get(field)
+            if compute is not None:
+                self.__dict__[field] = compute(self)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing from __dict__
+        compute = _COMPUTED_FIELDS.get(name)
+        if compute is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = self.__dict__[name] = compute(self)
+        return value
+
+
+def make_record(
+    name: str,
+    level: int,
+    fn: str,
+    lno: int,
+    msg: Any,
+    args: Any,
+    exc_info: Any,
+    func: str | None,
+    extra: Mapping[str, Any] | None,
+    sinfo: str | None,
+    fields: frozenset[str],
+) -> LeanLogRecord:
+    """Build a LeanLogRecord the way ``Logger.makeRecord`` builds a LogRecord.
+
+    Raises:
+        KeyError: If ``extra`` would overwrite a LogRecord attribute
+    """
+    record = LeanLogRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo, fields)
+    factory = logging.getLogRecordFactory()
+    if factory is not logging.LogRecord:
+        # A wrapping factory (see needed_fields) stamps its fields here
+        stamp = getattr(factory, "stamp_record", None)
+        if stamp is not None:
+            stamp(record)
+    if extra is not None:
+        for key in extra:
+            if key in _RECORD_ATTRS or key in record.__dict__:
+                raise KeyError(f"Attempt to overwrite {key!r} in LogRecord")
+            record.__dict__[key] = extra[key]
+    return record
+
+
+# Style class -> pattern matching the field names in its format string
+_STYLE_FIELDS = {
+    logging.PercentStyle: re.compile(r"%\((\w+)\)"),
+    logging.StrFormatStyle: re.compile(r"\{(\w+)"),
+    logging.StringTemplateStyle: re.compile(r"\$\{?(\w+)"),
+}
+_format_fields_cache: dict[tuple[type, str], frozenset[str] | None] = {}
+
+
+def formatter_fields(formatter: logging.Formatter) -> frozenset[str] | None:
+    """Return the optional fields a formatter reads, or None if unknown.
+
+    Formatters declare them in a ``record_fields`` attribute; for a plain
+    ``logging.Formatter`` they are parsed from the format string.
+    """
+    declared = getattr(formatter, "record_fields", None)
+    if declared is not None:
+        return declared
+    if type(formatter) is not logging.Formatter:
+        return None
+    style = formatter._style
+    key = (type(style), style._fmt)
+    try:
+        return _format_fields_cache[key]
+    except KeyError:
+        pattern = _STYLE_FIELDS.get(key[0])
+        fields = None if pattern is None else frozenset(pattern.findall(key[1])) & OPTIONAL_FIELDS
+        _format_fields_cache[key] = fields
+        return fields
+
+
+# Stdlib handlers that read records only through their formatter (exact
+# classes: subclasses may read anything). Matched by name so that
+# logging.handlers is not imported here.
+_FORMATTER_ONLY_HANDLERS = frozenset(
+    {
+        ("logging", "NullHandler"),
+        ("logging", "StreamHandler"),
+        ("logging", "FileHandler"),
+        ("logging.handlers", "WatchedFileHandler"),
+        ("logging.handlers", "RotatingFileHandler"),
+        ("logging.handlers", "TimedRotatingFileHandler"),
+        ("logging.handlers", "SysLogHandler"),
+    }
+)
+
+
+def filters_fields(filterer: logging.Filterer) -> frozenset[str] | None:
+    """Return the optional fields the filters of a logger or handler read, or None if unknown.
+
+    A filter reads nothing optional only if it says so with ``record_fields``.
+    """
+    fields = _NO_FIELDS
+    for record_filter in filterer.filters:
+        declared = getattr(record_filter, "record_fields", None)
+        if declared is None:
+            return None
+        fields = fields | declared
+    return fields
+
+
+def handler_fields(handler: logging.Handler) -> frozenset[str] | None:
+    """Return the optional fields a handler, its filters and its formatter read, or None if unknown."""
+    fields = getattr(handler, "record_fields", None)
+    if fields is None:
+        cls = type(handler)
+        if (cls.__module__, cls.__qualname__) not in _FORMATTER_ONLY_HANDLERS:
+            return None
+        fields = _NO_FIELDS
+    if handler.filters:
+        filter_needs = filters_fields(handler)
+        if filter_needs is None:
+            return None
+        fields = fields | filter_needs
+    if handler.formatter is None:
+        return fields
+    formatter_needs = formatter_fields(handler.formatter)
+    if formatter_needs is None:
+        return None
+    if formatter_needs <= fields:
+        return fields
+    return fields | formatter_needs if fields else formatter_needs
+
+
+_lean = True
+
+
+def enable_lean_records() -> None:
+    """Let TraceLogger capture lean records (the default)."""
+    global _lean
+    _lean = True
+
+
+def disable_lean_records() -> None:
+    """Make TraceLogger capture full stdlib LogRecords."""
+    global _lean
+    _lean = False
+
+
+def is_lean_records_enabled() -> bool:
+    """Return True if TraceLogger captures lean records."""
+    return _lean
+
+
+def needed_fields(logger: logging.Logger, level: int) -> frozenset[str] | None:
+    """Return the optional fields the handlers a record would reach need.
+
+    Walks the handlers like ``Logger.callHandlers`` (skipping handlers whose
+    level drops the record). Returns None when a full LogRecord is required:
+    lean records are disabled, the needs of a handler or of a filter (on the
+    logger, or on a handler the record reaches) are unknown, a custom
+    LogRecord factory is installed or the logger class overrides makeRecord.
+    Filters of ancestor loggers are not consulted: like stdlib, they never see
+    propagated records.
+    A factory that wraps ``logging.LogRecord`` and only adds attributes can
+    declare ``wraps_factory`` and ``stamp_record(record)`` (as arlogi's log
+    correlation does); make_record then applies ``stamp_record``.
+    """
+    if not _lean or type(logger).makeRecord is not logging.Logger.makeRecord:
+        return None
+    factory = logging.getLogRecordFactory()
+    if factory is not logging.LogRecord and getattr(factory, "wraps_factory", None) is not logging.LogRecord:
+        return None
+    fields = filters_fields(logger) if logger.filters else _NO_FIELDS
+    if fields is None:
+        return None
+    current: logging.Logger | None = logger
+    while current is not None:
+        for handler in current.handlers:
+            if level < handler.level:
+                continue
+            handler_needs = handler_fields(handler)
+            if handler_needs is None:
+                return None
+            if handler_needs and not handler_needs <= fields:
+                fields = fields | handler_needs
+        if not current.propagate:
+            break
+        current = current.parent
+    return fields
+
+
+# Per-record memo of formatted parts, shared by the handlers a record reaches
+_MEMO_ATTR = "_arlogi_memo"
+# Formats exceptions for handlers without a formatter
+_DEFAULT_FORMATTER = logging.Formatter()
+
+
+def record_memo(record: logging.LogRecord) -> dict[str, Any]:
+    """Return the dict in which handlers memoize formatted parts of a record."""
+    memo = record.__dict__.get(_MEMO_ATTR)
+    if memo is None:
+        memo = record.__dict__[_MEMO_ATTR] = {}
+    return memo
+
+
+def record_message(record: logging.LogRecord) -> str:
+    """Return ``record.getMessage()``, interpolating it once per record."""
+    memo = record_memo(record)
+    msg, args = record.msg, record.args
+    cached = memo.get("message")
+    if cached is not None and cached[0] is msg and cached[1] is args:
+        return cached[2]
+    message = record.getMessage()
+    memo["message"] = (msg, args, message)
+    return message
+
+
+def record_exc_text(record: logging.LogRecord, formatter: logging.Formatter | None = None) -> str:
+    """Return the record's formatted exception, formatting it once per record.
+
+    Uses ``record.exc_text`` as the memo, like ``logging.Formatter.format``.
+    The record must carry ``exc_info``.
+    """
+    if not record.exc_text:
+        record.exc_text = (formatter or _DEFAULT_FORMATTER).formatException(record.exc_info)
+    return record.exc_text
+
+
+def format_record(record: logging.LogRecord, formatter: logging.Formatter | None = None) -> str:
+    """``formatter.format(record)`` for a plain ``logging.Formatter``, with the message memoized."""
+    formatter = formatter or _DEFAULT_FORMATTER
+    record.message = record_message(record)
+    if formatter.usesTime():
+        record.asctime = formatter.formatTime(record, formatter.datefmt)
+    text = formatter.formatMessage(record)
+    if record.exc_info:
+        record_exc_text(record, formatter)
+    if record.exc_text:
+        if text[-1:] != "\n":
+            text += "\n"
+        text += record.exc_text
+    if record.stack_info:
+        if text[-1:] != "\n":
+            text += "\n"
+        text += formatter.formatStack(record.stack_info)
+    return text
+
+
+def record_payload(record: logging.LogRecord, plan: Any, build: Callable[[logging.LogRecord], Any]) -> Any:
+    """Return ``build(record)``, reusing the payload built for an equal ``plan``.
+
+    Sinks whose formatters share a field plan (the fields they emit and how
+    they encode them) produce identical payloads for a record, so fanning a
+    record out to N of them formats it once. The memo is dropped when the
+    record's message, exception or set of attributes changed since.
+    """
+    memo = record_memo(record)
+    state = (record.msg, record.args, id(record.exc_info), len(record.__dict__))
+    cached = memo.get("payload")
+    if (
+        cached is not None
+        and cached[0] == plan
+        and cached[1] is state[0]
+        and cached[2] is state[1]
+        and cached[3:5] == state[2:]
+    ):
+        return cached[5]
+    payload = build(record)
+    state = (record.msg, record.args, id(record.exc_info), len(record.__dict__))
+    memo["payload"] = (plan, *state, payload)
+    return payload
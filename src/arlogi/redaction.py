@@ -0,0 +1,277 @@
+"""Structured redaction of secrets before records reach any sink.
+
+The redactor runs in a RedactionFilter that arlogi attaches to every
+handler it installs, so records of any logger (not only TraceLogger) are
+masked before a sink formats them. The first handler a record reaches
+redacts it in place; the others see the redacted record:
+
+* extra fields (and keys nested in dict extras) whose lowercased name is in
+  a precompiled frozenset (``password``, ``token``, ``api_key``...) have
+  their value replaced;
+* the interpolated message and string extras are scanned by a single
+  combined regex (card numbers passing the Luhn check, bearer tokens, JWTs,
+  AWS access key ids, ``password=...`` style pairs plus any custom
+  patterns). Strings are only scanned when a substring prefilter finds a
+  candidate (enough digits for a card number, "token", "bearer"...) or
+  custom patterns are configured; strings without a match are left as
+  they are, and containers are only copied when something in them changed;
+* the formatted traceback (``exc_text``) and stack of records carrying
+  them are scanned by the same regex.
+
+Redaction is opt-in. The filters check a single module global per record
+while it is disabled. Add a RedactionFilter to handlers you install
+yourself.
+
+Example:
+    >>> from arlogi.redaction import enable_redaction
+    >>> enable_redaction(keys=["session_id"], patterns=[r"\\bsk_live_\\w+"])
+    >>> logger.info("login password=%s", "hunter2", session_id="abc")
+    # message: "login password=[REDACTED]", session_id: "[REDACTED]"
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from .records import _RECORD_ATTRS, record_exc_text, record_memo, record_message
+
+REPLACEMENT = "[REDACTED]"
+
+# Record memo key set when the formatted exception had secrets masked
+EXC_REDACTED = "exc_redacted"
+
+# Field names whose values are always secret (compared lowercased)
+DEFAULT_KEYS = frozenset(
+    {
+        "password",
+        "passwd",
+        "pwd",
+        "secret",
+        "client_secret",
+        "token",
+        "access_token",
+        "refresh_token",
+        "id_token",
+        "api_key",
+        "apikey",
+        "authorization",
+        "cookie",
+        "set-cookie",
+        "private_key",
+        "card_number",
+        "cvv",
+    }
+)
+
+# Built-in patterns, as named groups of the combined regex: the group name
+# tells the replacement what to keep.
+_BUILTIN_PATTERNS = (
+    r"(?P<card>\b(?:\d[ -]?){12,18}\d\b)",
+    r"(?P<bearer>\b[Bb]earer\s+)[A-Za-z0-9\-._~+/]+=*",
+    r"\beyJ[A-Za-z0-9_-]{4,}\.[A-Za-z0-9_-]{4,}\.[A-Za-z0-9_-]{4,}",
+    r"\bAKIA[0-9A-Z]{16}\b",
+    r"(?P<pair>\b(?i:password|passwd|pwd|secret|token|api[_-]?key|access[_-]?token)\s*[=:]\s*)[^\s,;&\"']+",
+)
+
+# Nesting of extra values that is scanned (guards against cyclic containers)
+_MAX_DEPTH = 16
+
+# Fewest digits in a card number
+_CARD_MIN_DIGITS = 13
+_DIGITS = "0123456789"
+
+
+def _may_hold_builtin_secret(text: str) -> bool:
+    """Cheap prefilter: False if no built-in pattern can match ``text``.
+
+    Substring tests run at C speed, several times faster than the regex
+    scanning every position of a string that holds no secret.
+    """
+    if len(text) >= _CARD_MIN_DIGITS and sum(map(text.count, _DIGITS)) >= _CARD_MIN_DIGITS:
+        return True
+    lowered = text.lower()
+    return (
+        "passw" in lowered
+        or "pwd" in lowered
+        or "secret" in lowered
+        or "token" in lowered
+        or "key" in lowered
+        or "bearer" in lowered
+        or "eyj" in lowered
+        or "akia" in lowered
+    )
+
+
+def _luhn_valid(number: str) -> bool:
+    """Return True if the digits of ``number`` pass the Luhn checksum."""
+    digits = [int(ch) for ch in number if ch.isdigit()]
+    checksum = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    return checksum % 10 == 0
+
+
+class Redactor:
+    """Masks secret keys and secret-looking substrings in records."""
+
+    def __init__(
+        self,
+        keys: Iterable[str] | None = None,
+        patterns: Iterable[str] | None = None,
+        replacement: str = REPLACEMENT,
+        defaults: bool = True,
+    ):
+        """Initialize the redactor.
+
+        Args:
+            keys: Additional secret field names (case-insensitive)
+            patterns: Additional regular expressions whose matches are masked
+            replacement: Text replacing secrets
+            defaults: Include DEFAULT_KEYS and the built-in patterns
+
+        Raises:
+            re.error: If a pattern is not a valid regular expression
+        """
+        self.replacement = replacement
+        self.keys = frozenset(key.lower() for key in (*(DEFAULT_KEYS if defaults else ()), *(keys or ())))
+        all_patterns = [*(_BUILTIN_PATTERNS if defaults else ()), *(f"(?:{pattern})" for pattern in patterns or ())]
+        self.pattern = re.compile("|".join(all_patterns)) if all_patterns else None
+        # Custom patterns can match anything: only built-ins can be prefiltered
+        self._prefilter = _may_hold_builtin_secret if defaults and not patterns else None
+
+    def _replace(self, match: re.Match[str]) -> str:
+        group = match.lastgroup
+        if group == "card":
+            return self.replacement if _luhn_valid(match.group()) else match.group()
+        if group in ("bearer", "pair"):
+            # Keep the "Bearer " / "password=" prefix, mask what follows
+            return match.group(group) + self.replacement
+        return self.replacement
+
+    def redact_text(self, text: str) -> str:
+        """Return ``text`` with secret-looking substrings masked (the same object if none)."""
+        pattern = self.pattern
+        if pattern is None or (self._prefilter is not None and not self._prefilter(text)):
+            return text
+        if pattern.search(text) is None:
+            return text
+        return pattern.sub(self._replace, text)
+
+    def redact_value(self, value: Any, depth: int = 0) -> Any:
+        """Return a redacted copy of an extra value, or the value itself if nothing changed."""
+        if isinstance(value, str):
+            return self.redact_text(value)
+        if depth >= _MAX_DEPTH:
+            return value
+        if isinstance(value, dict):
+            changed = None
+            for key, item in value.items():
+                if isinstance(key, str) and key.lower() in self.keys:
+                    redacted = self.replacement
+                else:
+                    redacted = self.redact_value(item, depth + 1)
+                if redacted is not item:
+                    if changed is None:
+                        changed = dict(value)
+                    changed[key] = redacted
+            return value if changed is None else changed
+        if isinstance(value, (list, tuple)):
+            items = [self.redact_value(item, depth + 1) for item in value]
+            if all(new is old for new, old in zip(items, value, strict=True)):
+                return value
+            return type(value)(items) if isinstance(value, tuple) else items
+        return value
+
+    def process(self, record: logging.LogRecord) -> None:
+        """Redact a record's message, exception, stack and extra fields in place.
+
+        The exception is formatted into ``exc_text`` (the text handlers
+        reuse); when that text changed, the record memo gets EXC_REDACTED
+        so handlers rendering ``exc_info`` themselves can fall back to it.
+        """
+        message = record_message(record)
+        redacted = self.redact_text(message)
+        if redacted is not message:
+            record.msg, record.args = redacted, ()
+        if record.exc_info:
+            exc_text = record_exc_text(record)
+            redacted = self.redact_text(exc_text)
+            if redacted is not exc_text:
+                record.exc_text = redacted
+                record_memo(record)[EXC_REDACTED] = True
+        if record.stack_info:
+            record.stack_info = self.redact_text(record.stack_info)
+
+        attrs = record.__dict__
+        changes = None
+        for key, value in attrs.items():
+            if key in _RECORD_ATTRS or key.startswith("_"):
+                continue
+            new = self.replacement if key.lower() in self.keys else self.redact_value(value)
+            if new is not value:
+                if changes is None:
+                    changes = {}
+                changes[key] = new
+        if changes:
+            attrs.update(changes)
+
+
+# The active redactor; None while redaction is disabled (the fast path).
+_active: Redactor | None = None
+
+
+class RedactionFilter(logging.Filter):
+    """Redacts each record with the active redactor before a handler emits it.
+
+    A record reaching several handlers is redacted once. A no-op while
+    redaction is disabled.
+    """
+
+    # Reads no optional LogRecord field (see arlogi.records)
+    record_fields: frozenset[str] = frozenset()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Redact the record in place (once per redactor); never drops it."""
+        redactor = _active
+        if redactor is not None:
+            memo = record_memo(record)
+            if memo.get("redactor") is not redactor:
+                memo["redactor"] = redactor
+                redactor.process(record)
+        return True
+
+
+def enable_redaction(
+    keys: Iterable[str] | None = None,
+    patterns: Iterable[str] | None = None,
+    replacement: str = REPLACEMENT,
+) -> Redactor:
+    """Start redacting records (replacing any active redactor).
+
+    Args:
+        keys: Secret field names added to DEFAULT_KEYS
+        patterns: Regular expressions added to the built-in patterns
+        replacement: Text replacing secrets
+
+    Returns:
+        The active Redactor
+    """
+    global _active
+    _active = Redactor(keys=keys, patterns=patterns, replacement=replacement)
+    return _active
+
+
+def disable_redaction() -> None:
+    """Stop redacting records."""
+    global _active
+    _active = None
+
+
+def get_redactor() -> Redactor | None:
+    """Return the active redactor, or None while redaction is disabled."""
+    return _active
@@ -0,0 +1,246 @@
+"""Self-metrics for the arlogi logging pipeline.
+
+Cheap in-process counters and histograms describing what logging itself
+costs: records per level and logger, formatted bytes, emit latency and
+handleError calls per handler, JSON file rotation durations, and records
+dropped or throttled before reaching a sink.
+
+Collection is off by default. Every instrumentation point checks a single
+module global, so the disabled cost is one attribute lookup per record.
+When enabled, read the numbers with get_self_metrics(); arlogi.otel's
+setup_metrics() also publishes them through the global MeterProvider.
+
+Example:
+    >>> from arlogi.selfmetrics import enable_self_metrics, get_self_metrics
+    >>> enable_self_metrics()
+    >>> get_self_metrics()["records"]
+    {}
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Histogram bucket upper bounds in seconds (emit latency and rotation duration)
+DURATION_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Reasons arlogi suppresses records for: "dropped" by a full queue or an
+# open circuit breaker, "throttled" when exception dedup drops a traceback
+SUPPRESSION_REASONS = ("dropped", "throttled")
+
+
+class _Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    __slots__ = ("bucket_counts", "count", "max", "min", "sum")
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(DURATION_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(DURATION_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip([*DURATION_BUCKETS, float("inf")], self.bucket_counts, strict=True)),
+        }
+
+
+def handler_label(handler: logging.Handler) -> str:
+    """Return the metric label of a handler: its name, or its class name."""
+    return handler.name or type(handler).__name__
+
+
+class PipelineMetrics:
+    """Counters and histograms of one collection period.
+
+    All updates take a single lock; they only run while collection is enabled.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.records: dict[tuple[str, str], int] = {}
+        self.handler_bytes: dict[str, int] = {}
+        self.emit_latency: dict[str, _Histogram] = {}
+        self.handle_errors: dict[str, int] = {}
+        self.rotation_duration = _Histogram()
+        self.suppressed: dict[tuple[str, str], int] = {}
+
+    def count_record(self, record: logging.LogRecord) -> None:
+        key = (record.name, record.levelname)
+        with self._lock:
+            self.records[key] = self.records.get(key, 0) + 1
+
+    def add_bytes(self, handler: logging.Handler, text: str) -> None:
+        size = len(text) if text.isascii() else len(text.encode("utf-8", "replace"))
+        label = handler_label(handler)
+        with self._lock:
+            self.handler_bytes[label] = self.handler_bytes.get(label, 0) + size
+
+    def observe_emit(self, handler: logging.Handler, seconds: float) -> None:
+        label = handler_label(handler)
+        with self._lock:
+            histogram = self.emit_latency.get(label)
+            if histogram is None:
+                histogram = self.emit_latency[label] = _Histogram()
+            histogram.observe(seconds)
+
+    def count_handle_error(self, handler: logging.Handler) -> None:
+        label = handler_label(handler)
+        with self._lock:
+            self.handle_errors[label] = self.handle_errors.get(label, 0) + 1
+
+    def observe_rotation(self, seconds: float) -> None:
+        with self._lock:
+            self.rotation_duration.observe(seconds)
+
+    def count_suppressed(self, reason: str, source: str, count: int = 1) -> None:
+        key = (reason, source)
+        with self._lock:
+            self.suppressed[key] = self.suppressed.get(key, 0) + count
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent, JSON-serializable copy of every metric."""
+        with self._lock:
+            records: dict[str, dict[str, int]] = {}
+            for (name, level), count in self.records.items():
+                records.setdefault(name, {})[level] = count
+            suppressed: dict[str, dict[str, int]] = {reason: {} for reason in SUPPRESSION_REASONS}
+            for (reason, source), count in self.suppressed.items():
+                suppressed.setdefault(reason, {})[source] = count
+            return {
+                "records": records,
+                "handler_bytes": dict(self.handler_bytes),
+                "emit_latency": {label: h.snapshot() for label, h in self.emit_latency.items()},
+                "handle_errors": dict(self.handle_errors),
+                "rotation_duration": self.rotation_duration.snapshot(),
+                "suppressed": suppressed,
+            }
+
+
+# The active collector; None while self-metrics are disabled (the fast path).
+_active: PipelineMetrics | None = None
+
+
+def enable_self_metrics() -> None:
+    """Start collecting self-metrics (a no-op when already enabled)."""
+    global _active
+    if _active is None:
+        _active = PipelineMetrics()
+
+
+def disable_self_metrics() -> None:
+    """Stop collecting self-metrics and discard the collected values."""
+    global _active
+    _active = None
+
+
+def is_self_metrics_enabled() -> bool:
+    """Return True while self-metrics are being collected."""
+    return _active is not None
+
+
+def reset_self_metrics() -> None:
+    """Zero every metric, keeping collection enabled if it was."""
+    global _active
+    if _active is not None:
+        _active = PipelineMetrics()
+
+
+def get_self_metrics() -> dict[str, Any]:
+    """Return a snapshot of the pipeline self-metrics.
+
+    Returns:
+        A dict with ``enabled`` plus, while enabled, ``records``
+        (logger -> level -> count), ``handler_bytes``, ``emit_latency``
+        and ``handle_errors`` (keyed by handler name or class name),
+        ``rotation_duration`` and ``suppressed`` (reason -> source -> count).
+        Histograms report count, sum, min, max and per-bucket (non-cumulative)
+        counts keyed by the bucket's upper bound in seconds.
+
+    Example:
+        >>> snapshot = get_self_metrics()
+        >>> snapshot["emit_latency"]["JSONFileHandler"]["count"]
+        42
+    """
+    metrics = _active
+    if metrics is None:
+        return {"enabled": False}
+    return {"enabled": True, **metrics.snapshot()}
+
+
+def count_suppressed(reason: str, source: str, count: int = 1) -> None:
+    """Count records dropped or throttled before reaching a sink.
+
+    Args:
+        reason: "dropped", "throttled" (see SUPPRESSION_REASONS), or a
+            reason of a custom filter
+        source: Handler or filter label that suppressed the records
+        count: Number of records suppressed
+    """
+    metrics = _active
+    if metrics is not None:
+        metrics.count_suppressed(reason, source, count)
+
+
+def observe_rotation(seconds: float) -> None:
+    """Record the duration of one log file rotation.
+
+    Args:
+        seconds: Wall time the rotation took
+    """
+    metrics = _active
+    if metrics is not None:
+        metrics.observe_rotation(seconds)
+
+
+class MeteredHandlerMixin:
+    """Handler mixin recording emit latency, formatted bytes and handleError calls.
+
+    Mixed in ahead of the logging.Handler base of every arlogi handler.
+    Handlers that do not go through format() call ``_count_bytes`` themselves.
+    """
+
+    def handle(self, record: logging.LogRecord) -> logging.LogRecord | bool:
+        metrics = _active
+        if metrics is None:
+            return super().handle(record)  # type: ignore[misc]
+        start = time.perf_counter()
+        try:
+            return super().handle(record)  # type: ignore[misc]
+        finally:
+            metrics.observe_emit(self, time.perf_counter() - start)  # type: ignore[arg-type]
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)  # type: ignore[misc]
+        metrics = _active
+        if metrics is not None:
+            metrics.add_bytes(self, text)  # type: ignore[arg-type]
+        return text
+
+    def _count_bytes(self, text: str) -> None:
+        metrics = _active
+        if metrics is not None:
+            metrics.add_bytes(self, text)  # type: ignore[arg-type]
+
+    def handleError(self, record: logging.LogRecord) -> None:
+        metrics = _active
+        if metrics is not None:
+            metrics.count_handle_error(self)  # type: ignore[arg-type]
+        super().handleError(record)  # type: ignore[misc]
@@ -0,0 +1,336 @@
+"""High-throughput RFC 5424 syslog transport over stream sockets.
+
+This module provides:
+- RFC5424Formatter: RFC 5424 messages with structured data built from record extras
+- SyslogStreamHandler: persistent TCP/Unix stream connection with RFC 6587
+  octet-counting framing, a bounded outbound queue, batched sends from a
+  background thread and reconnect with exponential backoff
+
+Unlike ArlogiSyslogHandler (a thin SysLogHandler), the calling thread only
+formats and enqueues; socket I/O never blocks application logging.
+"""
+
+import logging
+import logging.handlers
+import os
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from .handlers import _STANDARD_RECORD_ATTRS
+from .records import record_exc_text, record_message
+from .selfmetrics import MeteredHandlerMixin, count_suppressed, handler_label
+
+# Python level -> RFC 5424 severity (TRACE and DEBUG both map to debug)
+_SEVERITIES = (
+    (logging.CRITICAL, 2),
+    (logging.ERROR, 3),
+    (logging.WARNING, 4),
+    (logging.INFO, 6),
+)
+
+_SD_NAME_INVALID = str.maketrans({"=": "_", " ": "_", "]": "_", '"': "_"})
+
+
+def _severity(levelno: int) -> int:
+    """Map a Python log level to an RFC 5424 severity."""
+    for threshold, severity in _SEVERITIES:
+        if levelno >= threshold:
+            return severity
+    return 7
+
+
+def _header_field(value: str | None, max_length: int) -> str:
+    """Sanitize an RFC 5424 header field (printable US-ASCII, no spaces) or return NILVALUE."""
+    if not value:
+        return "-"
+    cleaned = "".join(ch if 33 <= ord(ch) <= 126 else "_" for ch in value[:max_length])
+    return cleaned or "-"
+
+
+def _sd_param_value(value: object) -> str:
+    """Escape an SD-PARAM value: backslash, double quote and ']' must be escaped."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("]", "\\]")
+
+
+class RFC5424Formatter(logging.Formatter):
+    """Format records as RFC 5424 syslog messages.
+
+    ``<PRI>1 TIMESTAMP HOSTNAME APP-NAME PROCID MSGID [SD-ELEMENT] MSG``
+
+    MSGID carries the logger name. Extra fields of the record are exported as
+    parameters of a single SD-ELEMENT (``sd_id``); records without extras get
+    the NILVALUE ``-``.
+    """
+
+    # Optional LogRecord fields format() reads (PROCID; see arlogi.records)
+    record_fields = frozenset({"process"})
+
+    def __init__(
+        self,
+        facility: int = logging.handlers.SysLogHandler.LOG_USER,
+        app_name: str | None = None,
+        hostname: str | None = None,
+        sd_id: str = "arlogi@32473",
+    ):
+        """Initialize the RFC 5424 formatter.
+
+        Args:
+            facility: Syslog facility number (default: LOG_USER)
+            app_name: APP-NAME field (default: name of the running program)
+            hostname: HOSTNAME field (default: socket.gethostname())
+            sd_id: SD-ID of the structured-data element holding record extras
+        """
+        super().__init__()
+        self.facility = facility
+        program = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else None
+        self.app_name = _header_field(app_name or program, 48)
+        self.hostname = _header_field(hostname or socket.gethostname(), 255)
+        self.sd_id = sd_id
+
+    def format_structured_data(self, record: logging.LogRecord) -> str:
+        """Build the STRUCTURED-DATA field from the record's extra attributes."""
+        params = [
+            f'{key.translate(_SD_NAME_INVALID)[:32]}="{_sd_param_value(value)}"'
+            for key, value in record.__dict__.items()
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_")
+        ]
+        if not params:
+            return "-"
+        return f"[{self.sd_id} {' '.join(params)}]"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as an RFC 5424 message (without transport framing).
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            The RFC 5424 message
+        """
+        message = record_message(record)
+        if record.exc_info:
+            record_exc_text(record, self)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+
+        pri = self.facility * 8 + _severity(record.levelno)
+        timestamp = datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="microseconds")
+        msgid = _header_field(record.name, 32)
+        structured_data = self.format_structured_data(record)
+        return (
+            f"<{pri}>1 {timestamp} {self.hostname} {self.app_name} {record.process or '-'} "
+            f"{msgid} {structured_data} {message}"
+        )
+
+
+class SyslogStreamHandler(MeteredHandlerMixin, logging.Handler):
+    """Send RFC 5424 syslog messages over a persistent stream connection.
+
+    Features:
+    - RFC 6587 octet-counting framing (``MSG-LEN SP SYSLOG-MSG``), so
+      multi-line messages and tracebacks survive intact
+    - Bounded outbound queue; records are dropped (and counted) when it is full
+    - Background sender joins queued frames and sends them with one syscall
+    - Reconnect with exponential backoff; frames not sent completely are retried
+    """
+
+    # Records are formatted on the calling thread; RFC5424Formatter declares its fields
+    record_fields = frozenset()
+
+    def __init__(
+        self,
+        address: str | tuple[str, int] = ("localhost", 601),
+        facility: int = logging.handlers.SysLogHandler.LOG_USER,
+        app_name: str | None = None,
+        queue_size: int = 10_000,
+        batch_size: int = 512,
+        connect_timeout: float = 5.0,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        flush_timeout: float = 5.0,
+    ):
+        """Initialize the stream syslog handler.
+
+        Args:
+            address: (host, port) for TCP or a filesystem path for a Unix stream socket
+            facility: Syslog facility number (default: LOG_USER)
+            app_name: RFC 5424 APP-NAME (default: name of the running program)
+            queue_size: Maximum number of queued, unsent messages
+            batch_size: Maximum number of messages sent per syscall
+            connect_timeout: Connect and send timeout in seconds
+            initial_backoff: First reconnect delay in seconds
+            max_backoff: Upper bound for the reconnect delay in seconds
+            flush_timeout: Maximum seconds flush() waits for the queue to drain
+
+        Raises:
+            ValueError: If queue_size or batch_size is not positive
+        """
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size and batch_size must be >= 1")
+
+        super().__init__()
+        self.address = address
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.connect_timeout = connect_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.flush_timeout = flush_timeout
+        self.setFormatter(RFC5424Formatter(facility=facility, app_name=app_name))
+
+        self.sent = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+        self._queue: deque[bytes] = deque()
+        self._inflight = 0
+        self._cond = threading.Condition()
+        self._closing = False
+        self._sock: socket.socket | None = None
+        self._backoff = initial_backoff
+        self._thread = threading.Thread(target=self._run, name="arlogi-syslog-sender", daemon=True)
+        self._thread.start()
+
+    @property
+    def connected(self) -> bool:
+        """True while the sender holds an open connection."""
+        return self._sock is not None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format, frame and enqueue a record; never blocks on the network."""
+        try:
+            payload = self.format(record).encode("utf-8", "replace")
+            frame = b"%d %s" % (len(payload), payload)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._cond:
+            if self._closing:
+                return
+            if len(self._queue) >= self.queue_size:
+                self.dropped += 1
+                count_suppressed("dropped", handler_label(self))
+                return
+            self._queue.append(frame)
+            self._cond.notify()
+
+    def _connect(self) -> socket.socket:
+        """Open the stream connection to the collector."""
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(self.connect_timeout)
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+        else:
+            sock = socket.create_connection(self.address, timeout=self.connect_timeout)
+        return sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def _next_batch(self) -> list[bytes] | None:
+        """Wait for queued frames and take up to batch_size of them (None: shut down)."""
+        with self._cond:
+            while not self._queue and not self._closing:
+                self._cond.wait()
+            if not self._queue:
+                return None
+            count = min(len(self._queue), self.batch_size)
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._inflight = count
+            return batch
+
+    def _send(self, batch: list[bytes]) -> list[bytes]:
+        """Send a batch over the connection, connecting first if needed.
+
+        Returns:
+            The frames not completely sent when the connection failed (empty
+            on success). A frame cut short is returned whole: its prefix went
+            to a dead connection, so the collector never received it intact.
+        """
+        data = memoryview(b"".join(batch))
+        offset = 0
+        try:
+            if self._sock is None:
+                self._sock = self._connect()
+                self.reconnects += 1
+            while offset < len(data):
+                offset += self._sock.send(data[offset:])
+            return []
+        except OSError:
+            self._disconnect()
+        for done, frame in enumerate(batch):
+            if offset < len(frame):
+                return batch[done:]
+            offset -= len(frame)
+        return []
+
+    def _run(self) -> None:
+        """Sender loop: batch, send, and reconnect with exponential backoff."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            unsent = self._send(batch)
+            if unsent:
+                with self._cond:
+                    self.sent += len(batch) - len(unsent)
+                    # Retry the unsent frames first; drop the oldest frames beyond the bound.
+                    self._queue.extendleft(reversed(unsent))
+                    overflow = len(self._queue) - self.queue_size
+                    for _ in range(overflow):
+                        self._queue.popleft()
+                    if overflow > 0:
+                        self.dropped += overflow
+                        count_suppressed("dropped", handler_label(self), overflow)
+                    self._inflight = 0
+                    self._cond.notify_all()
+                    # Sleep out the backoff: records enqueued meanwhile notify
+                    # the condition, only close() cuts the wait short.
+                    deadline = time.monotonic() + self._backoff
+                    while not self._closing:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    if self._closing:
+                        return
+                self._backoff = min(self._backoff * 2, self.max_backoff)
+                continue
+
+            self._backoff = self.initial_backoff
+            with self._cond:
+                self.sent += len(batch)
+                self._inflight = 0
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait (up to flush_timeout) until every queued message has been sent."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._queue and not self._inflight, timeout=self.flush_timeout)
+
+    def close(self) -> None:
+        """Drain the queue (bounded by flush_timeout), stop the sender and close the socket."""
+        try:
+            if self._thread.is_alive() and not self._closing:
+                self.flush()
+            with self._cond:
+                self._closing = True
+                self._cond.notify_all()
+            self._thread.join(self.flush_timeout)
+            self._disconnect()
+        finally:
+            super().close()
@@ -11,7 +11,7 @@ def reset_otel_globals():
         from opentelemetry import metrics, trace
         from opentelemetry.util._once import Once
 
-        from arlogi.otel import shutdown_metrics, shutdown_tracing
+        from arlogi.otel import shutdown_logs, shutdown_metrics, shutdown_tracing
     except ImportError:
         return  # [otel] extra absent (partial install); nothing to reset
 
@@ -19,6 +19,7 @@ def reset_otel_globals():
     # releases OpenTelemetry's set-once global slots.
     shutdown_tracing()
     shutdown_metrics()
+    shutdown_logs()
 
     # Providers a test registered directly, bypassing arlogi's bootstrap.
     trace._TRACER_PROVIDER_SET_ONCE = Once()
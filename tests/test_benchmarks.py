@@ -0,0 +1,41 @@
+"""Smoke tests for the benchmark runner (tiny iteration counts, no timing assertions)."""
+
+import json
+
+from benchmarks import runner
+from benchmarks.bench_paths import CASES
+
+
+def test_every_logging_path_has_a_case():
+    names = {case.name for case in CASES}
+    assert {
+        "disabled",
+        "info",
+        "kwargs_extra",
+        "caller_depth",
+        "console_rich",
+        "json_stream",
+        "json_file",
+        "json_file_rotating",
+        "syslog_udp",
+        "syslog_stream",
+        "exception",
+    } <= names
+
+
+def test_runner_writes_machine_readable_results(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--only", "info", "json_file", "syslog_udp", "--iterations", "20", "--repeats", "1", "--alloc-calls", "5"]
+
+    assert runner.main([*args, "--output", str(output)]) == 0
+    payload = json.loads(output.read_text())
+    assert payload["environment"]["python"]
+    results = {r["name"]: r for r in payload["results"]}
+    assert set(results) == {"info", "json_file", "syslog_udp"}
+    for result in results.values():
+        for side in ("arlogi", "stdlib"):
+            assert set(result[side]) == {"ns", "peak_bytes", "retained_bytes"}
+            assert result[side]["ns"] >= 0
+
+    assert runner.main([*args[:3], "--iterations", "20", "--repeats", "1", "--compare", str(output)]) == 0
+    assert "vs prev" in capsys.readouterr().out
@@ -0,0 +1,226 @@
+"""Tests for the per-handler circuit breaker."""
+
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+from arlogi.breaker import CircuitBreakerHandler, get_breaker_states
+from arlogi.config import LoggingConfig
+from arlogi.handler_factory import DeferredHandler, HandlerFactory
+
+
+class FlakySink(logging.Handler):
+    """Sink that fails (via handleError, like real handlers) while `broken` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.broken = False
+        self.delay = 0.0
+        self.received = []
+        self.errors = 0
+
+    def emit(self, record):
+        try:
+            if self.broken:
+                raise OSError("collector down")
+            self.received.append(record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+    def handleError(self, record):
+        self.errors += 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _record(msg):
+    return logging.LogRecord("breaker", logging.INFO, __file__, 1, msg, (), None)
+
+
+def _breaker(sink, **kwargs):
+    breaker = CircuitBreakerHandler(sink, **kwargs)
+    clock = FakeClock()
+    breaker._now = clock  # type: ignore[method-assign]
+    return breaker, clock
+
+
+def test_healthy_sink_passes_through():
+    sink = FlakySink()
+    breaker, _ = _breaker(sink)
+    for i in range(5):
+        breaker.handle(_record(f"m{i}"))
+
+    assert sink.received == [f"m{i}" for i in range(5)]
+    assert breaker.state == "closed"
+
+
+def test_trips_after_consecutive_failures_and_reports_once():
+    sink = FlakySink()
+    breaker, _ = _breaker(sink, failure_threshold=3)
+    sink.broken = True
+    for i in range(10):
+        breaker.handle(_record(f"m{i}"))
+
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+    assert sink.errors == 1  # only the first failure of the streak is reported
+    assert breaker.stats()["spilled"] == 7
+
+
+def test_trips_on_latency_budget():
+    sink = FlakySink()
+    breaker, clock = _breaker(sink, latency_budget=0.1, slow_threshold=2)
+
+    def slow_handle(record, original=sink.handle):
+        clock.now += 0.5
+        return original(record)
+
+    sink.handle = slow_handle  # type: ignore[method-assign]
+    breaker.handle(_record("slow 1"))
+    assert breaker.state == "closed"
+    breaker.handle(_record("slow 2"))
+    assert breaker.state == "open"
+
+
+def test_probe_closes_and_replays_spilled_records():
+    sink = FlakySink()
+    breaker, clock = _breaker(sink, failure_threshold=1, reset_timeout=5)
+    sink.broken = True
+    breaker.handle(_record("lost"))
+    breaker.handle(_record("spilled 1"))
+    breaker.handle(_record("spilled 2"))
+    assert breaker.state == "open"
+
+    sink.broken = False
+    clock.now += 1
+    breaker.handle(_record("still open"))
+    assert sink.received == []
+
+    clock.now += 5
+    breaker.handle(_record("probe"))
+
+    assert breaker.state == "closed"
+    assert sink.received == ["probe", "spilled 1", "spilled 2", "still open"]
+    assert breaker.replayed == 3
+
+
+def test_failed_probe_reopens():
+    sink = FlakySink()
+    breaker, clock = _breaker(sink, failure_threshold=1, reset_timeout=5)
+    sink.broken = True
+    breaker.handle(_record("a"))
+    clock.now += 6
+    breaker.handle(_record("probe"))
+
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+    assert sink.errors == 1
+
+
+def test_spill_buffer_is_bounded_and_can_be_disabled():
+    sink = FlakySink()
+    breaker, _ = _breaker(sink, failure_threshold=1, spill_size=2)
+    sink.broken = True
+    for i in range(6):
+        breaker.handle(_record(f"m{i}"))
+    assert breaker.stats()["buffered"] == 2
+
+    skipping, _ = _breaker(FlakySink(), failure_threshold=1, spill_size=0)
+    skipping.handler.broken = True
+    for i in range(3):
+        skipping.handle(_record(f"m{i}"))
+    assert skipping.skipped == 2
+
+
+def test_open_breaker_skips_flush_and_close_restores_error_handler():
+    sink = FlakySink()
+    breaker, _ = _breaker(sink, failure_threshold=1)
+    sink.broken = True
+    breaker.handle(_record("x"))
+    with patch.object(sink, "flush") as flush:
+        breaker.flush()
+    flush.assert_not_called()
+
+    breaker.close()
+    assert sink.handleError.__func__ is FlakySink.handleError
+
+
+def test_breaker_states_are_exposed_for_monitoring():
+    breaker, _ = _breaker(FlakySink())
+    states = get_breaker_states()
+    assert any(s["handler"] == "FlakySink" and s["state"] == "closed" for s in states)
+    breaker.close()
+
+
+def test_factory_wraps_handlers_when_enabled():
+    handlers = HandlerFactory.create_handlers(LoggingConfig(console_renderer="plain", circuit_breaker=True))
+    assert all(isinstance(h, CircuitBreakerHandler) for h in handlers)
+
+    deferred = HandlerFactory.create_handlers(
+        LoggingConfig(console_renderer="plain", circuit_breaker=True, defer_handlers=True)
+    )
+    assert isinstance(deferred[0], DeferredHandler)
+    assert isinstance(deferred[0].handler, CircuitBreakerHandler)
+
+
+class RaisingSink(logging.Handler):
+    """Sink whose emit fails through the stdlib handleError (not overridden)."""
+
+    def emit(self, record):
+        try:
+            raise OSError("disk full")
+        except Exception:
+            self.handleError(record)
+
+
+def test_stdlib_handle_error_reports_first_failure_without_raising(capsys):
+    logger = logging.getLogger("breaker.stdlib_error")
+    logger.propagate = False
+    breaker = CircuitBreakerHandler(RaisingSink(), failure_threshold=3)
+    logger.addHandler(breaker)
+    try:
+        for _ in range(5):
+            logger.error("boom")  # must not raise from the breaker
+    finally:
+        logger.removeHandler(breaker)
+        breaker.close()
+
+    err = capsys.readouterr().err
+    assert err.count("--- Logging error ---") == 1
+    assert "OSError: disk full" in err
+    assert breaker.state == "open"
+
+
+def test_hung_sink_opens_breaker_for_waiting_threads():
+    release = threading.Event()
+    entered = threading.Event()
+
+    class HungSink(logging.Handler):
+        def emit(self, record):
+            entered.set()
+            release.wait(5)
+
+    sink = HungSink()
+    breaker = CircuitBreakerHandler(sink, stall_timeout=0.05)
+    stuck = threading.Thread(target=breaker.handle, args=(_record("stuck"),))
+    stuck.start()
+    try:
+        assert entered.wait(5)
+        started = time.monotonic()
+        breaker.handle(_record("queued"))
+        breaker.handle(_record("bypassed"))
+        assert time.monotonic() - started < 1
+        assert breaker.state == "open"
+        assert breaker.stats()["stalls"] == 1
+        assert breaker.stats()["spilled"] == 2
+    finally:
+        release.set()
+        stuck.join()
+        breaker.close()
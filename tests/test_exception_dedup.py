@@ -0,0 +1,178 @@
+"""Tests for exception fingerprinting and traceback deduplication (arlogi.dedup)."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from arlogi import dedup, selfmetrics
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.dedup import ExceptionDeduplicator, exception_fingerprint
+from arlogi.factory import LoggerFactory, TraceLogger
+from arlogi.handlers import JSONHandler
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def logger():
+    logger = TraceLogger("dedup.test", logging.DEBUG)
+    logger.propagate = False
+    stream = io.StringIO()
+    logger.addHandler(JSONHandler(stream))
+    logger.stream = stream
+    clock = Clock()
+    dedup.enable_exception_dedup(window=60.0)._now = clock
+    logger.clock = clock
+    yield logger
+    dedup.disable_exception_dedup()
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def _lines(logger):
+    return [json.loads(line) for line in logger.stream.getvalue().splitlines()]
+
+
+def _fail(detail):
+    raise ConnectionError(f"upstream down: {detail}")
+
+
+def _log_failure(logger, detail):
+    try:
+        _fail(detail)
+    except ConnectionError:
+        logger.exception("request failed")
+
+
+def _capture(func):
+    try:
+        func()
+    except Exception as exc:
+        return exc
+
+
+def test_fingerprint_ignores_message_but_not_frames():
+    first, second = (_capture(lambda detail=detail: _fail(detail)) for detail in "ab")
+    other_site = _capture(lambda: (_ for _ in ()).throw(ConnectionError("a")))
+
+    assert exception_fingerprint(first) == exception_fingerprint(second)
+    assert exception_fingerprint(first) != exception_fingerprint(other_site)
+    assert len(exception_fingerprint(first)) == 16
+
+
+def test_fingerprint_includes_chained_cause():
+    def wrapped():
+        try:
+            _fail("a")
+        except ConnectionError as exc:
+            raise RuntimeError("wrapped") from exc
+
+    def wrapped_other():
+        try:
+            {}["missing"]
+        except KeyError as exc:
+            raise RuntimeError("wrapped") from exc
+
+    assert exception_fingerprint(_capture(wrapped)) != exception_fingerprint(_capture(wrapped_other))
+
+
+def test_repeated_tracebacks_keep_only_fingerprint_and_count(logger):
+    for i in range(3):
+        _log_failure(logger, i)
+
+    first, second, third = _lines(logger)
+    assert "ConnectionError: upstream down: 0" in first["exception"]
+    assert first["exc_occurrences"] == 1
+    assert "exception" not in second and "exception" not in third
+    assert second["exc_fingerprint"] == third["exc_fingerprint"] == first["exc_fingerprint"]
+    assert (second["exc_occurrences"], third["exc_occurrences"]) == (2, 3)
+
+
+def test_dropped_tracebacks_are_counted_as_throttled(logger):
+    selfmetrics.enable_self_metrics()
+    try:
+        for i in range(3):
+            _log_failure(logger, i)
+        suppressed = selfmetrics.get_self_metrics()["suppressed"]
+    finally:
+        selfmetrics.disable_self_metrics()
+
+    assert suppressed["throttled"] == {"dedup": 2}
+
+
+def test_traceback_logged_again_after_window(logger):
+    _log_failure(logger, 1)
+    _log_failure(logger, 2)
+    logger.clock.now += 60.0
+    _log_failure(logger, 3)
+
+    records = _lines(logger)
+    assert "exception" in records[2]
+    assert records[2]["exc_occurrences"] == 1
+
+
+def test_counts_exposed_per_fingerprint(logger):
+    _log_failure(logger, 1)
+    logger.clock.now += 90.0
+    _log_failure(logger, 2)
+
+    counts = dedup.get_exception_counts()
+    fingerprint = _lines(logger)[0]["exc_fingerprint"]
+    assert counts[fingerprint] == {
+        "type": "builtins.ConnectionError",
+        "count": 2,
+        "window_count": 1,
+        "first_seen": 1000.0,
+        "last_seen": 1090.0,
+    }
+
+
+def test_records_without_exceptions_are_untouched(logger):
+    logger.error("no exception")
+
+    assert "exc_fingerprint" not in _lines(logger)[0]
+
+
+def test_capacity_forgets_least_recently_seen():
+    deduplicator = ExceptionDeduplicator(capacity=2)
+    errors = [_capture(lambda: _fail("a")), _capture(lambda: {}["x"]), _capture(lambda: 1 / 0)]
+
+    for exc in errors:
+        deduplicator.observe(exc, now=0.0)
+
+    assert len(deduplicator.counts()) == 2
+    assert deduplicator.observe(errors[0], now=1.0)[1] == 1
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="window"):
+        ExceptionDeduplicator(window=0)
+    with pytest.raises(ValueError, match="capacity"):
+        ExceptionDeduplicator(capacity=0)
+    with pytest.raises(ValueError, match="exception_dedup_window"):
+        LoggingConfig(exception_dedup_window=-1)
+
+
+def test_config_plumbing():
+    assert LoggingConfig().exception_dedup_window is None
+    config = LoggingConfigBuilder().with_exception_dedup(window=300).build()
+    assert config.exception_dedup_window == 300
+    assert LoggingConfig.from_kwargs(exception_dedup_window=5.0).exception_dedup_window == 5.0
+    try:
+        LoggerFactory._apply_configuration(config)
+        assert dedup.get_exception_deduplicator().window == 300
+        LoggerFactory._apply_configuration(LoggingConfig())
+        assert dedup.get_exception_deduplicator() is None
+    finally:
+        dedup.disable_exception_dedup()
+        LoggerFactory._apply_configuration(LoggingConfig())
@@ -0,0 +1,166 @@
+"""Tests for the per-record format memo shared by arlogi handlers."""
+
+import io
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+from rich.traceback import Traceback
+
+from arlogi import selfmetrics
+from arlogi.factory import TraceLogger
+from arlogi.handlers import ColoredConsoleHandler, JSONFormatter, JSONHandler, PlainConsoleHandler
+from arlogi.records import record_message
+from arlogi.syslog import RFC5424Formatter
+
+
+class CountingMessage:
+    """A message object counting how often it is interpolated."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return self.text
+
+
+class FormatterHandler(logging.Handler):
+    """Formats records with a given formatter into a list."""
+
+    record_fields = frozenset()
+
+    def __init__(self, formatter):
+        super().__init__()
+        self.setFormatter(formatter)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def logger():
+    logger = TraceLogger("format.once", logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def _rich_handler():
+    return ColoredConsoleHandler(console=Console(file=io.StringIO(), force_terminal=True, width=120))
+
+
+def _fan_out(logger):
+    streams = [io.StringIO(), io.StringIO()]
+    logger.addHandler(PlainConsoleHandler(stream=io.StringIO()))
+    logger.addHandler(_rich_handler())
+    logger.addHandler(JSONHandler(streams[0]))
+    logger.addHandler(JSONHandler(streams[1]))
+    logger.addHandler(FormatterHandler(RFC5424Formatter(app_name="app", hostname="host")))
+    return streams
+
+
+def test_message_interpolated_once_across_sinks(logger):
+    _fan_out(logger)
+    message = CountingMessage("fanned out %d")
+
+    logger.info(message, 5, user_id=1)
+
+    assert message.calls == 1
+
+
+def test_json_payload_serialized_once_for_equal_plans(logger):
+    streams = _fan_out(logger)
+
+    with patch.object(JSONFormatter, "_format_json", autospec=True, side_effect=JSONFormatter._format_json) as build:
+        logger.info("shared payload", user_id=1)
+
+    assert build.call_count == 1
+    assert streams[0].getvalue() == streams[1].getvalue()
+    payload = json.loads(streams[0].getvalue())
+    assert payload["user_id"] == 1
+    assert not any(key.startswith("_") for key in payload)
+
+
+def test_exception_text_formatted_once_and_not_for_rich_tracebacks(logger):
+    _fan_out(logger)
+    logger.addHandler(_rich_handler())
+
+    with (
+        patch.object(logging.Formatter, "formatException", autospec=True, return_value="Traceback: boom") as text,
+        patch.object(Traceback, "extract", wraps=Traceback.extract) as extract,
+    ):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+    assert text.call_count == 1  # shared by the plain, JSON and syslog sinks
+    assert extract.call_count == 2  # each Rich console renders its own traceback
+
+
+def test_rich_traceback_records_count_message_bytes(logger):
+    handler = _rich_handler()
+    logger.addHandler(handler)
+    selfmetrics.enable_self_metrics()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        counted = selfmetrics.get_self_metrics()["handler_bytes"]
+    finally:
+        selfmetrics.disable_self_metrics()
+
+    assert counted == {"ColoredConsoleHandler": len("failed")}
+    assert "ValueError" in handler.console.file.getvalue()
+
+
+def test_rewritten_message_is_not_served_stale(logger):
+    first, second = io.StringIO(), io.StringIO()
+    logger.addHandler(JSONHandler(first))
+    redacting = JSONHandler(second)
+
+    def redact(record):
+        record.msg, record.args = "token=***", ()
+        return True
+
+    redacting.addFilter(redact)
+    logger.addHandler(redacting)
+
+    logger.info("token=%s", "secret")
+
+    assert json.loads(first.getvalue())["message"] == "token=secret"
+    assert json.loads(second.getvalue())["message"] == "token=***"
+
+
+def test_payload_rebuilt_when_attributes_added(logger):
+    first, second = io.StringIO(), io.StringIO()
+    logger.addHandler(JSONHandler(first))
+    enriched = JSONHandler(second)
+
+    def enrich(record):
+        record.region = "eu"
+        return True
+
+    enriched.addFilter(enrich)
+    logger.addHandler(enriched)
+
+    logger.info("enriched")
+
+    assert "region" not in json.loads(first.getvalue())
+    assert json.loads(second.getvalue())["region"] == "eu"
+
+
+def test_record_message_matches_get_message():
+    record = logging.LogRecord("n", logging.INFO, __file__, 1, "%(a)s-%(b)s", ({"a": 1, "b": 2},), None)
+
+    assert record_message(record) == record.getMessage() == "1-2"
+    record.args = {"a": 3, "b": 4}
+    assert record_message(record) == "3-4"
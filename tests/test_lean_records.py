@@ -0,0 +1,316 @@
+"""Tests for lean LogRecord capture (arlogi.records)."""
+
+import copy
+import io
+import json
+import logging
+import pickle
+import sys
+import threading
+
+import pytest
+
+from arlogi import records
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.factory import LoggerFactory, TraceLogger
+from arlogi.handler_factory import DeferredHandler
+from arlogi.handlers import JSONHandler, PlainConsoleHandler
+from arlogi.records import LeanLogRecord, formatter_fields, handler_fields, needed_fields
+
+
+class Capture(logging.Handler):
+    """Keeps records; declares which optional fields it reads."""
+
+    def __init__(self, record_fields=frozenset()):
+        super().__init__()
+        self.record_fields = record_fields
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class UnknownHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def trace_logger():
+    logger = TraceLogger("lean.test", logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+    records.enable_lean_records()
+
+
+def test_no_caller_lookup_when_no_handler_needs_it(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+
+    trace_logger.info("hello %s", "world")
+
+    record = handler.records[0]
+    assert isinstance(record, LeanLogRecord)
+    assert record.getMessage() == "hello world"
+    assert (record.pathname, record.lineno) == ("(unknown file)", 0)
+    assert "threadName" not in record.__dict__
+
+
+def test_caller_captured_when_needed(trace_logger):
+    handler = Capture(records.PATH_FIELDS)
+    trace_logger.addHandler(handler)
+
+    line = sys._getframe().f_lineno + 1
+    trace_logger.info("here")
+
+    record = handler.records[0]
+    assert record.pathname == __file__
+    assert record.lineno == line
+    assert record.funcName == "test_caller_captured_when_needed"
+    assert record.module == "test_lean_records"
+
+
+def test_optional_fields_computed_lazily_on_access(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+
+    trace_logger.info("lazy")
+
+    record = handler.records[0]
+    assert record.threadName == threading.current_thread().name
+    assert record.__dict__["threadName"] == threading.current_thread().name
+    assert record.process is not None
+    assert 0 <= record.msecs < 1000
+    assert record.relativeCreated > 0
+    assert not hasattr(record, "not_a_field")
+
+
+def test_formatter_fields_are_eager_for_dict_formatting(trace_logger):
+    handler = Capture()
+    handler.setFormatter(logging.Formatter("%(threadName)s %(process)d %(module)s: %(message)s"))
+    trace_logger.addHandler(handler)
+
+    trace_logger.info("formatted")
+
+    record = handler.records[0]
+    assert {"threadName", "process", "module"} <= record.__dict__.keys()
+    assert handler.format(record) == f"{threading.current_thread().name} {record.process} test_lean_records: formatted"
+
+
+def test_formatter_field_parsing_per_style():
+    assert formatter_fields(logging.Formatter("%(process)d %(message)s")) == {"process"}
+    assert formatter_fields(logging.Formatter("{threadName} {lineno}", style="{")) == {"threadName", "lineno"}
+    assert formatter_fields(logging.Formatter("${module} $funcName", style="$")) == {"module", "funcName"}
+
+    class CustomFormatter(logging.Formatter):
+        pass
+
+    assert formatter_fields(CustomFormatter()) is None
+
+
+def test_unknown_handlers_get_full_stdlib_records(trace_logger):
+    handler = UnknownHandler()
+    trace_logger.addHandler(handler)
+    trace_logger.addHandler(Capture())
+
+    trace_logger.info("full")
+
+    assert type(handler.records[0]) is logging.LogRecord
+    assert handler.records[0].pathname == __file__
+
+
+def test_stdlib_formatter_only_handlers_are_known():
+    stream = logging.StreamHandler(io.StringIO())
+    stream.setFormatter(logging.Formatter("%(threadName)s %(message)s"))
+    assert handler_fields(logging.NullHandler()) == frozenset()
+    assert handler_fields(stream) == {"threadName"}
+
+
+def test_handlers_filtering_the_level_are_ignored(trace_logger):
+    unknown = UnknownHandler()
+    unknown.setLevel(logging.ERROR)
+    trace_logger.addHandler(unknown)
+    trace_logger.addHandler(Capture())
+
+    assert needed_fields(trace_logger, logging.INFO) == frozenset()
+    assert needed_fields(trace_logger, logging.ERROR) is None
+
+
+@pytest.mark.parametrize("on_logger", [True, False])
+def test_filters_get_full_records_unless_they_declare_fields(trace_logger, on_logger):
+    seen = []
+
+    def caller_filter(record):
+        seen.append((record.lineno, record.funcName))
+        return True
+
+    handler = PlainConsoleHandler(show_path=False, stream=io.StringIO())
+    trace_logger.addHandler(handler)
+    (trace_logger if on_logger else handler).addFilter(caller_filter)
+
+    line = sys._getframe().f_lineno + 1
+    trace_logger.info("filtered")
+
+    assert seen == [(line, "test_filters_get_full_records_unless_they_declare_fields")]
+
+    caller_filter.record_fields = frozenset({"threadName"})
+    assert needed_fields(trace_logger, logging.INFO) == {"threadName"}
+
+
+def test_custom_record_factory_disables_lean_records(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+    original = logging.getLogRecordFactory()
+
+    def factory(*args, **kwargs):
+        record = original(*args, **kwargs)
+        record.stamped = True
+        return record
+
+    logging.setLogRecordFactory(factory)
+    try:
+        trace_logger.info("stamped")
+    finally:
+        logging.setLogRecordFactory(original)
+
+    assert type(handler.records[0]) is logging.LogRecord
+    assert handler.records[0].stamped
+
+
+def test_disable_lean_records(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+    records.disable_lean_records()
+
+    trace_logger.info("full")
+
+    assert type(handler.records[0]) is logging.LogRecord
+    assert not records.is_lean_records_enabled()
+
+
+def test_extra_may_not_overwrite_uncomputed_fields(trace_logger):
+    trace_logger.addHandler(Capture())
+
+    with pytest.raises(KeyError, match="threadName"):
+        trace_logger.info("clash", extra={"threadName": "x"})
+
+
+def test_kwargs_become_extra_fields(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+
+    trace_logger.info("kwargs", user_id=42)
+
+    assert handler.records[0].user_id == 42
+
+
+def test_json_output_unchanged_by_lean_capture(trace_logger):
+    stream = io.StringIO()
+    trace_logger.addHandler(JSONHandler(stream))
+
+    def emit_both():
+        for lean in (True, False):
+            records.enable_lean_records() if lean else records.disable_lean_records()
+            trace_logger.info("json", user_id=7)
+
+    emit_both()
+
+    lean, full = (json.loads(line) for line in stream.getvalue().splitlines())
+    lean.pop("timestamp")
+    full.pop("timestamp")
+    assert lean == full
+    assert lean["function"] == "emit_both"
+    assert "taskName" not in lean
+
+
+def test_plain_console_show_path(trace_logger):
+    stream = io.StringIO()
+    trace_logger.addHandler(PlainConsoleHandler(stream=stream, show_path=True))
+    line = sys._getframe().f_lineno + 1
+    trace_logger.info("with path")
+
+    assert stream.getvalue().rstrip().endswith(f"test_lean_records.py:{line}")
+
+
+def test_caller_depth_still_attributes_the_caller(trace_logger):
+    handler = Capture(records.PATH_FIELDS)
+    trace_logger.addHandler(handler)
+
+    def helper():
+        trace_logger.info("attributed", caller_depth=1)
+
+    helper()
+
+    record = handler.records[0]
+    assert record.getMessage().endswith("[from .test_caller_depth_still_attributes_the_caller()]")
+    assert record.funcName == "helper"
+
+
+def test_exception_and_stack_info(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        trace_logger.exception("failed", stack_info=True)
+
+    record = handler.records[0]
+    assert record.exc_info[0] is ValueError
+    assert record.stack_info is not None
+    assert record.pathname == __file__  # stack_info forces the caller lookup
+
+
+def test_disabled_levels_skip_parameter_processing(trace_logger, monkeypatch):
+    trace_logger.setLevel(logging.WARNING)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("processed a disabled call")
+
+    monkeypatch.setattr(trace_logger, "_process_params", fail)
+    trace_logger.debug("quiet", caller_depth=1)
+    trace_logger.info("quiet", user_id=1)
+    trace_logger.trace("quiet")
+    trace_logger.log(logging.INFO, "quiet")
+
+
+def test_log_rejects_non_integer_levels(trace_logger):
+    with pytest.raises(TypeError):
+        trace_logger.log("INFO", "bad level")
+
+
+def test_records_survive_copy_and_pickle(trace_logger):
+    handler = Capture()
+    trace_logger.addHandler(handler)
+    trace_logger.info("copied %d", 1)
+    record = handler.records[0]
+
+    for clone in (copy.copy(record), pickle.loads(pickle.dumps(record))):
+        assert clone.getMessage() == "copied 1"
+        assert clone.msecs == record.msecs
+
+
+def test_wrappers_report_inner_fields():
+    deferred = DeferredHandler(lambda: PlainConsoleHandler(stream=io.StringIO()))
+    assert deferred.record_fields is None  # not built yet
+    assert deferred.handler is not None
+    assert deferred.record_fields == records.PATH_FIELDS
+
+
+def test_config_plumbing():
+    assert LoggingConfig().lean_records is True
+    assert LoggingConfigBuilder().with_lean_records(False).build().lean_records is False
+    try:
+        LoggerFactory._apply_configuration(LoggingConfig(lean_records=False))
+        assert not records.is_lean_records_enabled()
+    finally:
+        LoggerFactory._apply_configuration(LoggingConfig())
+    assert records.is_lean_records_enabled()
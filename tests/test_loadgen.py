@@ -0,0 +1,107 @@
+"""Smoke tests for the load generator (small runs, no timing assertions)."""
+
+import json
+import logging
+
+import pytest
+
+from arlogi import redaction
+from arlogi.config import LoggingConfig
+from arlogi.factory import TraceLogger
+from arlogi.handlers import JSONFileHandler
+from benchmarks import loadgen
+from benchmarks.loadgen import Samples, percentiles, replay_workload, run_load, split_by_rotation, summarize
+
+
+def _config(tmp_path):
+    return LoggingConfig(json_file_name=str(tmp_path / "load.jsonl"), json_file_only=True, level="DEBUG")
+
+
+@pytest.mark.parametrize("mode", ["threads", "asyncio"])
+def test_run_load_in_process(tmp_path, mode):
+    samples, elapsed = run_load(_config(tmp_path), loadgen.synthetic_workload(), mode=mode, workers=3, records=50)
+    assert len(samples.durations) == 150
+    assert elapsed > 0
+    lines = (tmp_path / "load.jsonl").read_text().splitlines()
+    # The root handlers also get other loggers' records (asyncio's selector debug line)
+    assert sum(json.loads(line)["logger_name"] == "arlogi.loadgen" for line in lines) == 150
+
+
+def test_run_load_applies_the_whole_config(tmp_path):
+    config = LoggingConfig(
+        json_file_name=str(tmp_path / "load.jsonl"),
+        json_file_only=True,
+        module_levels={"arlogi.loadgen": "WARNING"},
+        redact=True,
+    )
+    workload = [(logging.INFO, "dropped by module level", {}), (logging.WARNING, "login password=hunter2", {})]
+    try:
+        run_load(config, workload, workers=1, records=2)
+    finally:
+        redaction.disable_redaction()
+        logging.getLogger("arlogi.loadgen").setLevel(logging.NOTSET)
+
+    (line,) = (tmp_path / "load.jsonl").read_text().splitlines()
+    assert json.loads(line)["message"] == "login password=[REDACTED]"
+    assert not any(isinstance(h, JSONFileHandler) for h in logging.getLogger().handlers)
+
+
+def test_run_load_processes(tmp_path):
+    samples, _ = run_load(_config(tmp_path), loadgen.synthetic_workload(), mode="processes", workers=2, records=20)
+    assert len(samples.durations) == 40
+
+
+def test_rate_limit_paces_calls(tmp_path):
+    _, elapsed = run_load(_config(tmp_path), loadgen.synthetic_workload(), workers=1, records=20, rate=200)
+    assert elapsed >= 0.09  # 20 records at 200/s
+
+
+def test_forced_rotations_are_recorded(tmp_path):
+    samples, elapsed = run_load(
+        _config(tmp_path), loadgen.synthetic_workload(), workers=2, records=2000, rate=8000, rotate_interval=0.05
+    )
+    summary = summarize(samples, elapsed)
+    assert summary["rotations"] >= 1
+    assert summary["latency_near_rotation"]["count"] + summary["latency_steady"]["count"] == summary["records"]
+
+
+def test_replay_workload_keeps_levels_and_extras(tmp_path):
+    log_file = tmp_path / "captured.jsonl"
+    handler = JSONFileHandler(str(log_file))
+    logger = TraceLogger("captured")
+    logger.addHandler(handler)
+    logger.warning("disk %s almost full", "/var", mount="/var")
+    logger.info("plain")
+    handler.close()
+    with log_file.open("a") as stream:
+        stream.write("not json\n")
+
+    workload = replay_workload(log_file)
+    assert workload == [(logging.WARNING, "disk /var almost full", {"mount": "/var"}), (logging.INFO, "plain", {})]
+
+
+def test_percentiles_and_rotation_split():
+    assert percentiles(list(range(1, 1001)))["p50_us"] == pytest.approx(0.501)
+    assert percentiles([])["count"] == 0
+
+    samples = Samples()
+    samples.starts.extend([0, 1_000_000, 50_000_000])
+    samples.durations.extend([10, 10, 10])
+    samples.rotations = [(900_000, 1_100_000)]
+    near, steady = split_by_rotation(samples, margin_ns=200_000)
+    assert near == [10]  # only the call at 1ms overlaps the rotation (+/- margin)
+    assert steady == [10, 10]
+
+
+def test_main_writes_summary(tmp_path, capsys):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(_config(tmp_path).to_dict()))
+    output = tmp_path / "summary.json"
+
+    assert (
+        loadgen.main(["--config", str(config_file), "--workers", "2", "--records", "10", "--output", str(output)]) == 0
+    )
+    summary = json.loads(output.read_text())
+    assert summary["records"] == 20
+    assert set(summary["latency"]) == {"count", "p50_us", "p99_us", "p999_us", "max_us"}
+    assert "records in" in capsys.readouterr().out
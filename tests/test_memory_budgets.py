@@ -0,0 +1,47 @@
+"""Allocation and RSS budgets (benchmarks/bench_memory.py)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_memory import PEAK_BYTES_BUDGETS, SHAPES, check_budgets
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_check_budgets_reports_each_exceeded_budget():
+    allocations = [
+        {"handler": "json_stream", "shape": "kwargs_3", "peak_bytes": 1.0, "retained_bytes": 0.0},
+        {"handler": "null", "shape": "message", "peak_bytes": PEAK_BYTES_BUDGETS["null"] + 1, "retained_bytes": 0.0},
+        {"handler": "null", "shape": "kwargs_10", "peak_bytes": 1.0, "retained_bytes": 1_000.0},
+    ]
+    soak = {"cycles": 10, "rss_start_mb": 20.0, "rss_end_mb": 100.0, "rss_growth_mb": 80.0}
+
+    failures = check_budgets(allocations, soak)
+
+    assert len(failures) == 3
+    assert failures[0].startswith("null/message: peak")
+    assert failures[1].startswith("null/kwargs_10: retained")
+    assert failures[2].startswith("soak: RSS grew")
+    assert check_budgets(allocations[:1], None) == []
+
+
+def test_every_kwargs_shape_is_measured_for_every_handler():
+    assert {"message", "percent_args", "kwargs_3", "kwargs_10", "kwargs_nested", "caller_depth"} <= set(SHAPES)
+    assert {"null", "plain_console", "rich_console", "json_stream", "json_file"} <= set(PEAK_BYTES_BUDGETS)
+
+
+def test_memory_budgets():
+    # Rich rendering is slow under tracemalloc; run the full matrix from the CLI.
+    handlers = ["null", "plain_console", "json_stream", "json_file"]
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_memory", "--records", "500", "--handlers", *handlers]
+        + ["--soak-cycles", "300", "--check"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT)])},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "soak: 300 cycles" in result.stdout
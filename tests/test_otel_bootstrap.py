@@ -1,15 +1,21 @@
 """Tests for arlogi.otel.bootstrap."""
 
+import io
 import json
 import logging
+import threading
 
 import pytest
 
 pytest.importorskip("opentelemetry")
 
 from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
 
-from arlogi.otel import install_log_correlation, setup_tracing, shutdown_tracing
+from arlogi import records
+from arlogi.factory import TraceLogger
+from arlogi.handlers import JSONHandler
+from arlogi.otel import bootstrap, get_span_processor, install_log_correlation, setup_tracing, shutdown_tracing
 
 
 def test_setup_tracing_sets_global_provider_and_writes_file(tmp_path, reset_otel_globals):
@@ -64,10 +70,11 @@ def test_setup_tracing_with_otlp_endpoint_adds_exporter_with_timeout(tmp_path, r
         otlp_endpoint="http://localhost:19999",  # unused local port: fails fast, reaches nothing
         otlp_timeout=1,
     )
-    processors = provider._active_span_processor._span_processors
-    assert len(processors) == 2  # rotating file + OTLP
+    (processor,) = provider._active_span_processor._span_processors
+    assert processor is get_span_processor()
+    assert len(processor._exporters) == 2  # rotating file + OTLP, fed by one queue
 
-    otlp_exporter = processors[1].span_exporter
+    otlp_exporter = processor._exporters[1]
     assert otlp_exporter._endpoint == "http://localhost:19999/v1/traces"
     assert otlp_exporter._timeout == 1
     provider.shutdown()
@@ -104,3 +111,69 @@ def test_install_log_correlation_is_idempotent(reset_otel_globals):
     install_log_correlation()
     assert logging.getLogRecordFactory() is once
     logging.setLogRecordFactory(before)
+
+
+@pytest.fixture
+def correlation():
+    before = logging.getLogRecordFactory()
+    install_log_correlation()
+    yield
+    logging.setLogRecordFactory(before)
+
+
+def test_correlation_ids_are_rendered_once_per_span(correlation):
+    tracer = TracerProvider().get_tracer("t")
+    with tracer.start_as_current_span("op") as span:
+        first = logging.getLogRecordFactory()("corr", logging.INFO, __file__, 1, "a", (), None)
+        second = logging.getLogRecordFactory()("corr", logging.INFO, __file__, 2, "b", (), None)
+
+    assert first.trace_id is second.trace_id  # shared by the span's records
+    expected = format(span.get_span_context().trace_id, "032x")
+    assert type(first.trace_id) is str and type(first.span_id) is str
+    assert first.trace_id == expected and "trace=" + first.trace_id == f"trace={expected}"
+    assert first.span_id == format(span.get_span_context().span_id, "016x")
+    assert json.dumps({"t": first.trace_id}) == json.dumps({"t": expected})
+
+
+def test_correlation_cache_is_bounded_and_thread_safe(correlation, monkeypatch):
+    monkeypatch.setattr(bootstrap, "_SPAN_IDS_MAX", 8)
+    monkeypatch.setattr(bootstrap, "_span_ids", {})
+    tracer = TracerProvider().get_tracer("t")
+    errors = []
+
+    def log_spans():
+        try:
+            for _ in range(200):
+                with tracer.start_as_current_span("op") as span:
+                    record = logging.getLogRecordFactory()("corr", logging.INFO, __file__, 1, "a", (), None)
+                    assert record.span_id == format(span.get_span_context().span_id, "016x")
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=log_spans) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(bootstrap._span_ids) <= 8
+
+
+def test_trace_logger_keeps_lean_records_with_correlation(correlation):
+    stream = io.StringIO()
+    handler = JSONHandler(stream)
+    logger = TraceLogger("corr-lean", logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    with TracerProvider().get_tracer("t").start_as_current_span("op") as span:
+        logger.info("inside")
+    logger.info("outside")
+    lines = stream.getvalue().splitlines()
+    handler.close()
+
+    inside, outside = map(json.loads, lines)
+    assert inside["trace_id"] == format(span.get_span_context().trace_id, "032x")
+    assert "trace_id" not in outside
+    assert records.needed_fields(logger, logging.INFO) is not None
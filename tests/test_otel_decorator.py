@@ -14,8 +14,7 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from opentelemetry.trace import StatusCode
 
-from arlogi.otel import traced
-from arlogi.otel import set_trace_modules
+from arlogi.otel import set_trace_modules, traced
 
 
 @pytest.fixture
@@ -146,6 +145,24 @@ def test_gating_applies_after_decoration(memory_spans):
     assert len(memory_spans.get_finished_spans()) == 1  # unchanged
 
 
+def test_gating_decision_is_cached_until_rules_change(memory_spans, monkeypatch):
+    from arlogi.otel import decorator
+
+    calls = []
+    resolve = decorator._module_enabled
+    monkeypatch.setattr(decorator, "_module_enabled", lambda module: calls.append(module) or resolve(module))
+    work = _make_traced("acme.api.client")
+    set_trace_modules({"acme": False})
+    for _ in range(3):
+        work()
+    assert calls == ["acme.api.client"]
+    set_trace_modules({"acme": True})
+    work()
+    work()
+    assert len(calls) == 2
+    assert len(memory_spans.get_finished_spans()) == 2
+
+
 def test_gated_off_is_noop_without_sdk():
     work = _make_traced("acme.api.client")
     set_trace_modules({"acme.api.client": False})
@@ -392,3 +409,104 @@ def test_decorator_module_never_imports_otel_sdk():
         "assert not sdk, f'decorator imported the OTEL SDK: {sdk}'\n"
     )
     subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_chunked_sync_gen_yields_every_item_under_one_span(memory_spans):
+    tracer = trace.get_tracer(__name__)
+
+    @traced(chunk_size=3)
+    def rows():
+        for row in range(7):
+            with tracer.start_as_current_span(f"row-{row}"):
+                pass
+            yield row
+
+    assert list(rows()) == list(range(7))
+    spans = {s.name: s for s in memory_spans.get_finished_spans()}
+    gen_span = spans.pop(next(n for n in spans if n.endswith("rows")))
+    assert len(spans) == 7
+    assert all(s.parent.span_id == gen_span.context.span_id for s in spans.values())
+
+
+def test_chunked_sync_gen_raises_after_preceding_items(memory_spans):
+    @traced(chunk_size=10)
+    def broken():
+        yield 1
+        yield 2
+        raise ValueError("mid-chunk")
+
+    gen = broken()
+    assert next(gen) == 1
+    assert next(gen) == 2
+    with pytest.raises(ValueError, match="mid-chunk"):
+        next(gen)
+    span = memory_spans.get_finished_spans()[0]
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == "exception"
+
+
+def test_chunked_sync_gen_close_ends_span_without_error(memory_spans):
+    @traced(chunk_size=2)
+    def counter():
+        yield from range(5)
+
+    gen = counter()
+    assert next(gen) == 0
+    gen.close()
+    spans = memory_spans.get_finished_spans()
+    assert len(spans) == 1
+    assert spans[0].status.status_code != StatusCode.ERROR
+
+
+def test_chunked_async_gen_yields_every_item_under_one_span(memory_spans):
+    tracer = trace.get_tracer(__name__)
+
+    @traced(chunk_size=4)
+    async def rows():
+        for row in range(6):
+            with tracer.start_as_current_span(f"row-{row}"):
+                pass
+            yield row
+
+    async def consume():
+        return [row async for row in rows()]
+
+    assert asyncio.run(consume()) == list(range(6))
+    spans = {s.name: s for s in memory_spans.get_finished_spans()}
+    gen_span = spans.pop(next(n for n in spans if n.endswith("rows")))
+    assert len(spans) == 6
+    assert all(s.parent.span_id == gen_span.context.span_id for s in spans.values())
+
+
+def test_chunked_async_gen_raises_after_preceding_items(memory_spans):
+    @traced(chunk_size=10)
+    async def broken():
+        yield 1
+        raise ValueError("mid-chunk")
+
+    received = []
+
+    async def consume():
+        async for item in broken():
+            received.append(item)
+
+    with pytest.raises(ValueError, match="mid-chunk"):
+        asyncio.run(consume())
+    assert received == [1]
+    assert memory_spans.get_finished_spans()[0].status.status_code == StatusCode.ERROR
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError, match="chunk_size"):
+        traced(chunk_size=0)
+
+
+def test_traced_benchmark_runs(reset_otel_globals):
+    from benchmarks.bench_traced import measure
+
+    per_call, per_item = measure(calls=10, repeats=1, items=20, chunk_size=8)
+
+    assert set(per_call) == {"plain", "no SDK", "enabled", "disabled"}
+    assert set(per_item) == {"no SDK", "enabled"}
+    assert set(per_item["enabled"]) == {"plain", "chunk_size=1", "chunk_size=8"}
+    assert all(ns > 0 for table in (per_call, per_item) for timings in table.values() for ns in timings.values())
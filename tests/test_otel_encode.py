@@ -0,0 +1,179 @@
+"""Tests for the direct OTLP/JSON encoders (arlogi.otel._encode) against the protobuf path."""
+
+import json
+import logging
+
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import trace
+from opentelemetry._logs import SeverityNumber
+from opentelemetry.exporter.otlp.proto.common._log_encoder import encode_logs
+from opentelemetry.exporter.otlp.proto.common.metrics_encoder import encode_metrics
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter, SimpleLogRecordProcessor
+from opentelemetry.sdk.metrics import (
+    Counter,
+    Histogram,
+    MeterProvider,
+    ObservableCounter,
+    ObservableGauge,
+    ObservableUpDownCounter,
+    UpDownCounter,
+)
+from opentelemetry.sdk.metrics._internal.exemplar import AlwaysOnExemplarFilter
+from opentelemetry.sdk.metrics.export import AggregationTemporality, InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import ExponentialBucketHistogramAggregation, View
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Link, SpanContext, SpanKind, Status, StatusCode, TraceFlags, TraceState
+
+from arlogi.otel._encode import b64_ids_to_hex, encode_logs_json, encode_metrics_json, encode_spans_json
+
+RESOURCE = Resource.create({"service.name": "svc", "pi": 3.14}, schema_url="https://example.com/schema")
+
+
+def _reference(message):
+    payload = MessageToDict(message)
+    b64_ids_to_hex(payload)
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _direct(payload):
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _spans():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(resource=RESOURCE)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("lib", "1.2", schema_url="https://example.com/lib", attributes={"scope.attr": 1})
+    remote = SpanContext(0xABC, 0xDEF, is_remote=True, trace_flags=TraceFlags(1), trace_state=TraceState([("k", "v")]))
+
+    with tracer.start_as_current_span("root", kind=SpanKind.SERVER) as root:
+        root.set_attributes(
+            {
+                "s": 'é\n"quoted"',
+                "b": False,
+                "i": -(2**63),
+                "f": 1.0,
+                "nan": float("nan"),
+                "inf": float("-inf"),
+                "empty": "",
+                "list": [1, 2],
+                "strs": ("a", "b"),
+                "none_list": [],
+            }
+        )
+        root.add_event("event", {"n": 0}, timestamp=1)
+        root.add_event("")
+        with tracer.start_as_current_span("child", links=[Link(remote, {"why": "retry"})]) as child:
+            child.set_status(Status(StatusCode.ERROR, "boom"))
+        with tracer.start_as_current_span("ok") as ok:
+            ok.set_status(StatusCode.OK)
+    with tracer.start_as_current_span(
+        "remote child", context=trace.set_span_in_context(trace.NonRecordingSpan(remote))
+    ):
+        pass
+    provider.get_tracer("").start_span("no scope name").end()
+    return exporter.get_finished_spans()
+
+
+def test_spans_match_the_protobuf_path():
+    spans = _spans()
+
+    assert _direct(encode_spans_json(spans)) == _reference(encode_spans(spans))
+    assert encode_spans_json([]) == {}
+
+
+def _metrics(temporality):
+    kinds = (Counter, UpDownCounter, Histogram, ObservableCounter, ObservableUpDownCounter, ObservableGauge)
+    reader = InMemoryMetricReader(preferred_temporality=dict.fromkeys(kinds, temporality))
+    provider = MeterProvider(
+        resource=RESOURCE,
+        metric_readers=[reader],
+        views=[View(instrument_name="exp", aggregation=ExponentialBucketHistogramAggregation(max_size=20))],
+        exemplar_filter=AlwaysOnExemplarFilter(),
+    )
+    meter = provider.get_meter("lib", "1.0", attributes={"scope.attr": "x"})
+    tracer = TracerProvider().get_tracer("t")
+
+    meter.create_counter("requests", unit="1", description="Requests").add(3, {"route": "/"})
+    meter.create_up_down_counter("queue").add(-2.5)
+    histogram = meter.create_histogram("latency", unit="ms")
+    exponential = meter.create_histogram("exp")
+    with tracer.start_as_current_span("op"):
+        for value in (0, 1.5, 250, 1e6):
+            histogram.record(value, {"ok": True})
+            exponential.record(value)
+    meter.create_gauge("temperature").set(21.5, {"room": "a"})
+    meter.create_observable_gauge("threads", callbacks=[lambda options: [Observation(7)]])
+    meter.create_counter("unused")
+    data = reader.get_metrics_data()
+    provider.shutdown()
+    return data
+
+
+@pytest.mark.parametrize("temporality", [AggregationTemporality.CUMULATIVE, AggregationTemporality.DELTA])
+def test_metrics_match_the_protobuf_path(temporality):
+    data = _metrics(temporality)
+    names = {m.name for rm in data.resource_metrics for sm in rm.scope_metrics for m in sm.metrics}
+    assert {"requests", "queue", "latency", "exp", "temperature", "threads"} <= names
+
+    assert _direct(encode_metrics_json(data)) == _reference(encode_metrics(data))
+
+
+def test_logs_match_the_protobuf_path():
+    exporter = InMemoryLogRecordExporter()
+    provider = LoggerProvider(resource=RESOURCE, shutdown_on_exit=False)
+    provider.add_log_record_processor(SimpleLogRecordProcessor(exporter))
+    otel_logger = provider.get_logger("lib", "2.0")
+
+    with TracerProvider().get_tracer("t").start_as_current_span("op"):
+        otel_logger.emit(
+            timestamp=5,
+            severity_number=SeverityNumber.WARN,
+            severity_text="WARN",
+            body={"event": "login", "ids": [1, 2], "raw": b"\x00\xff"},
+            attributes={"user": "ada", "nested": {"a": {"b": None}}},
+            event_name="user.login",
+        )
+    otel_logger.emit(body=None, severity_number=SeverityNumber.TRACE2)
+    otel_logger.emit(body="plain", attributes={"big": 2**70, "ok": 1})
+    batch = exporter.get_finished_logs()
+    provider.shutdown()
+
+    assert _direct(encode_logs_json(batch)) == _reference(encode_logs(batch))
+
+
+def test_unencodable_attribute_is_skipped_and_logged(caplog):
+    batch = [_log_with_attributes({"big": 2**70, "ok": 1})]
+
+    with caplog.at_level(logging.ERROR, logger="arlogi.otel._encode"):
+        record = encode_logs_json(batch)["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]
+
+    assert record["attributes"] == [{"key": "ok", "value": {"intValue": "1"}}]
+    assert "Failed to encode key big" in caplog.text
+
+
+def _log_with_attributes(attributes):
+    exporter = InMemoryLogRecordExporter()
+    provider = LoggerProvider(shutdown_on_exit=False)
+    provider.add_log_record_processor(SimpleLogRecordProcessor(exporter))
+    provider.get_logger("lib").emit(body="x", attributes=attributes)
+    return exporter.get_finished_logs()[0]
+
+
+def test_encode_benchmark_runs():
+    from benchmarks.bench_otlp_encode import measure
+
+    results = measure(batch_size=4, repeats=1)
+
+    assert set(results) == {"spans", "metric points", "logs"}
+    assert all(rate > 0 for rates in results.values() for rate in rates.values())
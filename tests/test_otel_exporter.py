@@ -1,6 +1,13 @@
 """Tests for arlogi.otel.exporters.RotatingJsonlSpanExporter."""
 
+import gzip
 import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
 
 import pytest
 
@@ -9,7 +16,9 @@ pytest.importorskip("opentelemetry")
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 
+import arlogi
 from arlogi.otel import RotatingJsonlSpanExporter
+from arlogi.otel._files import _RotatingJsonlWriter
 
 
 def _provider_with(exporter):
@@ -128,3 +137,158 @@ def test_io_error_degrades_to_noop_without_raising(tmp_path):
         pass
     provider.force_flush()  # must not raise
     provider.shutdown()  # must not raise
+
+
+def _clocked(exporter, start=1_700_000_000.0):
+    clock = {"now": start}
+    exporter._writer._now = lambda: clock["now"]  # type: ignore[method-assign]
+    return clock
+
+
+def test_buffered_writes_flush_on_size_interval_and_force_flush(tmp_path):
+    exporter = RotatingJsonlSpanExporter(tmp_path, prefix="t", flush_interval=5, flush_bytes=1_000_000)
+    clock = _clocked(exporter)
+    provider = _provider_with(exporter)
+    tracer = provider.get_tracer("test")
+
+    def lines():
+        return next(tmp_path.glob("t-*.jsonl")).read_text(encoding="utf-8").splitlines()
+
+    with tracer.start_as_current_span("one"):
+        pass
+    assert lines() == []  # held in the buffer
+    assert exporter.force_flush() is True
+    assert len(lines()) == 1
+
+    with tracer.start_as_current_span("two"):
+        pass
+    clock["now"] += 6
+    with tracer.start_as_current_span("three"):
+        pass
+    assert len(lines()) == 3  # the write after the interval flushed both
+
+    exporter._writer._flush_bytes = 1
+    with tracer.start_as_current_span("four"):
+        pass
+    assert len(lines()) == 4
+    provider.shutdown()
+
+
+def test_idle_buffered_writer_flushes_within_the_interval(tmp_path):
+    exporter = RotatingJsonlSpanExporter(tmp_path, prefix="t", flush_interval=0.1, flush_bytes=1_000_000)
+    provider = _provider_with(exporter)
+
+    with provider.get_tracer("test").start_as_current_span("last"):
+        pass
+    path = next(tmp_path.glob("t-*.jsonl"))
+    assert path.read_text(encoding="utf-8") == ""  # held in the buffer
+    deadline = time.monotonic() + 2
+    while not path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1  # no further export needed
+    provider.shutdown()
+
+
+def test_compressed_files_are_gzip_and_count_towards_retention(tmp_path):
+    plain = tmp_path / "t-20000101-000000-w.jsonl"
+    plain.write_text("{}\n", encoding="utf-8")
+    os.utime(plain, (946_684_800, 946_684_800))
+    exporter = RotatingJsonlSpanExporter(
+        tmp_path, prefix="t", rotate_hours=1, retention_count=2, compress=True, worker_id="w"
+    )
+    clock = _clocked(exporter)
+    provider = _provider_with(exporter)
+    for name in ("one", "two"):
+        with provider.get_tracer("test").start_as_current_span(name):
+            pass
+        clock["now"] += 3700
+    provider.shutdown()
+
+    files = sorted(tmp_path.glob("t-*"))
+    assert [f.name.endswith("-w.jsonl.gz") for f in files] == [True, True]  # the plain file was pruned
+    with gzip.open(files[0], "rt", encoding="utf-8") as stream:
+        assert json.loads(stream.read())["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "one"
+
+
+def test_rotate_schedule_aligns_files_to_wall_clock_boundaries(tmp_path):
+    exporter = RotatingJsonlSpanExporter(tmp_path, prefix="t", rotate_schedule="hour", worker_id="w")
+    start = datetime(2026, 6, 10, 14, 59, 30).timestamp()
+    clock = _clocked(exporter, start)
+    provider = _provider_with(exporter)
+    for _ in range(3):
+        with provider.get_tracer("test").start_as_current_span("tick"):
+            pass
+        clock["now"] += 20  # 14:59:30, 14:59:50, then 15:00:10
+    provider.shutdown()
+
+    assert sorted(f.name for f in tmp_path.glob("t-*.jsonl")) == [
+        "t-20260610-145930-w.jsonl",
+        "t-20260610-150010-w.jsonl",
+    ]
+    with pytest.raises(ValueError, match="Unsupported rotate_schedule"):
+        RotatingJsonlSpanExporter(tmp_path, rotate_schedule="minute")
+
+
+def test_writers_sharing_a_directory_keep_retention_per_owner(tmp_path):
+    for age, name in enumerate(("t-20000101-000002-old2.jsonl.gz", "t-20000101-000001-old1.jsonl", "t-legacy")):
+        path = tmp_path / name.replace("legacy", "20000101-000000.jsonl")
+        path.write_text("{}\n", encoding="utf-8")
+        os.utime(path, (946_684_800 - age, 946_684_800 - age))
+    writers = {owner: _RotatingJsonlWriter(tmp_path, "t", 0, 2, worker_id=owner) for owner in ("a", "b")}
+    twin = _RotatingJsonlWriter(tmp_path, "t", 24, 2, worker_id="a")  # misconfigured duplicate id
+    assert twin.write_line("{}")
+
+    for n in range(4):
+        for writer in writers.values():
+            assert writer.write_line(json.dumps({"n": n}))  # rotate_hours=0: a new file per line
+
+    owners = [path.name.split("-")[3].split(".")[0] for path in tmp_path.glob("t-*") if path.name.count("-") == 3]
+    assert not (tmp_path / "t-20000101-000000.jsonl").exists()
+    assert sorted(owners) == ["a", "a", "a", "b", "b", "old1", "old2"]  # retired owners share a budget of 2
+    assert Path(twin._stream.name).exists()  # the live twin's file was skipped, not pruned
+    for writer in [*writers.values(), twin]:
+        writer.close()
+    with pytest.raises(ValueError, match="Invalid worker_id"):
+        _RotatingJsonlWriter(tmp_path, "t", 24, 2, worker_id="a.b")
+
+
+def test_writer_reopens_its_own_file_after_fork(tmp_path):
+    writer = _RotatingJsonlWriter(tmp_path, "t", 24, 5, flush_bytes=1_000_000)
+    writer.write_line('{"parent": "buffered"}')
+    parent_file = Path(writer._stream.name)
+
+    writer._pid = -1  # as seen from a forked child
+    writer.write_line('{"child": 1}')
+    writer.close()
+
+    assert parent_file.read_text(encoding="utf-8") == ""  # the parent's buffer is not written by the child
+    child_file = next(tmp_path.glob(f"t-*-{os.getpid()}.1.jsonl"))
+    assert child_file.read_text(encoding="utf-8") == '{"child": 1}\n'
+
+
+_WORKER = """
+import json, os, sys
+from arlogi.otel._files import _RotatingJsonlWriter
+
+writer = _RotatingJsonlWriter(sys.argv[1], "t", 0, 2)
+for n in range(60):
+    assert writer.write_line(json.dumps({"pid": os.getpid(), "n": n}))
+    assert os.path.exists(writer._stream.name), "active file pruned by another process"
+writer.close()
+"""
+
+
+def test_processes_share_one_directory(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(Path(arlogi.__file__).parents[1])}
+    workers = [
+        subprocess.Popen([sys.executable, "-c", _WORKER, str(tmp_path)], env=env, stderr=subprocess.PIPE)
+        for _ in range(3)
+    ]
+    for worker in workers:
+        _, stderr = worker.communicate(timeout=60)
+        assert worker.returncode == 0, stderr.decode()
+
+    for path in tmp_path.glob("t-*.jsonl"):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            json.loads(line)
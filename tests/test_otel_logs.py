@@ -0,0 +1,146 @@
+"""Tests for the arlogi.otel logs pipeline."""
+
+import json
+import logging
+
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from opentelemetry import trace
+from opentelemetry._logs import SeverityNumber
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import BatchLogRecordProcessor, LogRecordExporter, LogRecordExportResult
+from opentelemetry.sdk.trace import TracerProvider
+
+from arlogi.config import LoggingConfig
+from arlogi.factory import LoggerFactory, TraceLogger
+from arlogi.otel import OtelLogHandler, setup_logs, shutdown_logs
+
+
+class RecordingExporter(LogRecordExporter):
+    def __init__(self):
+        self.records = []
+
+    def export(self, batch):
+        self.records.extend(batch)
+        return LogRecordExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=30_000):
+        return True
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def bridged():
+    exporter = RecordingExporter()
+    provider = LoggerProvider(shutdown_on_exit=False)
+    provider.add_log_record_processor(BatchLogRecordProcessor(exporter))
+    logger = TraceLogger("otel.logs.test", 1)
+    logger.propagate = False
+    logger.addHandler(OtelLogHandler(provider))
+    yield logger, provider, exporter
+    provider.shutdown()
+
+
+def _attributes(record):
+    return dict(record.log_record.attributes)
+
+
+def test_setup_logs_writes_otlp_json_log_lines(tmp_path, reset_otel_globals):
+    provider = setup_logs("svc", "1.0.0", file_dir=tmp_path, file_prefix="svc-logs")
+    log = logging.getLogger("otel.logs.setup")
+    log.setLevel(logging.INFO)
+
+    with TracerProvider().get_tracer("t").start_as_current_span("op") as span:
+        log.warning("user %s logged in", "ada", extra={"user_id": 7})
+    provider.force_flush()
+    shutdown_logs()
+
+    payload = json.loads(next(tmp_path.glob("svc-logs-*.jsonl")).read_text(encoding="utf-8").splitlines()[0])
+    resource = payload["resourceLogs"][0]
+    assert {"key": "service.name", "value": {"stringValue": "svc"}} in resource["resource"]["attributes"]
+    record = resource["scopeLogs"][0]["logRecords"][0]
+    assert record["body"] == {"stringValue": "user ada logged in"}
+    assert record["severityText"] == "WARN"
+    assert record["traceId"] == format(span.get_span_context().trace_id, "032x")
+    assert {"key": "user_id", "value": {"intValue": "7"}} in record["attributes"]
+
+
+def test_setup_logs_is_idempotent_and_shutdown_detaches_the_bridge(tmp_path, reset_otel_globals):
+    first = setup_logs("svc", file_dir=tmp_path)
+    assert setup_logs("svc", file_dir=tmp_path) is first
+    assert sum(isinstance(h, OtelLogHandler) for h in logging.getLogger().handlers) == 1
+
+    shutdown_logs()
+    shutdown_logs()  # and still safe to repeat
+    assert not any(isinstance(h, OtelLogHandler) for h in logging.getLogger().handlers)
+    assert setup_logs("svc", file_dir=tmp_path) is not first
+
+
+@pytest.mark.parametrize("otel_first", [True, False])
+def test_bridge_survives_logging_reconfiguration(tmp_path, reset_otel_globals, otel_first):
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    try:
+        if otel_first:
+            setup_logs("svc", file_dir=tmp_path, file_prefix="svc-logs")
+        LoggerFactory._clear_and_add_handlers(LoggingConfig())
+        if not otel_first:
+            setup_logs("svc", file_dir=tmp_path, file_prefix="svc-logs")
+        LoggerFactory._clear_and_add_handlers(LoggingConfig(level="WARNING"))
+
+        assert sum(isinstance(h, OtelLogHandler) for h in root.handlers) == 1
+        logging.getLogger("otel.logs.reconfigured").error("still exported")
+        shutdown_logs()
+    finally:
+        for handler in root.handlers:
+            if handler not in saved:
+                handler.close()
+        root.handlers[:] = saved
+
+    assert "still exported" in next(tmp_path.glob("svc-logs-*.jsonl")).read_text(encoding="utf-8")
+
+
+def test_emit_only_queues_the_record(bridged):
+    logger, provider, exporter = bridged
+
+    logger.info("hello %s", "world")
+    assert exporter.records == []  # encoding and export wait for the batch
+    provider.force_flush()
+
+    assert [r.log_record.body for r in exporter.records] == ["hello world"]
+
+
+def test_attributes_exceptions_and_severities(bridged):
+    logger, provider, exporter = bridged
+
+    try:
+        raise ValueError("bad input")
+    except ValueError:
+        logger.exception("failed", payload={"ids": [1, 2]}, handle=object())
+    logger.trace("fine grained")
+    provider.force_flush()
+
+    failed, fine = exporter.records
+    attributes = _attributes(failed)
+    assert attributes["payload"] == {"ids": (1, 2)}
+    assert attributes["handle"].startswith("<object object")
+    assert attributes["exception.type"] == "ValueError"
+    assert "ValueError: bad input" in attributes["exception.stacktrace"]
+    assert attributes["code.function.name"] == "test_attributes_exceptions_and_severities"
+    assert (failed.log_record.severity_text, failed.log_record.severity_number) == ("ERROR", SeverityNumber.ERROR)
+    assert fine.log_record.severity_number == SeverityNumber.TRACE
+
+
+def test_records_from_opentelemetry_loggers_are_not_bridged(bridged):
+    logger, provider, exporter = bridged
+    handler = logger.handlers[0]
+
+    handler.handle(logging.makeLogRecord({"name": "opentelemetry.sdk", "msg": "export failed"}))
+    provider.force_flush()
+
+    assert exporter.records == []
+    assert trace.get_current_span() is trace.INVALID_SPAN
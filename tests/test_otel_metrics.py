@@ -1,14 +1,18 @@
 """Tests for the arlogi.otel metrics pipeline."""
 
 import json
+import math
 
 import pytest
 
 pytest.importorskip("opentelemetry")
 
 from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import MetricExporter, MetricExportResult
 
-from arlogi.otel import setup_metrics, shutdown_metrics
+from arlogi.otel import FanOutMetricReader, setup_metrics, shutdown_metrics
 
 
 def test_setup_metrics_writes_otlp_json_metrics_file(tmp_path, reset_otel_globals):
@@ -61,10 +65,106 @@ def test_setup_metrics_with_otlp_endpoint_adds_reader_with_timeout(tmp_path, res
         otlp_endpoint="http://localhost:19999",  # unused local port: fails fast, reaches nothing
         otlp_timeout=1,
     )
-    readers = provider._metric_readers
-    assert len(readers) == 2  # rotating file + OTLP
+    (reader,) = provider._metric_readers
+    assert len(reader._exporter._exporters) == 2  # rotating file + OTLP, fed by one collection
 
-    otlp_exporter = readers[1]._exporter
+    otlp_exporter = reader._exporter._exporters[1]
     assert otlp_exporter._endpoint == "http://localhost:19999/v1/metrics"
     assert otlp_exporter._timeout == 1
     provider.shutdown()
+
+
+class RecordingMetricExporter(MetricExporter):
+    def __init__(self):
+        super().__init__()
+        self.exports = []
+
+    def export(self, metrics_data, timeout_millis=10_000, **kwargs):
+        self.exports.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=10_000):
+        return True
+
+    def shutdown(self, timeout_millis=30_000, **kwargs):
+        pass
+
+
+def _points(metrics_data):
+    return {
+        (metric.name, tuple(point.attributes.items())): point.value
+        for rm in metrics_data.resource_metrics
+        for sm in rm.scope_metrics
+        for metric in sm.metrics
+        for point in metric.data.data_points
+    }
+
+
+def _reader(**kwargs):
+    exporters = [RecordingMetricExporter(), RecordingMetricExporter()]
+    reader = FanOutMetricReader(exporters, export_interval_millis=math.inf, **kwargs)
+    return reader, MeterProvider(metric_readers=[reader]).get_meter("test"), exporters
+
+
+def test_fan_out_reader_collects_once_for_every_exporter():
+    reader, meter, (first, second) = _reader()
+    calls = []
+    meter.create_observable_gauge("threads", [lambda options: calls.append(1) or [Observation(4)]])
+
+    reader.collect()
+
+    assert calls == [1]
+    assert first.exports[0] is second.exports[0]
+    assert _points(first.exports[0]) == {("threads", ()): 4}
+
+
+def test_delta_temporality_skips_series_without_new_measurements():
+    reader, meter, (exporter, _) = _reader(temporality="delta", skip_unchanged=True)
+    counter = meter.create_counter("requests")
+
+    counter.add(3, {"route": "/"})
+    reader.collect()
+    counter.add(2, {"route": "/"})
+    reader.collect()
+    reader.collect()  # nothing recorded: nothing exported
+
+    assert [_points(data) for data in exporter.exports] == [
+        {("requests", (("route", "/"),)): 3},
+        {("requests", (("route", "/"),)): 2},
+    ]
+
+
+def test_cumulative_skip_unchanged_exports_only_changed_series():
+    reader, meter, (exporter, _) = _reader(skip_unchanged=True)
+    counter = meter.create_counter("requests")
+    meter.create_observable_gauge("threads", [lambda options: [Observation(4)]])
+
+    counter.add(1, {"route": "a"})
+    counter.add(1, {"route": "b"})
+    reader.collect()
+    counter.add(1, {"route": "a"})
+    reader.collect()
+    reader.collect()
+
+    assert [_points(data) for data in exporter.exports] == [
+        {("requests", (("route", "a"),)): 1, ("requests", (("route", "b"),)): 1, ("threads", ()): 4},
+        {("requests", (("route", "a"),)): 2},
+    ]
+    with pytest.raises(ValueError, match="Invalid temporality"):
+        FanOutMetricReader([], temporality="gauge")
+
+
+def test_setup_metrics_writes_delta_points(tmp_path, reset_otel_globals):
+    provider = setup_metrics("svc", file_dir=tmp_path, temporality="delta", skip_unchanged=True)
+    counter = metrics.get_meter("test").create_counter("requests")
+    counter.add(3)
+    provider.force_flush()
+    counter.add(4)
+    provider.force_flush()
+    provider.force_flush()
+    provider.shutdown()
+
+    lines = next(tmp_path.glob("metrics-*.jsonl")).read_text(encoding="utf-8").splitlines()
+    sums = [json.loads(line)["resourceMetrics"][0]["scopeMetrics"][0]["metrics"][0]["sum"] for line in lines]
+    assert [s["dataPoints"][0]["asInt"] for s in sums] == ["3", "4"]
+    assert {s["aggregationTemporality"] for s in sums} == {"AGGREGATION_TEMPORALITY_DELTA"}
@@ -0,0 +1,137 @@
+"""Tests for arlogi.otel.processors.FanOutSpanProcessor."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from arlogi.otel import FanOutSpanProcessor, get_span_processor, setup_tracing, shutdown_tracing
+
+
+class RecordingExporter(SpanExporter):
+    def __init__(self, result=SpanExportResult.SUCCESS):
+        self.batches = []
+        self.result = result
+        self.shut_down = False
+
+    def export(self, spans):
+        self.batches.append(spans)
+        return self.result
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+class BlockingExporter(RecordingExporter):
+    """Holds the worker inside export() until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def export(self, spans):
+        self.started.set()
+        self.release.wait(5)
+        return super().export(spans)
+
+
+def _tracer(processor):
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test")
+
+
+def _end(tracer, *names):
+    for name in names:
+        tracer.start_span(name).end()
+
+
+def _names(exporter):
+    return [span.name for batch in exporter.batches for span in batch]
+
+
+def test_each_batch_is_queued_once_and_handed_to_every_exporter():
+    first, second = RecordingExporter(), RecordingExporter()
+    processor = FanOutSpanProcessor([first, second], max_export_batch_size=2, schedule_delay_millis=60_000)
+    tracer = _tracer(processor)
+
+    _end(tracer, "a", "b", "c")
+    assert processor.force_flush()
+
+    assert _names(first) == ["a", "b", "c"]
+    assert [len(batch) for batch in first.batches] == [2, 1]
+    assert all(mine is theirs for mine, theirs in zip(first.batches, second.batches, strict=True))
+    assert processor.stats() == {"queued": 0, "exported": 3, "dropped": {}, "export_failures": {}}
+    processor.shutdown()
+    assert first.shut_down and second.shut_down
+
+
+@pytest.mark.parametrize(("policy", "kept"), [("drop_oldest", ["a", "c", "d"]), ("drop_newest", ["a", "b", "c"])])
+def test_full_queue_follows_the_drop_policy(policy, kept):
+    exporter = BlockingExporter()
+    reader = InMemoryMetricReader()
+    processor = FanOutSpanProcessor(
+        [exporter],
+        max_queue_size=2,
+        max_export_batch_size=1,
+        schedule_delay_millis=60_000,
+        drop_policy=policy,
+        meter_provider=MeterProvider(metric_readers=[reader]),
+    )
+    tracer = _tracer(processor)
+
+    _end(tracer, "a")
+    assert exporter.started.wait(5)  # the worker holds "a"; the queue is empty again
+    _end(tracer, "b", "c", "d")
+    exporter.release.set()
+    processor.force_flush()
+
+    assert _names(exporter) == kept
+    assert processor.dropped_spans == 1
+    (metric,) = [m for rm in reader.get_metrics_data().resource_metrics for sm in rm.scope_metrics for m in sm.metrics]
+    assert metric.name == "arlogi.otel.spans.dropped"
+    assert [(p.value, dict(p.attributes)) for p in metric.data.data_points] == [(1, {"reason": "queue_full"})]
+    processor.shutdown()
+
+
+def test_export_failures_and_spans_after_shutdown_are_counted():
+    class Raising(RecordingExporter):
+        def export(self, spans):
+            raise RuntimeError("collector down")
+
+    healthy = RecordingExporter()
+    processor = FanOutSpanProcessor([Raising(), RecordingExporter(SpanExportResult.FAILURE), healthy])
+    tracer = _tracer(processor)
+
+    _end(tracer, "a")
+    processor.shutdown()
+    _end(tracer, "late")
+
+    assert _names(healthy) == ["a"]  # one failing exporter does not starve the others
+    stats = processor.stats()
+    assert stats["export_failures"] == {"Raising": 1, "RecordingExporter": 1}
+    assert stats["dropped"] == {"shutdown": 1}
+    assert processor.force_flush() is False
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError, match="Invalid drop_policy"):
+        FanOutSpanProcessor([], drop_policy="block")
+    with pytest.raises(ValueError, match="must not exceed"):
+        FanOutSpanProcessor([], max_queue_size=10, max_export_batch_size=20)
+
+
+def test_setup_tracing_passes_the_batching_knobs(tmp_path, reset_otel_globals):
+    setup_tracing("svc", file_dir=tmp_path, max_queue_size=64, max_export_batch_size=8, drop_policy="drop_newest")
+    processor = get_span_processor()
+
+    assert (processor._max_queue_size, processor._max_export_batch_size, processor._drop_oldest) == (64, 8, False)
+    shutdown_tracing()
+    assert get_span_processor() is None
@@ -0,0 +1,135 @@
+"""Tests for the length-delimited OTLP protobuf segments (file_format="protobuf")."""
+
+import io
+import json
+
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from opentelemetry import trace
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import SimpleLogRecordProcessor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from arlogi.otel import (
+    RotatingJsonlLogExporter,
+    RotatingJsonlMetricExporter,
+    RotatingJsonlSpanExporter,
+    read_segment,
+    setup_tracing,
+    shutdown_tracing,
+)
+from arlogi.otel._encode import encode_metrics_json, encode_spans_json
+from arlogi.otel._files import encode_varint
+from arlogi.otel.segments import SegmentError, _read_varint, iter_messages, to_jsonl
+
+
+def _spans(*exporters):
+    provider = TracerProvider()
+    for exporter in exporters:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("test")
+    with tracer.start_as_current_span("parent", attributes={"n": 1}):
+        with tracer.start_as_current_span("child"):
+            pass
+    provider.shutdown()
+
+
+def test_span_segments_read_back_as_the_jsonl_payloads(tmp_path):
+    memory = InMemorySpanExporter()
+    _spans(RotatingJsonlSpanExporter(tmp_path, file_format="protobuf"), memory)
+
+    (segment,) = tmp_path.glob("traces-*.binpb")
+    payloads = list(read_segment(segment))
+
+    assert [p["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for p in payloads] == ["child", "parent"]
+    assert payloads == [encode_spans_json([span]) for span in memory.get_finished_spans()]
+    assert not list(tmp_path.glob("*.jsonl"))
+
+
+def test_metric_and_log_segments(tmp_path):
+    exporter = RotatingJsonlMetricExporter(tmp_path, prefix="m", file_format="protobuf")
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+    meter_provider.get_meter("lib").create_counter("requests").add(3)
+    data = reader.get_metrics_data()
+    exporter.export(data)
+    exporter.shutdown()
+    meter_provider.shutdown()
+
+    (segment,) = tmp_path.glob("m-*.binpb")
+    assert list(read_segment(segment, "metrics")) == [encode_metrics_json(data)]
+
+    log_provider = LoggerProvider(shutdown_on_exit=False)
+    log_provider.add_log_record_processor(
+        SimpleLogRecordProcessor(RotatingJsonlLogExporter(tmp_path, file_format="protobuf"))
+    )
+    log_provider.get_logger("lib").emit(body="hello")
+    log_provider.shutdown()
+
+    (segment,) = tmp_path.glob("logs-*.binpb")
+    output = io.StringIO()
+    assert to_jsonl(segment, output) == 1
+    record = json.loads(output.getvalue())["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]
+    assert record["body"] == {"stringValue": "hello"}
+
+
+def test_truncated_tail_is_ignored_and_bad_prefixes_raise(tmp_path, caplog):
+    segment = tmp_path / "traces-x.binpb"
+    segment.write_bytes(encode_varint(3) + b"abc" + encode_varint(300) + b"partial")
+
+    assert list(iter_messages(segment)) == [b"abc"]
+    assert "truncated" in caplog.text
+
+    segment.write_bytes(b"\x80")
+    with pytest.raises(SegmentError, match="inside a length prefix"):
+        list(iter_messages(segment))
+    segment.write_bytes(encode_varint(2) + b"\xff\xff")
+    with pytest.raises(SegmentError, match="does not hold traces"):
+        list(read_segment(segment))
+    with pytest.raises(ValueError, match="Cannot tell the signal"):
+        list(read_segment(tmp_path / "other.binpb"))
+
+
+def test_varint_round_trips():
+    for value in (0, 1, 127, 128, 300, 2**32, 2**63 - 1):
+        assert _read_varint(io.BytesIO(encode_varint(value))) == value
+
+
+def test_invalid_file_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Invalid file_format"):
+        RotatingJsonlSpanExporter(tmp_path, file_format="xml")
+
+
+def test_setup_tracing_writes_protobuf_segments(tmp_path, reset_otel_globals):
+    provider = setup_tracing("svc", file_dir=tmp_path, file_format="protobuf")
+    with trace.get_tracer("t").start_as_current_span("op"):
+        pass
+    provider.force_flush()
+    shutdown_tracing()
+
+    (payload,) = read_segment(next(tmp_path.glob("traces-*.binpb")))
+    resource = payload["resourceSpans"][0]
+    assert {"key": "service.name", "value": {"stringValue": "svc"}} in resource["resource"]["attributes"]
+    assert resource["scopeSpans"][0]["spans"][0]["name"] == "op"
+
+
+def test_compressed_segments_are_read_back(tmp_path, caplog):
+    exporter = RotatingJsonlSpanExporter(tmp_path, file_format="protobuf", compress=True, flush_bytes=1_000_000)
+    _spans(exporter)
+
+    (segment,) = tmp_path.glob("traces-*.binpb.gz")
+    assert [p["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for p in read_segment(segment)] == [
+        "child",
+        "parent",
+    ]
+    assert caplog.text == ""
+
+    segment.write_bytes(segment.read_bytes()[:-8])  # drop the gzip trailer
+    assert len(list(read_segment(segment))) == 2
+    assert "truncated data" in caplog.text
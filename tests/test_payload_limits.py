@@ -0,0 +1,167 @@
+"""Tests for JSON payload size budgets (arlogi.payload)."""
+
+import io
+import json
+import logging
+from collections import deque
+from collections.abc import Mapping
+
+import pytest
+
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.factory import TraceLogger
+from arlogi.handler_factory import HandlerFactory
+from arlogi.handlers import JSONHandler
+from arlogi.payload import PayloadLimits, clip
+
+
+class Exploding:
+    """Fails the test if a formatter stringifies it."""
+
+    def __str__(self):
+        raise AssertionError("stringified an object beyond the item budget")
+
+
+@pytest.fixture
+def emit():
+    logger = TraceLogger("payload.test", logging.DEBUG)
+    logger.propagate = False
+
+    def emit(limits, msg="event", **kwargs):
+        stream = io.StringIO()
+        handler = JSONHandler(stream, limits=limits)
+        logger.addHandler(handler)
+        try:
+            logger.info(msg, **kwargs)
+            return stream.getvalue().rstrip("\n")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    return emit
+
+
+def test_records_within_limits_are_unchanged(emit):
+    unlimited = json.loads(emit(None, user={"id": 1, "tags": ["a", "b"]}, count=3))
+    limited = json.loads(emit(PayloadLimits(), user={"id": 1, "tags": ["a", "b"]}, count=3))
+
+    unlimited.pop("timestamp")
+    limited.pop("timestamp")
+    assert limited == unlimited
+    assert "_truncated" not in limited
+
+
+def test_message_and_string_values_are_clipped(emit):
+    limits = PayloadLimits(max_message_length=10, max_value_length=20)
+
+    data = json.loads(emit(limits, "m" * 100, blob="x" * 1_000, small="ok"))
+
+    assert data["message"] == "m" * 10 + "...[90 chars truncated]"
+    assert data["blob"] == "x" * 20 + "...[980 chars truncated]"
+    assert data["small"] == "ok"
+    assert data["_truncated"] == ["message", "blob"]
+
+
+def test_containers_are_cut_by_items_and_depth(emit):
+    limits = PayloadLimits(max_items=3, max_depth=2)
+    nested = {"a": {"b": {"c": 1}}}
+
+    data = json.loads(emit(limits, items=list(range(10)) + [Exploding()], nested=nested))
+
+    assert data["items"] == [0, 1, 2]
+    assert data["nested"] == {"a": {"b": "{...}"}}
+    assert data["_truncated"] == ["items", "nested"]
+
+
+def test_value_budget_counts_nested_strings(emit):
+    limits = PayloadLimits(max_value_length=100, max_items=1_000)
+
+    data = json.loads(emit(limits, rows=[{"name": "n" * 30} for _ in range(50)]))
+
+    assert 1 < len(data["rows"]) < 5
+    assert data["_truncated"] == ["rows"]
+
+
+def test_record_budget_drops_extras_then_keeps_core_fields(emit):
+    limits = PayloadLimits(max_value_length=400, max_record_bytes=1_000)
+
+    extras = {f"field_{i}": "v" * 300 for i in range(10)}
+    data = json.loads(emit(limits, **extras))
+    assert "field_0" in data and "field_9" not in data
+    assert "field_9" in data["_truncated"]
+
+    text = emit(limits, "é" * 900)  # escaped to 6 bytes per character
+    data = json.loads(text)
+    assert len(text) <= 1_000
+    assert data["_truncated"] == ["record"]
+    assert data["level"] == "INFO"
+
+
+def test_unknown_objects_are_stringified_and_clipped(emit):
+    class Big:
+        def __str__(self):
+            return "b" * 500
+
+    data = json.loads(emit(PayloadLimits(max_value_length=50), obj=Big()))
+
+    assert data["obj"].startswith("b" * 50 + "...")
+
+
+def test_any_container_type_is_bounded(emit):
+    class Table(Mapping):
+        def __init__(self, rows):
+            self.rows = rows
+
+        def __getitem__(self, key):
+            return self.rows[key]
+
+        def __iter__(self):
+            return iter(self.rows)
+
+        def __len__(self):
+            return len(self.rows)
+
+    limits = PayloadLimits(max_items=3)
+    rows = Table({f"k{i}": i for i in range(10)} | {"boom": Exploding()})
+
+    data = json.loads(emit(limits, queue=deque([*range(10), Exploding()]), ids=frozenset(range(10)), table=rows))
+
+    assert data["queue"] == [0, 1, 2]
+    assert len(data["ids"]) == 3
+    assert data["table"] == {"k0": 0, "k1": 1, "k2": 2}
+    assert data["_truncated"] == ["queue", "ids", "table"]
+
+
+def test_bytes_are_clipped_before_rendering(emit):
+    data = json.loads(emit(PayloadLimits(max_value_length=20), blob=b"\x00" * 1_000_000, small=bytearray(b"ok")))
+
+    assert data["blob"].startswith("b'\\x00")
+    assert len(data["blob"]) < 60
+    assert data["small"] == "bytearray(b'ok')"
+    assert data["_truncated"] == ["blob"]
+
+
+def test_limits_validation():
+    with pytest.raises(ValueError, match="max_items"):
+        PayloadLimits(max_items=0)
+    with pytest.raises(ValueError, match="Unknown payload limits: max_bytes"):
+        PayloadLimits.from_dict({"max_bytes": 10})
+    with pytest.raises(ValueError, match="max_depth"):
+        LoggingConfig(payload_limits={"max_depth": -1})
+    assert clip("abc", 5) == "abc"
+
+
+def test_config_plumbing(tmp_path):
+    assert LoggingConfig().resolved_payload_limits is None
+    config = LoggingConfigBuilder().with_payload_limits(max_value_length=64).build()
+    assert config.resolved_payload_limits == PayloadLimits(max_value_length=64)
+    assert LoggingConfigBuilder().with_payload_limits().build().resolved_payload_limits == PayloadLimits()
+
+    config = LoggingConfig(json_file_name=str(tmp_path / "app.jsonl"), payload_limits={"max_items": 5})
+    handler = HandlerFactory.create_json_handler(config)
+    try:
+        assert handler.formatter.limits == PayloadLimits(max_items=5)
+    finally:
+        handler.close()
+    assert HandlerFactory.create_json_stream().formatter.limits is None
@@ -0,0 +1,142 @@
+"""Tests for PlainConsoleHandler and console renderer selection."""
+
+import logging
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.handler_factory import HandlerFactory
+from arlogi.handlers import ColoredConsoleHandler, PlainConsoleHandler
+
+
+def _record(msg, level=logging.INFO, args=(), exc_info=None, pathname=None):
+    return logging.LogRecord(
+        name="test.plain",
+        level=level,
+        pathname=pathname or os.path.join(os.getcwd(), "pkg", "mod.py"),
+        lineno=42,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+
+
+def test_compact_layout():
+    stream = StringIO()
+    handler = PlainConsoleHandler(stream=stream, project_root=os.getcwd())
+    handler.emit(_record("hello %s", args=("world",)))
+
+    assert stream.getvalue() == f"I hello world  {os.path.join('pkg', 'mod.py')}:42\n"
+
+
+def test_layout_flags():
+    stream = StringIO()
+    handler = PlainConsoleHandler(show_level=False, show_path=False, stream=stream)
+    handler.emit(_record("bare", level=logging.WARNING))
+
+    assert stream.getvalue() == "bare\n"
+
+
+def test_show_time_uses_formatter_datefmt():
+    stream = StringIO()
+    handler = PlainConsoleHandler(show_time=True, show_path=False, stream=stream)
+    handler.setFormatter(logging.Formatter(datefmt="<%Y>"))
+    record = _record("timed")
+    handler.emit(record)
+
+    assert stream.getvalue().startswith("<")
+    assert stream.getvalue().endswith("> I timed\n")
+
+
+def test_markup_is_stripped_and_escapes_resolved():
+    stream = StringIO()
+    handler = PlainConsoleHandler(show_path=False, stream=stream)
+    handler.emit(_record("[bold]loud[/bold] done\n\\[inner_func()]"))
+
+    assert stream.getvalue() == "I loud done\n  [inner_func()]\n"
+
+
+def test_invalid_markup_is_printed_verbatim():
+    stream = StringIO()
+    handler = PlainConsoleHandler(show_path=False, stream=stream)
+    handler.emit(_record("closing [/nothing]"))
+
+    assert stream.getvalue() == "I closing [/nothing]\n"
+
+
+def test_exception_text_is_appended():
+    stream = StringIO()
+    handler = PlainConsoleHandler(show_path=False, stream=stream)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        import sys
+
+        handler.emit(_record("failed", level=logging.ERROR, exc_info=sys.exc_info()))
+
+    output = stream.getvalue()
+    assert output.startswith("E failed\n  Traceback")
+    assert "ValueError: boom" in output
+
+
+def test_relative_path_is_memoized():
+    handler = PlainConsoleHandler(stream=StringIO(), project_root=os.getcwd())
+    pathname = os.path.join(os.getcwd(), "a.py")
+
+    with patch("os.path.relpath", return_value="a.py") as relpath:
+        handler.emit(_record("one", pathname=pathname))
+        handler.emit(_record("two", pathname=pathname))
+
+    assert relpath.call_count == 1
+
+
+def test_relative_path_failure_falls_back_to_basename():
+    handler = PlainConsoleHandler(stream=StringIO(), project_root=os.getcwd())
+
+    with patch("os.path.relpath", side_effect=ValueError("different drive")):
+        assert handler._relative_path("/elsewhere/mod.py") == "mod.py"
+
+
+def test_write_failure_goes_to_handle_error():
+    class BrokenStream(StringIO):
+        def write(self, s):
+            raise OSError("pipe closed")
+
+    handler = PlainConsoleHandler(stream=BrokenStream())
+    with patch.object(handler, "handleError") as handle_error:
+        handler.emit(_record("lost"))
+
+    handle_error.assert_called_once()
+
+
+class TestRendererSelection:
+    def test_auto_uses_plain_when_stdout_is_not_a_tty(self):
+        with patch("sys.stdout", StringIO()):
+            handler = HandlerFactory.create_console(LoggingConfig())
+        assert isinstance(handler, PlainConsoleHandler)
+
+    def test_auto_uses_rich_on_a_tty(self):
+        class FakeTTY(StringIO):
+            def isatty(self):
+                return True
+
+        with patch("sys.stdout", FakeTTY()):
+            handler = HandlerFactory.create_console(LoggingConfig())
+        assert isinstance(handler, ColoredConsoleHandler)
+
+    def test_explicit_renderer_overrides_detection(self):
+        assert isinstance(HandlerFactory.create_console(LoggingConfig(console_renderer="rich")), ColoredConsoleHandler)
+        assert isinstance(HandlerFactory.create_console(LoggingConfig(console_renderer="plain")), PlainConsoleHandler)
+
+    def test_invalid_renderer_rejected(self):
+        with pytest.raises(ValueError, match="Invalid console_renderer"):
+            LoggingConfig(console_renderer="fancy")
+
+    def test_builder_and_kwargs_accept_renderer(self):
+        config = LoggingConfigBuilder().with_console_format(renderer="plain").build()
+        assert config.console_renderer == "plain"
+        assert LoggingConfig.from_kwargs(console_renderer="rich").to_dict()["console_renderer"] == "rich"
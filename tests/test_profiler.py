@@ -0,0 +1,162 @@
+"""Tests for the call-site log volume profiler."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from arlogi import profiler
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.factory import LoggerFactory, TraceLogger
+from arlogi.handlers import JSONFileHandler
+from arlogi.profiler import LogVolumeProfiler, SpaceSaving, enable_profiler, format_report, get_profile_report
+
+
+@pytest.fixture
+def trace_logger():
+    logger = TraceLogger("profiled")
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+@pytest.fixture
+def active_profiler():
+    yield enable_profiler(capacity=10)
+    profiler.disable_profiler()
+
+
+class TestSpaceSaving:
+    def test_exact_below_capacity(self):
+        sketch = SpaceSaving(3)
+        for key in "aabbbc":
+            sketch.add(key)
+        assert sketch.top(3) == [("b", 3, 0), ("a", 2, 0), ("c", 1, 0)]
+
+    def test_bounded_and_keeps_heavy_hitters(self):
+        sketch = SpaceSaving(5)
+        for i in range(1000):
+            sketch.add("heavy", 10)
+            sketch.add(f"noise-{i}")
+        assert len(sketch.counts) == 5
+        key, count, error = sketch.top(1)[0]
+        assert key == "heavy"
+        assert count - error <= 10_000 <= count
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSaving(0)
+
+
+def test_disabled_by_default(trace_logger):
+    trace_logger.info("not profiled")
+    assert profiler.get_profiler() is None
+    assert get_profile_report() == {}
+
+
+def test_attributes_records_and_bytes_to_call_sites(active_profiler, trace_logger):
+    def noisy():
+        for _ in range(5):
+            trace_logger.info("x" * 100)
+
+    def quiet():
+        trace_logger.warning("y")
+
+    noisy()
+    quiet()
+
+    report = get_profile_report(top=5)
+    assert report["records"] == 6
+    assert report["bytes"] == 501
+    heaviest = report["sites"][0]
+    assert (heaviest["module"], heaviest["function"]) == ("test_profiler", "noisy")
+    assert heaviest["records"] == 5
+    assert heaviest["bytes"] == 500
+    assert report["loggers"] == [{"logger": "profiled", "records": 6, "bytes": 501, "error": 0}]
+
+    by_bytes = get_profile_report(top=1, by="bytes")
+    assert by_bytes["sites"][0]["function"] == "noisy"
+
+
+def test_bytes_count_the_message_not_the_traceback(active_profiler, trace_logger):
+    try:
+        raise ValueError("z" * 1000)
+    except ValueError:
+        trace_logger.exception("héllo")
+
+    assert get_profile_report()["bytes"] == len("héllo".encode())
+
+
+def test_windows_rotate_and_previous_is_reportable():
+    clock = [1000.0]
+    volume = LogVolumeProfiler(capacity=4, window=60)
+    volume._now = lambda: clock[0]  # type: ignore[method-assign]
+    volume.reset()
+
+    volume.add(("m", "old", 1), "app", 10)
+    clock[0] += 61
+    volume.add(("m", "new", 2), "app", 20)
+
+    assert [s["function"] for s in volume.report()["sites"]] == ["new"]
+    previous = volume.report(previous=True)
+    assert [s["function"] for s in previous["sites"]] == ["old"]
+    assert previous["elapsed"] == 61
+
+
+def test_invalid_order_rejected():
+    with pytest.raises(ValueError, match="Invalid report order"):
+        LogVolumeProfiler().report(by="size")
+
+
+def test_config_enables_profiler():
+    config = LoggingConfigBuilder().with_log_profiler().build()
+    assert config.profile_log_volume
+    try:
+        LoggerFactory._apply_configuration(config)
+        assert profiler.get_profiler() is not None
+        LoggerFactory._apply_configuration(LoggingConfig())
+        assert profiler.get_profiler() is None
+    finally:
+        profiler.disable_profiler()
+
+
+def test_cli_reports_json_log_file(tmp_path, capsys):
+    log_file = tmp_path / "app.jsonl"
+    handler = JSONFileHandler(str(log_file))
+    logger = TraceLogger("cli")
+    logger.propagate = False
+    logger.addHandler(handler)
+    for _ in range(3):
+        logger.info("repeated")
+    logger.info("once")
+    handler.close()
+
+    assert profiler.main([str(log_file), "--top", "5"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("4 records")
+    assert "test_profiler.test_cli_reports_json_log_file" in out
+    assert "cli" in out
+
+    report = profiler.profile_json_lines(io.StringIO(log_file.read_text()), by="bytes")
+    assert report["bytes"] == sum(len(line) for line in log_file.read_text().splitlines())
+    assert json.dumps(report)
+
+
+def test_profile_json_lines_skips_malformed_entries():
+    lines = [
+        "[1, 2]",
+        '"text"',
+        "not json",
+        '{"module": "m", "function": "f", "line_number": "x"}',
+        '{"module": "m", "function": "f", "line_number": 3, "logger_name": "app"}',
+    ]
+
+    report = profiler.profile_json_lines(lines)
+
+    assert report["records"] == 1
+
+
+def test_format_report_without_window():
+    assert format_report({}) == "no completed window\n"
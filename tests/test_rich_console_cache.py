@@ -0,0 +1,115 @@
+"""Tests for ColoredConsoleHandler's per-record caching fast path."""
+
+import io
+import logging
+import os
+import sys
+from unittest.mock import patch
+
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.text import Text
+
+from arlogi.handlers import ColoredConsoleHandler
+
+
+class _UncachedHandler(ColoredConsoleHandler):
+    """Reference implementation without any of the caches."""
+
+    def _relative_path(self, pathname):
+        try:
+            return os.path.relpath(pathname, self.project_root)
+        except (ValueError, OSError):
+            return os.path.basename(pathname)
+
+    def get_level_text(self, record):
+        style = self.level_styles.get(record.levelname.lower(), "default")
+        return Text(f"{record.levelname[0]} ", style=style)
+
+    def render_message(self, record, message):
+        message_text = RichHandler.render_message(self, record, message)
+        message_text.style = self.level_styles.get(record.levelname.lower(), "default")
+        return message_text
+
+
+def _console():
+    return Console(file=io.StringIO(), force_terminal=True, width=100, color_system="truecolor")
+
+
+def _record(msg, level=logging.INFO, exc_info=None, lineno=7):
+    return logging.LogRecord(
+        name="test.rich",
+        level=level,
+        pathname=os.path.join(os.getcwd(), "pkg", "mod.py"),
+        lineno=lineno,
+        msg=msg,
+        args=(),
+        exc_info=exc_info,
+    )
+
+
+def _exc_info():
+    # Captured in a finished frame: Rich reads live frames' current line.
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        return sys.exc_info()
+
+
+MESSAGES = [
+    "plain message",
+    "value=42 path=/tmp/x.py url=https://example.com",
+    "[bold]markup[/bold] text",
+    "emoji :thumbs_up: code",
+    "escaped \\[not markup]",
+    "multi\nline\n\\[from .caller()]",
+    "True False None 'quoted' 0x1f",
+]
+
+
+def test_output_identical_to_uncached_rendering():
+    cached = ColoredConsoleHandler(console=_console(), project_root=os.getcwd())
+    reference = _UncachedHandler(console=_console(), project_root=os.getcwd())
+
+    for _ in range(2):  # second pass hits every cache
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR):
+            for msg in MESSAGES:
+                cached.handle(_record(msg, level))
+                reference.handle(_record(msg, level))
+
+    exc_info = _exc_info()
+    cached.handle(_record("failed", logging.ERROR, exc_info=exc_info))
+    reference.handle(_record("failed", logging.ERROR, exc_info=exc_info))
+
+    assert cached.console.file.getvalue() == reference.console.file.getvalue()
+
+
+def test_relative_path_is_memoized():
+    handler = ColoredConsoleHandler(console=_console(), project_root=os.getcwd())
+    with patch("os.path.relpath", return_value="pkg/mod.py") as relpath:
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+    assert relpath.call_count == 1
+
+
+def test_level_text_is_prebuilt_per_level():
+    handler = ColoredConsoleHandler(console=_console())
+    first = handler.get_level_text(_record("a"))
+    assert handler.get_level_text(_record("b")) is first
+    assert handler.get_level_text(_record("c", logging.ERROR)) is not first
+
+
+def test_replacing_level_styles_invalidates_level_text():
+    handler = ColoredConsoleHandler(console=_console())
+    assert str(handler.get_level_text(_record("a")).style) == "grey75"
+
+    handler.level_styles = {**handler.level_styles, "info": "blue"}
+    assert str(handler.get_level_text(_record("a")).style) == "blue"
+
+
+def test_markup_parser_skipped_without_markup_characters():
+    handler = ColoredConsoleHandler(console=_console())
+    with patch.object(Text, "from_markup", wraps=Text.from_markup) as from_markup:
+        handler.render_message(_record("no markup here"), "no markup here")
+        handler.render_message(_record("[b]x[/b]"), "[b]x[/b]")
+    assert from_markup.call_count == 1
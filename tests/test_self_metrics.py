@@ -0,0 +1,163 @@
+"""Tests for the logging pipeline self-metrics."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from arlogi import selfmetrics
+from arlogi.breaker import CircuitBreakerHandler
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.factory import LoggerFactory, TraceLogger
+from arlogi.handlers import JSONFileHandler, JSONHandler, PlainConsoleHandler
+from arlogi.selfmetrics import count_suppressed, disable_self_metrics, enable_self_metrics, get_self_metrics
+
+
+@pytest.fixture
+def metrics_on():
+    enable_self_metrics()
+    yield
+    disable_self_metrics()
+
+
+@pytest.fixture
+def trace_logger():
+    logger = TraceLogger("selfmetrics.test")
+    logger.propagate = False
+    yield logger
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def test_disabled_by_default_and_snapshot_is_minimal():
+    assert selfmetrics._active is None
+    assert get_self_metrics() == {"enabled": False}
+
+
+def test_records_counted_per_logger_and_level(metrics_on, trace_logger):
+    trace_logger.addHandler(logging.NullHandler())
+    trace_logger.setLevel(logging.DEBUG)
+    trace_logger.info("a")
+    trace_logger.info("b")
+    trace_logger.warning("c")
+    trace_logger.debug("d")
+
+    assert get_self_metrics()["records"]["selfmetrics.test"] == {"INFO": 2, "WARNING": 1, "DEBUG": 1}
+
+
+def test_handler_bytes_and_emit_latency(metrics_on, trace_logger):
+    stream = io.StringIO()
+    handler = JSONHandler(stream)
+    plain = PlainConsoleHandler(show_path=False, stream=io.StringIO())
+    plain.set_name("console")
+    trace_logger.addHandler(handler)
+    trace_logger.addHandler(plain)
+    trace_logger.info("hello")
+    trace_logger.info("héllo")
+
+    snapshot = get_self_metrics()
+    expected = sum(len(line.encode()) for line in stream.getvalue().splitlines())
+    assert snapshot["handler_bytes"]["JSONHandler"] == expected
+    assert snapshot["handler_bytes"]["console"] == len("I hello\n") + len("I héllo\n".encode())
+    latency = snapshot["emit_latency"]["JSONHandler"]
+    assert latency["count"] == 2
+    assert 0 < latency["min"] <= latency["max"] <= latency["sum"]
+    assert sum(latency["buckets"].values()) == 2
+    json.dumps(snapshot)  # the snapshot is serializable as-is
+
+
+def test_handle_error_invocations_counted(metrics_on, trace_logger, monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    handler = JSONHandler(io.StringIO())
+    handler.stream.close()
+    trace_logger.addHandler(handler)
+    trace_logger.info("fails")
+
+    assert get_self_metrics()["handle_errors"] == {"JSONHandler": 1}
+
+
+def test_rotation_duration_observed(metrics_on, tmp_path):
+    handler = JSONFileHandler(str(tmp_path / "app.jsonl"))
+    handler.handle(logging.LogRecord("rot", logging.INFO, __file__, 1, "x", (), None))
+    assert handler.rotate_now()
+    handler.close()
+
+    rotation = get_self_metrics()["rotation_duration"]
+    assert rotation["count"] == 1
+    assert rotation["sum"] > 0
+
+
+def test_suppressed_counts(metrics_on):
+    count_suppressed("sampled", "sampler", 3)  # a custom filter's reason
+    breaker = CircuitBreakerHandler(logging.NullHandler(), failure_threshold=1, spill_size=0)
+    breaker._state = "open"
+    breaker._opened_at = breaker._now()
+    breaker.handle(logging.LogRecord("s", logging.INFO, __file__, 1, "x", (), None))
+    breaker.close()
+
+    suppressed = get_self_metrics()["suppressed"]
+    assert suppressed["sampled"] == {"sampler": 3}
+    assert suppressed["dropped"] == {"NullHandler": 1}
+    assert suppressed["throttled"] == {}
+
+
+def test_disabled_collects_nothing(trace_logger):
+    trace_logger.addHandler(JSONHandler(io.StringIO()))
+    trace_logger.info("not counted")
+    count_suppressed("dropped", "x")
+
+    enable_self_metrics()
+    try:
+        assert get_self_metrics()["records"] == {}
+        assert get_self_metrics()["suppressed"]["dropped"] == {}
+    finally:
+        disable_self_metrics()
+
+
+def test_config_enables_self_metrics():
+    config = LoggingConfigBuilder().with_self_metrics().build()
+    assert config.self_metrics
+    assert LoggingConfig.from_kwargs(self_metrics=True).to_dict()["self_metrics"] is True
+    try:
+        LoggerFactory._apply_configuration(config)
+        assert selfmetrics.is_self_metrics_enabled()
+    finally:
+        disable_self_metrics()
+
+
+def test_reconfiguring_without_self_metrics_disables_them():
+    try:
+        LoggerFactory._apply_configuration(LoggingConfig(self_metrics=True))
+        LoggerFactory._apply_configuration(LoggingConfig(self_metrics=False))
+        assert not selfmetrics.is_self_metrics_enabled()
+    finally:
+        disable_self_metrics()
+
+
+def test_published_through_otel_meter_provider(tmp_path, reset_otel_globals, metrics_on, trace_logger):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    from arlogi.otel.selfmetrics import register_self_metrics
+
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    register_self_metrics(provider)
+    trace_logger.addHandler(JSONHandler(io.StringIO()))
+    trace_logger.info("exported")
+
+    data = reader.get_metrics_data()
+    points = {
+        metric.name: [(dict(p.attributes), p.value) for p in metric.data.data_points]
+        for rm in data.resource_metrics
+        for sm in rm.scope_metrics
+        for metric in sm.metrics
+    }
+    assert points["arlogi.records"] == [({"logger": "selfmetrics.test", "level": "INFO"}, 1)]
+    assert points["arlogi.handler.emits"] == [({"handler": "JSONHandler"}, 1)]
+    assert points["arlogi.handler.bytes"][0][1] > 0
+    provider.shutdown()
@@ -0,0 +1,109 @@
+"""Startup cost tests: lazy imports and deferred handlers."""
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.handler_factory import DeferredHandler, HandlerFactory
+from arlogi.handlers import JSONFileHandler
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    env = {key: value for key, value in os.environ.items() if key != "PYTEST_CURRENT_TEST"}
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH", "")])
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=REPO_ROOT)
+
+
+def test_import_does_not_load_rich_or_handlers():
+    result = _run_python(
+        "import sys\n"
+        "import arlogi\n"
+        "heavy = [m for m in ('rich', 'logging.handlers', 'arlogi.handlers') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_implicit_setup_defers_handlers_until_first_record():
+    result = _run_python(
+        "import logging, sys\n"
+        "import arlogi\n"
+        "logger = arlogi.get_logger('startup')\n"
+        "assert 'arlogi.handlers' not in sys.modules\n"
+        "logger.info('first')\n"
+        "assert all(h.is_built for h in logging.getLogger().handlers)\n"
+        "assert 'rich' not in sys.modules  # stdout is a pipe: plain console\n"
+    )
+    assert result.returncode == 0, result.stderr
+    assert "I first" in result.stdout
+
+
+def test_handlers_module_resolves_colored_console_handler_lazily():
+    import arlogi.handlers
+    from arlogi._rich_console import ColoredConsoleHandler
+
+    assert arlogi.handlers.ColoredConsoleHandler is ColoredConsoleHandler
+
+
+class TestDeferredHandler:
+    def test_file_not_created_before_first_record(self, tmp_path):
+        log_file = tmp_path / "deferred.jsonl"
+        config = (
+            LoggingConfigBuilder().with_json_file(str(log_file), console_also=False).with_deferred_handlers().build()
+        )
+
+        (handler,) = HandlerFactory.create_handlers(config)
+        assert isinstance(handler, DeferredHandler)
+        assert not handler.is_built
+        assert not log_file.exists()
+
+        handler.handle(logging.LogRecord("deferred", logging.INFO, __file__, 1, "hello", (), None))
+        handler.close()
+
+        assert isinstance(handler.handler, JSONFileHandler)
+        assert "hello" in log_file.read_text()
+
+    def test_filters_apply_before_build(self):
+        built = []
+        handler = DeferredHandler(lambda: built.append(1) or logging.NullHandler())
+        handler.addFilter(lambda record: False)
+
+        handler.handle(logging.LogRecord("deferred", logging.INFO, __file__, 1, "dropped", (), None))
+
+        assert not built
+        assert not handler.is_built
+
+    def test_flush_and_close_without_build_are_noops(self):
+        handler = DeferredHandler(lambda: (_ for _ in ()).throw(AssertionError("built")))
+        handler.flush()
+        handler.close()
+        assert not handler.is_built
+
+    def test_set_formatter_reaches_real_handler(self):
+        handler = DeferredHandler(logging.NullHandler)
+        formatter = logging.Formatter("%(message)s")
+        handler.setFormatter(formatter)
+        assert handler.handler.formatter is formatter
+
+    def test_not_deferred_by_default(self):
+        handlers = HandlerFactory.create_handlers(LoggingConfig(console_renderer="plain"))
+        assert not any(isinstance(h, DeferredHandler) for h in handlers)
+
+
+def test_startup_benchmark_runs():
+    # Timings are reported, not asserted: the import checks above are the deterministic guard
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--runs", "1"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT)])},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "rich imported (non-TTY stdout): False" in result.stdout
@@ -0,0 +1,267 @@
+"""Tests for the RFC 5424 stream syslog transport against a local socket server."""
+
+import logging
+import re
+import socket
+import threading
+import time
+
+import pytest
+
+from arlogi import cleanup_syslog_logger, get_syslog_logger
+from arlogi.config import LoggingConfig
+from arlogi.config_builder import LoggingConfigBuilder
+from arlogi.handler_factory import HandlerFactory
+from arlogi.syslog import RFC5424Formatter, SyslogStreamHandler
+
+RFC5424_RE = re.compile(
+    r"^<(?P<pri>\d+)>1 (?P<ts>\S+) (?P<host>\S+) (?P<app>\S+) (?P<procid>\S+) (?P<msgid>\S+) "
+    r"(?P<sd>-|\[.*?[^\\]\]) (?P<msg>.*)$",
+    re.DOTALL,
+)
+
+
+class OctetCountingServer:
+    """Minimal TCP syslog collector that parses RFC 6587 octet-counted frames."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.address = self.sock.getsockname()
+        self.messages: list[str] = []
+        self.recv_calls = 0
+        self.connections = 0
+        self._stop = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        self.sock.settimeout(0.1)
+        while not self._stop:
+            try:
+                conn, _ = self.sock.accept()
+            except (TimeoutError, OSError):
+                continue
+            self.connections += 1
+            self._read(conn)
+
+    def _read(self, conn):
+        buffer = b""
+        conn.settimeout(0.1)
+        with conn:
+            while not self._stop:
+                try:
+                    chunk = conn.recv(65536)
+                except TimeoutError:
+                    continue
+                if not chunk:
+                    return
+                self.recv_calls += 1
+                buffer += chunk
+                while b" " in buffer:
+                    length, _, rest = buffer.partition(b" ")
+                    if len(rest) < int(length):
+                        break
+                    self.messages.append(rest[: int(length)].decode())
+                    buffer = rest[int(length) :]
+
+    def wait_for(self, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while len(self.messages) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.messages
+
+    def stop(self):
+        self._stop = True
+        self._thread.join(2)
+        self.sock.close()
+
+
+@pytest.fixture
+def server():
+    srv = OctetCountingServer()
+    yield srv
+    srv.stop()
+
+
+def _record(msg, level=logging.INFO, extra=None, exc_info=None):
+    record = logging.LogRecord("app.db", level, __file__, 10, msg, (), exc_info)
+    for key, value in (extra or {}).items():
+        setattr(record, key, value)
+    return record
+
+
+class TestRFC5424Formatter:
+    def test_header_fields(self):
+        formatter = RFC5424Formatter(facility=16, app_name="svc", hostname="host1")
+        match = RFC5424_RE.match(formatter.format(_record("hello", logging.WARNING)))
+
+        assert match is not None
+        assert match["pri"] == str(16 * 8 + 4)
+        assert match["host"] == "host1"
+        assert match["app"] == "svc"
+        assert match["msgid"] == "app.db"
+        assert match["sd"] == "-"
+        assert match["msg"] == "hello"
+
+    def test_severity_mapping(self):
+        formatter = RFC5424Formatter(facility=0)
+        severities = {5: "7", logging.DEBUG: "7", logging.INFO: "6", logging.ERROR: "3", logging.CRITICAL: "2"}
+        for level, severity in severities.items():
+            assert formatter.format(_record("x", level)).startswith(f"<{severity}>1 ")
+
+    def test_structured_data_from_extras_is_escaped(self):
+        formatter = RFC5424Formatter(hostname="h", app_name="a")
+        line = formatter.format(_record("m", extra={"user": 'a"b]c\\d', "bad key=": 1, "_private": 2}))
+
+        assert '[arlogi@32473 user="a\\"b\\]c\\\\d" bad_key_="1"]' in line
+        assert "_private" not in line
+
+    def test_header_fields_are_sanitized(self):
+        formatter = RFC5424Formatter(app_name="my app", hostname="h")
+        assert " my_app " in formatter.format(_record("m"))
+
+    def test_exception_text_is_appended(self):
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            import sys
+
+            line = RFC5424Formatter().format(_record("failed", logging.ERROR, exc_info=sys.exc_info()))
+        assert "failed\nTraceback" in line
+
+
+class TestSyslogStreamHandler:
+    def test_octet_counted_delivery(self, server):
+        handler = SyslogStreamHandler(address=server.address)
+        handler.handle(_record("first\nsecond line", extra={"request_id": "r1"}))
+        handler.handle(_record("third"))
+        handler.close()
+
+        messages = server.wait_for(2)
+        assert [RFC5424_RE.match(m)["msg"] for m in messages] == ["first\nsecond line", "third"]
+        assert '[arlogi@32473 request_id="r1"]' in messages[0]
+        assert handler.sent == 2
+
+    def test_many_messages_are_batched(self, server):
+        handler = SyslogStreamHandler(address=server.address, batch_size=1000)
+        for i in range(2000):
+            handler.handle(_record(f"msg {i}"))
+        handler.flush()
+
+        assert len(server.wait_for(2000)) == 2000
+        assert server.recv_calls < 2000
+        handler.close()
+
+    def test_bounded_queue_drops_when_collector_unreachable(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        address = probe.getsockname()
+        probe.close()  # nothing listens on this port
+
+        handler = SyslogStreamHandler(address=address, queue_size=5, initial_backoff=10, flush_timeout=0.2)
+        for i in range(20):
+            handler.handle(_record(f"msg {i}"))
+
+        assert handler.dropped >= 15
+        assert not handler.connected
+        handler.close()
+
+    def test_new_records_do_not_cut_the_backoff_short(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        address = probe.getsockname()
+        probe.close()  # nothing listens on this port
+
+        handler = SyslogStreamHandler(address=address, initial_backoff=0.2, flush_timeout=0.1)
+        attempts = []
+        connect = handler._connect
+        handler._connect = lambda: attempts.append(time.monotonic()) or connect()
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            handler.handle(_record("collector down"))
+            time.sleep(0.002)
+        handler.close()
+
+        # Attempts at about 0, 0.2 and 0.6 s (backoff 0.2 s, then 0.4 s)
+        assert 1 <= len(attempts) <= 3
+
+    def test_reconnects_with_backoff_and_retries_batch(self, server):
+        handler = SyslogStreamHandler(address=server.address, initial_backoff=0.01)
+        handler.handle(_record("before"))
+        assert server.wait_for(1)
+
+        # Drop the connection from our side; the next send fails and reconnects.
+        handler._sock.shutdown(socket.SHUT_RDWR)
+        handler.handle(_record("after"))
+        handler.close()
+
+        messages = server.wait_for(2)
+        assert any("after" in m for m in messages)
+        assert handler.reconnects >= 2
+
+    def test_failed_send_requeues_only_unsent_frames(self, server):
+        class FlakySocket:
+            """Accepts 6 bytes per send, then the connection breaks."""
+
+            def __init__(self):
+                self.received = b""
+
+            def send(self, data):
+                if len(self.received) >= 10:
+                    raise ConnectionResetError
+                self.received += bytes(data[:6])
+                return min(len(data), 6)
+
+            def close(self):
+                pass
+
+        handler = SyslogStreamHandler(address=server.address)
+        handler._sock = flaky = FlakySocket()
+        frames = [b"3 one", b"3 two", b"5 three"]
+
+        unsent = handler._send(frames)
+
+        assert flaky.received == b"3 one3 two5 "
+        assert unsent == [b"5 three"]  # the cut-short frame is resent whole, the others not at all
+        assert not handler.connected
+        handler.close()
+
+    def test_emit_after_close_is_ignored(self, server):
+        handler = SyslogStreamHandler(address=server.address)
+        handler.close()
+        handler.emit(_record("late"))
+        assert handler.sent == 0
+
+    def test_invalid_sizes_rejected(self):
+        with pytest.raises(ValueError, match="queue_size"):
+            SyslogStreamHandler(queue_size=0)
+
+
+class TestStreamTransportConfiguration:
+    def test_factory_creates_stream_handler(self, server):
+        config = LoggingConfigBuilder().with_syslog(server.address, transport="stream").build()
+        handler = HandlerFactory.create_syslog(config)
+        try:
+            assert isinstance(handler, SyslogStreamHandler)
+        finally:
+            handler.close()
+
+    def test_invalid_transport_rejected(self):
+        with pytest.raises(ValueError, match="Invalid syslog_transport"):
+            LoggingConfig(syslog_transport="carrier-pigeon")
+
+    def test_stream_transport_needs_explicit_address(self):
+        with pytest.raises(ValueError, match="explicit syslog_address"):
+            LoggingConfig(use_syslog=True, syslog_transport="stream")
+
+    def test_get_syslog_logger_with_stream_transport(self, server):
+        logger = get_syslog_logger("stream_test", address=server.address, transport="stream")
+        logger.info("via logger", extra={"tenant": "t1"})
+        cleanup_syslog_logger("stream_test")
+
+        (message,) = server.wait_for(1)
+        assert message.endswith(" via logger")
+        assert 'tenant="t1"' in message